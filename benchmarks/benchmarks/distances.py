@@ -0,0 +1,118 @@
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+
+try:
+    from MDAnalysis.lib import distances
+except ImportError:
+    pass
+
+
+class DistancesBench(object):
+    """Benchmarks for the distance calculations with float64 results,
+    float32 results computed in single precision and float32 results
+    computed in double precision.
+    """
+    params = ([1000, 4000],
+              [None, 'ortho', 'triclinic'],
+              ['float64', 'float32', 'float32_double_accumulate'])
+    param_names = ['num_atoms', 'box', 'precision']
+
+    def setup(self, num_atoms, box, precision):
+        rng = np.random.RandomState(42)
+        self.coords = [(rng.random_sample((num_atoms, 3)) *
+                        100).astype(np.float32) for _ in range(4)]
+        if box == 'ortho':
+            self.box = np.array([100, 100, 100, 90, 90, 90],
+                                dtype=np.float32)
+        elif box == 'triclinic':
+            self.box = np.array([100, 100, 100, 70, 80, 90],
+                                dtype=np.float32)
+        else:
+            self.box = None
+        self.dtype = np.dtype(precision.split('_')[0])
+        self.double_accumulate = precision.endswith('double_accumulate')
+        n = num_atoms
+        self.result = np.empty((n, n), dtype=self.dtype)
+        self.self_result = np.empty(n * (n - 1) // 2, dtype=self.dtype)
+
+    def time_distance_array(self, num_atoms, box, precision):
+        """Benchmark distance_array into a preallocated result."""
+        distances.distance_array(self.coords[0], self.coords[1],
+                                 box=self.box, result=self.result,
+                                 double_accumulate=self.double_accumulate)
+
+    def time_self_distance_array(self, num_atoms, box, precision):
+        """Benchmark self_distance_array into a preallocated result."""
+        distances.self_distance_array(self.coords[0], box=self.box,
+                                      result=self.self_result,
+                                      double_accumulate=self.double_accumulate)
+
+    def time_calc_bonds(self, num_atoms, box, precision):
+        """Benchmark calc_bonds."""
+        distances.calc_bonds(self.coords[0], self.coords[1], box=self.box,
+                             dtype=self.dtype,
+                             double_accumulate=self.double_accumulate)
+
+    def time_calc_angles(self, num_atoms, box, precision):
+        """Benchmark calc_angles."""
+        distances.calc_angles(self.coords[0], self.coords[1],
+                              self.coords[2], box=self.box, dtype=self.dtype,
+                              double_accumulate=self.double_accumulate)
+
+    def time_calc_dihedrals(self, num_atoms, box, precision):
+        """Benchmark calc_dihedrals."""
+        distances.calc_dihedrals(self.coords[0], self.coords[1],
+                                 self.coords[2], self.coords[3],
+                                 box=self.box, dtype=self.dtype,
+                                 double_accumulate=self.double_accumulate)
+
+
+class ReductionsBench(object):
+    """Benchmarks for the distance reductions, which never store the
+    distance array.
+    """
+    params = ([1000, 4000],
+              [None, 'ortho', 'triclinic'])
+    param_names = ['num_atoms', 'box']
+
+    def setup(self, num_atoms, box):
+        rng = np.random.RandomState(42)
+        self.coords = [(rng.random_sample((num_atoms, 3)) *
+                        100).astype(np.float32) for _ in range(2)]
+        if box == 'ortho':
+            self.box = np.array([100, 100, 100, 90, 90, 90],
+                                dtype=np.float32)
+        elif box == 'triclinic':
+            self.box = np.array([100, 100, 100, 70, 80, 90],
+                                dtype=np.float32)
+        else:
+            self.box = None
+
+    def time_distance_histogram(self, num_atoms, box):
+        """Benchmark distance_histogram."""
+        distances.distance_histogram(self.coords[0], self.coords[1],
+                                     bins=75, range=(0.0, 15.0),
+                                     box=self.box)
+
+    def time_numpy_histogram(self, num_atoms, box):
+        """Benchmark the distance_array and numpy.histogram it replaces."""
+        np.histogram(distances.distance_array(self.coords[0],
+                                              self.coords[1], box=self.box),
+                     bins=75, range=(0.0, 15.0))
+
+    def time_min_distance_per_atom(self, num_atoms, box):
+        """Benchmark min_distance_per_atom."""
+        distances.min_distance_per_atom(self.coords[0], self.coords[1],
+                                        box=self.box)
+
+    def peakmem_distance_histogram(self, num_atoms, box):
+        """Peak memory of distance_histogram."""
+        distances.distance_histogram(self.coords[0], self.coords[1],
+                                     box=self.box)
+
+    def peakmem_numpy_histogram(self, num_atoms, box):
+        """Peak memory of the distance_array and numpy.histogram."""
+        np.histogram(distances.distance_array(self.coords[0],
+                                              self.coords[1], box=self.box),
+                     bins=75, range=(0.0, 15.0))
@@ -26,21 +26,123 @@ Analysis building blocks --- :mod:`MDAnalysis.analysis.base`
 A collection of useful building blocks for creating Analysis
 classes.
 
+
+Parallel execution
+------------------
+
+:meth:`AnalysisBase.run` can split the frames of an analysis into blocks
+(split), analyse every block independently on its own copy of the trajectory
+(apply) and merge the results of the blocks (combine)::
+
+   rmsf = RMSF(u.select_atoms('name CA')).run(backend='multiprocessing',
+                                               n_workers=8)
+
+With ``backend='threads'`` every worker thread opens its own
+:class:`~MDAnalysis.core.universe.Universe` that shares the topology of the
+original one; with ``backend='multiprocessing'`` the analysis is pickled
+together with its Universes and every worker process analyses its blocks on
+the unpickled copies (which re-open the trajectory files). Each block calls
+:meth:`~AnalysisBase._prepare` and :meth:`~AnalysisBase._single_frame` as
+usual; the attributes that are (re)assigned while doing so are the results of
+the block. The blocks are then folded, in frame order, with
+:meth:`~AnalysisBase._reduce` before :meth:`~AnalysisBase._conclude` is called
+once on the merged results.
+
+An analysis supports parallel execution if
+
+1. all its per-run state (accumulators, result lists and arrays) is assigned
+   in :meth:`~AnalysisBase._prepare`, not in ``__init__``, and
+2. it implements :meth:`~AnalysisBase._reduce`.
+
+The ``'multiprocessing'`` backend additionally requires that the analysis
+and the results of a block can be pickled.
+
+
+Analysing several frames at once
+--------------------------------
+
+Analyses that only need the coordinates of a fixed
+:class:`~MDAnalysis.core.groups.AtomGroup` can process many frames with a few
+NumPy calls instead of calling :meth:`~AnalysisBase._single_frame` for every
+frame. Such an analysis implements :meth:`~AnalysisBase._multi_frame` and
+sets ``self._multi_frame_atoms`` to the AtomGroup whose coordinates it needs.
+:meth:`AnalysisBase.run` then passes the frames in chunks of
+:attr:`~AnalysisBase._multi_frame_size` frames as a :class:`FrameBlock`::
+
+   class MeanPosition(AnalysisBase):
+       def __init__(self, atomgroup, **kwargs):
+           super(MeanPosition, self).__init__(atomgroup.universe.trajectory,
+                                              **kwargs)
+           self._multi_frame_atoms = atomgroup
+
+       def _prepare(self):
+           self.sum = np.zeros((self._multi_frame_atoms.n_atoms, 3))
+
+       def _single_frame(self):
+           self.sum += self._multi_frame_atoms.positions
+
+       def _multi_frame(self, block):
+           self.sum += block.positions.sum(axis=0)
+
+       def _conclude(self):
+           self.mean = self.sum / self.n_frames
+
+An analysis can keep using :meth:`~AnalysisBase._single_frame` for some of
+its options by leaving ``self._multi_frame_atoms`` at ``None``.
+
+.. autoclass:: FrameBlock
+
 """
 from __future__ import absolute_import
 import six
 from six.moves import range, zip
+from six.moves import cPickle as pickle
+import collections
+import copy
 import inspect
 import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import warnings
 
 import numpy as np
-from MDAnalysis import coordinates
-from MDAnalysis.core.groups import AtomGroup
+from MDAnalysis import coordinates, _ANCHOR_UNIVERSES
+from MDAnalysis.core.groups import (AtomGroup, UpdatingAtomGroup, GroupBase,
+                                    ComponentBase)
+from MDAnalysis.core.universe import Universe
 from MDAnalysis.lib.log import ProgressMeter, _set_verbose
 
 logger = logging.getLogger(__name__)
 
 
+class FrameBlock(collections.namedtuple(
+        'FrameBlock', ['indices', 'frames', 'times', 'positions',
+                       'dimensions'])):
+    """Coordinates of several frames passed to
+    :meth:`AnalysisBase._multi_frame`
+
+    Attributes
+    ----------
+    indices : numpy.ndarray
+        indices of the frames in the analysis, i.e. the values that
+        ``_frame_index`` takes for these frames in
+        :meth:`~AnalysisBase._single_frame`
+    frames : numpy.ndarray
+        trajectory frame numbers
+    times : numpy.ndarray
+        times of the frames
+    positions : numpy.ndarray
+        positions of ``_multi_frame_atoms`` of shape
+        ``(n_frames, n_atoms, 3)``
+    dimensions : numpy.ndarray
+        unitcell dimensions of shape ``(n_frames, 6)``
+
+
+    .. versionadded:: 0.17.0
+    """
+    __slots__ = ()
+
+
 class AnalysisBase(object):
     """Base class for defining multi frame analysis
 
@@ -87,8 +189,30 @@ class AnalysisBase(object):
        na = NewAnalysis(u.select_atoms('name CA'), 35).run()
        print(na.result)
 
+    To be able to run the analysis in parallel (see `Parallel execution`_)
+    the results of two blocks of frames must be combined in `_reduce`
+
+    .. code-block:: python
+
+           def _reduce(self, other):
+               # OPTIONAL
+               # Called with the results of the next block of frames when
+               # the analysis is run in more than one block.
+               self.result.extend(other.result)
+
+
+    .. versionchanged:: 0.17.0
+       Added `_reduce` and parallel execution of :meth:`run`; added
+       `_multi_frame` to analyse several frames at once
     """
 
+    #: AtomGroup whose positions are passed to :meth:`_multi_frame`; with the
+    #: default ``None`` every frame is analysed with :meth:`_single_frame`
+    _multi_frame_atoms = None
+
+    #: maximum number of frames passed to one call of :meth:`_multi_frame`
+    _multi_frame_size = 100
+
     def __init__(self, trajectory, start=None,
                  stop=None, step=None, verbose=None, quiet=None):
         """
@@ -158,6 +282,18 @@ class AnalysisBase(object):
         """
         raise NotImplementedError("Only implemented in child classes")
 
+    def _multi_frame(self, block):
+        """Calculate data from several frames of the trajectory
+
+        Only called if ``self._multi_frame_atoms`` is set, instead of
+        :meth:`_single_frame`. `block` is a :class:`FrameBlock` with the
+        positions of ``self._multi_frame_atoms`` in consecutive frames of the
+        analysis.
+        """
+        raise NotImplementedError("{0} sets _multi_frame_atoms but does not "
+                                  "implement _multi_frame()"
+                                  "".format(self.__class__.__name__))
+
     def _prepare(self):
         """Set things up before the analysis loop begins"""
         pass
@@ -169,21 +305,131 @@ class AnalysisBase(object):
         """
         pass
 
-    def run(self):
-        """Perform the calculation"""
-        logger.info("Starting preparation")
-        self._prepare()
-        for i, ts in enumerate(
-                self._trajectory[self.start:self.stop:self.step]):
-            self._frame_index = i
-            self._ts = ts
-            # logger.info("--> Doing frame {} of {}".format(i+1, self.n_frames))
-            self._single_frame()
-            self._pm.echo(self._frame_index)
+    def _reduce(self, other):
+        """Merge the results of another block of frames into this instance.
+
+        Only called when the analysis is run in more than one block. `other`
+        is a copy of this analysis that analysed the block of frames
+        following the ones already merged into `self`; the frame indices of
+        that block are given by the slice ``other._block``.
+        """
+        raise NotImplementedError("{0} does not support running in several "
+                                  "blocks; it has to implement _reduce()"
+                                  "".format(self.__class__.__name__))
+
+    def run(self, backend='serial', n_workers=None, n_blocks=None):
+        """Perform the calculation
+
+        Parameters
+        ----------
+        backend : {'serial', 'threads', 'multiprocessing'}, optional
+            how the blocks of frames are analysed: one after another, in
+            parallel threads or in parallel processes ['serial']
+        n_workers : int, optional
+            number of threads or processes; defaults to the number of CPUs
+            for the parallel backends
+        n_blocks : int, optional
+            number of blocks the frames are split into; defaults to
+            `n_workers`
+
+        .. versionchanged:: 0.17.0
+           Added `backend`, `n_workers` and `n_blocks` for parallel
+           execution.
+        """
+        try:
+            run_blocks = _BACKENDS[backend]
+        except KeyError:
+            raise ValueError("Unknown backend '{0}'; use one of {1}"
+                             "".format(backend, sorted(_BACKENDS)))
+        if n_workers is None:
+            n_workers = 1 if backend == 'serial' else multiprocessing.cpu_count()
+        if n_blocks is None:
+            n_blocks = n_workers
+        n_blocks = max(1, min(n_blocks, self.n_frames))
+
+        if n_blocks == 1:
+            logger.info("Starting preparation")
+            self._prepare()
+            if self._multi_frame_atoms is None:
+                for i, ts in enumerate(
+                        self._trajectory[self.start:self.stop:self.step]):
+                    self._frame_index = i
+                    self._ts = ts
+                    # logger.info("--> Doing frame {} of {}".format(i+1, self.n_frames))
+                    self._single_frame()
+                    self._pm.echo(self._frame_index)
+            else:
+                self._run_multi_frame(
+                    np.arange(self.start, self.stop, self.step), 0)
+                self._trajectory.rewind()
+        else:
+            bounds = np.linspace(0, self.n_frames, n_blocks + 1).astype(int)
+            blocks = [slice(b_start, b_stop)
+                      for b_start, b_stop in zip(bounds[:-1], bounds[1:])]
+            logger.info("Analysing {0} blocks with the {1} backend"
+                        "".format(n_blocks, backend))
+            states = run_blocks(self, blocks, n_workers)
+
+            self.__dict__.update(states[0])
+            for state in states[1:]:
+                other = copy.copy(self)
+                other.__dict__.update(state)
+                self._reduce(other)
+            self._block = slice(0, self.n_frames)
+            self._frame_index = self.n_frames - 1
         logger.info("Finishing up")
         self._conclude()
         return self
 
+    def _run_block(self, block):
+        """Analyse the frames in `block` and return the results
+
+        The results are all attributes that were assigned while running
+        :meth:`_prepare` and :meth:`_single_frame` on the block.
+        """
+        before = dict(vars(self))
+        self._block = block
+        self._prepare()
+        frames = np.arange(self.start, self.stop, self.step)[block]
+        if self._multi_frame_atoms is None:
+            for i, ts in enumerate(self._trajectory[frames], block.start):
+                self._frame_index = i
+                self._ts = ts
+                self._single_frame()
+                self._pm.echo(self._frame_index)
+        else:
+            self._run_multi_frame(frames, block.start)
+        return {key: value for key, value in six.iteritems(vars(self))
+                if key not in _UNMERGED_ATTRS and
+                before.get(key, _MISSING) is not value}
+
+    def _run_multi_frame(self, frames, first_index):
+        """Analyse `frames` in chunks with :meth:`_multi_frame`
+
+        `first_index` is the index of ``frames[0]`` in the analysis. All
+        data of a chunk are gathered in one pass over its frames.
+        """
+        indices = self._multi_frame_atoms.indices
+        for start in range(0, len(frames), self._multi_frame_size):
+            chunk = frames[start:start + self._multi_frame_size]
+            n_chunk = len(chunk)
+            positions = np.empty((n_chunk, len(indices), 3), dtype=np.float32)
+            dimensions = np.empty((n_chunk, 6), dtype=np.float32)
+            times = np.empty(n_chunk)
+            for j, ts in enumerate(self._trajectory[chunk]):
+                positions[j] = ts.positions[indices]
+                dimensions[j] = ts.dimensions
+                times[j] = ts.time
+            self._ts = ts
+            block = FrameBlock(
+                indices=np.arange(first_index + start,
+                                  first_index + start + n_chunk),
+                frames=chunk, times=times, positions=positions,
+                dimensions=dimensions)
+            self._frame_index = block.indices[-1]
+            self._multi_frame(block)
+            self._pm.echo(self._frame_index)
+
 
 class AnalysisFromFunction(AnalysisBase):
     """
@@ -255,6 +501,9 @@ class AnalysisFromFunction(AnalysisBase):
     def _conclude(self):
         self.results = np.asarray(self.results)
 
+    def _reduce(self, other):
+        self.results.extend(other.results)
+
 
 def analysis_class(function):
     """
@@ -336,3 +585,151 @@ def _filter_baseanalysis_kwargs(function, kwargs):
         base_args[argname] = kwargs.pop(argname, default)
 
     return base_args, kwargs
+
+
+#: sentinel for attributes that did not exist before a block was analysed
+_MISSING = object()
+
+#: per-frame bookkeeping that is never merged between blocks
+_UNMERGED_ATTRS = ('_ts', '_trajectory', '_pm')
+
+
+def _find_universes(obj, universes):
+    """Collect all Universes referenced by `obj` in `universes`
+
+    `universes` maps ``id(universe)`` to the Universe. Containers (dict, list
+    and tuple) are searched recursively.
+    """
+    if isinstance(obj, Universe):
+        universes[id(obj)] = obj
+    elif isinstance(obj, (GroupBase, ComponentBase)):
+        universes[id(obj.universe)] = obj.universe
+    elif isinstance(obj, dict):
+        for value in six.itervalues(obj):
+            _find_universes(value, universes)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _find_universes(value, universes)
+    return universes
+
+
+def _rebind(obj, universes):
+    """Return `obj` with all Universes, Groups and Components moved to new
+    Universes
+
+    `universes` maps ``id(old_universe)`` to the replacement Universe;
+    objects of other Universes are returned unchanged. Containers (dict, list
+    and tuple) are copied.
+    """
+    if isinstance(obj, Universe):
+        return universes.get(id(obj), obj)
+    elif isinstance(obj, UpdatingAtomGroup):
+        return UpdatingAtomGroup(_rebind(obj._base_group, universes),
+                                 obj._selections, obj.selection_strings)
+    elif isinstance(obj, (GroupBase, ComponentBase)):
+        u = universes.get(id(obj.universe))
+        if u is None:
+            return obj
+        if isinstance(obj, GroupBase):
+            return obj.level.plural(obj.ix, u)
+        return obj.level.singular(obj.ix, u)
+    elif type(obj) is dict:
+        return {key: _rebind(value, universes)
+                for key, value in six.iteritems(obj)}
+    elif type(obj) is list:
+        return [_rebind(value, universes) for value in obj]
+    elif type(obj) is tuple:
+        return tuple(_rebind(value, universes) for value in obj)
+    return obj
+
+
+def _open_reader_copy(reader):
+    """Copy of `reader` at the same frame with its own file handles"""
+    return pickle.loads(pickle.dumps(reader, pickle.HIGHEST_PROTOCOL))
+
+
+def _open_universe_copy(universe):
+    """Universe sharing the topology of `universe` with its own Reader"""
+    new = Universe(universe._topology, is_anchor=False)
+    new.trajectory = _open_reader_copy(universe.trajectory)
+    return new
+
+
+def _run_serial(analysis, blocks, n_workers):
+    """Analyse `blocks` one after another in this process"""
+    states = [copy.copy(analysis)._run_block(block) for block in blocks]
+    analysis._trajectory.rewind()
+    return states
+
+
+def _run_threads(analysis, blocks, n_workers):
+    """Analyse `blocks` in a pool of threads
+
+    Every block is analysed by a copy of `analysis` that reads from its own
+    Universes.
+    """
+    old = _find_universes(vars(analysis), {})
+
+    def run_block(block):
+        new = {key: _open_universe_copy(u) for key, u in six.iteritems(old)}
+        worker = copy.copy(analysis)
+        worker.__dict__ = _rebind(vars(analysis), new)
+        for key, u in six.iteritems(old):
+            if analysis._trajectory is u.trajectory:
+                worker._trajectory = new[key].trajectory
+                break
+        else:
+            worker._trajectory = _open_reader_copy(analysis._trajectory)
+        state = worker._run_block(block)
+        # hand back groups of the original Universes
+        return _rebind(state, {id(u): old[key]
+                               for key, u in six.iteritems(new)})
+
+    pool = ThreadPool(n_workers)
+    try:
+        return pool.map(run_block, blocks)
+    finally:
+        pool.close()
+        pool.join()
+
+
+#: Universes and analysis unpickled in a worker process
+_WORKER_UNIVERSES = None
+_WORKER_ANALYSIS = None
+
+
+def _init_worker_process(payload):
+    """Unpickle the Universes and the analysis sent to a worker process"""
+    global _WORKER_UNIVERSES, _WORKER_ANALYSIS
+    # The AtomGroups of the analysis must be unpickled onto the Universes
+    # sent along (with their own file handles), not onto Universes
+    # inherited from a forked parent process.
+    _ANCHOR_UNIVERSES.clear()
+    _WORKER_UNIVERSES, _WORKER_ANALYSIS = pickle.loads(payload)
+
+
+def _run_block_in_process(block):
+    """Analyse `block` with the analysis of this worker process"""
+    return copy.copy(_WORKER_ANALYSIS)._run_block(block)
+
+
+def _run_multiprocessing(analysis, blocks, n_workers):
+    """Analyse `blocks` in a pool of processes
+
+    The analysis is pickled together with all its Universes and unpickled
+    once in every worker process.
+    """
+    universes = list(_find_universes(vars(analysis), {}).values())
+    payload = pickle.dumps((universes, analysis), pickle.HIGHEST_PROTOCOL)
+    pool = multiprocessing.Pool(n_workers, initializer=_init_worker_process,
+                                initargs=(payload,))
+    try:
+        return pool.map(_run_block_in_process, blocks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+_BACKENDS = {'serial': _run_serial,
+             'threads': _run_threads,
+             'multiprocessing': _run_multiprocessing}
@@ -429,20 +429,24 @@ class Contacts(AnalysisBase):
                 self.initial_contacts.append(contact_matrix(self.r0[-1],
                                                             radius))
 
+        # only the contacts formed in the reference state are ever looked at,
+        # so keep their index pairs and reference distances around
+        self._contacts = [(np.nonzero(initial_contacts), r0[initial_contacts])
+                          for initial_contacts, r0 in zip(
+                              self.initial_contacts, self.r0)]
+
         self.fraction_kwargs = kwargs if kwargs is not None else {}
         self.timeseries = []
 
     def _single_frame(self):
-        # compute distance array for a frame
-        d = distance_array(self.grA.positions, self.grB.positions)
+        posA = self.grA.positions
+        posB = self.grB.positions
 
         y = np.empty(len(self.r0) + 1)
         y[0] = self._ts.frame
-        for i, (initial_contacts, r0) in enumerate(zip(self.initial_contacts,
-                                                       self.r0)):
-            # select only the contacts that were formed in the reference state
-            r = d[initial_contacts]
-            r0 = r0[initial_contacts]
+        for i, ((idxA, idxB), r0) in enumerate(self._contacts):
+            # distances of the reference contacts only, no full distance array
+            r = MDAnalysis.lib.distances.calc_bonds(posA[idxA], posB[idxB])
             y[i + 1] = self.fraction_contacts(r, r0, **self.fraction_kwargs)
 
         if len(y) == 1:
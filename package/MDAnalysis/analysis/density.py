@@ -755,22 +755,21 @@ def notwithin_coordinates_factory(universe, sel1, sel2, cutoff,
                 group = ns_w.search(protein, cutoff)  # solvent within CUTOFF of protein
                 return group.positions
     else:
-        # slower distance matrix based (calculate all with all distances first)
-        dist = np.zeros((len(solvent), len(protein)), dtype=np.float64)
+        # slower distance based approach: only the distance of each solvent
+        # atom to its closest protein atom is needed, which is reduced tile by
+        # tile instead of storing the full distance matrix
         box = None  # as long as s_coor is not minimum-image remapped
         if not_within is True:  # default
             compare = np.greater
-            aggregatefunc = np.all
         else:
             compare = np.less_equal
-            aggregatefunc = np.any
 
         def notwithin_coordinates(cutoff=cutoff):
             s_coor = solvent.positions
             p_coor = protein.positions
-            # Does water i satisfy d[i,j] > r for ALL j?
-            d = distances.distance_array(s_coor, p_coor, box=box, result=dist)
-            return s_coor[aggregatefunc(compare(d, cutoff), axis=1)]
+            # Does water i satisfy d[i,j] > r for ALL j, i.e. min_j d[i,j] > r?
+            dmin = distances.min_distance_per_atom(s_coor, p_coor, box=box)
+            return s_coor[compare(dmin, cutoff)]
     return notwithin_coordinates
 
 
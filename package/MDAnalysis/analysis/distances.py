@@ -38,15 +38,15 @@ See Also
 
 from __future__ import absolute_import
 
-__all__ = ['distance_array', 'self_distance_array',
-           'contact_matrix', 'dist', 'between']
+__all__ = ['distance_array', 'self_distance_array', 'capped_distance',
+           'self_capped_distance', 'contact_matrix', 'dist', 'between']
 
 import numpy as np
 import scipy.sparse
 
-from MDAnalysis.lib.distances import distance_array, self_distance_array
-from MDAnalysis.lib.c_distances import contact_matrix_no_pbc, contact_matrix_pbc
-from MDAnalysis.lib.NeighborSearch import AtomNeighborSearch
+from MDAnalysis.lib.distances import (distance_array, self_distance_array,
+                                      capped_distance, self_capped_distance,
+                                      calc_bonds)
 
 import warnings
 import logging
@@ -56,8 +56,8 @@ logger = logging.getLogger("MDAnalysis.analysis.distances")
 def contact_matrix(coord, cutoff=15.0, returntype="numpy", box=None):
     '''Calculates a matrix of contacts.
 
-    There is a fast, high-memory-usage version for small systems
-    (*returntype* = 'numpy'), and a slower, low-memory-usage version for
+    The matrix can be returned as a dense array for small systems
+    (*returntype* = 'numpy'), or as a low-memory-usage sparse matrix for
     larger systems (*returntype* = 'sparse').
 
     If *box* dimensions are passed then periodic boundary conditions
@@ -92,22 +92,34 @@ def contact_matrix(coord, cutoff=15.0, returntype="numpy", box=None):
 
     .. versionchanged:: 0.11.0
        Keyword *suppress_progmet* and *progress_meter_freq* were removed.
+    .. versionchanged:: 0.17.0
+       Contacts are found with
+       :func:`~MDAnalysis.lib.distances.self_capped_distance`, which scales
+       linearly with the number of coordinates for both return types.
     '''
 
+    if returntype not in ("numpy", "sparse"):
+        return None
+
+    n = len(coord)
+    pairs, distances = self_capped_distance(coord, cutoff, box=box)
+    # a contact is strictly closer than the cutoff
+    pairs = pairs[distances < cutoff]
+    # contacts are symmetric and every particle is in contact with itself
+    rows = np.concatenate([pairs[:, 0], pairs[:, 1], np.arange(n)])
+    cols = np.concatenate([pairs[:, 1], pairs[:, 0], np.arange(n)])
+
     if returntype == "numpy":
-        adj = (distance_array(coord, coord, box=box) < cutoff)
+        adj = np.zeros((n, n), dtype=bool)
+        adj[rows, cols] = True
         return adj
     elif returntype == "sparse":
-        # Initialize square List of Lists matrix of dimensions equal to number
+        # square List of Lists matrix of dimensions equal to number
         # of coordinates passed
-        sparse_contacts = scipy.sparse.lil_matrix((len(coord), len(coord)), dtype='bool')
-        if box is not None:
-            # with PBC
-            contact_matrix_pbc(coord, sparse_contacts, box, cutoff)
-        else:
-            # without PBC
-            contact_matrix_no_pbc(coord, sparse_contacts, cutoff)
-        return sparse_contacts
+        sparse_contacts = scipy.sparse.coo_matrix(
+            (np.ones(len(rows), dtype=bool), (rows, cols)),
+            shape=(n, n), dtype='bool')
+        return sparse_contacts.tolil()
 
 
 def dist(A, B, offset=0):
@@ -150,8 +162,7 @@ def dist(A, B, offset=0):
         off_A = off_B = int(offset)
     residues_A = np.array(A.resids) + off_A
     residues_B = np.array(B.resids) + off_B
-    r = A.positions - B.positions
-    d = np.sqrt(np.sum(r * r, axis=1))
+    d = calc_bonds(A.positions, B.positions)
     return np.array([residues_A, residues_B, d])
 
 
@@ -185,9 +196,17 @@ def between(group, A, B, distance):
 
 
     .. versionadded: 0.7.5
+    .. versionchanged:: 0.17.0
+       Finds the atoms of `group` with a neighbour in `A` and in `B` with
+       :func:`~MDAnalysis.lib.distances.capped_distance`; always returns an
+       :class:`AtomGroup`, which is empty if no atom is found.
 
     """
-    ns_group = AtomNeighborSearch(group)
-    resA = set(ns_group.search(A, distance))
-    resB = set(ns_group.search(B, distance))
-    return sum(sorted(resB.intersection(resA)))
+    positions = group.positions
+    # only the atoms close to A are searched for neighbours in B
+    near = np.arange(len(group))
+    for other in (A, B):
+        pairs = capped_distance(positions[near], other.positions,
+                                distance, return_distances=False)
+        near = near[np.unique(pairs[:, 0])]
+    return group[near].unique
@@ -160,7 +160,7 @@ import scipy.optimize
 import warnings
 
 from MDAnalysis.lib.log import ProgressMeter
-from MDAnalysis.lib.distances import distance_array, calc_angles, calc_bonds
+from MDAnalysis.lib.distances import capped_distance, calc_angles, calc_bonds
 
 
 class HydrogenBondAutoCorrel(object):
@@ -185,9 +185,9 @@ class HydrogenBondAutoCorrel(object):
         'continuous' or 'intermittent'.
     exclusions : ndarray, optional
         Indices of Hydrogen-Acceptor pairs to be excluded.
-        With nH and nA Hydrogens and Acceptors, a (nH x nA) array of distances
-        is calculated, *exclusions* is used as a mask on this array to exclude
-        some pairs.
+        With nH and nA Hydrogens and Acceptors, *exclusions* indexes a
+        (nH x nA) array of Hydrogen-Acceptor pairs; these pairs are excluded
+        from the pairs within the distance criterion.
     angle_crit : float, optional
         The angle (in degrees) which all bonds must be greater than [130.0]
     dist_crit : float, optional
@@ -336,14 +336,18 @@ class HydrogenBondAutoCorrel(object):
         # Calculate partners at t=0
         box = self.u.dimensions if self.pbc else None
 
-        # 2d array of all distances
-        d = distance_array(self.h.positions, self.a.positions, box=box)
+        # find which partners satisfy distance criteria, only the pairs
+        # within the cutoff are ever computed
+        pairs, d = capped_distance(self.h.positions, self.a.positions,
+                                   self.d_crit, box=box)
+        pairs = pairs[d < self.d_crit]
         if self.exclusions:
-            # set to above dist crit to exclude
-            d[self.exclusions] = self.d_crit + 1.0
-
-        # find which partners satisfy distance criteria
-        hidx, aidx = np.where(d < self.d_crit)
+            # drop the excluded pairs
+            shape = (len(self.h), len(self.a))
+            excluded = np.ravel_multi_index(self.exclusions, shape)
+            pairs = pairs[~np.in1d(np.ravel_multi_index(pairs.T, shape),
+                                   excluded)]
+        hidx, aidx = pairs.T
 
         a = calc_angles(self.d.positions[hidx], self.h.positions[hidx],
                         self.a.positions[aidx], box=box)
@@ -71,13 +71,11 @@ from __future__ import division, absolute_import
 
 from six.moves import range
 
-import warnings
-
 import numpy as np
 import networkx as NX
 
 from .. import core
-from . import distances
+from ..lib.distances import self_capped_distance
 from .. import selections
 
 
@@ -102,10 +100,8 @@ class LeafletFinder(object):
     pbc : bool (optional)
         take periodic boundary conditions into account [``False``]
     sparse : bool (optional)
-        ``None``: use fastest possible routine; ``True``: use slow
-        sparse matrix implementation (for large systems); ``False``:
-        use fast :func:`~MDAnalysis.lib.distances.distance_array`
-        implementation [``None``].
+        Ignored, only kept for backwards compatibility; the graph is always
+        built from the pairs within `cutoff` [``None``].
 
     Example
     -------
@@ -126,6 +122,12 @@ class LeafletFinder(object):
     instance. Similarly, all atoms in the first leaflet are then ::
 
        leaflet0.residues.atoms
+
+
+    .. versionchanged:: 0.17.0
+       The graph is built from the pairs found by
+       :func:`~MDAnalysis.lib.distances.self_capped_distance` instead of a
+       contact matrix; *sparse* is ignored.
     """
 
     def __init__(self, universe, selectionstring, cutoff=15.0, pbc=False, sparse=None):
@@ -150,39 +152,21 @@ class LeafletFinder(object):
     # detection work.
 
     def _get_graph(self):
-        """Build graph from adjacency matrix at the given cutoff.
-        Automatically select between high and low memory usage versions of
-        contact_matrix."""
-        # could use self_distance_array to speed up but then need to deal with the sparse indexing
+        """Build graph of the atoms closer than the cutoff.
+
+        Only the pairs within the cutoff are computed, with
+        :func:`~MDAnalysis.lib.distances.self_capped_distance`, so no
+        ``N x N`` matrix is needed."""
         if self.pbc:
             box = self.universe.trajectory.ts.dimensions
         else:
             box = None
         coord = self.selection.positions
-        if self.sparse is False:
-            # only try distance array
-            try:
-                adj = distances.contact_matrix(coord, cutoff=self.cutoff, returntype="numpy", box=box)
-            except ValueError:
-                warnings.warn('N x N matrix too big, use sparse=True or sparse=None', category=UserWarning,
-                              stacklevel=2)
-                raise
-        elif self.sparse is True:
-            # only try sparse
-            adj = distances.contact_matrix(coord, cutoff=self.cutoff, returntype="sparse", box=box)
-        else:
-            # use distance_array and fall back to sparse matrix
-            try:
-                # this works for small-ish systems and depends on system memory
-                adj = distances.contact_matrix(coord, cutoff=self.cutoff, returntype="numpy", box=box)
-            except ValueError:
-                # but use a sparse matrix method for larger systems for memory reasons
-                warnings.warn(
-                    'N x N matrix too big - switching to sparse matrix method (works fine, but is currently rather '
-                    'slow)',
-                    category=UserWarning, stacklevel=2)
-                adj = distances.contact_matrix(coord, cutoff=self.cutoff, returntype="sparse", box=box)
-        return NX.Graph(adj)
+        pairs, distances = self_capped_distance(coord, self.cutoff, box=box)
+        graph = NX.Graph()
+        graph.add_nodes_from(range(len(coord)))
+        graph.add_edges_from(pairs[distances < self.cutoff].tolist())
+        return graph
 
     def _get_components(self):
         """Return connected components (as sorted numpy arrays), sorted by size."""
@@ -33,6 +33,7 @@ import os.path as path
 import numpy as np
 
 from MDAnalysis.analysis.base import AnalysisBase
+from MDAnalysis.lib import distances
 
 
 class LinearDensity(AnalysisBase):
@@ -89,8 +90,6 @@ class LinearDensity(AnalysisBase):
         # AtomGroup.wrap())
         self.grouping = grouping
 
-        # Dictionary containing results
-        self.results = {'x': {'dim': 0}, 'y': {'dim': 1}, 'z': {'dim': 2}}
         # Box sides
         self.dimensions = self._universe.dimensions[:3]
         self.volume = np.prod(self.dimensions)
@@ -100,18 +99,16 @@ class LinearDensity(AnalysisBase):
         # Here we choose a number of bins of the largest cell side so that
         # x, y and z values can use the same "coord" column in the output file
         self.nbins = bins.max()
-        slices_vol = self.volume / bins
+        self._slices_vol = self.volume / bins
 
         self.keys = ['pos', 'pos_std', 'char', 'char_std']
 
-        # Initialize results array with zeros
-        for dim in self.results:
-            idx = self.results[dim]['dim']
-            self.results[dim].update({'slice volume': slices_vol[idx]})
-            for key in self.keys:
-                self.results[dim].update({key: np.zeros(self.nbins)})
+        # atoms can be wrapped and binned for a whole block of frames at once
+        if self.grouping == 'atoms':
+            self._multi_frame_atoms = selection
 
         # Variables later defined in _prepare() method
+        self.results = None
         self.masses = None
         self.charges = None
         self.totalmass = None
@@ -131,8 +128,16 @@ class LinearDensity(AnalysisBase):
 
         self.totalmass = np.sum(self.masses)
 
+        # Dictionary containing results, initialized with zeros
+        self.results = {'x': {'dim': 0}, 'y': {'dim': 1}, 'z': {'dim': 2}}
+        for dim in self.results:
+            idx = self.results[dim]['dim']
+            self.results[dim].update({'slice volume': self._slices_vol[idx]})
+            for key in self.keys:
+                self.results[dim].update({key: np.zeros(self.nbins)})
+
     def _single_frame(self):
-        self.group = getattr(self._ags[0], self.grouping)
+        group = getattr(self._ags[0], self.grouping)
         self._ags[0].wrap(compound=self.grouping)
 
         # Find position of atom/group of atoms
@@ -140,7 +145,7 @@ class LinearDensity(AnalysisBase):
             positions = self._ags[0].positions  # faster for atoms
         else:
             # COM for res/frag/etc
-            positions = np.array([elem.centroid() for elem in self.group])
+            positions = np.array([elem.centroid() for elem in group])
 
         for dim in ['x', 'y', 'z']:
             idx = self.results[dim]['dim']
@@ -167,6 +172,39 @@ class LinearDensity(AnalysisBase):
             self.results[dim][key] += hist
             self.results[dim][key_std] += np.square(hist)
 
+    def _multi_frame(self, block):
+        n_frames = len(block.positions)
+        # wrap atoms into the (orthorhombic or triclinic) box of their
+        # frame, like wrap() in _single_frame
+        positions = np.array([distances.apply_PBC(xyz, box) for xyz, box
+                              in zip(block.positions, block.dimensions)])
+
+        # bin edges as used by np.histogram in _single_frame
+        edges = np.linspace(0.0, max(self.dimensions), self.nbins + 1)
+        for dim in ['x', 'y', 'z']:
+            idx = self.results[dim]['dim']
+            x = positions[:, :, idx]
+            inside = (x >= edges[0]) & (x <= edges[-1])
+            bins = np.searchsorted(edges, x, side='right') - 1
+            bins[x == edges[-1]] = self.nbins - 1
+            # one histogram per frame
+            bins += self.nbins * np.arange(n_frames)[:, np.newaxis]
+            bins = bins[inside]
+
+            for key, weights in (('pos', self.masses),
+                                 ('char', self.charges)):
+                weights = np.broadcast_to(weights, x.shape)[inside]
+                hist = np.bincount(bins, weights=weights,
+                                   minlength=n_frames * self.nbins)
+                hist = hist.reshape(n_frames, self.nbins)
+                self.results[dim][key] += hist.sum(axis=0)
+                self.results[dim][key + '_std'] += np.square(hist).sum(axis=0)
+
+    def _reduce(self, other):
+        for dim in ['x', 'y', 'z']:
+            for key in self.keys:
+                self.results[dim][key] += other.results[dim][key]
+
     def _conclude(self):
         k = 6.022e-1  # divide by avodagro and convert from A3 to cm3
 
@@ -217,6 +217,11 @@ class PCA(AnalysisBase):
             self.mean = mean.positions
             self._calc_mean = False
 
+        # without alignment the covariance of a block of frames is a single
+        # matrix product
+        if not self.align:
+            self._multi_frame_atoms = self._atoms
+
     def _prepare(self):
         n_dim = self._n_atoms * 3
         self.cov = np.zeros((n_dim, n_dim))
@@ -232,18 +237,24 @@ class PCA(AnalysisBase):
             mean_pm = ProgressMeter(self.n_frames if self.n_frames else 1,
                                     interval=interval, verbose=self._verbose,
                                     format=format)
-            for i, ts in enumerate(self._u.trajectory[self.start:self.stop:
-                                                      self.step]):
-                if self.align:
+            if self.align:
+                for i, ts in enumerate(self._u.trajectory[self.start:self.stop:
+                                                          self.step]):
                     mobile_cog = self._atoms.center_of_geometry()
                     mobile_atoms, old_rmsd = _fit_to(self._atoms.positions,
                                                      self._ref_atom_positions,
                                                      self._atoms,
                                                      mobile_com=mobile_cog,
                                                      ref_com=self._ref_cog)
-                else:
-                    self.mean += self._atoms.positions.ravel()
-                mean_pm.echo(i)
+                    mean_pm.echo(i)
+            else:
+                i = -1
+                for block in self._u.trajectory.iter_timeseries(
+                        self._multi_frame_size, asel=self._atoms,
+                        start=self.start, stop=self.stop, step=self.step):
+                    self.mean += block.sum(axis=0, dtype=np.float64).ravel()
+                    i += len(block)
+                    mean_pm.echo(i)
             self.mean /= self.n_frames
 
         self.mean_atoms = self._atoms
@@ -264,6 +275,10 @@ class PCA(AnalysisBase):
         x -= self.mean
         self.cov += np.dot(x[:, np.newaxis], x[:, np.newaxis].T)
 
+    def _multi_frame(self, block):
+        x = block.positions.reshape(len(block.positions), -1) - self.mean
+        self.cov += np.dot(x.T, x)
+
     def _conclude(self):
         self.cov /= self.n_frames - 1
         e_vals, e_vects = np.linalg.eig(self.cov)
@@ -35,7 +35,6 @@ distribution functions" or "RDF").
 from __future__ import division, absolute_import
 import numpy as np
 
-from ..lib.util import blocks_of
 from ..lib import distances
 from .base import AnalysisBase
 
@@ -110,29 +109,20 @@ class InterRDF(AnalysisBase):
         # Need to know average volume
         self.volume = 0.0
 
-        # Allocate a results array which we will reuse
-        self._result = np.zeros((len(self.g1), len(self.g2)), dtype=np.float64)
-        # If provided exclusions, create a mask of _result which
-        # lets us take these out
-        if self._exclusion_block is not None:
-            self._exclusion_mask = blocks_of(self._result,
-                                             *self._exclusion_block)
-            self._maxrange = self.rdf_settings['range'][1] + 1.0
-        else:
-            self._exclusion_mask = None
-
     def _single_frame(self):
-        distances.distance_array(self.g1.positions, self.g2.positions,
-                                 box=self.u.dimensions, result=self._result)
-        # Maybe exclude same molecule distances
-        if self._exclusion_mask is not None:
-            self._exclusion_mask[:] = self._maxrange
-
-        count = np.histogram(self._result, **self.rdf_settings)[0]
+        # distances are binned as they are calculated, pairs within the
+        # same exclusion block are skipped
+        count = distances.distance_histogram(
+            self.g1.positions, self.g2.positions, box=self.u.dimensions,
+            exclusion_block=self._exclusion_block, **self.rdf_settings)[0]
         self.count += count
 
         self.volume += self._ts.volume
 
+    def _reduce(self, other):
+        self.count += other.count
+        self.volume += other.volume
+
     def _conclude(self):
         # Number of each selection
         nA = len(self.g1)
@@ -248,6 +248,59 @@ def rmsd(a, b, weights=None, center=False, superposition=False):
             return np.sqrt(np.sum((a - b) ** 2) / N)
 
 
+def _superposition_rmsd(ref, mobile, weights=None):
+    """Minimum RMSD after rotational superposition for several frames
+
+    Vectorized form of the QCP RMSD (without rotation matrix) of
+    :func:`MDAnalysis.lib.qcprot.CalcRMSDRotationalMatrix`: the largest
+    eigenvalue of the quaternion key matrix of every frame is obtained in a
+    single call of :func:`numpy.linalg.eigvalsh`.
+
+    Parameters
+    ----------
+    ref : numpy.ndarray
+        centered reference coordinates of shape ``(N, 3)``
+    mobile : numpy.ndarray
+        centered coordinates of shape ``(n_frames, N, 3)``
+    weights : numpy.ndarray (optional)
+        weights of the atoms, relative to their mean
+
+    Returns
+    -------
+    numpy.ndarray
+        RMSD of every frame
+    """
+    ref = np.asarray(ref, dtype=np.float64)
+    mobile = np.asarray(mobile, dtype=np.float64)
+    n_atoms = ref.shape[0]
+    if weights is None:
+        weights = np.ones(n_atoms)
+    w_ref = weights[:, np.newaxis] * ref
+
+    # inner products and correlation matrices S[f, a, b] = sum w x_a y_b
+    E0 = np.sum(w_ref * ref) + np.einsum('fij,i,fij->f', mobile, weights,
+                                         mobile)
+    S = np.einsum('ia,fib->fab', w_ref, mobile)
+    Sxx, Sxy, Sxz = S[:, 0, 0], S[:, 0, 1], S[:, 0, 2]
+    Syx, Syy, Syz = S[:, 1, 0], S[:, 1, 1], S[:, 1, 2]
+    Szx, Szy, Szz = S[:, 2, 0], S[:, 2, 1], S[:, 2, 2]
+
+    K = np.empty((len(S), 4, 4))
+    K[:, 0, 0] = Sxx + Syy + Szz
+    K[:, 1, 1] = Sxx - Syy - Szz
+    K[:, 2, 2] = -Sxx + Syy - Szz
+    K[:, 3, 3] = -Sxx - Syy + Szz
+    K[:, 0, 1] = K[:, 1, 0] = Syz - Szy
+    K[:, 0, 2] = K[:, 2, 0] = Szx - Sxz
+    K[:, 0, 3] = K[:, 3, 0] = Sxy - Syx
+    K[:, 1, 2] = K[:, 2, 1] = Sxy + Syx
+    K[:, 1, 3] = K[:, 3, 1] = Szx + Sxz
+    K[:, 2, 3] = K[:, 3, 2] = Syz + Szy
+    max_eigenvalue = np.linalg.eigvalsh(K)[:, -1]
+
+    return np.sqrt(np.abs(E0 - 2 * max_eigenvalue) / n_atoms)
+
+
 def process_selection(select):
     """Return a canonical selection dictionary.
 
@@ -523,6 +576,11 @@ class RMSD(AnalysisBase):
                              "weights=None or weights='mass', not a weight "
                              "array.")
 
+        # without groupselections only the positions of mobile_atoms are
+        # needed and whole blocks of frames can be superimposed at once
+        if not self._groupselections_atoms:
+            self._multi_frame_atoms = self.mobile_atoms
+
         # initialized to note for testing the save function
         self.rmsd = None
 
@@ -620,6 +678,24 @@ class RMSD(AnalysisBase):
 
         self._pm.rmsd = self.rmsd[self._frame_index, 2]
 
+    def _multi_frame(self, block):
+        mobile = block.positions.astype(np.float64)
+        if self.weights is None:
+            mobile -= mobile.mean(axis=1)[:, np.newaxis]
+        else:
+            mobile -= (np.einsum('fij,i->fj', mobile, self.weights) /
+                       np.sum(self.weights))[:, np.newaxis]
+
+        self.rmsd[block.indices, 0] = block.frames
+        self.rmsd[block.indices, 1] = block.times
+        self.rmsd[block.indices, 2] = _superposition_rmsd(
+            self._ref_coordinates64, mobile, self.weights)
+
+        self._pm.rmsd = self.rmsd[block.indices[-1], 2]
+
+    def _reduce(self, other):
+        self.rmsd[other._block] = other.rmsd[other._block]
+
     def save(self, filename=None):
         """Save RMSD from :attr:`RMSD.rmsd` to text file *filename*.
 
@@ -759,10 +835,16 @@ class RMSF(AnalysisBase):
         """
         super(RMSF, self).__init__(atomgroup.universe.trajectory, **kwargs)
         self.atomgroup = atomgroup
+        self._multi_frame_atoms = atomgroup
 
     def run(self, start=None, stop=None, step=None, progout=None,
-            verbose=None, quiet=None):
-        """Perform the analysis."""
+            verbose=None, quiet=None, backend='serial', n_workers=None,
+            n_blocks=None):
+        """Perform the analysis.
+
+        See :meth:`MDAnalysis.analysis.base.AnalysisBase.run` for `backend`,
+        `n_workers` and `n_blocks`.
+        """
 
         if any([el is not None for el in (start, stop, step, progout, quiet)]):
             warnings.warn("run arguments are deprecated. Please pass them at "
@@ -773,20 +855,41 @@ class RMSF(AnalysisBase):
             super(RMSF, self).__init__(self.atomgroup.universe.trajectory,
                                        start=start, stop=stop, step=step,
                                        verbose=verbose)
-        return super(RMSF, self).run()
+        return super(RMSF, self).run(backend=backend, n_workers=n_workers,
+                                     n_blocks=n_blocks)
 
     def _prepare(self):
         self.sumsquares = np.zeros((self.atomgroup.n_atoms, 3))
         self.mean = self.sumsquares.copy()
+        self._n_frames_seen = 0
 
     def _single_frame(self):
-        k = self._frame_index
+        k = self._n_frames_seen
         self.sumsquares += (k / (k+1.0)) * (self.atomgroup.positions - self.mean) ** 2
         self.mean = (k * self.mean + self.atomgroup.positions) / (k + 1)
+        self._n_frames_seen = k + 1
+
+    def _multi_frame(self, block):
+        positions = block.positions.astype(np.float64)
+        mean = positions.mean(axis=0)
+        sumsquares = np.sum((positions - mean) ** 2, axis=0)
+        self._combine(len(positions), mean, sumsquares)
+
+    def _reduce(self, other):
+        self._combine(other._n_frames_seen, other.mean, other.sumsquares)
+
+    def _combine(self, n_other, mean, sumsquares):
+        # combine the sums of squares of two sets of frames (Chan et al. 1979)
+        n_self = self._n_frames_seen
+        n = n_self + n_other
+        delta = mean - self.mean
+        self.sumsquares = (self.sumsquares + sumsquares +
+                           delta ** 2 * (n_self * n_other / float(n)))
+        self.mean = self.mean + delta * (n_other / float(n))
+        self._n_frames_seen = n
 
     def _conclude(self):
-        k = self._frame_index
-        self.rmsf = np.sqrt(self.sumsquares.sum(axis=1) / (k + 1))
+        self.rmsf = np.sqrt(self.sumsquares.sum(axis=1) / self._n_frames_seen)
 
         if not (self.rmsf >= 0).all():
             raise ValueError("Some RMSF values negative; overflow " +
@@ -0,0 +1,73 @@
+#-*- coding:utf-8 -*-
+
+# This file is generated from the AUTHORS file during the installation process.
+# Do not edit it as your changes will be overwritten.
+
+__authors__ = [
+    u"Naveen Michaud-Agrawal",
+    u"Elizabeth J. Denning",
+    u"Christian Beckstein (logo)",
+    u"Joshua L. Adelman",
+    u"Shobhit Agarwal",
+    u"Balasubramanian",
+    u"Utkarsh Bansal",
+    u"Jonathan Barnoud",
+    u"Tone Bengtsen",
+    u"Alejandro Bernardin",
+    u"Wouter Boomsma",
+    u"Jose Borreguero",
+    u"Bart Bruininks",
+    u"Sébastien Buchoux",
+    u"David Caplan",
+    u"Matthieu Chavent",
+    u"Kathleen Clark",
+    u"Robert Delgado",
+    u"John Detlefs",
+    u"Xavier Deupi",
+    u"Jan Domanski",
+    u"David L. Dotson",
+    u"Lennard van der Feltz",
+    u"Philip Fowler",
+    u"Joseph Goose",
+    u"Richard J. Gowers",
+    u"Lukas Grossar",
+    u"Abhinav Gupta",
+    u"Akshay Gupta",
+    u"Benjamin Hall",
+    u"Eugen Hruska",
+    u"Kyle J. Huston",
+    u"Joe Jordan",
+    u"Jon Kapla",
+    u"Andrew William King",
+    u"Max Linke",
+    u"Jinju Lu",
+    u"Micaela Matta",
+    u"Robert McGibbon",
+    u"Manuel Nuno Melo",
+    u"Dominik 'Rathann' Mierzejewski",
+    u"Fiona Naughton",
+    u"Alex Nesterenko",
+    u"Hai Nguyen",
+    u"Sang Young Noh",
+    u"Mattia F. Palermo",
+    u"Danny Parton",
+    u"Joshua L. Phillips",
+    u"Vedant Rathore",
+    u"Tyler Reddy",
+    u"Paul Rigor",
+    u"Carlos Yanez S.",
+    u"Utkarsh Saxena",
+    u"Sean L. Seyler",
+    u"Andy Somogyi",
+    u"Caio S. Souza",
+    u"Shantanu Srivastava",
+    u"Lukas Stelzl",
+    u"Gorman Stock",
+    u"Xiki Tempula",
+    u"Matteo Tiberti",
+    u"Isaac Virshup",
+    u"Nestor Wendt",
+    u"Zhuyi Xue",
+    u"Juan Eiros Zamora",
+    u"Oliver Beckstein"
+]
@@ -176,6 +176,17 @@ class DCDReader(base.ReaderBase):
         self._file.close()
         self._file.open('r')
 
+    def __getstate__(self):
+        state, reopen, linked = super(DCDReader, self).__getstate__()
+        # the DCDFile would seek past the last frame after reading it, the
+        # file is opened again and moved to the frame of the Timestep instead
+        state['_file'] = None
+        return state, True, linked
+
+    def __setstate__(self, state):
+        state[0]['_file'] = DCDFile(state[0]['filename'])
+        super(DCDReader, self).__setstate__(state)
+
     def _read_frame(self, i):
         """read frame i"""
         self._frame = i - 1
@@ -318,6 +329,32 @@ class DCDReader(base.ReaderBase):
             start, stop, step, order=format, indices=atom_numbers)
         return frames.xyz
 
+    def _read_timeseries(self, frames, indices, out):
+        """read positions of `frames` into `out` with one readframes call
+
+        readframes only reads evenly spaced frames forwards: decreasing
+        frames are read forwards and reversed, frames that are not evenly
+        spaced are read one by one.
+        """
+        frames = np.asarray(frames)
+        steps = np.diff(frames)
+        if len(steps) and (steps[0] == 0 or (steps != steps[0]).any()):
+            return super(DCDReader, self)._read_timeseries(frames, indices,
+                                                           out)
+        step = abs(int(steps[0])) if len(steps) else 1
+        start = int(frames.min())
+        stop = int(frames.max()) + step
+        try:
+            xyz = self._file.readframes(start, stop, step, order='fac',
+                                        indices=indices).xyz
+            out[:] = xyz if frames[0] <= frames[-1] else xyz[::-1]
+        finally:
+            # readframes leaves the file after the last frame it read
+            if self._frame + 1 < self.n_frames:
+                self._file.seek(self._frame + 1)
+        if self.convert_units:
+            self.convert_pos_from_native(out)
+
 
 class DCDWriter(base.WriterBase):
     """DCD Writer class
@@ -267,4 +267,7 @@ class HistoryReader(base.ReaderBase):
         self.ts.frame = -1
 
     def close(self):
+        if self._file is None:
+            return
         self._file.close()
+        self._file = None
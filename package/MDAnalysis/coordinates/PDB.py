@@ -227,6 +227,11 @@ class PDBReader(base.ReaderBase):
     .. versionchanged:: 0.11.0
        * Frames now 0-based instead of 1-based
        * New :attr:`title` (list with all TITLE lines).
+    .. versionchanged:: 0.17.0
+       Frame offsets of multi-model files are stored on disk and reused;
+       new keyword *refresh_offsets*. The coordinates of a frame are
+       converted with :func:`~MDAnalysis.lib.util.fixed_width_floats`
+       for all atoms at once.
 
     """
     format = ['PDB', 'ENT']
@@ -239,7 +244,10 @@ class PDBReader(base.ReaderBase):
 
         If the pdb file contains multiple MODEL records then it is
         read as a trajectory where the MODEL numbers correspond to
-        frame numbers.
+        frame numbers. The frame offsets of such a file are stored
+        persistently (see :ref:`persistent-offsets`) so that opening it
+        again does not require reading the whole file; pass
+        ``refresh_offsets=True`` to recalculate them.
         """
         super(PDBReader, self).__init__(filename, **kwargs)
 
@@ -256,13 +264,44 @@ class PDBReader(base.ReaderBase):
 
         self.model_offset = kwargs.pop("model_offset", 0)
 
+        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
+
+        self._pdbfile = util.anyopen(filename)
+
+        offsets = None
+        if not kwargs.get('refresh_offsets', False):
+            offsets = base.load_offsets(self.filename, self.n_atoms)
+        if offsets is not None:
+            self._start_offsets = offsets['start'].tolist()
+            self._stop_offsets = offsets['stop'].tolist()
+            self.header = str(offsets['header'])
+            self.title = [str(line) for line in offsets['title']]
+            self.compound = [str(line) for line in offsets['compound']]
+            self.remarks = [str(line) for line in offsets['remarks']]
+        else:
+            self._scan_offsets()
+            if len(self._start_offsets) > 1:
+                # only worth it for trajectories
+                base.store_offsets(self.filename, self.n_atoms,
+                                   start=self._start_offsets,
+                                   stop=self._stop_offsets,
+                                   header=self.header, title=self.title,
+                                   compound=self.compound,
+                                   remarks=self.remarks)
+        self.n_frames = len(self._start_offsets)
+
+        self._read_frame(0)
+
+    def _scan_offsets(self):
+        """Find the start and end of all frames and read the header records
+
+        .. versionadded:: 0.17.0
+        """
         self.header = header = ""
         self.title = title = []
         self.compound = compound = []
         self.remarks = remarks = []
 
-        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
-
         # Record positions in file of CRYST and MODEL headers
         # then build frame offsets to start at the minimum of these
         # This allows CRYST to come either before or after MODEL
@@ -272,7 +311,7 @@ class PDBReader(base.ReaderBase):
         models = []
         crysts = []
 
-        pdbfile = self._pdbfile = util.anyopen(filename)
+        pdbfile = self._pdbfile
 
         line = "magical"
         while line:
@@ -311,9 +350,6 @@ class PDBReader(base.ReaderBase):
         self._start_offsets = offsets
         # Position of the end of each frame
         self._stop_offsets = offsets[1:] + [end]
-        self.n_frames = len(offsets)
-
-        self._read_frame(0)
 
     def Writer(self, filename, **kwargs):
         """Returns a PDBWriter for *filename*.
@@ -357,41 +393,40 @@ class PDBReader(base.ReaderBase):
         except IndexError:  # out of range of known frames
             raise IOError
 
-        pos = 0
-        occupancy = np.ones(self.n_atoms)
-
         # Seek to start and read until start of next frame
         self._pdbfile.seek(start)
         chunk = self._pdbfile.read(stop - start)
 
-        tmp_buf = []
-        for line in chunk.splitlines():
-            if line[:6] in ('ATOM  ', 'HETATM'):
-                # we only care about coordinates
-                tmp_buf.append([line[30:38], line[38:46], line[46:54]])
-                # TODO import bfactors - might these change?
-                try:
-                    # does an implicit str -> float conversion
-                    occupancy[pos] = line[54:60]
-                except ValueError:
-                    # Be tolerant for ill-formated or empty occupancies
-                    pass
-                pos += 1
-            elif line[:6] == 'CRYST1':
-                # does an implicit str -> float conversion
-                self.ts._unitcell[:] = [line[6:15], line[15:24],
-                                        line[24:33], line[33:40],
-                                        line[40:47], line[47:54]]
-
-        # doing the conversion from list to array at the end is faster
-        self.ts.positions = tmp_buf
+        # all ATOM/HETATM records (and the unit cell) are converted at once
+        chars, kinds = util.fixed_width_records(
+            chunk, ('ATOM  ', 'HETATM', 'CRYST1'), width=60)
+        atoms = chars[kinds < 2]
+        cryst = chars[kinds == 2]
+        if len(cryst):
+            line = cryst[-1].tobytes().decode('ascii')
+            # does an implicit str -> float conversion
+            self.ts._unitcell[:] = [line[6:15], line[15:24],
+                                    line[24:33], line[33:40],
+                                    line[40:47], line[47:54]]
 
         # check if atom number changed
+        pos = len(atoms)
         if pos != self.n_atoms:
             raise ValueError("Read an incorrect number of atoms\n"
                              "Expected {expected} got {actual}"
                              "".format(expected=self.n_atoms, actual=pos+1))
 
+        xyz, ok = util.fixed_width_floats(atoms[:, 30:54].reshape(-1, 8))
+        if not ok.all():
+            bad = atoms[np.flatnonzero(~ok)[0] // 3, 30:54]
+            raise ValueError("could not convert coordinates {0!r} to float"
+                             "".format(bad.tobytes().decode('ascii')))
+        self.ts._pos[:] = xyz.reshape(-1, 3)
+        # TODO import bfactors - might these change?
+        occupancy, ok = util.fixed_width_floats(atoms[:, 54:60])
+        # Be tolerant for ill-formated or empty occupancies
+        occupancy[~ok] = 1.0
+
         if self.convert_units:
             # both happen inplace
             self.convert_pos_from_native(self.ts._pos)
@@ -401,7 +436,10 @@ class PDBReader(base.ReaderBase):
         return self.ts
 
     def close(self):
+        if self._pdbfile is None:
+            return
         self._pdbfile.close()
+        self._pdbfile = None
 
 
 class PDBWriter(base.WriterBase):
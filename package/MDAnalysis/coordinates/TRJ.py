@@ -184,11 +184,18 @@ class TRJReader(base.ReaderBase):
     Functionality is currently limited to simple iteration over the
     trajectory.
 
+    Frame offsets are stored persistently (see
+    :ref:`persistent-offsets`); pass ``refresh_offsets=True`` to
+    recalculate them.
+
     .. _AMBER TRJ format: http://ambermd.org/formats.html#trajectory
 
     .. versionchanged:: 0.11.0
        Frames now 0-based instead of 1-based.
        kwarg `delta` renamed to `dt`, for uniformity with other Readers
+    .. versionchanged:: 0.17.0
+       Frame offsets are stored on disk and reused; new keyword
+       *refresh_offsets*.
     """
     format = ['TRJ', 'MDCRD', 'CRDBOX']
     units = {'time': 'ps', 'length': 'Angstrom'}
@@ -200,6 +207,7 @@ class TRJReader(base.ReaderBase):
             raise ValueError("AMBER TRJ reader REQUIRES the n_atoms keyword")
         self._n_atoms = n_atoms
         self._n_frames = None
+        self._refresh_offsets = kwargs.get('refresh_offsets', False)
 
         self.trjfile = None  # have _read_next_timestep() open it properly!
         self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
@@ -328,6 +336,12 @@ class TRJReader(base.ReaderBase):
             return self._n_frames
 
     def _read_trj_n_frames(self, filename):
+        if not self._refresh_offsets:
+            stored = base.load_offsets(self.filename, self.n_atoms)
+            if stored is not None:
+                self._offsets = stored['offsets'].tolist()
+                return len(self._offsets)
+
         lpf = self.lines_per_frame
         if self.periodic:
             lpf += 1
@@ -342,6 +356,8 @@ class TRJReader(base.ReaderBase):
                 line = f.readline()
                 counter += 1
         offsets.pop()  # last offset is EOF
+        if len(offsets) > 1:
+            base.store_offsets(self.filename, self.n_atoms, offsets=offsets)
         return len(offsets)
 
     @property
@@ -551,9 +567,33 @@ class NCDFReader(base.ReaderBase):
         self._current_frame = frame
         return ts
 
+    def _read_timeseries(self, frames, indices, out):
+        """read positions of `frames` into `out` in one slice of the netcdf
+        `coordinates` variable"""
+        if self.trjfile is None:
+            raise IOError("Trajectory is closed")
+        coordinates = self.trjfile.variables['coordinates']
+        if indices is None:
+            out[:] = coordinates[frames]
+        else:
+            out[:] = coordinates[frames[:, np.newaxis], indices]
+        if self.convert_units:
+            self.convert_pos_from_native(out)
+
     def _reopen(self):
         self._current_frame = -1
 
+    def __getstate__(self):
+        state, reopen, linked = super(NCDFReader, self).__getstate__()
+        # the (memory mapped) netcdf file can not be pickled
+        state['trjfile'] = None
+        return state, reopen, linked
+
+    def __setstate__(self, state):
+        state[0]['trjfile'] = scipy.io.netcdf.netcdf_file(
+            state[0]['filename'], mmap=state[0]['_mmap'])
+        super(NCDFReader, self).__setstate__(state)
+
     def _read_next_timestep(self, ts=None):
         if ts is None:
             ts = self.ts
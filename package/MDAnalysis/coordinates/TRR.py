@@ -126,43 +126,56 @@ class TRRReader(XDRBaseReader):
     _writer = TRRWriter
     _file = TRRFile
 
+    def _read_xdr_frame(self, ts):
+        """decode the next trr-frame, into `ts` where possible"""
+        return self._xdr.readinto(self._decode_target(ts, '_pos'),
+                                  self._decode_target(ts, '_velocities'),
+                                  self._decode_target(ts, '_forces'),
+                                  self._box, sub=self._sub)
+
+    def _read_xdr_positions(self, xyz, sub):
+        """decode the positions of the atoms `sub` of the next trr-frame into
+        `xyz`"""
+        return self._xdr.readinto(xyz, None, None, self._box, sub=sub)
+
     def _frame_to_ts(self, frame, ts):
         """convert a trr-frame to a mda TimeStep"""
         ts.time = frame.time
         ts.frame = self._frame
         ts.data['step'] = frame.step
 
-        ts.has_positions = frame.hasx
-        ts.has_velocities = frame.hasv
-        ts.has_forces = frame.hasf
         ts.dimensions = triclinic_box(*frame.box)
-
         if self.convert_units:
             self.convert_pos_from_native(ts.dimensions[:3])
 
-        if ts.has_positions:
-            if self._sub is not None:
-                ts.positions = frame.x[self._sub]
-            else:
+        # data decoded in place only needs the has_* flag, the property
+        # setters would replace the arrays that were just filled
+        if frame.hasx and frame.x is getattr(ts, '_pos', None):
+            ts._has_positions = True
+        else:
+            ts.has_positions = frame.hasx
+            if ts.has_positions:
                 ts.positions = frame.x
-            if self.convert_units:
-                self.convert_pos_from_native(ts.positions)
-
-        if ts.has_velocities:
-            if self._sub is not None:
-                ts.velocities = frame.v[self._sub]
-            else:
+        if ts.has_positions and self.convert_units:
+            self.convert_pos_from_native(ts.positions)
+
+        if frame.hasv and frame.v is getattr(ts, '_velocities', None):
+            ts._has_velocities = True
+        else:
+            ts.has_velocities = frame.hasv
+            if ts.has_velocities:
                 ts.velocities = frame.v
-            if self.convert_units:
-                self.convert_velocities_from_native(ts.velocities)
-
-        if ts.has_forces:
-            if self._sub is not None:
-                ts.forces = frame.f[self._sub]
-            else:
+        if ts.has_velocities and self.convert_units:
+            self.convert_velocities_from_native(ts.velocities)
+
+        if frame.hasf and frame.f is getattr(ts, '_forces', None):
+            ts._has_forces = True
+        else:
+            ts.has_forces = frame.hasf
+            if ts.has_forces:
                 ts.forces = frame.f
-            if self.convert_units:
-                self.convert_forces_from_native(ts.forces)
+        if ts.has_forces and self.convert_units:
+            self.convert_forces_from_native(ts.forces)
 
         ts.data['lambda'] = frame.lmbda
 
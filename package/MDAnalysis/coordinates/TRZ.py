@@ -356,10 +356,13 @@ class TRZReader(base.ReaderBase):
 
         .. versionchanged:: 0.11.0
            Frames now 0-based instead of 1-based
+        .. versionchanged:: 0.17.0
+           All frames have the same size, so *frame* is reached with a single
+           absolute seek instead of a seek relative to the current frame
         """
-        move = frame - self.ts.frame
-
-        self._seek(move - 1)
+        offset = (self._headerdtype.itemsize +
+                  int(frame) * self._dtype.itemsize)
+        self.trzfile.seek(offset)
         self._read_next_timestep()
         return self.ts
 
@@ -37,59 +37,32 @@ import six
 
 import errno
 import numpy as np
-from os.path import getctime, getsize, isfile, split, join
 import warnings
 
 from . import base
+# keep the offsets helpers importable from here for backwards compatibility
+from .base import offsets_filename, read_numpy_offsets
+from ..exceptions import NoDataError
 from ..lib.mdamath import triclinic_box
 
 
-def offsets_filename(filename, ending='npz'):
-    """Return offset filename for XDR files. For this the filename is appended
-    with `_offsets.{ending}`.
-
-    Parameters
-    ----------
-    filename : str
-        filename of trajectory
-    ending : str (optional)
-        fileending of offsets file
-
-    Returns
-    -------
-    offset_filename : str
-
-    """
-    head, tail = split(filename)
-    return join(head, '.{tail}_offsets.{ending}'.format(tail=tail,
-                                                        ending=ending))
-
-
-def read_numpy_offsets(filename):
-    """read offsets into dictionary.
-
-    This assume offsets have been saved using numpy
-
-    Parameters
-    ----------
-    filename : str
-        filename of offsets
-
-    Returns
-    -------
-    offsets : dict
-        dictionary of offsets information
-
-    """
-    return {k: v for k, v in six.iteritems(np.load(filename))}
+def _decodable(arr):
+    """can libmdaxdr decode a frame directly into `arr`"""
+    return (isinstance(arr, np.ndarray) and arr.dtype == np.float32 and
+            arr.flags.c_contiguous and arr.flags.writeable)
 
 
 class XDRBaseReader(base.ReaderBase):
     """Base class for libmdaxdr file formats xtc and trr
 
     This class handles integration of XDR based formats into MDAnalysis. The
-    XTC and TRR classes only implement `write_next_timestep` and
-    `_frame_to_ts`.
+    XTC and TRR classes only implement `write_next_timestep`,
+    `_read_xdr_frame` and `_frame_to_ts`.
+
+    Frames are decoded directly into the arrays of the :class:`Timestep`
+    with :meth:`~MDAnalysis.lib.formats.libmdaxdr.XTCFile.readinto`, so
+    iterating over a trajectory does not allocate new arrays for every
+    frame.
 
     .. _offsets-label:
 
@@ -109,6 +82,12 @@ class XDRBaseReader(base.ReaderBase):
     Reader. However, the  next time the trajectory is opened,  the offsets will
     have to be rebuilt again.
 
+    .. versionchanged:: 0.17.0
+       Offsets are handled by the shared :ref:`persistent-offsets` facility
+       of :mod:`MDAnalysis.coordinates.base`; offsets files now also store
+       an :data:`~MDAnalysis.coordinates.base.OFFSETS_VERSION`.
+       Frames are decoded in place into the :class:`Timestep`; with `sub`
+       only the selected atoms are decoded.
     """
     def __init__(self, filename, convert_units=True, sub=None,
                  refresh_offsets=False, **kwargs):
@@ -122,7 +101,9 @@ class XDRBaseReader(base.ReaderBase):
         sub : array_like (optional)
             `sub` is an array of indices to pick out the corresponding
             coordinates and load only them; this requires that the topology
-            itself is that of the sub system.
+            itself is that of the sub system. TRR files only read the data
+            of these atoms and XTC files only store them, so that reading a
+            frame and unit conversion scale with the size of `sub`.
         refresh_offsets : bool (optional)
             force refresh of offsets
         **kwargs : dict
@@ -134,17 +115,26 @@ class XDRBaseReader(base.ReaderBase):
                                             **kwargs)
         self._xdr = self._file(self.filename)
 
-        self._sub = sub
-        if self._sub is not None:
-            self.n_atoms = len(self._sub)
+        if sub is not None:
+            # plain atom indices, also for boolean masks or negative indices
+            sub = np.arange(self._xdr.n_atoms)[sub]
+            self.n_atoms = len(sub)
         else:
             self.n_atoms = self._xdr.n_atoms
+        self._sub = sub
 
         if not refresh_offsets:
             self._load_offsets()
         else:
             self._read_offsets(store=True)
-        frame = self._xdr.read()
+
+        # frames are decoded straight into the arrays of the Timestep, these
+        # buffers are only used for data that has to be post-processed
+        self._box = np.empty((3, 3), dtype=np.float32)
+        self._buffers = {}
+
+        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
+        frame = self._read_xdr_frame(self.ts)
         try:
             xdr_frame = self._xdr.read()
             dt = xdr_frame.time - frame.time
@@ -152,7 +142,6 @@ class XDRBaseReader(base.ReaderBase):
         except StopIteration:
             dt = 0
 
-        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
         self._frame = 0
         self._frame_to_ts(frame, self.ts)
         # these should only be initialized once
@@ -165,29 +154,38 @@ class XDRBaseReader(base.ReaderBase):
         """close reader"""
         self._xdr.close()
 
-    def _load_offsets(self):
-        """load frame offsets from file, reread them from the trajectory if that
-        fails"""
-        fname = offsets_filename(self.filename)
+    def _read_xdr_frame(self, ts):
+        """decode the next frame of the file, into `ts` where possible"""
+        raise NotImplementedError("BUG: XDR readers have to implement "
+                                  "_read_xdr_frame")
 
-        if not isfile(fname):
-            self._read_offsets(store=True)
-            return
+    def _read_xdr_positions(self, xyz, sub):
+        """decode only the positions of the atoms `sub` of the next frame
+        into `xyz`"""
+        raise NotImplementedError("BUG: XDR readers have to implement "
+                                  "_read_xdr_positions")
 
-        data = read_numpy_offsets(fname)
-        ctime_ok = size_ok = n_atoms_ok = False
+    def _decode_target(self, ts, attr):
+        """array the next frame's `attr` of `ts` is decoded into
 
+        This is the array of the Timestep itself if it can be filled
+        directly, otherwise a buffer owned by the reader.
+        """
+        arr = getattr(ts, attr, None)
+        if _decodable(arr):
+            return arr
         try:
-            ctime_ok = getctime(self.filename) == data['ctime']
-            size_ok = getsize(self.filename) == data['size']
-            n_atoms_ok = self._xdr.n_atoms == data['n_atoms']
+            return self._buffers[attr]
         except KeyError:
-            # we tripped over some old offset formated file
-            pass
+            buf = np.empty((self.n_atoms, 3), dtype=np.float32)
+            self._buffers[attr] = buf
+            return buf
 
-        if not (ctime_ok and size_ok and n_atoms_ok):
-            warnings.warn("Reload offsets from trajectory\n "
-                          "ctime or size or n_atoms did not match")
+    def _load_offsets(self):
+        """load frame offsets from file, reread them from the trajectory if that
+        fails"""
+        data = base.load_offsets(self.filename, self._xdr.n_atoms)
+        if data is None:
             self._read_offsets(store=True)
         else:
             self._xdr.set_offsets(data['offsets'])
@@ -196,14 +194,8 @@ class XDRBaseReader(base.ReaderBase):
         """read frame offsets from trajectory"""
         offsets = self._xdr.offsets
         if store:
-            ctime = getctime(self.filename)
-            size = getsize(self.filename)
-            try:
-                np.savez(offsets_filename(self.filename),
-                         offsets=offsets, size=size, ctime=ctime,
-                         n_atoms=self._xdr.n_atoms)
-            except Exception as e:
-                warnings.warn("Couldn't save offsets because: {}".format(e))
+            base.store_offsets(self.filename, self._xdr.n_atoms,
+                               offsets=offsets)
 
     @property
     def n_frames(self):
@@ -221,6 +213,20 @@ class XDRBaseReader(base.ReaderBase):
         if len(offsets) != 0:
             self._xdr.set_offsets(offsets)
 
+    def __getstate__(self):
+        state, reopen, linked = super(XDRBaseReader, self).__getstate__()
+        # the XDR file would seek past the last frame after reading it, the
+        # file is opened again and moved to the frame of the Timestep instead
+        state['_xdr'] = None
+        state['_xdr_offsets'] = self._xdr.offsets
+        return state, True, linked
+
+    def __setstate__(self, state):
+        xdr = self._file(state[0]['filename'])
+        xdr.set_offsets(state[0].pop('_xdr_offsets'))
+        state[0]['_xdr'] = xdr
+        super(XDRBaseReader, self).__setstate__(state)
+
     def _read_frame(self, i):
         """read frame i"""
         self._frame = i - 1
@@ -236,13 +242,42 @@ class XDRBaseReader(base.ReaderBase):
             timestep = self._read_next_timestep()
         return timestep
 
+    def _read_timeseries(self, frames, indices, out):
+        """read positions of `frames` straight into `out`
+
+        Frames are decoded without going through the :class:`Timestep`,
+        only the atoms of the `sub` and `indices` subsets are decoded.
+        """
+        if self._sub is not None:
+            indices = self._sub if indices is None else self._sub[indices]
+        direct = _decodable(out)
+        if not direct:
+            xyz = np.empty(out.shape[1:], dtype=np.float32)
+        try:
+            for i, frame in enumerate(frames):
+                self._xdr.seek(int(frame))
+                if direct:
+                    xyz = out[i]
+                xdr_frame = self._read_xdr_positions(xyz, indices)
+                if not getattr(xdr_frame, 'hasx', True):
+                    raise NoDataError("frame {} contains no positions"
+                                      "".format(frame))
+                if not direct:
+                    out[i] = xyz
+        finally:
+            # put the file back to where the current timestep left it
+            if self._frame + 1 < self.n_frames:
+                self._xdr.seek(self._frame + 1)
+        if self.convert_units:
+            self.convert_pos_from_native(out)
+
     def _read_next_timestep(self, ts=None):
         """copy next frame into timestep"""
         if self._frame == self.n_frames - 1:
             raise IOError(errno.EIO, 'trying to go over trajectory limit')
         if ts is None:
             ts = self.ts
-        frame = self._xdr.read()
+        frame = self._read_xdr_frame(ts)
         self._frame += 1
         self._frame_to_ts(frame, ts)
         return ts
@@ -118,6 +118,16 @@ class XTCReader(XDRBaseReader):
     _writer = XTCWriter
     _file = XTCFile
 
+    def _read_xdr_frame(self, ts):
+        """decode the next xtc-frame, into `ts` where possible"""
+        return self._xdr.readinto(self._decode_target(ts, '_pos'), self._box,
+                                  sub=self._sub)
+
+    def _read_xdr_positions(self, xyz, sub):
+        """decode the positions of the atoms `sub` of the next xtc-frame into
+        `xyz`"""
+        return self._xdr.readinto(xyz, self._box, sub=sub)
+
     def _frame_to_ts(self, frame, ts):
         """convert a xtc-frame to a mda TimeStep"""
         ts.frame = self._frame
@@ -125,9 +135,7 @@ class XTCReader(XDRBaseReader):
         ts.data['step'] = frame.step
         ts.dimensions = triclinic_box(*frame.box)
 
-        if self._sub is not None:
-            ts.positions = frame.x[self._sub]
-        else:
+        if frame.x is not ts._pos:
             ts.positions = frame.x
         if self.convert_units:
             self.convert_pos_from_native(ts.positions)
@@ -280,9 +280,16 @@ class XYZReader(base.ReaderBase):
     The XYZ file format follows VMD's xyzplugin_ and is also described
     under :ref:`XYZ format <xyz-format>`.
 
+    Frame offsets are stored persistently (see :ref:`persistent-offsets`)
+    so that the file does not have to be read completely when it is opened
+    again; pass ``refresh_offsets=True`` to recalculate them.
+
     .. versionchanged:: 0.11.0
        Frames now 0-based instead of 1-based. Added *dt* and
        *time_offset* keywords (passed to :class:`Timestep`)
+    .. versionchanged:: 0.17.0
+       Frame offsets are stored on disk and reused; new keyword
+       *refresh_offsets*.
     """
 
     # Phil Fowler:
@@ -306,6 +313,7 @@ class XYZReader(base.ReaderBase):
         self.xyzfile = util.anyopen(self.filename)
         self.compression = ext[1:] if ext[1:] != "xyz" else None
         self._cache = dict()
+        self._refresh_offsets = kwargs.get('refresh_offsets', False)
 
         self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
         # Haven't quite figured out where to start with all the self._reopen()
@@ -332,6 +340,13 @@ class XYZReader(base.ReaderBase):
             return 0
 
     def _read_xyz_n_frames(self):
+        offsets = None
+        if not self._refresh_offsets:
+            offsets = base.load_offsets(self.filename, self.n_atoms)
+        if offsets is not None:
+            self._offsets = offsets['offsets'].tolist()
+            return len(self._offsets)
+
         # the number of lines in the XYZ file will be 2 greater than the
         # number of atoms
         linesPerFrame = self.n_atoms + 2
@@ -349,6 +364,9 @@ class XYZReader(base.ReaderBase):
         # need to check this is an integer!
         n_frames = int(counter / linesPerFrame)
         self._offsets = offsets
+        if n_frames > 1:
+            base.store_offsets(self.filename, self.n_atoms,
+                               offsets=offsets[:n_frames])
         return n_frames
 
     def _read_frame(self, frame):
@@ -289,6 +289,7 @@ History
 - 2015-06-11 Reworked Timestep init.  Base Timestep now does Vels & Forces
 - 2015-07-21 Major changes to Timestep and Reader API (release 0.11.0)
 - 2016-04-03 Removed references to Strict Readers for PDBS [jdetle]
+- 2017-10-16 Readers can be pickled
 
 .. _Issue 49: https://github.com/MDAnalysis/mdanalysis/issues/49
 .. _Context Manager: http://docs.python.org/2/reference/datamodel.html#context-managers
@@ -543,8 +544,22 @@ deal with missing methods gracefully.
      passed through to the init method of the Writer, with sensible defaults
      filled in; the actual keyword arguments depend on the Writer.
 
- ``timeseries(atomGroup, [start[,stop[,skip[,format]]]])``
-     returns a subset of coordinate data
+ ``timeseries(atomGroup, [start[,stop[,step[,format]]]])``
+     returns a subset of coordinate data as one array; implemented for all
+     readers in :class:`MDAnalysis.coordinates.base.ProtoReader`, which calls
+     the ``_read_timeseries(frames, indices, out)`` hook. Readers that can
+     read several frames at once (such as the XTC, TRR, DCD and NCDF readers)
+     override the hook to fill the preallocated output array directly.
+
+ ``iter_timeseries(chunksize, [atomGroup[,start[,stop[,step[,format]]]]])``
+     iterates over blocks of up to `chunksize` frames of coordinate data
+
+ ``__getstate__()``, ``__setstate__(state)``
+     pickle support; implemented in
+     :class:`MDAnalysis.coordinates.base.ProtoReader`, which drops open
+     Python file objects and re-opens the file at the current frame when
+     unpickled. Readers holding other unpicklable handles have to replace
+     them in ``__getstate__`` and re-open them in ``__setstate__``.
 
 Attributes
 ..........
@@ -162,6 +162,30 @@ file.
    :inherited-members:
 
 
+.. _persistent-offsets:
+
+Persistent offsets
+------------------
+
+Readers of formats without a frame index (such as multi-model PDB or XYZ)
+have to scan the whole file once to find where each frame starts. They can
+opt in to storing these frame offsets in a hidden ``.<filename>_offsets.npz``
+file next to the trajectory with :func:`store_offsets`, so that the next time
+the file is opened :func:`load_offsets` returns the offsets immediately and
+random access to a frame is a single seek. The offsets file records the
+modification time and size of the trajectory, the number of atoms and the
+:data:`OFFSETS_VERSION`; if any of them do not match, the offsets are
+discarded and have to be recalculated. Offsets files without a version
+(written by the XDR readers of earlier releases) are read as version 1. Failing to write the offsets file
+(e.g. in a read-only directory) only issues a warning.
+
+.. autodata:: OFFSETS_VERSION
+.. autofunction:: offsets_filename
+.. autofunction:: read_numpy_offsets
+.. autofunction:: load_offsets
+.. autofunction:: store_offsets
+
+
 Helper classes
 --------------
 
@@ -179,8 +203,10 @@ from six.moves import range
 import numpy as np
 import numbers
 import copy
+import types
 import warnings
 import weakref
+from os.path import getctime, getsize, isfile, split, join
 
 from . import core
 from .. import NoDataError
@@ -193,7 +219,141 @@ from .. import units
 from ..auxiliary.base import AuxReader
 from ..auxiliary.core import auxreader
 from ..core import flags
-from ..lib.util import asiterable, Namespace
+from ..lib.util import asiterable, isstream, Namespace
+
+
+#: Version of the layout of offsets files written by :func:`store_offsets`;
+#: offsets stored with a different version are recalculated.
+OFFSETS_VERSION = 1
+
+
+def offsets_filename(filename, ending='npz'):
+    """Return offset filename for a trajectory. For this the filename is
+    appended with `_offsets.{ending}`.
+
+    Parameters
+    ----------
+    filename : str
+        filename of trajectory
+    ending : str (optional)
+        fileending of offsets file
+
+    Returns
+    -------
+    offset_filename : str
+
+
+    .. versionchanged:: 0.17.0
+       Moved here from :mod:`MDAnalysis.coordinates.XDR`.
+    """
+    head, tail = split(filename)
+    return join(head, '.{tail}_offsets.{ending}'.format(tail=tail,
+                                                        ending=ending))
+
+
+def read_numpy_offsets(filename):
+    """read offsets into dictionary.
+
+    This assume offsets have been saved using numpy
+
+    Parameters
+    ----------
+    filename : str
+        filename of offsets
+
+    Returns
+    -------
+    offsets : dict
+        dictionary of offsets information
+
+
+    .. versionchanged:: 0.17.0
+       Moved here from :mod:`MDAnalysis.coordinates.XDR`.
+    """
+    return {k: v for k, v in six.iteritems(np.load(filename))}
+
+
+def load_offsets(filename, n_atoms):
+    """Load the persistent offsets of trajectory `filename`.
+
+    The offsets are only returned if they were stored for the current
+    version of the trajectory file, i.e. if the modification time, size and
+    number of atoms stored with them still match, and if they were written
+    with the current :data:`OFFSETS_VERSION`.
+
+    Parameters
+    ----------
+    filename : str
+        filename of trajectory
+    n_atoms : int
+        number of atoms in the trajectory
+
+    Returns
+    -------
+    offsets : dict or ``None``
+        all arrays stored with :func:`store_offsets`, or ``None`` if there
+        are no valid offsets for this trajectory (or it is a stream)
+
+
+    .. versionadded:: 0.17.0
+    """
+    if isstream(filename):
+        # streams have no persistent offsets
+        return None
+
+    fname = offsets_filename(filename)
+
+    if not isfile(fname):
+        return None
+
+    data = read_numpy_offsets(fname)
+    # offsets of the XDR readers stored before the version was recorded
+    # have the layout of version 1
+    data.setdefault('version', 1)
+    expected = (('ctime', getctime(filename)),
+                ('size', getsize(filename)),
+                ('n_atoms', n_atoms),
+                ('version', OFFSETS_VERSION))
+    # we may trip over some old offset formated file without all keys
+    mismatched = [key for key, value in expected
+                  if key not in data or data[key] != value]
+
+    if mismatched:
+        warnings.warn("Reload offsets from trajectory\n "
+                      "{0} did not match".format(" or ".join(mismatched)))
+        return None
+    return data
+
+
+def store_offsets(filename, n_atoms, **offsets):
+    """Store persistent offsets of trajectory `filename`.
+
+    Together with the arrays in `offsets` the modification time and size of
+    the trajectory, `n_atoms` and the :data:`OFFSETS_VERSION` are stored, so
+    that :func:`load_offsets` can detect when the offsets are out of date.
+    If the offsets file cannot be written a warning is issued. Nothing is
+    stored for streams.
+
+    Parameters
+    ----------
+    filename : str
+        filename of trajectory
+    n_atoms : int
+        number of atoms in the trajectory
+    **offsets : dict
+        arrays to store, e.g. the byte offsets of the frames
+
+
+    .. versionadded:: 0.17.0
+    """
+    if isstream(filename):
+        return
+    try:
+        np.savez(offsets_filename(filename),
+                 size=getsize(filename), ctime=getctime(filename),
+                 n_atoms=n_atoms, version=OFFSETS_VERSION, **offsets)
+    except Exception as e:
+        warnings.warn("Couldn't save offsets because: {}".format(e))
 
 
 class Timestep(object):
@@ -449,6 +609,13 @@ class Timestep(object):
     def __deepcopy__(self):
         return self.from_timestep(self)
 
+    def __getstate__(self):
+        # the weak reference back to the Reader can not be pickled; the
+        # Reader restores it when it is unpickled together with the Timestep
+        state = self.__dict__.copy()
+        state.pop('_reader', None)
+        return state
+
     def copy_slice(self, sel):
         """Make a new `Timestep` containing a subset of the original `Timestep`.
 
@@ -1277,6 +1444,42 @@ class ProtoReader(six.with_metaclass(_Readermeta, IOBase)):
         """
         pass
 
+    def __getstate__(self):
+        """State of the Reader for pickling
+
+        Open Python file objects are replaced by ``None``; the Reader
+        re-opens its file and moves to the current frame when it is
+        unpickled. Offsets and all other attributes are kept, so that the
+        trajectory does not have to be scanned again.
+
+
+        .. versionadded:: 0.17.0
+        """
+        if isstream(self.__dict__.get('filename')):
+            raise TypeError("{0} reading from a stream can not be pickled"
+                            "".format(self.__class__.__name__))
+        state = self.__dict__.copy()
+        reopen = False
+        for key, value in six.iteritems(self.__dict__):
+            if isstream(value) or isinstance(value, types.GeneratorType):
+                state[key] = None
+                reopen = True
+        ts = state.get('ts')
+        linked = (ts is not None and hasattr(ts, '_reader') and
+                  ts._reader() is self)
+        return state, reopen, linked
+
+    def __setstate__(self, state):
+        state, reopen, linked = state
+        self.__dict__.update(state)
+        if linked:
+            self.ts._reader = weakref.ref(self)
+        if reopen:
+            frame = self.ts.frame
+            self._reopen()
+            if frame >= 0:
+                self._read_frame_with_aux(frame)
+
     def __getitem__(self, frame):
         """Return the Timestep corresponding to *frame*.
 
@@ -1452,6 +1655,180 @@ class ProtoReader(six.with_metaclass(_Readermeta, IOBase)):
 
         return start, stop, step
 
+    def timeseries(self, asel=None, start=None, stop=None, step=None,
+                   format='afc'):
+        """Return a subset of coordinate data for an AtomGroup
+
+        The coordinates of all requested frames are read into a single
+        preallocated array.
+
+        Parameters
+        ----------
+        asel : :class:`~MDAnalysis.core.groups.AtomGroup` (optional)
+            The :class:`~MDAnalysis.core.groups.AtomGroup` to read the
+            coordinates from. Defaults to ``None``, in which case the full set
+            of coordinate data is returned.
+        start : int (optional)
+            Begin reading the trajectory at frame index `start` (where 0 is the
+            index of the first frame in the trajectory); the default ``None``
+            starts at the beginning.
+        stop : int (optional)
+            End reading the trajectory at frame index `stop`-1, i.e, `stop` is
+            excluded. The trajectory is read to the end with the default
+            ``None``.
+        step : int (optional)
+            Step size for reading; the default ``None`` is equivalent to 1 and
+            means to read every frame.
+        format : str (optional)
+            the order/shape of the return data array, corresponding
+            to (a)tom, (f)rame, (c)oordinates all six combinations
+            of 'a', 'f', 'c' are allowed ie "fac" - return array
+            where the shape is (frame, number of atoms,
+            coordinates)
+
+        Returns
+        -------
+        numpy.ndarray
+            coordinates of the selected atoms in the order given by `format`
+
+        Raises
+        ------
+        NoDataError
+            if `asel` is empty
+        ValueError
+            if `format` is not a permutation of ``'afc'``
+
+        See Also
+        --------
+        iter_timeseries
+
+
+        .. versionadded:: 0.17.0
+        """
+        start, stop, step = self.check_slice_indices(start, stop, step)
+        indices = self._timeseries_indices(asel)
+        axes = self._timeseries_axes(format)
+
+        frames = np.arange(start, stop, step)
+        return self._timeseries_block(frames, indices, axes)
+
+    def iter_timeseries(self, chunksize, asel=None, start=None, stop=None,
+                        step=None, format='fac'):
+        """Iterate over blocks of coordinate data for an AtomGroup
+
+        Each block holds the coordinates of up to `chunksize` consecutive
+        frames of the slice `start:stop:step`, so that analyses can work on
+        several frames at once while only one block is kept in memory.
+
+        Parameters
+        ----------
+        chunksize : int
+            maximum number of frames in each block
+        asel : :class:`~MDAnalysis.core.groups.AtomGroup` (optional)
+            The :class:`~MDAnalysis.core.groups.AtomGroup` to read the
+            coordinates from. Defaults to ``None``, in which case the full set
+            of coordinate data is returned.
+        start : int (optional)
+            first frame of the slice
+        stop : int (optional)
+            frame index to stop before
+        step : int (optional)
+            step size of the slice
+        format : str (optional)
+            the order/shape of each block, see :meth:`timeseries`; the default
+            ``'fac'`` returns blocks of shape (frames, number of atoms, 3)
+
+        Returns
+        -------
+        generator
+            yields one :class:`numpy.ndarray` per block
+
+        Raises
+        ------
+        NoDataError
+            if `asel` is empty
+        ValueError
+            if `chunksize` is smaller than 1 or `format` is not a permutation
+            of ``'afc'``
+
+        See Also
+        --------
+        timeseries
+
+
+        .. versionadded:: 0.17.0
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1, got {}"
+                             "".format(chunksize))
+        start, stop, step = self.check_slice_indices(start, stop, step)
+        indices = self._timeseries_indices(asel)
+        axes = self._timeseries_axes(format)
+
+        frames = np.arange(start, stop, step)
+
+        def iter_blocks():
+            for i in range(0, len(frames), chunksize):
+                yield self._timeseries_block(frames[i:i + chunksize],
+                                             indices, axes)
+
+        return iter_blocks()
+
+    def _timeseries_indices(self, asel):
+        """Atom indices for :meth:`timeseries`, ``None`` selects all atoms"""
+        if asel is None:
+            return None
+        if len(asel) == 0:
+            raise NoDataError(
+                "Timeseries requires at least one atom to analyze")
+        return np.asarray(asel.indices, dtype=np.int64)
+
+    @staticmethod
+    def _timeseries_axes(format):
+        """Transpose from (frame, atom, coordinate) into `format`"""
+        if sorted(format) != ['a', 'c', 'f']:
+            raise ValueError("format must be a combination of 'a', 'f' and "
+                             "'c', got {!r}".format(format))
+        return tuple('fac'.index(axis) for axis in format)
+
+    def _timeseries_block(self, frames, indices, axes):
+        n_atoms = self.n_atoms if indices is None else len(indices)
+        out = np.empty((len(frames), n_atoms, 3), dtype=np.float32)
+        if len(frames):
+            self._read_timeseries(frames, indices, out)
+        if axes == (0, 1, 2):
+            return out
+        return np.ascontiguousarray(out.transpose(axes))
+
+    def _read_timeseries(self, frames, indices, out):
+        """Read the positions of `frames` into `out`
+
+        The default implementation reads the frames one by one into the
+        :class:`Timestep`; readers that can decode several frames at once
+        should override it. The current frame of the reader must be the same
+        before and after the call.
+
+        Parameters
+        ----------
+        frames : numpy.ndarray
+            indices of the frames to read, an arithmetic progression
+        indices : numpy.ndarray or None
+            indices of the atoms to read, ``None`` for all atoms
+        out : numpy.ndarray
+            float32 array of shape ``(len(frames), n_atoms, 3)`` to fill
+        """
+        current = self.ts.frame
+        try:
+            for i, frame in enumerate(frames):
+                ts = self._read_frame(int(frame))
+                if indices is None:
+                    out[i] = ts.positions
+                else:
+                    out[i] = ts.positions[indices]
+        finally:
+            if 0 <= current < self.n_frames:
+                self._read_frame_with_aux(current)
+
     def __repr__(self):
         return ("<{cls} {fname} with {nframes} frames of {natoms} atoms>"
                 "".format(
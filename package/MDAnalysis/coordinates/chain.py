@@ -355,6 +355,11 @@ class ChainReader(base.ProtoReader):
         # set time step for frame 1
         self.ts = next(self.__chained_trajectories_iter)
 
+    def _reopen(self):
+        """Position all readers just before the first frame"""
+        self._rewind()
+        self.__chained_trajectories_iter = self._chained_iterator()
+
     def _rewind(self):
         """Internal method: Rewind trajectories themselves and trj pointer."""
         self._apply('rewind')
@@ -85,6 +85,31 @@ displayed) but then subsequent operations on the trajectory directly
 operate on the in-memory array and will be very fast.
 
 
+Memory-mapped trajectories
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Trajectories that do not fit into memory can be transferred to a coordinate
+cache on disk instead, a float32 numpy ``.npy`` file of shape (frames, atoms,
+3)::
+
+    universe = mda.Universe(TPR, XTC)
+    universe.transfer_to_memory(cache='traj_cache.npy')
+
+The :class:`MemoryReader` then works on a :class:`numpy.memmap` of the cache,
+with the same interface (:meth:`~MemoryReader.get_array`,
+:meth:`~MemoryReader.timeseries` and in-place modification of coordinates,
+which are written to the cache). The operating system only keeps the frames
+that are accessed in its page cache, and all processes that map the same cache
+share these pages. A cache can be opened directly as a trajectory::
+
+    universe = mda.Universe(TPR, 'traj_cache.npy', dt=universe.trajectory.dt)
+
+The cache only contains coordinates; `dimensions` and `dt` have to be passed
+again when it is re-opened. Use ``mmap_mode='r'`` (read-only) or
+``mmap_mode='c'`` (copy-on-write) to keep other processes from changing the
+cache.
+
+
 Constructing a Reader from a numpy array
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
@@ -187,6 +212,8 @@ from __future__ import absolute_import
 import logging
 import errno
 import numpy as np
+import six
+import warnings
 
 from . import base
 
@@ -221,19 +248,23 @@ class MemoryReader(base.ProtoReader):
     specifying the order of columns through the format option.
 
     .. versionadded:: 0.16.0
+    .. versionchanged:: 0.17.0
+       Can memory-map the coordinates from a ``.npy`` coordinate cache.
 
     """
 
-    format = 'MEMORY'
+    format = ['MEMORY', 'NPY']
     _Timestep = Timestep
 
     def __init__(self, coordinate_array, order='fac',
-                 dimensions=None, dt=1, filename=None, **kwargs):
+                 dimensions=None, dt=1, filename=None, mmap_mode='r+',
+                 **kwargs):
         """
         Parameters
         ----------
-        coordinate_array : numpy.ndarray
-            The underlying array of coordinates
+        coordinate_array : numpy.ndarray or str
+            The underlying array of coordinates or the name of a ``.npy``
+            file with the coordinates, which is memory-mapped
         order : {"afc", "acf", "caf", "fac", "fca", "cfa"} (optional)
             the order/shape of the return data array, corresponding
             to (a)tom, (f)rame, (c)oordinates all six combinations
@@ -250,6 +281,10 @@ class MemoryReader(base.ProtoReader):
         filename: string (optional)
             The name of the file from which this instance is created. Set to ``None``
             when created from an array
+        mmap_mode: {'r+', 'r', 'c'} (optional)
+            how a ``.npy`` file given as `coordinate_array` is mapped, see
+            :func:`numpy.load`; with the default ``'r+'`` changes of the
+            coordinates are written to the file
 
         Note
         ----
@@ -262,9 +297,19 @@ class MemoryReader(base.ProtoReader):
 
         super(MemoryReader, self).__init__()
 
+        cache = None
+        if isinstance(coordinate_array, six.string_types):
+            cache = coordinate_array
+            coordinate_array = np.load(cache, mmap_mode=mmap_mode)
+            if filename is None:
+                filename = cache
+
         self.filename = filename
         self.stored_order = order
         self.set_array(np.asarray(coordinate_array), order)
+        # name of the memory-mapped coordinate cache, if any
+        self._cache = cache
+        self._mmap_mode = mmap_mode
         self.n_frames = \
             self.coordinate_array.shape[self.stored_order.find('f')]
         self.n_atoms = \
@@ -304,6 +349,7 @@ class MemoryReader(base.ProtoReader):
         # Only make copy if not already in float32 format
         self.coordinate_array = coordinate_array.astype('float32', copy=False)
         self.stored_format = order
+        self._cache = None
 
     def get_array(self):
         """
@@ -316,7 +362,25 @@ class MemoryReader(base.ProtoReader):
         self.ts.frame = -1
         self.ts.time = -1
 
-    def timeseries(self, asel=None, start=0, stop=-1, step=1, format='afc'):
+    def __getstate__(self):
+        state, reopen, linked = super(MemoryReader, self).__getstate__()
+        if self._cache is not None:
+            # map the cache again instead of pickling all coordinates
+            state['coordinate_array'] = None
+        return state, reopen, linked
+
+    def __setstate__(self, state):
+        if state[0]['_cache'] is not None:
+            state[0]['coordinate_array'] = np.asarray(np.load(
+                state[0]['_cache'], mmap_mode=state[0]['_mmap_mode']))
+        super(MemoryReader, self).__setstate__(state)
+        # the positions of the Timestep have to be a view of the
+        # coordinate array again
+        if self.ts.frame >= 0:
+            self._read_frame(self.ts.frame)
+
+    def timeseries(self, asel=None, start=None, stop=None, step=None,
+                   format='afc'):
         """Return a subset of coordinate data for an AtomGroup in desired
         column order/format. If no selection is given, it will return a view of
         the underlying array, while a copy is returned otherwise.
@@ -329,9 +393,13 @@ class MemoryReader(base.ProtoReader):
             of the underlying numpy array is returned, while a copy of the
             data is returned whenever `asel` is different from ``None``.
         start : int (optional)
+            first frame to return; the default ``None`` starts at the
+            beginning
         stop : int (optional)
+            last frame to return, i.e. `stop` is *included* (``-1`` is the
+            last frame); the default ``None`` reads to the end
         step : int (optional)
-            range of trajectory to access, `start` and `stop` are *inclusive*
+            step size; the default ``None`` returns every frame
         format : {"afc", "acf", "caf", "fac", "fca", "cfa"} (optional)
             the order/shape of the return data array, corresponding
             to (a)tom, (f)rame, (c)oordinates all six combinations
@@ -345,10 +413,26 @@ class MemoryReader(base.ProtoReader):
         :class:`MDAnalysis.coordinates.DCD.timeseries` interface. It is
         identical to the `order` parameter for :class:`MemoryReader`. In a
         future version, `format` will be renamed to `order`.
+
+
+        .. versionchanged:: 0.17.0
+           `start`, `stop` and `step` default to ``None``.
+        .. deprecated:: 0.17.0
+           `stop` is included, unlike for the other readers; passing `stop`
+           issues a :class:`DeprecationWarning` and it will be excluded in
+           1.0.
         """
         # Renaming 'format' to 'order' here for internal consistency in this class
         order = format
 
+        if stop is not None:
+            warnings.warn("The stop frame of MemoryReader.timeseries() is "
+                          "included; this is deprecated and it will be "
+                          "excluded like for the other readers in 1.0",
+                          DeprecationWarning)
+            # include the stop frame, -1 being the last frame
+            stop = stop + 1 or None
+
         array = self.get_array()
         if order == self.stored_order:
             pass
@@ -367,12 +451,9 @@ class MemoryReader(base.ProtoReader):
 
         a_index = order.find('a')
         f_index = order.find('f')
-        stop_index = stop+1
-        if stop_index == 0:
-            stop_index = None
-        basic_slice = ([slice(None)] * f_index +
-                       [slice(start, stop_index, step)] +
-                       [slice(None)] * (2-f_index))
+        basic_slice = tuple([slice(None)] * f_index +
+                            [slice(start, stop, step)] +
+                            [slice(None)] * (2-f_index))
 
         # Return a view if either:
         #   1) asel is None
@@ -384,6 +465,15 @@ class MemoryReader(base.ProtoReader):
             # If selection is specified, return a copy
             return array.take(asel.indices, a_index)
 
+    def _read_timeseries(self, frames, indices, out):
+        """copy positions of `frames` from the stored array into `out`"""
+        array = self.coordinate_array.transpose(
+            [self.stored_order.find(axis) for axis in 'fac'])
+        if indices is None:
+            out[:] = array[frames]
+        else:
+            out[:] = array[frames[:, np.newaxis], indices]
+
     def _read_next_timestep(self, ts=None):
         """copy next frame into timestep"""
 
@@ -393,9 +483,9 @@ class MemoryReader(base.ProtoReader):
             ts = self.ts
         ts.frame += 1
         f_index = self.stored_order.find('f')
-        basic_slice = ([slice(None)]*(f_index) +
-                       [self.ts.frame] +
-                       [slice(None)]*(2-f_index))
+        basic_slice = tuple([slice(None)]*(f_index) +
+                            [self.ts.frame] +
+                            [slice(None)]*(2-f_index))
         ts.positions = self.coordinate_array[basic_slice]
 
         ts.time = self.ts.frame*self.dt
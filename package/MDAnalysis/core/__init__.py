@@ -281,36 +281,39 @@ _flags = [
 
         The MDAnalysis preset of this flag is %(default)r.
 
-        Note that KD-tree based distance selections always ignore this flag. (For
-        details see the docs for the 'use_KDTree_routines' flag.)
+        Both the grid based and the distance matrix based distance
+        selections honour this flag. (For details see the docs for the
+        'use_KDTree_routines' flag.)
         """
     ),
     _Flag(
         'use_KDTree_routines',
         'fast',
-        {True: 'fast', 'fast': 'fast',  # only KDTree if advantageous
-         'always': 'always',  # always even if slower (for testing)
+        {True: 'fast', 'fast': 'fast',  # grid search if advantageous
+         'always': 'always',  # always grid search (eg for benchmarking)
          False: 'never', 'never': 'never'},  # never, only use (slower) alternatives
         """
-           Determines which KDTree routines are used for distance selections
+           Determines which routines are used for distance selections
 
            >>> flags['%(name)s'] = value
 
            Values for flag:
 
-           * True, 'fast'   - only use KDTree routines that are typically faster than others
-             -               POINT      uses distance matrix routines (with periodicity)
-             -               AROUND     uses KDTree routines (always ignores periodicity)
-           * 'always'       - always use KDTree routines where available (eg for benchmarking)
-           * False, 'never' - always use alternatives
+           * True, 'fast'   - only use the grid based neighbor search of
+             :mod:`MDAnalysis.lib.nsgrid` where it is typically faster
+             -               AROUND uses the grid search
+             -               SPHLAYER, SPHZONE and POINT use distance matrix
+                             routines (a single reference point)
+           * 'always'       - always use the grid search (eg for benchmarking)
+           * False, 'never' - always use distance matrix routines
 
            The preset value for MDAnalysis is %(default)r.
 
-           :mod:`MDAnalysis.lib.KDTree` routines are significantly faster for some distance
-           selections. However, they cannot deal with periodic boxes and thus ignore
-           periodicity; if periodicity is crucial, disable KDTree routines with
-
-           >>> MDAnalysis.core.flags['use_KDTree_routines'] = False
+           The grid search scales linearly with the number of atoms and
+           takes periodic boundary conditions (orthorhombic and triclinic)
+           into account whenever the 'use_periodic_selections' flag is set.
+           The name of the flag is historical; the KDTree routines were
+           replaced by the grid search in 0.17.0.
            """
     ),
     _Flag(
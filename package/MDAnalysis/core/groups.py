@@ -56,6 +56,8 @@ Collections
    :inherited-members:
 .. autoclass:: UpdatingAtomGroup
    :members:
+.. autoclass:: GroupBy
+   :members:
 
 Chemical units
 --------------
@@ -94,12 +96,17 @@ from six.moves import zip
 from six import string_types
 
 from collections import namedtuple
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
 import numpy as np
 import functools
 import itertools
 import numbers
 import os
 import warnings
+import weakref
 
 from numpy.lib.utils import deprecate
 
@@ -107,6 +114,7 @@ import MDAnalysis
 from .. import _ANCHOR_UNIVERSES
 from ..lib import util
 from ..lib import distances
+from ..lib import mdamath
 from ..lib import transformations
 from ..selections import get_writer as get_selection_writer_for
 from . import selection
@@ -116,7 +124,36 @@ from . import topologyobjects
 from ._get_readers import get_writer_for
 
 
-def _unpickle(uhash, ix):
+class _PickleAnchor(object):
+    """Ties the AtomGroups pickled together with a Universe to its copy
+
+    Every Universe has one, which is pickled with the Universe and with each
+    of its AtomGroups.  As pickle only stores it once, the AtomGroups find
+    the Universe unpickled from the same pickle through it, provided that
+    the Universe comes first in the pickle.
+    """
+    def __init__(self):
+        self._universe = None
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self._universe = None
+
+    def bind(self, universe):
+        self._universe = weakref.ref(universe)
+
+    @property
+    def universe(self):
+        """The unpickled Universe, ``None`` if it has not been unpickled"""
+        return self._universe() if self._universe is not None else None
+
+
+def _unpickle(uhash, ix, anchor=None):
+    u = anchor.universe if anchor is not None else None
+    if u is not None:
+        return u.atoms[ix]
     try:
         u = _ANCHOR_UNIVERSES[uhash]
     except KeyError:
@@ -322,6 +359,110 @@ class _ImmutableBase(object):
 
 
 
+def _compound_average(xyz, weights, order, starts):
+    """(weighted) average of `xyz` over each compound, with `order` and
+    `starts` as returned by :meth:`GroupBase._compound_split`"""
+    xyz = xyz[order].astype(np.float64)
+    if weights is None:
+        sizes = np.diff(np.append(starts, len(order)))
+        return np.add.reduceat(xyz, starts, axis=0) / sizes[:, np.newaxis]
+    weights = np.asarray(weights, dtype=np.float64)[order]
+    return (np.add.reduceat(xyz * weights[:, np.newaxis], starts, axis=0) /
+            np.add.reduceat(weights, starts)[:, np.newaxis])
+
+
+def _sort_by_keys(*keys):
+    """Sort positions by `keys` and find where each combination of keys starts
+
+    Returns ``order, starts`` where ``order`` sorts the positions by the
+    keys (the first key first), keeping the original order within equal
+    keys, and ``starts`` are the positions in ``order`` where a new
+    combination of keys starts.
+    """
+    order = np.lexsort(keys[::-1])
+    new = np.zeros(len(order), dtype=bool)
+    new[:1] = True
+    for key in keys:
+        key = key[order]
+        new[1:] |= key[1:] != key[:-1]
+    return order, np.flatnonzero(new)
+
+
+class GroupBy(Mapping):
+    """The elements of a Group split by the values of topology attributes
+
+    Returned by :meth:`GroupBase.groupby`. Behaves like a dictionary from
+    each distinct value (a tuple of values when grouping by several
+    attributes) to the Group of elements with that value. The elements of
+    all Groups are stored together in one array sorted by value and each
+    Group is only created when it is accessed.
+
+    Attributes
+    ----------
+    ix : numpy.ndarray
+        indices of the elements, sorted by value; the elements of the
+        Group of the i-th key are ``ix[bounds[i]:bounds[i + 1]]``
+    bounds : numpy.ndarray
+        start of each Group in :attr:`ix`, followed by the total number of
+        elements
+
+
+    .. versionadded:: 0.17.0
+    """
+    def __init__(self, group, keys, order, starts):
+        self._group = group
+        self._keys = keys
+        self._lookup = {key: i for i, key in enumerate(keys)}
+        self._order = order
+        self.bounds = np.append(starts, len(order))
+
+    @property
+    def ix(self):
+        return self._group.ix[self._order]
+
+    def __getitem__(self, key):
+        i = self._lookup[key]
+        return self._group[self._order[self.bounds[i]:self.bounds[i + 1]]]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._lookup
+
+    def __repr__(self):
+        return "<GroupBy with {0} groups of {1}>".format(
+            len(self), self._group.__class__.__name__)
+
+
+def _isin(values, others, n):
+    """Mask of the `values` that are in the sorted unique array `others`
+
+    `values` and `others` are indices below `n`.  If they cover a large part
+    of ``range(n)`` a bitmap is used, otherwise a binary search.
+    """
+    if len(values) + len(others) > n // 8:
+        found = np.zeros(n, dtype=bool)
+        found[others] = True
+        return found[values]
+    if not len(others):
+        return np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(others, values)
+    pos[pos == len(others)] = 0
+    return others[pos] == values
+
+
+def _merge_sorted(a, b):
+    """Merge the sorted arrays `a` and `b` into one sorted array"""
+    merged = np.concatenate([a, b])
+    # mergesort only has to merge the two sorted runs
+    merged.sort(kind='mergesort')
+    return merged
+
+
 def _only_same_level(function):
     @functools.wraps(function)
     def wrapped(self, other):
@@ -449,7 +590,14 @@ class GroupBase(_MutableBase):
             # We specify _derived_class instead of self.__class__ to allow
             # subclasses, such as UpdatingAtomGroup, to control the class
             # resulting from slicing.
-            return self._derived_class(self.ix[item], self.universe)
+            group = self._derived_class(self.ix[item], self.universe)
+            if self._cache.get('sorted_unique') and (
+                    isinstance(item, slice) and (item.step is None or
+                                                 item.step > 0) or
+                    isinstance(item, np.ndarray) and item.dtype == bool):
+                # masks and forward slices keep the elements sorted
+                group._cache['sorted_unique'] = True
+            return group
 
     def __repr__(self):
         name = self.level.name
@@ -523,6 +671,10 @@ class GroupBase(_MutableBase):
             # maybe raise TypeError instead?
             # eq method raises Error for wrong comparisons
             return False
+        if (isinstance(other, ComponentBase) and
+                self._cache.get('sorted_unique')):
+            pos = np.searchsorted(self._ix, other.ix)
+            return bool(pos < len(self._ix) and self._ix[pos] == other.ix)
         return other.ix in self.ix
 
     def __or__(self, other):
@@ -565,6 +717,34 @@ class GroupBase(_MutableBase):
         """
         return self._ix
 
+    def _sorted_unique_ix(self):
+        """Sorted unique indices of the Group
+
+        Whether the indices already are sorted and unique is remembered, and
+        the groups created by the set operations, :attr:`unique` and by
+        masking or slicing such a group are marked as sorted and unique.
+        """
+        try:
+            sorted_unique = self._cache['sorted_unique']
+        except KeyError:
+            ix = self._ix
+            sorted_unique = self._cache['sorted_unique'] = bool(
+                np.all(ix[1:] > ix[:-1]))
+        return self._ix if sorted_unique else np.unique(self._ix)
+
+    def _derived_unique(self, ix):
+        """New Group of the sorted unique indices `ix`"""
+        group = self._derived_class(ix, self.universe)
+        group._cache['sorted_unique'] = True
+        return group
+
+    def _n_total(self):
+        """Number of components of this level in the Universe"""
+        top = self.universe._topology
+        return {'atom': top.n_atoms,
+                'residue': top.n_residues,
+                'segment': top.n_segments}[self.level.name]
+
     @property
     def dimensions(self):
         return self.universe.trajectory.ts.dimensions
@@ -573,7 +753,7 @@ class GroupBase(_MutableBase):
     def dimensions(self, dimensions):
         self.universe.trajectory.ts.dimensions = dimensions
 
-    def center(self, weights, pbc=None):
+    def center(self, weights, pbc=None, compound='group'):
         """Calculate center of group given some weights
 
         Parameters
@@ -583,11 +763,17 @@ class GroupBase(_MutableBase):
         pbc : boolean, optional
             ``True``: Move all atoms within the primary unit cell
             before calculation [``False``]
+        compound : {'group', 'residues', 'segments', 'fragments'}, optional
+            If ``'group'``, the center of the whole group is returned.
+            Otherwise, the center of the atoms of this group is calculated
+            for each residue, segment or fragment at once.
 
         Returns
         -------
         center : ndarray
-            weighted center of group
+            weighted center of group; for a `compound` an array of shape
+            ``(n_compounds, 3)`` with the centers ordered by the index of
+            the compound (of the first atom of the fragment)
 
         Examples
         --------
@@ -597,12 +783,18 @@ class GroupBase(_MutableBase):
             >>> sel = u.select_atoms('prop mass > 4.0')
             >>> sel.center(sel.charges)
 
+        To find the centers of geometry of all residues of a group::
+
+            >>> sel.center(None, compound='residues')
+
 
         Notes
         -----
         If the :class:`MDAnalysis.core.flags` flag *use_pbc* is set to
         ``True`` then the `pbc` keyword is used by default.
 
+
+        .. versionchanged:: 0.17.0 Added `compound` parameter
         """
         atoms = self.atoms
         if pbc is None:
@@ -612,9 +804,12 @@ class GroupBase(_MutableBase):
         else:
             xyz = atoms.positions
 
-        return np.average(xyz, weights=weights, axis=0)
+        if compound.lower() == 'group':
+            return np.average(xyz, weights=weights, axis=0)
+        order, starts = atoms._compound_split(compound)
+        return _compound_average(xyz, weights, order, starts)
 
-    def center_of_geometry(self, pbc=None):
+    def center_of_geometry(self, pbc=None, compound='group'):
         """Center of geometry (also known as centroid) of the selection.
 
         Parameters
@@ -622,6 +817,9 @@ class GroupBase(_MutableBase):
         pbc : boolean, optional
             ``True``: Move all atoms within the primary unit cell
             before calculation [``False``]
+        compound : {'group', 'residues', 'segments', 'fragments'}, optional
+            calculate the center of each residue, segment or fragment
+            instead of the whole group, see :meth:`center`
 
         Returns
         -------
@@ -635,8 +833,45 @@ class GroupBase(_MutableBase):
 
 
         .. versionchanged:: 0.8 Added `pbc` keyword
+        .. versionchanged:: 0.17.0 Added `compound` parameter
         """
-        return self.center(None, pbc=pbc)
+        return self.center(None, pbc=pbc, compound=compound)
+
+    def _compound_split(self, compound):
+        """Sort the atoms of this group by the compound they belong to.
+
+        Parameters
+        ----------
+        compound : {'group', 'residues', 'segments', 'fragments'}
+
+        Returns
+        -------
+        order : ndarray
+            indices that sort :attr:`atoms` by compound; the atoms keep their
+            order within a compound
+        starts : ndarray
+            position in `order` of the first atom of each compound, so that
+            ``np.add.reduceat(values[order], starts)`` sums `values` over
+            each compound
+
+
+        .. versionadded:: 0.17.0
+        """
+        atoms = self.atoms
+        compound = compound.lower()
+        if compound == 'group':
+            keys = np.zeros(len(atoms), dtype=np.intp)
+        elif compound == 'residues':
+            keys = atoms.resindices
+        elif compound == 'segments':
+            keys = atoms.segindices
+        elif compound == 'fragments':
+            keys = atoms.fragindices
+        else:
+            raise ValueError("Unrecognised compound definition: {0} "
+                             "Please use one of 'group' 'residues' 'segments' "
+                             "or 'fragments'".format(compound))
+        return _sort_by_keys(keys)
 
     centroid = center_of_geometry
 
@@ -973,19 +1208,26 @@ class GroupBase(_MutableBase):
 
 
         .. versionadded:: 0.9.2
+        .. versionchanged:: 0.17.0
+           The centers and shifts of all compounds are calculated at once.
         """
         atomgroup = self.atoms.unique
-        if compound.lower() == "atoms":
+        compound = compound.lower()
+        if compound == "atoms":
             return atomgroup.pack_into_box(box=box)
 
-        if compound.lower() == 'group':
-            objects = [atomgroup.atoms]
-        elif compound.lower() == 'residues':
-            objects = atomgroup.residues
-        elif compound.lower() == 'segments':
-            objects = atomgroup.segments
-        elif compound.lower() == 'fragments':
-            objects = atomgroup.fragments
+        # compounds are shifted as a whole, including their atoms that are
+        # not part of this group
+        if compound == 'group':
+            atoms = atomgroup
+        elif compound == 'residues':
+            atoms = atomgroup.residues.atoms
+        elif compound == 'segments':
+            atoms = atomgroup.segments.atoms
+        elif compound == 'fragments':
+            allatoms = atomgroup.universe.atoms
+            atoms = allatoms[np.in1d(allatoms.fragindices,
+                                     atomgroup.fragindices)]
         else:
             raise ValueError("Unrecognised compound definition: {0}"
                              "Please use one of 'group' 'residues' 'segments'"
@@ -993,12 +1235,19 @@ class GroupBase(_MutableBase):
 
         # TODO: ADD TRY-EXCEPT FOR MASSES PRESENCE
         if center.lower() in ('com', 'centerofmass'):
-            centers = np.vstack([o.atoms.center_of_mass() for o in objects])
+            weights = atoms.masses
         elif center.lower() in ('cog', 'centroid', 'centerofgeometry'):
-            centers = np.vstack([o.atoms.center_of_geometry() for o in objects])
+            weights = None
         else:
             raise ValueError("Unrecognised center definition: {0}"
                              "Please use one of 'com' or 'cog'".format(center))
+        # all compounds at once
+        order, starts = atoms._compound_split(compound)
+        if flags['use_pbc']:
+            xyz = atoms.pack_into_box(inplace=False)
+        else:
+            xyz = atoms.positions
+        centers = _compound_average(xyz, weights, order, starts)
         centers = centers.astype(np.float32)
 
         if box is None:
@@ -1008,37 +1257,135 @@ class GroupBase(_MutableBase):
         dests = distances.apply_PBC(centers, box=box)
         shifts = dests - centers
 
-        for o, s in zip(objects, shifts):
-            # Save some needless shifts
-            if not all(s == 0.0):
-                o.atoms.translate(s)
+        sizes = np.diff(np.append(starts, len(order)))
+        atomgroup.universe.trajectory.ts.positions[atoms.indices[order]] += \
+            np.repeat(shifts, sizes, axis=0)
+
+    def unwrap(self, compound='fragments', box=None):
+        """Make the bonded compounds of this Group whole across the unit cell.
+
+        All compounds are unwrapped in a single call by walking their bonds
+        breadth-first at once and moving every atom to the minimum image of
+        its bond vector from the atom it was reached from.  The first atom
+        of every compound stays in place.  Positions are modified in place.
+
+        Parameters
+        ----------
+        compound : {'group', 'residues', 'segments', 'fragments'}
+            Only bonds within the same compound are followed.
+        box : array
+            Box dimensions, can be either orthogonal or triclinic information,
+            ``[lx, ly, lz, alpha, beta, gamma]``. If ``None``, uses the
+            timestep dimensions.
+
+        Raises
+        ------
+        NoDataError
+            There are no bonds present.
+        ValueError
+            The box has zero size.
+
+        Notes
+        -----
+        Atoms of a compound that can not be reached through bonds between
+        atoms of this Group are unwrapped as separate pieces.
+
+        See Also
+        --------
+        :func:`MDAnalysis.lib.mdamath.make_whole`
+
+
+        .. versionadded:: 0.17.0
+        """
+        atoms = self.atoms.unique
+        bonds = mdamath._internal_bonds(atoms)
+
+        # bonds never join different fragments, so 'group' and 'fragments'
+        # follow all of them
+        compound = compound.lower()
+        if compound == 'residues':
+            keys = atoms.resindices
+            bonds = bonds[keys[bonds[:, 0]] == keys[bonds[:, 1]]]
+        elif compound == 'segments':
+            keys = atoms.segindices
+            bonds = bonds[keys[bonds[:, 0]] == keys[bonds[:, 1]]]
+        elif compound not in ('group', 'fragments'):
+            raise ValueError("Unrecognised compound definition: {0} "
+                             "Please use one of 'group' 'residues' 'segments' "
+                             "or 'fragments'".format(compound))
 
-    def groupby(self, topattr):
+        if box is None:
+            box = atoms.dimensions
+        box = np.asarray(box, dtype=np.float32)
+        if np.all(box[:3] == 0.0):
+            raise ValueError("Supplied box had zero size")
+
+        # start from the first atom of every bonded piece
+        labels = mdamath._connected_components(len(atoms), bonds)
+        roots = np.unique(labels, return_index=True)[1]
+
+        positions = atoms.positions
+        mdamath._unwrap(positions, bonds, roots, box)
+        atoms.positions = positions
+
+    def _factorize(self, attrname):
+        """Vocabulary and codes of the values of *attrname* in this group"""
+        attr = getattr(self.universe._topology, attrname, None)
+        if hasattr(attr, 'get_atom_codes') and self.level.name == 'atom':
+            # categorical attributes are already encoded
+            return attr.vocabulary, attr.get_atom_codes(self)
+        return util.factorize(getattr(self, attrname))
+
+    def groupby(self, topattrs):
         """Group together items in this group according to values of *topattr*
 
         Parameters
         ----------
-        topattr: str
-           Topology attribute to group components by.
+        topattrs: str or list of str
+           Topology attribute(s) to group components by.
 
         Returns
         -------
-        dict
-            Unique values of the topology attribute as keys, Groups as values.
+        GroupBy
+            Mapping with the unique values of the topology attribute as keys,
+            Groups as values. When grouping by several attributes the keys
+            are tuples of their values.
 
         Example
         -------
         To group atoms with the same mass together::
 
           >>> ag.groupby('masses')
+          <GroupBy with 3 groups of AtomGroup>
+          >>> dict(ag.groupby('masses'))
           {12.010999999999999: <AtomGroup with 462 atoms>,
           14.007: <AtomGroup with 116 atoms>,
           15.999000000000001: <AtomGroup with 134 atoms>}
 
+        To group atoms by residue name and atom name::
+
+          >>> ag.groupby(['resnames', 'names'])['LYS', 'CA']
+          <AtomGroup with 41 atoms>
+
         .. versionadded:: 0.16.0
-        """
-        ta = getattr(self, topattr)
-        return {i: self[ta == i] for i in set(ta)}
+        .. versionchanged:: 0.17.0
+           Returns a :class:`GroupBy` built with a single sort instead of a
+           dict, accepts several attributes.
+        """
+        single = isinstance(topattrs, string_types)
+        if single:
+            topattrs = [topattrs]
+        vocabularies, codes = zip(*(self._factorize(attr)
+                                    for attr in topattrs))
+        order, starts = _sort_by_keys(*codes)
+        firsts = order[starts]
+        if single:
+            keys = vocabularies[0][codes[0][firsts]].tolist()
+        else:
+            keys = list(zip(*(vocabulary[code[firsts]].tolist()
+                              for vocabulary, code in zip(vocabularies,
+                                                          codes))))
+        return GroupBy(self, keys, order, starts)
 
     @_only_same_level
     def concatenate(self, other):
@@ -1111,8 +1458,10 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        o_ix = other.ix_array
-        return self._derived_class(np.union1d(self.ix, o_ix), self.universe)
+        s_ix = self._sorted_unique_ix()
+        o_ix = other._sorted_unique_ix()
+        o_ix = o_ix[~_isin(o_ix, s_ix, self._n_total())]
+        return self._derived_unique(_merge_sorted(s_ix, o_ix))
 
     @_only_same_level
     def intersection(self, other):
@@ -1149,8 +1498,9 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        o_ix = other.ix_array
-        return self._derived_class(np.intersect1d(self.ix, o_ix), self.universe)
+        s_ix = self._sorted_unique_ix()
+        o_ix = other._sorted_unique_ix()
+        return self._derived_unique(s_ix[_isin(s_ix, o_ix, self._n_total())])
 
     @_only_same_level
     def subtract(self, other):
@@ -1189,8 +1539,9 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        o_ix = other.ix_array
-        in_other = np.in1d(self.ix, o_ix)  # mask of in self.ix AND other
+        o_ix = other._sorted_unique_ix()
+        # mask of in self.ix AND other
+        in_other = _isin(self.ix, o_ix, self._n_total())
         return self[~in_other]  # ie inverse of previous mask
 
     @_only_same_level
@@ -1218,8 +1569,9 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        o_ix = other.ix_array
-        return self._derived_class(np.setdiff1d(self._ix, o_ix), self._u)
+        s_ix = self._sorted_unique_ix()
+        o_ix = other._sorted_unique_ix()
+        return self._derived_unique(s_ix[~_isin(s_ix, o_ix, self._n_total())])
 
     @_only_same_level
     def symmetric_difference(self, other):
@@ -1254,9 +1606,13 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        o_ix = other.ix_array
-        return self._derived_class(np.setxor1d(self._ix, o_ix), self._u)
+        s_ix = self._sorted_unique_ix()
+        o_ix = other._sorted_unique_ix()
+        n = self._n_total()
+        return self._derived_unique(_merge_sorted(s_ix[~_isin(s_ix, o_ix, n)],
+                                                  o_ix[~_isin(o_ix, s_ix, n)]))
 
+    @_only_same_level
     def isdisjoint(self, other):
         """If the Group has no elements in common with the other Group
 
@@ -1272,7 +1628,9 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        return len(self.intersection(other)) == 0
+        s_ix = self._sorted_unique_ix()
+        o_ix = other._sorted_unique_ix()
+        return not _isin(s_ix, o_ix, self._n_total()).any()
 
     @_only_same_level
     def issubset(self, other):
@@ -1292,9 +1650,9 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        o_ix = set(other.ix_array)
-        s_ix = set(self.ix)
-        return s_ix.issubset(o_ix)
+        s_ix = self._sorted_unique_ix()
+        o_ix = other._sorted_unique_ix()
+        return bool(_isin(s_ix, o_ix, self._n_total()).all())
 
     def is_strict_subset(self, other):
         """If this Group is a subset of another Group but not identical
@@ -1329,9 +1687,9 @@ class GroupBase(_MutableBase):
 
         .. versionadded:: 0.16
         """
-        o_ix = set(other.ix_array)
-        s_ix = set(self.ix)
-        return s_ix.issuperset(o_ix)
+        s_ix = self._sorted_unique_ix()
+        o_ix = other._sorted_unique_ix()
+        return bool(_isin(o_ix, s_ix, self._n_total()).all())
 
     def is_strict_superset(self, other):
         """If this Group is a superset of another Group but not identical
@@ -1524,7 +1882,8 @@ class AtomGroup(GroupBase):
         # REMOVE in 1.0
         #
         # is this a known attribute failure?
-        if attr in ('fragments',):  # TODO: Generalise this to cover many attributes
+        # TODO: Generalise this to cover many attributes
+        if attr in ('fragments', 'fragindices', 'n_fragments'):
             # eg:
             # if attr in _ATTR_ERRORS:
             # raise NDE(_ATTR_ERRORS[attr])
@@ -1539,7 +1898,8 @@ class AtomGroup(GroupBase):
             cls=self.__class__.__name__, attr=attr))
 
     def __reduce__(self):
-        return (_unpickle, (self.universe.anchor_name, self.ix))
+        return (_unpickle, (self.universe.anchor_name, self.ix,
+                            self.universe._pickle_anchor))
 
     @property
     def atoms(self):
@@ -1585,6 +1945,7 @@ class AtomGroup(GroupBase):
         # comprehension isn't terrible.
         for at, r in zip(self, r_ix):
             self.universe._topology.tt.move_atom(at.ix, r)
+        self.universe._topology._version += 1
 
     @property
     def n_residues(self):
@@ -1635,7 +1996,7 @@ class AtomGroup(GroupBase):
 
         .. versionadded:: 0.16.0
         """
-        return self.universe.atoms[np.unique(self.ix)]
+        return self._derived_unique(self._sorted_unique_ix())
 
     @property
     def positions(self):
@@ -1949,6 +2310,15 @@ class AtomGroup(GroupBase):
             static :class:`~MDAnalysis.core.groups.AtomGroup`, which will no
             longer update across frames.
 
+            Updating groups with distance based selections (``around``,
+            ``sphzone``, ``sphlayer``, ``point``) can also be given a `skin`
+            distance, e.g. ``select_atoms('around 3.5 protein',
+            updating=True, skin=2.0)``. The atoms within the cutoff plus
+            `skin` are then remembered and the distance search is only
+            repeated once atoms have moved further than `skin`, which makes
+            the update much cheaper for slowly diffusing systems. `skin` is
+            ignored for non-updating selections.
+
 
         .. versionchanged:: 0.7.4
            Added *resnum* selection.
@@ -1965,12 +2335,21 @@ class AtomGroup(GroupBase):
            Updating selections now possible by setting the ``updating`` argument.
         .. versionadded:: 0.17.0
            Added *moltype* selection.
+        .. versionadded:: 0.17.0
+           Added the `skin` argument for updating selections.
 
         """
         updating = selgroups.pop('updating', False)
+        skin = selgroups.pop('skin', None)
         sel_strs = (sel,) + othersel
-        selections = tuple((selection.Parser.parse(s, selgroups)
-                            for s in sel_strs))
+        if updating and skin is not None:
+            # the Verlet lists belong to this group, don't share them
+            selections = tuple(selection.CompiledSelection(s, selgroups,
+                                                           skin=skin)
+                               for s in sel_strs)
+        else:
+            selections = tuple((selection.compile_selection(s, selgroups)
+                                for s in sel_strs))
         if updating:
             atomgrp = UpdatingAtomGroup(self, selections, sel_strs)
         else:
@@ -1993,7 +2372,7 @@ class AtomGroup(GroupBase):
                      'residue': 'resindices'}
 
         if level == "atom":
-            return [self.universe.atoms[[a.ix]] for a in self]
+            return [self.universe.atoms[[ix]] for ix in self.ix]
 
         # higher level groupings
         try:
@@ -2003,8 +2382,10 @@ class AtomGroup(GroupBase):
                              "must be one of {1}".format(level,
                                                          accessors.keys()))
 
-        return [self[levelindices == index] for index in
-                np.unique(levelindices)]
+        if not len(levelindices):
+            return []
+        order, starts = _sort_by_keys(levelindices)
+        return [self[members] for members in np.split(order, starts[1:])]
 
     def guess_bonds(self, vdwradii=None):
         """Guess bonds that exist within this AtomGroup and add to Universe
@@ -2296,6 +2677,7 @@ class ResidueGroup(GroupBase):
         # comprehension isn't terrible.
         for r, s in zip(self, s_ix):
             self.universe._topology.tt.move_residue(r.ix, s)
+        self.universe._topology._version += 1
 
     @property
     def n_segments(self):
@@ -2326,7 +2708,7 @@ class ResidueGroup(GroupBase):
 
         .. versionadded:: 0.16.0
         """
-        return self.universe.residues[np.unique(self.ix)]
+        return self._derived_unique(self._sorted_unique_ix())
 
 
 class SegmentGroup(GroupBase):
@@ -2421,7 +2803,7 @@ class SegmentGroup(GroupBase):
         .. versionadded:: 0.16.0
 
         """
-        return self.universe.segments[np.unique(self.ix)]
+        return self._derived_unique(self._sorted_unique_ix())
 
 
 @functools.total_ordering
@@ -2521,6 +2903,9 @@ class ComponentBase(_MutableBase):
         """
         return np.array([self.ix], dtype=np.intp)
 
+    def _sorted_unique_ix(self):
+        return self.ix_array
+
 
 class Atom(ComponentBase):
     """Atom base class.
@@ -2532,7 +2917,7 @@ class Atom(ComponentBase):
     """
     def __getattr__(self, attr):
         """Try and catch known attributes and give better error message"""
-        if attr in ('fragment',):
+        if attr in ('fragment', 'fragindex'):
             raise NoDataError("Atom has no fragment data, this requires Bonds")
         else:
             raise AttributeError("{cls} has no attribute {attr}".format(
@@ -2564,6 +2949,7 @@ class Atom(ComponentBase):
             raise TypeError(
                 "Can only set Atom residue to Residue, not {}".format(type(new)))
         self.universe._topology.tt.move_atom(self.ix, new.resindex)
+        self.universe._topology._version += 1
 
     @property
     def segment(self):
@@ -2679,6 +3065,7 @@ class Residue(ComponentBase):
             raise TypeError(
                 "Can only set Residue segment to Segment, not {}".format(type(new)))
         self.universe._topology.tt.move_residue(self.ix, new.segindex)
+        self.universe._topology._version += 1
 
 
 class Segment(ComponentBase):
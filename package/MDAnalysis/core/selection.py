@@ -36,6 +36,17 @@ This is all invisible to the user through the
 :meth:`~MDAnalysis.core.groups.AtomGroup.select_atoms` method of an
 :class:`~MDAnalysis.core.groups.AtomGroup`.
 
+Selection strings are parsed once with :func:`compile_selection`, which
+keeps the most recently used :class:`CompiledSelection` objects.  Parts of
+a selection that only depend on the topology (``resname SOL and name OW``)
+are evaluated once per group and reused until the topology changes, so
+that updating selections only re-evaluate their geometric parts
+(``around``, ``prop``, ``point``, ``cyzone``...) every frame.
+
+.. autofunction:: compile_selection
+.. autoclass:: CompiledSelection
+   :members:
+
 """
 from __future__ import division, absolute_import
 import six
@@ -43,15 +54,16 @@ from six.moves import zip
 
 import collections
 import re
-import functools
+import threading
 import warnings
+import weakref
 
 import numpy as np
 from numpy.lib.utils import deprecate
-from Bio.KDTree import KDTree
 
 from MDAnalysis.core import flags
 from ..lib import distances
+from ..lib.nsgrid import FastNS, VerletNS
 from ..exceptions import SelectionError, NoDataError
 
 
@@ -106,11 +118,33 @@ def grab_not_keywords(tokens):
     return values
 
 
+def _match_strings(group, attrname, patterns):
+    """Mask of the atoms in *group* whose *attrname* matches *patterns*
+
+    A pattern matches equal values or, if it contains a ``*``, all values
+    starting with the text before it.  Categorical attributes are matched
+    once against their vocabulary and the atoms only compare codes.
+    """
+    attr = getattr(group.universe._topology, attrname, None)
+    if hasattr(attr, 'get_atom_codes'):
+        return attr.match(patterns)[attr.get_atom_codes(group)]
+
+    values = getattr(group, attrname)
+    mask = np.zeros(len(group), dtype=np.bool)
+    for val in patterns:
+        wc_pos = val.find('*')
+        if wc_pos == -1:  # No wildcard found
+            mask |= values == val
+        else:
+            mask |= np.char.startswith(values.astype(np.str_), val[:wc_pos])
+    return mask
+
+
 _SELECTIONDICT = {}
 _OPERATIONS = {}
 # These are named args to select_atoms that have a special meaning and must
 # not be allowed as names for the 'group' keyword.
-_RESERVED_KWARGS=('updating',)
+_RESERVED_KWARGS=('updating', 'skin')
 
 
 # And and Or are exception and aren't strictly a Selection
@@ -130,19 +164,33 @@ class LogicOperation(six.with_metaclass(_Operationmeta, object)):
         self.rsel = rsel
         self.lsel = lsel
 
+    @property
+    def is_static(self):
+        return self.lsel.is_static and self.rsel.is_static
+
+    @property
+    def is_filter(self):
+        return self.lsel.is_filter and self.rsel.is_filter
+
 
 class AndOperation(LogicOperation):
     token = 'and'
     precedence = 3
 
     def apply(self, group):
-        rsel = self.rsel.apply(group)
-        lsel = self.lsel.apply(group)
+        # Evaluate a static side first, it is cached between frames
+        first, second = self.lsel, self.rsel
+        if second.is_static and not first.is_static:
+            first, second = second, first
+        fsel = first.apply(group)
+        if not fsel:
+            return fsel
+
+        if second.is_filter:
+            # only the atoms already selected need to be looked at
+            return second.apply(fsel).unique
 
-        # Mask which lsel indices appear in rsel
-        mask = np.in1d(rsel.indices, lsel.indices)
-        # and mask rsel according to that
-        return rsel[mask].unique
+        return second.apply(group).intersection(fsel)
 
 
 class OrOperation(LogicOperation):
@@ -153,11 +201,9 @@ class OrOperation(LogicOperation):
         lsel = self.lsel.apply(group)
         rsel = self.rsel.apply(group)
 
-        # Find unique indices from both these AtomGroups
-        # and slice master list using them
-        idx = np.union1d(lsel.indices, rsel.indices).astype(np.int32)
-
-        return group.universe.atoms[idx]
+        # the results of selections are sorted, so that the union only has
+        # to merge them
+        return lsel.union(rsel)
 
 
 class _Selectionmeta(type):
@@ -170,7 +216,13 @@ class _Selectionmeta(type):
 
 
 class Selection(six.with_metaclass(_Selectionmeta, object)):
-    pass
+    #: ``True`` if the result only depends on the topology and not on the
+    #: coordinates, so that it can be reused between frames
+    is_static = True
+    #: ``True`` if the selection tests every atom on its own, so that
+    #: applying it to a subset of a group selects the same atoms of that
+    #: subset as applying it to the whole group
+    is_filter = True
 
 
 class AllSelection(Selection):
@@ -194,6 +246,14 @@ class UnarySelection(Selection):
         sel = parser.parse_expression(self.precedence)
         self.sel = sel
 
+    @property
+    def is_static(self):
+        return self.sel.is_static
+
+    @property
+    def is_filter(self):
+        return self.sel.is_filter
+
 
 class NotSelection(UnarySelection):
     token = 'not'
@@ -201,12 +261,13 @@ class NotSelection(UnarySelection):
 
     def apply(self, group):
         notsel = self.sel.apply(group)
-        return group[~np.in1d(group.indices, notsel.indices)].unique
+        return group.subtract(notsel).unique
 
 
 class GlobalSelection(UnarySelection):
     token = 'global'
     precedence = 5
+    is_filter = False
 
     def apply(self, group):
         return self.sel.apply(group.universe.atoms).unique
@@ -215,6 +276,7 @@ class GlobalSelection(UnarySelection):
 class ByResSelection(UnarySelection):
     token = 'byres'
     precedence = 1
+    is_filter = False
 
     def apply(self, group):
         res = self.sel.apply(group)
@@ -232,19 +294,66 @@ class DistanceSelection(Selection):
      - 'use_periodic_selections'
 
     Populates the `apply` method with either
-     - _apply_KDTree
+     - _apply_nsgrid
      - _apply_distmat
+
+    With 'fast' the grid search is only used by the selections that set
+    `_nsgrid_is_faster`, with 'always' by all of them.
+
+    .. versionchanged:: 0.17.0
+       The KDTree routines were replaced by the grid search of
+       :mod:`MDAnalysis.lib.nsgrid`, which also handles periodic systems.
+       Added :meth:`_set_skin` to reuse a Verlet list between frames.
     """
+    is_static = False
+    is_filter = False
+    #: the grid search beats the distance matrix for typical problems
+    _nsgrid_is_faster = True
+
     def __init__(self):
-        if flags['use_KDTree_routines'] in (True, 'fast', 'always'):
-            self.apply = self._apply_KDTree
+        use_nsgrid = flags['use_KDTree_routines']
+        if (use_nsgrid == 'always' or
+                (use_nsgrid in (True, 'fast') and self._nsgrid_is_faster)):
+            self.apply = self._apply_nsgrid
         else:
             self.apply = self._apply_distmat
 
         self.periodic = flags['use_periodic_selections']
-        # KDTree doesn't support periodic
-        if self.periodic:
-            self.apply = self._apply_distmat
+        self.skin = None
+        self._verlet = None
+
+    def _set_skin(self, skin):
+        """Search with a :class:`~MDAnalysis.lib.nsgrid.VerletNS`
+
+        The pairs within the cutoff plus `skin` are kept between
+        applications and only rebuilt once the atoms moved too far.
+        """
+        self.skin = skin
+        self._verlet = None
+        self.apply = self._apply_nsgrid
+
+    def _search(self, cutoff, query, coords, group, key):
+        """All pairs of `query` and `coords` within `cutoff`
+
+        `key` identifies the atoms of `query` and `coords`; it tells a
+        Verlet list when the atoms themselves changed.
+        """
+        box = self._get_box(group)
+        if self.skin is None:
+            return FastNS(cutoff, coords, box=box).search(query)
+        if self._verlet is None:
+            self._verlet = VerletNS(cutoff, self.skin)
+        return self._verlet.search(query, coords, box=box, key=key)
+
+    def _get_box(self, group):
+        """Unit cell used for the distance search, or ``None``"""
+        if not self.periodic:
+            return None
+        box = group.dimensions
+        if not np.all(box[:3] > 0):
+            # no unit cell information, can't apply periodicity
+            return None
+        return box
 
 
 class AroundSelection(DistanceSelection):
@@ -256,31 +365,25 @@ class AroundSelection(DistanceSelection):
         self.cutoff = float(tokens.popleft())
         self.sel = parser.parse_expression(self.precedence)
 
-    def _apply_KDTree(self, group):
-        """KDTree based selection is about 7x faster than distmat
-        for typical problems.
-        Limitations: always ignores periodicity
-        """
+    def _apply_nsgrid(self, group):
         sel = self.sel.apply(group)
         # All atoms in group that aren't in sel
         sys = group[~np.in1d(group.indices, sel.indices)]
 
-        kdtree = KDTree(dim=3, bucket_size=10)
-        kdtree.set_coords(sys.positions)
-        found_indices = []
-        for atom in sel.positions:
-            kdtree.search(atom, self.cutoff)
-            found_indices.append(kdtree.get_indices())
+        if not sys or not sel:
+            return sys[[]]
+
+        pairs = self._search(self.cutoff, sel.positions, sys.positions,
+                             group, (sel.ix, sys.ix)).get_pairs()
         # These are the indices from SYS that were seen when
         # probing with SEL
-        unique_idx = np.unique(np.concatenate(found_indices))
-        return sys[unique_idx.astype(np.int32)].unique
+        return sys[np.unique(pairs[:, 1])].unique
 
     def _apply_distmat(self, group):
         sel = self.sel.apply(group)
         sys = group[~np.in1d(group.indices, sel.indices)]
 
-        box = group.dimensions if self.periodic else None
+        box = self._get_box(group)
         dist = distances.distance_array(
             sys.positions, sel.positions, box)
 
@@ -292,6 +395,8 @@ class AroundSelection(DistanceSelection):
 class SphericalLayerSelection(DistanceSelection):
     token = 'sphlayer'
     precedence = 1
+    # a single distance array row is cheaper than building a grid
+    _nsgrid_is_faster = False
 
     def __init__(self, parser, tokens):
         super(SphericalLayerSelection, self).__init__()
@@ -299,27 +404,21 @@ class SphericalLayerSelection(DistanceSelection):
         self.exRadius = float(tokens.popleft())
         self.sel = parser.parse_expression(self.precedence)
 
-    def _apply_KDTree(self, group):
-        """Selection using KDTree but periodic = True not supported.
-        """
+    def _apply_nsgrid(self, group):
         sel = self.sel.apply(group)
-        ref = sel.center_of_geometry()
-
-        kdtree = KDTree(dim=3, bucket_size=10)
-        kdtree.set_coords(group.positions)
+        ref = sel.center_of_geometry().reshape(1, 3)
 
-        kdtree.search(ref, self.exRadius)
-        found_ExtIndices = kdtree.get_indices()
-        kdtree.search(ref, self.inRadius)
-        found_IntIndices = kdtree.get_indices()
-        found_indices = list(set(found_ExtIndices) - set(found_IntIndices))
-        return group[found_indices].unique
+        results = self._search(self.exRadius, ref, group.positions,
+                               group, (group.ix,))
+        d = results.get_pair_distances()
+        mask = (d < self.exRadius) & (d > self.inRadius)
+        return group[results.get_pairs()[mask, 1]].unique
 
     def _apply_distmat(self, group):
         sel = self.sel.apply(group)
         ref = sel.center_of_geometry().reshape(1, 3).astype(np.float32)
 
-        box = group.dimensions if self.periodic else None
+        box = self._get_box(group)
         d = distances.distance_array(ref,
                                      group.positions,
                                      box=box)[0]
@@ -332,31 +431,28 @@ class SphericalLayerSelection(DistanceSelection):
 class SphericalZoneSelection(DistanceSelection):
     token = 'sphzone'
     precedence = 1
+    # a single distance array row is cheaper than building a grid
+    _nsgrid_is_faster = False
 
     def __init__(self, parser, tokens):
         super(SphericalZoneSelection, self).__init__()
         self.cutoff = float(tokens.popleft())
         self.sel = parser.parse_expression(self.precedence)
 
-    def _apply_KDTree(self, group):
-        """Selection using KDTree but periodic = True not supported.
-        (KDTree routine is ca 15% slower than the distance matrix one)
-        """
+    def _apply_nsgrid(self, group):
         sel = self.sel.apply(group)
-        ref = sel.center_of_geometry()
-
-        kdtree = KDTree(dim=3, bucket_size=10)
-        kdtree.set_coords(group.positions)
-        kdtree.search(ref, self.cutoff)
-        found_indices = kdtree.get_indices()
+        ref = sel.center_of_geometry().reshape(1, 3)
 
-        return group[found_indices].unique
+        results = self._search(self.cutoff, ref, group.positions,
+                               group, (group.ix,))
+        mask = results.get_pair_distances() < self.cutoff
+        return group[results.get_pairs()[mask, 1]].unique
 
     def _apply_distmat(self, group):
         sel = self.sel.apply(group)
         ref = sel.center_of_geometry().reshape(1, 3).astype(np.float32)
 
-        box = group.dimensions if self.periodic else None
+        box = self._get_box(group)
         d = distances.distance_array(ref,
                                      group.positions,
                                      box=box)[0]
@@ -365,6 +461,9 @@ class SphericalZoneSelection(DistanceSelection):
 
 
 class CylindricalSelection(Selection):
+    is_static = False
+    is_filter = False
+
     def __init__(self):
         self.periodic = flags['use_periodic_selections']
 
@@ -452,6 +551,9 @@ class CylindricalLayerSelection(CylindricalSelection):
 
 class PointSelection(DistanceSelection):
     token = 'point'
+    is_filter = True
+    # a single distance array row is cheaper than building a grid
+    _nsgrid_is_faster = False
 
     def __init__(self, parser, tokens):
         super(PointSelection, self).__init__()
@@ -461,19 +563,17 @@ class PointSelection(DistanceSelection):
         self.ref = np.array([x, y, z])
         self.cutoff = float(tokens.popleft())
 
-    def _apply_KDTree(self, group):
-        kdtree = KDTree(dim=3, bucket_size=10)
-        kdtree.set_coords(group.positions)
-        kdtree.search(self.ref, self.cutoff)
-        found_indices = kdtree.get_indices()
-
-        return group[found_indices].unique
+    def _apply_nsgrid(self, group):
+        pairs = self._search(self.cutoff, self.ref[np.newaxis, ...],
+                             group.positions, group,
+                             (group.ix,)).get_pairs()
+        return group[pairs[:, 1]].unique
 
     def _apply_distmat(self, group):
         ref_coor = self.ref[np.newaxis, ...]
 
         ref_coor = np.asarray(ref_coor, dtype=np.float32)
-        box = group.dimensions if self.periodic else None
+        box = self._get_box(group)
 
         dist = distances.distance_array(group.positions, ref_coor, box)
         mask = (dist <= self.cutoff).any(axis=1)
@@ -500,31 +600,26 @@ class AtomSelection(Selection):
 class BondedSelection(Selection):
     token = 'bonded'
     precedence = 1
+    is_filter = False
 
     def __init__(self, parser, tokens):
         self.sel = parser.parse_expression(self.precedence)
 
+    @property
+    def is_static(self):
+        return self.sel.is_static
+
     def apply(self, group):
         grp = self.sel.apply(group)
+        bondattr = group.universe._topology.bonds
         # Check if we have bonds
-        if not group.bonds:
+        if not len(bondattr._terms_of(group.ix)):
             warnings.warn("Bonded selection has 0 bonds")
             return group[[]]
 
-        grpidx = grp.indices
-
-        # (n, 2) array of bond indices
-        bix = np.array(group.bonds.to_indices())
+        idx = bondattr._bonded_indices(grp.ix)
 
-        idx = []
-        # left side
-        idx.append(bix[:, 0][np.in1d(bix[:, 1], grpidx)])
-        # right side
-        idx.append(bix[:, 1][np.in1d(bix[:, 0], grpidx)])
-
-        idx = np.union1d(*idx)
-
-        return group.universe.atoms[np.unique(idx)]
+        return group.universe.atoms[idx]
 
 
 class SelgroupSelection(Selection):
@@ -541,6 +636,11 @@ class SelgroupSelection(Selection):
         except KeyError:
             raise ValueError("Failed to find group: {0}".format(grpname))
 
+    @property
+    def is_static(self):
+        # UpdatingAtomGroups change from frame to frame
+        return not hasattr(self.grp, 'update_selection')
+
     def apply(self, group):
         mask = np.in1d(group.indices, self.grp.indices)
         return group[mask]
@@ -548,6 +648,7 @@ class SelgroupSelection(Selection):
 
 class FullSelgroupSelection(Selection):
     token = 'fullgroup'
+    is_filter = False
 
     def __init__(self, parser, tokens):
         grpname = tokens.popleft()
@@ -556,6 +657,10 @@ class FullSelgroupSelection(Selection):
         except KeyError:
             raise ValueError("Failed to find group: {0}".format(grpname))
 
+    @property
+    def is_static(self):
+        return not hasattr(self.grp, 'update_selection')
+
     @deprecate(old_name='fullgroup', new_name='global group',
                message=' This will be removed in v0.15.0')
     def apply(self, group):
@@ -575,15 +680,7 @@ class StringSelection(Selection):
         self.values = vals
 
     def apply(self, group):
-        mask = np.zeros(len(group), dtype=np.bool)
-        for val in self.values:
-            wc_pos = val.find('*')
-            if wc_pos == -1:  # No wildcard found
-                mask |= getattr(group, self.field) == val
-            else:
-                values = getattr(group, self.field).astype(np.str_)
-                mask |= np.char.startswith(values, val[:wc_pos])
-
+        mask = _match_strings(group, self.field, self.values)
         return group[mask].unique
 
 
@@ -859,7 +956,7 @@ class ProteinSelection(Selection):
         pass
 
     def apply(self, group):
-        mask = np.in1d(group.resnames, self.prot_res)
+        mask = _match_strings(group, 'resnames', self.prot_res)
         return group[mask].unique
 
 
@@ -891,7 +988,7 @@ class NucleicSelection(Selection):
         pass
 
     def apply(self, group):
-        mask = np.in1d(group.resnames, self.nucl_res)
+        mask = _match_strings(group, 'resnames', self.nucl_res)
         return group[mask].unique
 
 
@@ -905,8 +1002,8 @@ class BackboneSelection(ProteinSelection):
     bb_atoms = np.array(['N', 'CA', 'C', 'O'])
 
     def apply(self, group):
-        mask = np.in1d(group.names, self.bb_atoms)
-        mask &= np.in1d(group.resnames, self.prot_res)
+        mask = _match_strings(group, 'names', self.bb_atoms)
+        mask &= _match_strings(group, 'resnames', self.prot_res)
         return group[mask].unique
 
 
@@ -920,8 +1017,8 @@ class NucleicBackboneSelection(NucleicSelection):
     bb_atoms = np.array(["P", "C5'", "C3'", "O3'", "O5'"])
 
     def apply(self, group):
-        mask = np.in1d(group.names, self.bb_atoms)
-        mask &= np.in1d(group.resnames, self.nucl_res)
+        mask = _match_strings(group, 'names', self.bb_atoms)
+        mask &= _match_strings(group, 'resnames', self.nucl_res)
         return group[mask].unique
 
 
@@ -940,8 +1037,8 @@ class BaseSelection(NucleicSelection):
         'O2', 'N4', 'O4', 'C5M'])
 
     def apply(self, group):
-        mask = np.in1d(group.names, self.base_atoms)
-        mask &= np.in1d(group.resnames, self.nucl_res)
+        mask = _match_strings(group, 'names', self.base_atoms)
+        mask &= _match_strings(group, 'resnames', self.nucl_res)
         return group[mask].unique
 
 
@@ -952,8 +1049,8 @@ class NucleicSugarSelection(NucleicSelection):
     sug_atoms = np.array(["C1'", "C2'", "C3'", "C4'", "O4'"])
 
     def apply(self, group):
-        mask = np.in1d(group.names, self.sug_atoms)
-        mask &= np.in1d(group.resnames, self.nucl_res)
+        mask = _match_strings(group, 'names', self.sug_atoms)
+        mask &= _match_strings(group, 'resnames', self.nucl_res)
         return group[mask].unique
 
 
@@ -1043,6 +1140,10 @@ class PropertySelection(Selection):
                 "".format(oper, self.ops.keys()))
         self.value = float(value)
 
+    @property
+    def is_static(self):
+        return self.prop not in ('x', 'y', 'z')
+
     def apply(self, group):
         try:
             col = {'x': 0, 'y': 1, 'z': 2}[self.prop]
@@ -1068,6 +1169,7 @@ class PropertySelection(Selection):
 class SameSelection(Selection):
     token = 'same'
     precedence = 1
+    is_filter = False
 
     prop_trans = {
         'fragment': None,
@@ -1099,6 +1201,10 @@ class SameSelection(Selection):
         self.sel = parser.parse_expression(self.precedence)
         self.prop = prop
 
+    @property
+    def is_static(self):
+        return self.prop not in ('x', 'y', 'z') and self.sel.is_static
+
     def apply(self, group):
         res = self.sel.apply(group)
         if not res:
@@ -1106,11 +1212,8 @@ class SameSelection(Selection):
 
         # Fragment must come before self.prop_trans lookups!
         if self.prop == 'fragment':
-            # Combine all fragments together, then check where group
-            # indices are same as fragment(s) indices
-            allfrags = functools.reduce(lambda x, y: x + y, res.fragments)
-
-            mask = np.in1d(group.indices, allfrags.indices)
+            # check where group atoms are in the same fragment(s)
+            mask = np.in1d(group.fragindices, res.fragindices)
             return group[mask].unique
         # [xyz] must come before self.prop_trans lookups too!
         try:
@@ -1120,8 +1223,15 @@ class SameSelection(Selection):
             # so don't need error checking here.
             # KeyError at this point is impossible!
             attrname = self.prop_trans[self.prop]
-            vals = getattr(res, attrname)
-            mask = np.in1d(getattr(group, attrname), vals)
+            attr = getattr(group.universe._topology, attrname, None)
+            if hasattr(attr, 'get_atom_codes'):
+                # compare the codes of categorical attributes
+                found = np.zeros(len(attr.vocabulary), dtype=bool)
+                found[attr.get_atom_codes(res)] = True
+                mask = found[attr.get_atom_codes(group)]
+            else:
+                vals = getattr(res, attrname)
+                mask = np.in1d(getattr(group, attrname), vals)
 
             return group[mask].unique
         else:
@@ -1229,3 +1339,183 @@ class SelectionParser(object):
 
 # The module level instance
 Parser = SelectionParser()
+
+
+class _StaticSelection(Selection):
+    """Wraps a static selection and reuses its last result
+
+    The result is reused while the selection is applied to the same atoms
+    and the topology has not changed since.  The results are kept for every
+    thread separately and keyed by weak references to the topologies, so
+    that threads applying the same selection don't see each other's results
+    and cached selections don't keep Universes alive.
+    """
+    is_static = True
+
+    def __init__(self, sel):
+        self.sel = sel
+        self.is_filter = sel.is_filter
+        self._local = threading.local()
+
+    def __getstate__(self):
+        return {'sel': self.sel, 'is_filter': self.is_filter}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def apply(self, group):
+        top = group.universe._topology
+        try:
+            results = self._local.results
+        except AttributeError:
+            results = self._local.results = weakref.WeakKeyDictionary()
+        last = results.get(top)
+        if not (last is not None and last[0] == top._version and
+                np.array_equal(group.ix, last[1])):
+            result = self.sel.apply(group)
+            # selections returning the group itself (e.g. "all" applied to
+            # Universe.atoms) keep doing so
+            last = (top._version, group.ix, result.ix, result is group)
+            results[top] = last
+        if last[3]:
+            return group
+        return group.universe.atoms[last[2]]
+
+
+def _use_skin(sel, skin):
+    """Make all distance searches in *sel* keep a Verlet list with *skin*"""
+    if isinstance(sel, DistanceSelection):
+        sel._set_skin(skin)
+    for attr in ('sel', 'lsel', 'rsel'):
+        child = getattr(sel, attr, None)
+        if isinstance(child, (Selection, LogicOperation)):
+            _use_skin(child, skin)
+
+
+def _cache_static(sel):
+    """Wrap the largest static subtrees of *sel* in :class:`_StaticSelection`"""
+    if sel.is_static:
+        return _StaticSelection(sel)
+    for attr in ('sel', 'lsel', 'rsel'):
+        child = getattr(sel, attr, None)
+        if isinstance(child, (Selection, LogicOperation)):
+            setattr(sel, attr, _cache_static(child))
+    return sel
+
+
+class CompiledSelection(object):
+    """A selection string parsed into a tree of :class:`Selection` objects
+
+    The static parts of the selection, which only depend on the topology,
+    remember their result for the group they were last applied to until
+    the topology changes.  Applying the same :class:`CompiledSelection` to
+    the same group for every frame of a trajectory therefore only
+    evaluates the parts depending on coordinates.
+
+    Parameters
+    ----------
+    selectstr : str
+        The string that describes the selection
+    selgroups : dict, optional
+        AtomGroups to be used in `group` selections
+    skin : float, optional
+        If given, the distance based selections (``around``, ``sphzone``,
+        ``sphlayer`` and ``point``) keep the atom pairs within their cutoff
+        plus `skin` and only search again once the atoms have moved further
+        than `skin` (see :class:`~MDAnalysis.lib.nsgrid.VerletNS`).  This is
+        worthwhile when the selection is applied to the same group for
+        consecutive frames.
+
+    Raises
+    ------
+    SelectionError
+        If the selection string can not be parsed.
+
+    Example
+    -------
+    Select the water oxygens near a protein for every frame::
+
+        sel = compile_selection('name OW and around 3.5 protein')
+        for ts in u.trajectory:
+            shell = sel.apply(u.atoms)
+
+
+    .. versionadded:: 0.17.0
+    """
+    def __init__(self, selectstr, selgroups=None, skin=None):
+        self.selectstr = selectstr
+        self.skin = skin
+        # a parser of its own, as the parser keeps the state of the parse
+        tree = SelectionParser().parse(selectstr,
+                                       {} if selgroups is None else selgroups)
+        if skin is not None:
+            _use_skin(tree, skin)
+        self._tree = _cache_static(tree)
+
+    @property
+    def is_static(self):
+        """``True`` if the selection does not depend on coordinates"""
+        return self._tree.is_static
+
+    def apply(self, group):
+        """Apply the selection to *group*
+
+        Returns
+        -------
+        AtomGroup
+            The selected atoms, sorted and without duplicates
+        """
+        return self._tree.apply(group)
+
+    def __repr__(self):
+        return "<CompiledSelection '{0}'>".format(self.selectstr)
+
+
+#: Maximum number of selections kept by :func:`compile_selection`
+COMPILED_CACHE_SIZE = 128
+_COMPILED = collections.OrderedDict()
+_COMPILED_LOCK = threading.Lock()
+
+
+def compile_selection(selectstr, selgroups=None):
+    """Return the :class:`CompiledSelection` of a selection string
+
+    The most recently used selections are kept, keyed by the selection
+    string and the selection flags, so that a string is only parsed the
+    first time it is used.  Selections using `selgroups` hold on to their
+    AtomGroups and are therefore compiled anew every time.
+
+    Parameters
+    ----------
+    selectstr : str
+        The string that describes the selection
+    selgroups : dict, optional
+        AtomGroups to be used in `group` selections
+
+    Returns
+    -------
+    CompiledSelection
+
+
+    .. versionadded:: 0.17.0
+    """
+    if selgroups:
+        return CompiledSelection(selectstr, selgroups)
+    key = (selectstr,
+           flags['use_KDTree_routines'], flags['use_periodic_selections'])
+    with _COMPILED_LOCK:
+        try:
+            compiled = _COMPILED.pop(key)
+        except KeyError:
+            compiled = None
+        else:
+            _COMPILED[key] = compiled
+    if compiled is None:
+        # parse outside of the lock, another thread may do the same
+        compiled = CompiledSelection(selectstr)
+        with _COMPILED_LOCK:
+            while len(_COMPILED) >= COMPILED_CACHE_SIZE:
+                _COMPILED.popitem(last=False)
+            compiled = _COMPILED.setdefault(key, compiled)
+    return compiled
@@ -138,6 +138,29 @@ def make_downshift_arrays(upshift, nparents):
     return np.array(downshift, dtype=object)
 
 
+def _make_downshift_csr(upshift, nparents):
+    """Children of all parents in one array, sorted by parent.
+
+    Returns ``order, starts``, the children of parent ``i`` are
+    ``order[starts[i]:starts[i + 1]]``.
+    """
+    order = np.argsort(upshift, kind='mergesort').astype(np.intp)
+    starts = np.zeros(nparents + 1, dtype=np.intp)
+    np.cumsum(np.bincount(upshift, minlength=nparents), out=starts[1:])
+    return order, starts
+
+
+def _downshift_csr_children(csr, parents):
+    """Children of each of `parents` concatenated, and their number."""
+    order, starts = csr
+    first = starts[parents]
+    counts = starts[parents + 1] - first
+    ends = np.cumsum(counts)
+    pos = np.arange(ends[-1] if len(ends) else 0, dtype=np.intp)
+    pos += np.repeat(first - ends + counts, counts)
+    return order[pos], counts
+
+
 class TransTable(object):
     """Membership tables with methods to translate indices across levels.
 
@@ -225,6 +248,8 @@ class TransTable(object):
             if not len(self._RS) == n_residues:
                 raise ValueError("residue_segindex must be len n_residues")
         self._SR = make_downshift_arrays(self._RS, n_segments)
+        self._RA_csr = None
+        self._SR_csr = None
 
     @property
     def size(self):
@@ -399,16 +424,35 @@ class TransTable(object):
         rixs = self.segments2residues_2d(six)
         return [self.residues2atoms_1d(rix) for rix in rixs]
 
+    def _residues2atoms_counts(self, rix):
+        """Atom indices of all residues `rix` and the number of atoms of each
+
+        Unlike :meth:`residues2atoms_1d` no Python loop over the residues
+        is needed, `rix` must be an array.
+        """
+        if self._RA_csr is None:
+            self._RA_csr = _make_downshift_csr(self._AR, self.n_residues)
+        return _downshift_csr_children(self._RA_csr, rix)
+
+    def _segments2residues_counts(self, six):
+        """Residue indices of all segments `six` and the number of residues
+        of each"""
+        if self._SR_csr is None:
+            self._SR_csr = _make_downshift_csr(self._RS, self.n_segments)
+        return _downshift_csr_children(self._SR_csr, six)
+
     # Move between different groups.
     def move_atom(self, aix, rix):
         """Move aix to be in rix"""
         self._AR[aix] = rix
         self._RA = make_downshift_arrays(self._AR, self.n_residues)
+        self._RA_csr = None
 
     def move_residue(self, rix, six):
         """Move rix to be in six"""
         self._RS[rix] = six
         self._SR = make_downshift_arrays(self._RS, self.n_segments)
+        self._SR_csr = None
 
     def add_Residue(self, segidx):
         # segidx - index of parent
@@ -416,6 +460,7 @@ class TransTable(object):
         self._RA = make_downshift_arrays(self._AR, self.n_residues)
         self._RS = np.concatenate([self._RS, np.array([segidx])])
         self._SR = make_downshift_arrays(self._RS, self.n_segments)
+        self._RA_csr = self._SR_csr = None
 
         return self.n_residues - 1
 
@@ -423,6 +468,7 @@ class TransTable(object):
         self.n_segments += 1
         # self._RS remains the same, no residues point to the new segment yet
         self._SR = make_downshift_arrays(self._RS, self.n_segments)
+        self._SR_csr = None
 
         return self.n_segments - 1
 
@@ -468,6 +514,10 @@ class Topology(object):
         # add core TopologyAttrs that give access to indices
         attrs.extend((Atomindices(), Resindices(), Segindices()))
 
+        # incremented with every change, so that cached selections can
+        # tell when they are out of date
+        self._version = 0
+
         # attach the TopologyAttrs
         self.attrs = []
         for topologyattr in attrs:
@@ -496,6 +546,7 @@ class Topology(object):
         self.attrs.append(topologyattr)
         topologyattr.top = self
         self.__setattr__(topologyattr.attrname, topologyattr)
+        self._version += 1
 
     @property
     def guessed_attributes(self):
@@ -531,6 +582,7 @@ class Topology(object):
 
         # Resize topology table
         residx = self.tt.add_Residue(segment.segindex)
+        self._version += 1
 
         # Add new value to each attribute
         for attr in self.attrs:
@@ -553,6 +605,7 @@ class Topology(object):
                                       "".format(', '.join(missing)))
 
         segidx = self.tt.add_Segment()
+        self._version += 1
 
         for attr in self.attrs:
             if not attr.per_object == 'segment':
@@ -46,7 +46,8 @@ import warnings
 from numpy.lib.utils import deprecate
 
 from . import flags
-from ..lib.util import cached, convert_aa_code, iterable
+from ..lib.util import (cached, convert_aa_code, iterable, unique_rows,
+                        factorize)
 from ..lib import transformations, mdamath
 from ..exceptions import NoDataError, SelectionError
 from .topologyobjects import TopologyGroup
@@ -114,6 +115,33 @@ def _check_length(func):
     return wrapper
 
 
+def _residue_sums(tt, values, rix):
+    """sum of the per atom `values` over the atoms of each residue `rix` of
+    the TransTable `tt`"""
+    ures, inverse = np.unique(rix, return_inverse=True)
+    aix, counts = tt._residues2atoms_counts(ures)
+    sums = np.bincount(np.repeat(np.arange(len(ures)), counts),
+                       weights=values[aix], minlength=len(ures))
+    return sums[inverse]
+
+
+def _segment_sums(tt, values, six):
+    """sum of the per atom `values` over the atoms of each segment `six` of
+    the TransTable `tt`"""
+    useg, inverse = np.unique(six, return_inverse=True)
+    rix, counts = tt._segments2residues_counts(useg)
+    sums = np.bincount(np.repeat(np.arange(len(useg)), counts),
+                       weights=_residue_sums(tt, values, rix),
+                       minlength=len(useg))
+    return sums[inverse]
+
+
+def _compound_sums(atoms, values, compound):
+    """sum of the per atom `values` of `atoms` over each compound"""
+    order, starts = atoms._compound_split(compound)
+    return np.add.reduceat(np.asarray(values)[order], starts)
+
+
 def _wronglevel_error(attr, group):
     """Generate an error for setting attr at wrong level
 
@@ -195,6 +223,61 @@ class TopologyAttr(object):
         self.values = values
         self._guessed = guessed
 
+    def __setattr__(self, name, value):
+        super(TopologyAttr, self).__setattr__(name, value)
+        if name == 'values':
+            self._changed()
+
+    def _changed(self):
+        """Tell the Topology that the values of this attribute changed"""
+        if self.top is not None:
+            self.top._version += 1
+
+    @classmethod
+    def from_loader(cls, loader, guessed=False):
+        """Create a TopologyAttr whose contents are read on first use
+
+        Parsers use this for expensive sections of a topology file.  Nothing
+        is read until an attribute of the TopologyAttr other than its class
+        level information (``attrname``, ``per_object``...) is needed, at
+        which point ``loader()`` is called once.
+
+        Parameters
+        ----------
+        loader : callable
+            called without arguments, returns the fully built TopologyAttr
+            of the same class
+        guessed : bool, optional
+            the guessed state reported before the values are loaded
+
+
+        .. versionadded:: 0.17.0
+        """
+        attr = cls.__new__(cls)
+        attr._loader = loader
+        attr._guessed = guessed
+        return attr
+
+    def __getattr__(self, name):
+        # only reached for attributes missing from the instance, which is
+        # everything but the loader while a lazy TopologyAttr is unloaded
+        if name.startswith('__') or '_loader' not in self.__dict__:
+            raise AttributeError("'{0}' object has no attribute '{1}'"
+                                 "".format(type(self).__name__, name))
+        self._load()
+        return getattr(self, name)
+
+    def _load(self):
+        """Replace the contents of a lazy TopologyAttr by the loaded ones"""
+        loader = self.__dict__.pop('_loader', None)
+        if loader is not None:
+            self.__dict__.update(loader().__dict__)
+
+    def __getstate__(self):
+        # pickles and copies get the values, never the loader
+        self._load()
+        return self.__dict__
+
     def __len__(self):
         """Length of the TopologyAttr at its intrinsic level."""
         return len(self.values)
@@ -209,6 +292,7 @@ class TopologyAttr(object):
             return self.get_segments(group)
 
     def __setitem__(self, group, values):
+        self._changed()
         if isinstance(group, (Atom, AtomGroup)):
             return self.set_atoms(group, values)
         elif isinstance(group, (Residue, ResidueGroup)):
@@ -221,6 +305,14 @@ class TopologyAttr(object):
         """Bool of if the source of this information is a guess"""
         return self._guessed
 
+    def _get_values(self, ix):
+        """Values at the indices `ix` of this attribute's own level"""
+        return self.values[ix]
+
+    def _set_values(self, ix, values):
+        """Set the values at the indices `ix` of this attribute's level"""
+        self.values[ix] = values
+
     def get_atoms(self, ag):
         """Get atom attributes for a given AtomGroup"""
         raise NoDataError
@@ -246,6 +338,128 @@ class TopologyAttr(object):
         raise NotImplementedError
 
 
+class _CategoricalValues(np.ndarray):
+    """Decoded values of a :class:`_CategoricalAttr`
+
+    Item assignment is passed on to the codes of the attribute, so that
+    ``attr.values[ix] = value`` changes the attribute like it did when the
+    values were a plain array.  Slices and results of operations are plain
+    arrays that are not connected to the attribute.
+
+
+    .. versionadded:: 0.17.0
+    """
+    def __new__(cls, attr):
+        values = attr._vocabulary[attr._codes].view(cls)
+        values._attr = attr
+        return values
+
+    def __array_finalize__(self, obj):
+        self._attr = None
+
+    def __array_wrap__(self, obj, context=None, return_scalar=False):
+        obj = obj.view(np.ndarray)
+        return obj[()] if return_scalar else obj
+
+    def __getitem__(self, key):
+        item = super(_CategoricalValues, self).__getitem__(key)
+        if isinstance(item, _CategoricalValues):
+            item = item.view(np.ndarray)
+        return item
+
+    def __setitem__(self, key, value):
+        if self._attr is not None:
+            self._attr._set_values(key, value)
+            self._attr._changed()
+        super(_CategoricalValues, self).__setitem__(key, value)
+
+    def __reduce__(self):
+        return np.asarray(self).__reduce__()
+
+
+class _CategoricalAttr(object):
+    """Mixin storing the values of a TopologyAttr as categorical codes
+
+    Names, types, resnames and segids take few distinct values.  They are
+    stored as an int32 array of codes into a vocabulary of the distinct
+    values; ``values`` is still available as an array (writing to it
+    changes the codes) and the groups get arrays of the values as before.
+
+    Comparisons with strings are done once against the vocabulary, see
+    :meth:`match` and :meth:`get_atom_codes`.  The vocabulary only grows:
+    values that are no longer used keep their code.
+
+    Must come before the level base class (:class:`AtomAttr`...) in the
+    bases of a TopologyAttr.
+
+
+    .. versionadded:: 0.17.0
+    """
+    @property
+    def values(self):
+        return _CategoricalValues(self)
+
+    @values.setter
+    def values(self, values):
+        self._vocabulary, self._codes = factorize(values)
+        self._lookup = {value: code for code, value
+                        in enumerate(self._vocabulary)}
+
+    @property
+    def vocabulary(self):
+        """Array of the distinct values, indexed by the codes"""
+        return self._vocabulary
+
+    def __len__(self):
+        return len(self._codes)
+
+    def _code_of(self, value):
+        """Code of `value`, added to the vocabulary if it is new"""
+        try:
+            return self._lookup[value]
+        except KeyError:
+            code = self._lookup[value] = len(self._vocabulary)
+            self._vocabulary = np.append(self._vocabulary, [value])
+            return code
+
+    def _get_values(self, ix):
+        return self._vocabulary[self._codes[ix]]
+
+    def _set_values(self, ix, values):
+        vocabulary, codes = factorize(values)
+        if vocabulary.dtype.kind != self._vocabulary.dtype.kind:
+            self._vocabulary = self._vocabulary.astype(object)
+        remap = np.array([self._code_of(value) for value in vocabulary],
+                         dtype=np.int32)
+        self._codes[ix] = remap[codes]
+
+    def get_atom_codes(self, ag):
+        """Codes of the values of every atom in AtomGroup `ag`"""
+        return self._codes[self._ix_of_atoms(ag._ix)]
+
+    def match(self, patterns):
+        """Which entries of the vocabulary match any of `patterns`
+
+        A pattern matches equal values or, if it contains a ``*``, all
+        values starting with the text before the ``*``.
+
+        Returns
+        -------
+        numpy.ndarray
+            boolean mask over :attr:`vocabulary`; index it with the codes
+            of a group to get the matching atoms
+        """
+        mask = np.zeros(len(self._vocabulary), dtype=bool)
+        for pattern in patterns:
+            wc_pos = pattern.find('*')
+            if wc_pos == -1:  # No wildcard found
+                mask |= self._vocabulary == pattern
+            else:
+                mask |= np.char.startswith(
+                    self._vocabulary.astype(np.str_), pattern[:wc_pos])
+        return mask
+
+
 # core attributes
 
 class Atomindices(TopologyAttr):
@@ -355,12 +569,15 @@ class AtomAttr(TopologyAttr):
     singular = 'atomattr'
     target_classes = [Atom]
 
+    def _ix_of_atoms(self, aix):
+        return aix
+
     def get_atoms(self, ag):
-        return self.values[ag._ix]
+        return self._get_values(ag._ix)
 
     @_check_length
     def set_atoms(self, ag, values):
-        self.values[ag._ix] = values
+        self._set_values(ag._ix, values)
 
     def get_residues(self, rg):
         """By default, the values for each atom present in the set of residues
@@ -369,7 +586,7 @@ class AtomAttr(TopologyAttr):
 
         """
         aixs = self.top.tt.residues2atoms_2d(rg._ix)
-        return [self.values[aix] for aix in aixs]
+        return [self._get_values(aix) for aix in aixs]
 
     def set_residues(self, rg, values):
         raise _wronglevel_error(self, rg)
@@ -381,7 +598,7 @@ class AtomAttr(TopologyAttr):
 
         """
         aixs = self.top.tt.segments2atoms_2d(sg._ix)
-        return [self.values[aix] for aix in aixs]
+        return [self._get_values(aix) for aix in aixs]
 
     def set_segments(self, sg, values):
         raise _wronglevel_error(self, sg)
@@ -397,7 +614,7 @@ class Atomids(AtomAttr):
 
 
 # TODO: update docs to property doc
-class Atomnames(AtomAttr):
+class Atomnames(_CategoricalAttr, AtomAttr):
     """Name for each atom.
     """
     attrname = 'names'
@@ -558,7 +775,7 @@ class Atomnames(AtomAttr):
 
 
 # TODO: update docs to property doc
-class Atomtypes(AtomAttr):
+class Atomtypes(_CategoricalAttr, AtomAttr):
     """Type for each atom"""
     attrname = 'types'
     singular = 'type'
@@ -566,7 +783,7 @@ class Atomtypes(AtomAttr):
 
 
 # TODO: update docs to property doc
-class Elements(AtomAttr):
+class Elements(_CategoricalAttr, AtomAttr):
     """Element for each atom"""
     attrname = 'elements'
     singular = 'element'
@@ -580,7 +797,7 @@ class Radii(AtomAttr):
     per_object = 'atom'
 
 
-class ChainIDs(AtomAttr):
+class ChainIDs(_CategoricalAttr, AtomAttr):
     """ChainID per atom
 
     Note
@@ -621,32 +838,22 @@ class Masses(AtomAttr):
         self._guessed = guessed
 
     def get_residues(self, rg):
-        resatoms = self.top.tt.residues2atoms_2d(rg._ix)
-
         if isinstance(rg._ix, numbers.Integral):
             # for a single residue
-            masses = self.values[resatoms].sum()
-        else:
-            # for a residuegroup
-            masses = np.empty(len(rg))
-            for i, row in enumerate(resatoms):
-                masses[i] = self.values[row].sum()
-
-        return masses
+            resatoms = self.top.tt.residues2atoms_1d(rg._ix)
+            return self.values[resatoms].sum()
+        # for a residuegroup, summed for all residues at once
+        return _residue_sums(self.top.tt, self.values, rg._ix)
 
     def get_segments(self, sg):
-        segatoms = self.top.tt.segments2atoms_2d(sg._ix)
-
         if isinstance(sg._ix, numbers.Integral):
             # for a single segment
-            masses = self.values[segatoms].sum()
-        else:
-            # for a segmentgroup
-            masses = np.array([self.values[row].sum() for row in segatoms])
-
-        return masses
+            segatoms = self.top.tt.segments2atoms_1d([sg._ix])
+            return self.values[segatoms].sum()
+        # for a segmentgroup
+        return _segment_sums(self.top.tt, self.values, sg._ix)
 
-    def center_of_mass(group, pbc=None):
+    def center_of_mass(group, pbc=None, compound='group'):
         """Center of mass of the Group.
 
         Parameters
@@ -654,6 +861,10 @@ class Masses(AtomAttr):
         pbc : bool, optional
             If ``True``, move all atoms within the primary unit cell before
             calculation. [``False``]
+        compound : {'group', 'residues', 'segments', 'fragments'}, optional
+            calculate the center of mass of the atoms of the Group in each
+            residue, segment or fragment instead of the whole Group, see
+            :meth:`~MDAnalysis.core.groups.GroupBase.center`
 
         Returns
         -------
@@ -666,18 +877,30 @@ class Masses(AtomAttr):
             ``True`` allows the *pbc* flag to be used by default.
 
         .. versionchanged:: 0.8 Added `pbc` parameter
+        .. versionchanged:: 0.17.0 Added `compound` parameter
         """
         return group.atoms.center(weights=group.atoms.masses,
-                                  pbc=pbc)
+                                  pbc=pbc, compound=compound)
 
     transplants[GroupBase].append(
         ('center_of_mass', center_of_mass))
 
-    def total_mass(group):
+    def total_mass(group, compound='group'):
         """Total mass of the Group.
 
+        Parameters
+        ----------
+        compound : {'group', 'residues', 'segments', 'fragments'}, optional
+            If not ``'group'``, the mass of the atoms of the Group in each
+            residue, segment or fragment, ordered as in
+            :meth:`~MDAnalysis.core.groups.GroupBase.center`
+
+
+        .. versionchanged:: 0.17.0 Added `compound` parameter
         """
-        return group.masses.sum()
+        if compound.lower() == 'group':
+            return group.masses.sum()
+        return _compound_sums(group.atoms, group.atoms.masses, compound)
 
     transplants[GroupBase].append(
         ('total_mass', total_mass))
@@ -947,34 +1170,37 @@ class Charges(AtomAttr):
     transplants = defaultdict(list)
 
     def get_residues(self, rg):
-        resatoms = self.top.tt.residues2atoms_2d(rg._ix)
-
         if isinstance(rg._ix, numbers.Integral):
-            charges = self.values[resatoms].sum()
-        else:
-            charges = np.empty(len(rg))
-            for i, row in enumerate(resatoms):
-                charges[i] = self.values[row].sum()
-
-        return charges
+            # for a single residue
+            resatoms = self.top.tt.residues2atoms_1d(rg._ix)
+            return self.values[resatoms].sum()
+        # for a residuegroup, summed for all residues at once
+        return _residue_sums(self.top.tt, self.values, rg._ix)
 
     def get_segments(self, sg):
-        segatoms = self.top.tt.segments2atoms_2d(sg._ix)
-
         if isinstance(sg._ix, numbers.Integral):
             # for a single segment
-            charges = self.values[segatoms].sum()
-        else:
-            # for a segmentgroup
-            charges = np.array([self.values[row].sum() for row in segatoms])
+            segatoms = self.top.tt.segments2atoms_1d([sg._ix])
+            return self.values[segatoms].sum()
+        # for a segmentgroup
+        return _segment_sums(self.top.tt, self.values, sg._ix)
 
-        return charges
-
-    def total_charge(group):
+    def total_charge(group, compound='group'):
         """Total charge of the Group.
 
+        Parameters
+        ----------
+        compound : {'group', 'residues', 'segments', 'fragments'}, optional
+            If not ``'group'``, the charge of the atoms of the Group in each
+            residue, segment or fragment, ordered as in
+            :meth:`~MDAnalysis.core.groups.GroupBase.center`
+
+
+        .. versionchanged:: 0.17.0 Added `compound` parameter
         """
-        return group.charges.sum()
+        if compound.lower() == 'group':
+            return group.charges.sum()
+        return _compound_sums(group.atoms, group.atoms.charges, compound)
 
     transplants[GroupBase].append(
         ('total_charge', total_charge))
@@ -996,7 +1222,7 @@ class Occupancies(AtomAttr):
 
 
 # TODO: update docs to property doc
-class AltLocs(AtomAttr):
+class AltLocs(_CategoricalAttr, AtomAttr):
     """AltLocs for each atom"""
     attrname = 'altLocs'
     singular = 'altLoc'
@@ -1019,19 +1245,21 @@ class ResidueAttr(TopologyAttr):
     target_classes = [Residue]
     per_object = 'residue'
 
+    def _ix_of_atoms(self, aix):
+        return self.top.tt.atoms2residues(aix)
+
     def get_atoms(self, ag):
-        rix = self.top.tt.atoms2residues(ag._ix)
-        return self.values[rix]
+        return self._get_values(self._ix_of_atoms(ag._ix))
 
     def set_atoms(self, ag, values):
         raise _wronglevel_error(self, ag)
 
     def get_residues(self, rg):
-        return self.values[rg._ix]
+        return self._get_values(rg._ix)
 
     @_check_length
     def set_residues(self, rg, values):
-        self.values[rg._ix] = values
+        self._set_values(rg._ix, values)
 
     def get_segments(self, sg):
         """By default, the values for each residue present in the set of
@@ -1040,7 +1268,7 @@ class ResidueAttr(TopologyAttr):
 
         """
         rixs = self.top.tt.segments2residues_2d(sg._ix)
-        return [self.values[rix] for rix in rixs]
+        return [self._get_values(rix) for rix in rixs]
 
     def set_segments(self, sg, values):
         raise _wronglevel_error(self, sg)
@@ -1055,7 +1283,7 @@ class Resids(ResidueAttr):
 
 
 # TODO: update docs to property doc
-class Resnames(ResidueAttr):
+class Resnames(_CategoricalAttr, ResidueAttr):
     attrname = 'resnames'
     singular = 'resname'
     target_classes = [Atom, Residue]
@@ -1219,13 +1447,13 @@ class Resnums(ResidueAttr):
     target_classes = [Atom, Residue]
 
 
-class ICodes(ResidueAttr):
+class ICodes(_CategoricalAttr, ResidueAttr):
     """Insertion code for Atoms"""
     attrname = 'icodes'
     singular = 'icode'
 
 
-class Moltypes(ResidueAttr):
+class Moltypes(_CategoricalAttr, ResidueAttr):
     """Name of the molecule type
 
     Two molecules that share a molecule type share a common template topology.
@@ -1246,30 +1474,32 @@ class SegmentAttr(TopologyAttr):
     target_classes = [Segment]
     per_object = 'segment'
 
+    def _ix_of_atoms(self, aix):
+        return self.top.tt.atoms2segments(aix)
+
     def get_atoms(self, ag):
-        six = self.top.tt.atoms2segments(ag._ix)
-        return self.values[six]
+        return self._get_values(self._ix_of_atoms(ag._ix))
 
     def set_atoms(self, ag, values):
         raise _wronglevel_error(self, ag)
 
     def get_residues(self, rg):
         six = self.top.tt.residues2segments(rg._ix)
-        return self.values[six]
+        return self._get_values(six)
 
     def set_residues(self, rg, values):
         raise _wronglevel_error(self, rg)
 
     def get_segments(self, sg):
-        return self.values[sg._ix]
+        return self._get_values(sg._ix)
 
     @_check_length
     def set_segments(self, sg, values):
-        self.values[sg._ix] = values
+        self._set_values(sg._ix, values)
 
 
 # TODO: update docs to property doc
-class Segids(SegmentAttr):
+class Segids(_CategoricalAttr, SegmentAttr):
     attrname = 'segids'
     singular = 'segid'
     target_classes = [Atom, Residue, Segment]
@@ -1330,85 +1560,147 @@ class Segids(SegmentAttr):
 
 
 class _Connection(AtomAttr):
-    """Base class for connectivity between atoms"""
+    """Base class for connectivity between atoms
+
+    The terms are stored as an ``(n_terms, n_atoms)`` integer array
+    alongside arrays of their types, guessed flags and orders.  Lookups
+    by atom go through a compressed sparse row (CSR) index from each atom
+    to the terms it takes part in, which is built lazily and dropped
+    whenever terms are added.
+
+    .. versionchanged:: 0.17.0
+       Terms are stored as NumPy arrays and looked up through a CSR
+       atom to term index instead of a dict of tuples.
+    """
+    #: number of atoms in each term
+    _n_atoms = None
+
     def __init__(self, values, types=None, guessed=False, order=None):
-        self.values = list(values)
-        if types is None:
-            types = [None] * len(values)
-        self.types = types
-        if guessed in (True, False):
-            # if single value passed, multiply this across
-            # all bonds
-            guessed = [guessed] * len(values)
-        self._guessed = guessed
-        if order is None:
-            order = [None] * len(values)
-        self.order = order
+        self._bix = self._as_indices(values)
+        n = len(self._bix)
+        self.types = self._as_objects(types, n)
+        self._guessed = np.empty(n, dtype=bool)
+        self._guessed[:] = guessed
+        self.order = self._as_objects(order, n)
         self._cache = dict()
 
+    @classmethod
+    def _as_indices(cls, values):
+        """Convert a sequence of index tuples to a 2D integer array"""
+        if not isinstance(values, np.ndarray):
+            # rows may be any iterable, eg generators
+            values = [tuple(v) for v in values]
+        values = np.asarray(values, dtype=np.int32)
+        if values.size == 0:
+            return np.zeros((0, cls._n_atoms or 2), dtype=np.int32)
+        return values.reshape(len(values), -1)
+
+    @staticmethod
+    def _as_objects(values, n):
+        """Convert per term *values* to an object array of length *n*"""
+        arr = np.empty(n, dtype=object)
+        if values is not None:
+            arr[:] = values
+        return arr
+
+    @property
+    def is_guessed(self):
+        """List of bools, if each term is a guess"""
+        return self._guessed.tolist()
+
+    @property
+    @cached('values')
+    def values(self):
+        """Tuple of the index tuples of all terms, in the order they were added
+
+        Built on first access and kept until terms are added; it is a tuple
+        so that it cannot be changed in place.
+
+        .. versionchanged:: 0.17.0
+           A tuple instead of a list.
+        """
+        return tuple(tuple(b) for b in self._bix.tolist())
+
     def __len__(self):
-        return len(self._bondDict)
+        """Number of atoms which take part in at least one term"""
+        return np.count_nonzero(np.diff(self._csr[0]))
 
     @property
-    @cached('bd')
-    def _bondDict(self):
-        """Lazily built mapping of atoms:bonds"""
-        bd = defaultdict(list)
-
-        for b, t, g, o in zip(self.values, self.types,
-                              self._guessed, self.order):
-            # We always want the first index
-            # to be less than the last
-            # eg (0, 1) not (1, 0)
-            # and (4, 10, 8) not (8, 10, 4)
-            if b[0] > b[-1]:
-                b = b[::-1]
-            for a in b:
-                bd[a].append((b, t, g, o))
-        return bd
+    @cached('csr')
+    def _csr(self):
+        """Lazily built CSR index of atoms to the terms they are part of
+
+        Returns ``(indptr, terms)``: the terms involving atom ``i`` are
+        ``terms[indptr[i]:indptr[i + 1]]``, in ascending order.
+        """
+        n_terms, width = self._bix.shape
+        flat = self._bix.ravel()
+        n_atoms = flat.max() + 1 if flat.size else 0
+        indptr = np.zeros(n_atoms + 1, dtype=np.intp)
+        np.cumsum(np.bincount(flat, minlength=n_atoms), out=indptr[1:])
+        # a stable sort keeps the terms of each atom in ascending order
+        order = np.argsort(flat, kind='mergesort')
+        terms = (order // width).astype(np.int32)
+        return indptr, terms
+
+    def _terms_of(self, ix):
+        """Sorted, unique indices of all terms involving any atom in *ix*"""
+        indptr, terms = self._csr
+        ix = np.atleast_1d(ix)
+        ix = ix[ix < len(indptr) - 1]
+        starts = indptr[ix]
+        counts = indptr[ix + 1] - starts
+        # positions starts[i] ... starts[i] + counts[i] - 1 for every atom
+        ends = np.cumsum(counts)
+        pos = np.arange(ends[-1] if len(ends) else 0, dtype=np.intp)
+        pos += np.repeat(starts - ends + counts, counts)
+        return np.unique(terms[pos])
+
+    def _canonical(self, terms):
+        """Index rows of *terms* with the first index below the last
+
+        eg (0, 1) not (1, 0) and (4, 10, 8) not (8, 10, 4)
+        """
+        bix = self._bix[terms]
+        flip = bix[:, 0] > bix[:, -1]
+        bix[flip] = bix[flip, ::-1]
+        return bix
 
     def set_atoms(self, ag):
         return NotImplementedError("Cannot set bond information")
 
     def get_atoms(self, ag):
-        try:
-            unique_bonds = set(itertools.chain(
-                *[self._bondDict[a] for a in ag._ix]))
-        except TypeError:
-            # maybe we got passed an Atom
-            unique_bonds = self._bondDict[ag._ix]
-        bond_idx, types, guessed, order = np.hsplit(
-            np.array(sorted(unique_bonds)), 4)
-        bond_idx = np.array(bond_idx.ravel().tolist(), dtype=np.int32)
-        types = types.ravel()
-        guessed = guessed.ravel()
-        order = order.ravel()
-        return TopologyGroup(bond_idx, ag._u,
+        terms = self._terms_of(ag._ix)
+        return TopologyGroup(self._canonical(terms), ag._u,
                              self.singular[:-1],
-                             types,
-                             guessed,
-                             order)
+                             self.types[terms],
+                             self._guessed[terms],
+                             self.order[terms])
 
     def add_bonds(self, values, types=None, guessed=True, order=None):
-        if types is None:
-            types = itertools.cycle((None,))
-        if guessed in (True, False):
-            guessed = itertools.cycle((guessed,))
-        if order is None:
-            order = itertools.cycle((None,))
-
-        existing = set(self.values)
-        for v, t, g, o in zip(values, types, guessed, order):
-            if v not in existing:
-                self.values.append(v)
-                self.types.append(t)
-                self._guessed.append(g)
-                self.order.append(o)
-        # kill the old cache of bond Dict
-        try:
-            del self._cache['bd']
-        except KeyError:
-            pass
+        new = self._as_indices(values)
+        if not len(new):
+            return
+        n_old = len(self._bix)
+        allbix = np.concatenate([self._bix, new])
+        flip = allbix[:, 0] > allbix[:, -1]
+        allbix[flip] = allbix[flip, ::-1]
+        # first occurrence of every term, only keep those not yet present
+        _, first = unique_rows(allbix, return_index=True)
+        keep = np.sort(first[first >= n_old]) - n_old
+
+        n = len(new)
+        guessed_new = np.empty(n, dtype=bool)
+        guessed_new[:] = guessed
+        self._bix = np.concatenate([self._bix, new[keep]])
+        self.types = np.concatenate(
+            [self.types, self._as_objects(types, n)[keep]])
+        self._guessed = np.concatenate([self._guessed, guessed_new[keep]])
+        self.order = np.concatenate(
+            [self.order, self._as_objects(order, n)[keep]])
+        # kill the old atom to term index and everything built on it
+        self._cache.clear()
+        self._changed()
 
 
 class Bonds(_Connection):
@@ -1418,30 +1710,100 @@ class Bonds(_Connection):
     These indices refer to the atom indices.
     E.g., ` [(0, 1), (1, 2), (2, 3)]`
 
-    Also adds the `bonded_atoms`, `fragment` and `fragments`
-    attributes.
+    Also adds the `bonded_atoms`, `fragindex`, `fragindices`,
+    `n_fragments`, `fragment` and `fragments` attributes.  Fragments are
+    cached and recalculated when bonds are added.
     """
     attrname = 'bonds'
     # Singular is the same because one Atom might have
     # many bonds, so still asks for "bonds" in the plural
     singular = 'bonds'
     transplants = defaultdict(list)
+    _n_atoms = 2
+
+    def _bonded_indices(self, ix):
+        """Sorted indices of all atoms sharing a bond with any atom in *ix*"""
+        bix = self._bix[self._terms_of(ix)]
+        return np.unique(np.concatenate([
+            bix[:, 1][np.in1d(bix[:, 0], ix)],
+            bix[:, 0][np.in1d(bix[:, 1], ix)]]))
 
     def bonded_atoms(self):
         """An AtomGroup of all atoms bonded to this Atom"""
-        idx = [b.partner(self).index for b in self.bonds]
-        return self._u.atoms[idx]
+        bondattr = self.universe._topology.bonds
+        return self._u.atoms[bondattr._bonded_indices(self._ix)]
 
     transplants[Atom].append(
         ('bonded_atoms', property(bonded_atoms, None, None,
                                   bonded_atoms.__doc__)))
 
+    @property
+    @cached('fragindices')
+    def _fragindices(self):
+        """Fragment index of every atom, numbered by their lowest atom
+
+        Atoms without bonds are fragments of their own.
+        """
+        return mdamath._connected_components(self._n_topology_atoms,
+                                             self._bix)
+
+    @property
+    @cached('fragments')
+    def _fragments(self):
+        """Sorted atom indices of every fragment, in fragment order"""
+        fragindices = self._fragindices
+        order = np.argsort(fragindices, kind='mergesort')
+        splits = np.flatnonzero(np.diff(fragindices[order])) + 1
+        return np.split(order, splits)
+
+    def _setup_fragments(self, n_atoms):
+        """Size the fragments on *n_atoms*, dropping them if it changed"""
+        if getattr(self, '_n_topology_atoms', None) != n_atoms:
+            self._n_topology_atoms = n_atoms
+            for key in ('fragindices', 'fragments'):
+                self._cache.pop(key, None)
+        return self
+
+    @staticmethod
+    def _of(group):
+        """The Bonds of *group*'s Universe, ready to answer fragments"""
+        top = group.universe._topology
+        return top.bonds._setup_fragments(top.n_atoms)
+
+    def fragindex(self):
+        """The index of the fragment this Atom is part of
+
+        Fragments are numbered in the order of their first atom.
+
+        .. versionadded:: 0.17.0
+        """
+        return Bonds._of(self)._fragindices[self.ix]
+
+    def fragindices(self):
+        """The fragment index of each Atom in this AtomGroup
+
+        .. versionadded:: 0.17.0
+        """
+        return Bonds._of(self)._fragindices[self.ix]
+
+    def n_fragments(self):
+        """The number of distinct fragments the Atoms of this AtomGroup
+        are part of
+
+        .. versionadded:: 0.17.0
+        """
+        return len(np.unique(self.fragindices))
+
     def fragment(self):
         """The fragment that this Atom is part of
 
         .. versionadded:: 0.9.0
+        .. versionchanged:: 0.17.0
+           Looked up through :attr:`fragindex`.
         """
-        return self.universe._fragdict[self]
+        bondattr = Bonds._of(self)
+        ix = bondattr._fragments[bondattr._fragindices[self.ix]]
+        return AtomGroup(ix, self.universe)
 
     def fragments(self):
         """Read-only list of fragments.
@@ -1451,11 +1813,25 @@ class Bonds(_Connection):
         contents of this AtomGroup.
 
         .. versionadded 0.9.0
+        .. versionchanged:: 0.17.0
+           Looked up through :attr:`fragindices`.
         """
-        return tuple(sorted(
-            set(a.fragment for a in self),
-            key=lambda x: x[0].index
-        ))
+        bondattr = Bonds._of(self)
+        frags = bondattr._fragments
+        return tuple(AtomGroup(frags[i], self.universe)
+                     for i in np.unique(bondattr._fragindices[self.ix]))
+
+    transplants[Atom].append(
+        ('fragindex', property(fragindex, None, None,
+                               fragindex.__doc__)))
+
+    transplants[AtomGroup].append(
+        ('fragindices', property(fragindices, None, None,
+                                 fragindices.__doc__)))
+
+    transplants[AtomGroup].append(
+        ('n_fragments', property(n_fragments, None, None,
+                                 n_fragments.__doc__)))
 
     transplants[Atom].append(
         ('fragment', property(fragment, None, None,
@@ -1477,6 +1853,7 @@ class Angles(_Connection):
     attrname = 'angles'
     singular = 'angles'
     transplants = defaultdict(list)
+    _n_atoms = 3
 
 
 class Dihedrals(_Connection):
@@ -1484,6 +1861,7 @@ class Dihedrals(_Connection):
     attrname = 'dihedrals'
     singular = 'dihedrals'
     transplants = defaultdict(list)
+    _n_atoms = 4
 
 
 class Impropers(_Connection):
@@ -1491,3 +1869,4 @@ class Impropers(_Connection):
     attrname = 'impropers'
     singular = 'impropers'
     transplants = defaultdict(list)
+    _n_atoms = 4
@@ -97,7 +97,7 @@ from .. import _ANCHOR_UNIVERSES
 from ..exceptions import NoDataError
 from ..lib import util
 from ..lib.log import ProgressMeter, _set_verbose
-from ..lib.util import cached, NamedStream, isstream
+from ..lib.util import NamedStream, isstream
 from . import groups
 from ._get_readers import get_reader_for, get_parser_for
 from .groups import (GroupBase, Atom, Residue, Segment,
@@ -159,6 +159,11 @@ class Universe(object):
         the file extension [``None``] Can also pass a subclass of
         :class:`MDAnalysis.topology.base.TopologyReaderBase` to define a custom
         reader to be used on the topology file.
+    lazy_topology : bool, optional
+        Only read expensive parts of the topology, such as the bonds, angles
+        and dihedrals of a PSF or TPR file, when they are first used. Not all
+        parsers support this; the others read everything as usual.
+        [``False``]
     format
         Provide the file format of the coordinate or trajectory file; ``None``
         guesses it from the file extension. Note that this keyword has no
@@ -190,6 +195,9 @@ class Universe(object):
         representations, which allow for manipulation of coordinates.
     in_memory_step
         Only read every nth frame into in-memory representation.
+    in_memory_cache
+        Write the in-memory representation to this ``.npy`` file and
+        memory-map it instead of holding it in memory.
 
     Attributes
     ----------
@@ -203,6 +211,11 @@ class Universe(object):
     bonds, angles, dihedrals
         master ConnectivityGroups for each connectivity type
 
+
+    .. versionchanged:: 0.17.0
+       A Universe can be pickled. It is restored from its topology and the
+       state of its trajectory reader (file name, current frame and offsets)
+       without parsing any file again. Added the *lazy_topology* keyword.
     """
 
     def __init__(self, *args, **kwargs):
@@ -224,6 +237,7 @@ class Universe(object):
             self.atoms = None
         else:
             topology_format = kwargs.pop('topology_format', None)
+            lazy_topology = kwargs.pop('lazy_topology', False)
             if len(args) == 1:
                 # special hacks to treat a coordinate file as a coordinate AND
                 # topology file
@@ -248,7 +262,7 @@ class Universe(object):
                     self.filename = args[0]
                 parser = get_parser_for(self.filename, format=topology_format)
                 try:
-                    with parser(self.filename) as p:
+                    with parser(self.filename, lazy=lazy_topology) as p:
                         self._topology = p.parse()
                 except (IOError, OSError) as err:
                     # There are 2 kinds of errors that might be raised here - one because the file isn't present
@@ -407,6 +421,12 @@ class Universe(object):
 
             .. versionadded:: 0.16.0
 
+        in_memory_cache : str (optional)
+            with `in_memory`, write the coordinates to this ``.npy`` file
+            and memory-map it (see :meth:`transfer_to_memory`)
+
+            .. versionadded:: 0.17.0
+
         **kwargs : dict
             Other kwargs are passed to the trajectory reader (only for
             advanced use)
@@ -465,12 +485,13 @@ class Universe(object):
                                  trj_n_atoms=self.trajectory.n_atoms))
 
         if in_memory:
-            self.transfer_to_memory(step=kwargs.get("in_memory_step", 1))
+            self.transfer_to_memory(step=kwargs.get("in_memory_step", 1),
+                                    cache=kwargs.get("in_memory_cache"))
 
         return self
 
     def transfer_to_memory(self, start=None, stop=None, step=None,
-                           verbose=None, quiet=None):
+                           verbose=None, quiet=None, cache=None):
         """Transfer the trajectory to in memory representation.
 
         Replaces the current trajectory reader object with one of type
@@ -488,35 +509,52 @@ class Universe(object):
         verbose : bool, optional
             Will print the progress of loading trajectory to memory, if
             set to True. Default value is False.
+        cache : str, optional
+            name of a ``.npy`` file; if given, the coordinates are written to
+            this file and memory-mapped by the
+            :class:`~MDAnalysis.coordinates.memory.MemoryReader` instead of
+            being held in memory.
 
 
         .. versionadded:: 0.16.0
+        .. versionchanged:: 0.17.0
+           Coordinates are read in blocks of frames with
+           :meth:`~MDAnalysis.coordinates.base.ProtoReader.iter_timeseries`
+           for all trajectory formats; added `cache` for memory-mapped
+           trajectories.
         """
         from ..coordinates.memory import MemoryReader
 
         verbose = _set_verbose(verbose, quiet, default=False)
 
         if not isinstance(self.trajectory, MemoryReader):
-            # Try to extract coordinates using Timeseries object
-            # This is significantly faster, but only implemented for certain
-            # trajectory file formats
-            try:
-                coordinates = self.trajectory.timeseries(
-                    self.atoms, start=start, stop=stop, step=step, format='fac')
-            # if the Timeseries extraction fails,
-            # fall back to a slower approach
-            except AttributeError:
-                n_frames = len(range(
-                    *self.trajectory.check_slice_indices(start, stop, step)
-                ))
-                pm_format = '{step}/{numsteps} frames copied to memory (frame {frame})'
-                pm = ProgressMeter(n_frames, interval=1,
-                                   verbose=verbose, format=pm_format)
-                coordinates = []  # TODO: use pre-allocated array
-                for i, ts in enumerate(self.trajectory[start:stop:step]):
-                    coordinates.append(np.copy(ts.positions))
-                    pm.echo(i, frame=ts.frame)
-                coordinates = np.array(coordinates)
+            # Copy the coordinates in blocks of frames into one preallocated
+            # array; readers that can decode several frames at once fill each
+            # block directly
+            n_frames = len(range(
+                *self.trajectory.check_slice_indices(start, stop, step)
+            ))
+            shape = (n_frames, self.trajectory.n_atoms, 3)
+            if cache is None:
+                coordinates = np.empty(shape, dtype=np.float32)
+            else:
+                coordinates = np.lib.format.open_memmap(
+                    cache, mode='w+', dtype=np.float32, shape=shape)
+            pm_format = '{step}/{numsteps} frames copied to memory'
+            pm = ProgressMeter(n_frames, interval=1,
+                               verbose=verbose, format=pm_format)
+            i = 0
+            for block in self.trajectory.iter_timeseries(
+                    100, start=start, stop=stop, step=step, format='fac'):
+                coordinates[i:i + len(block)] = block
+                i += len(block)
+                pm.echo(i - 1)
+
+            if cache is not None:
+                # the MemoryReader maps the finished cache again
+                coordinates.flush()
+                del coordinates
+                coordinates = cache
 
             # Overwrite trajectory in universe with an MemoryReader
             # object, to provide fast access and allow coordinates
@@ -612,11 +650,53 @@ class Universe(object):
         return "<Universe with {n_atoms} atoms>".format(
             n_atoms=len(self.atoms))
 
+    @property
+    def _pickle_anchor(self):
+        try:
+            return self._anchor
+        except AttributeError:
+            self._anchor = groups._PickleAnchor()
+            return self._anchor
+
     def __getstate__(self):
-        raise NotImplementedError
+        # A Universe is rebuilt from its Topology and its Reader, so neither
+        # the topology nor the trajectory file are parsed again on unpickling.
+        return {'topology': self._topology,
+                'pickle_anchor': self._pickle_anchor,
+                'trajectory': self._trajectory,
+                'filename': getattr(self, 'filename', None),
+                'kwargs': self._kwargs,
+                'anchor_name': self._anchor_name,
+                'anchor_uuid': getattr(self, '_anchor_uuid', None),
+                'is_anchor': self.is_anchor}
 
     def __setstate__(self, state):
-        raise NotImplementedError
+        self._instant_selectors = {}
+        self._kwargs = state['kwargs']
+        self._cache = {}
+        self._trajectory = None
+
+        self._topology = state['topology']
+        if self._topology is None:
+            self.atoms = None
+        else:
+            self.filename = state['filename']
+            self._generate_from_topology()
+        self._trajectory = state['trajectory']
+
+        self._anchor_name = state['anchor_name']
+        if state['anchor_uuid'] is not None:
+            self._anchor_uuid = state['anchor_uuid']
+        # AtomGroups pickled together with (after) this Universe are
+        # unpickled onto it
+        self._anchor = state['pickle_anchor']
+        self._anchor.bind(self)
+        # AtomGroups pickled on their own are unpickled onto the anchor,
+        # this Universe becomes one unless the original Universe is still an
+        # anchor (for instance when unpickling in the same process)
+        if (state['is_anchor'] and
+                self._gen_anchor_hash() not in _ANCHOR_UNIVERSES):
+            self.make_anchor()
 
     # Properties
     @property
@@ -796,83 +876,6 @@ class Universe(object):
         # return the new segment
         return self.segments[segidx]
 
-    # TODO: Maybe put this as a Bond attribute transplant
-    # Problems: Can we transplant onto Universe?
-    # Probably a smarter way to do this too, could generate
-    # these on demand *per atom*.
-    # Wouldn't then need the Universe linkage here
-    #
-    # Alternate idea: Bonds Attribute generates a Fragments
-    # Attribute (ie, 2 for the price of 1)
-    # Fragments then gets its own Class/namespace/jazz.
-    @property
-    @cached('fragments')
-    def _fragdict(self):
-        """
-        .. versionadded:: 0.9.0
-        .. versionchanged:: 0.16.0
-           Fragment atoms are sorted by their index, and framgents are sorted
-           by their first atom index so their order is predictable.
-        """
-        bonds = self.atoms.bonds
-
-        class _fragset(object):
-            __slots__ = ['ats']
-            """Normal sets aren't hashable, this is"""
-
-            def __init__(self, ats):
-                self.ats = set(ats)
-
-            def __iter__(self):
-                return iter(self.ats)
-
-            def add(self, other):
-                self.ats.add(other)
-
-            def update(self, other):
-                self.ats.update(other.ats)
-
-        # each atom starts with its own list
-        f = dict.fromkeys(self.atoms, None)
-
-        for a1, a2 in bonds:
-            if not (f[a1] or f[a2]):
-                # New set made here
-                new = _fragset([a1, a2])
-                f[a1] = f[a2] = new
-            elif f[a1] and not f[a2]:
-                # If a2 isn't in a fragment, add it to a1's
-                f[a1].add(a2)
-                f[a2] = f[a1]
-            elif not f[a1] and f[a2]:
-                # If a1 isn't in a fragment, add it to a2's
-                f[a2].add(a1)
-                f[a1] = f[a2]
-            elif f[a1] is f[a2]:
-                # If they're in the same fragment, do nothing
-                continue
-            else:
-                # If they are both in different fragments, combine fragments
-                f[a1].update(f[a2])
-                f.update(dict((a, f[a1]) for a in f[a2]))
-
-        # Lone atoms get their own fragment
-        f.update(dict((a, _fragset((a,)))
-                      for a, val in f.items() if not val))
-
-        # All the unique values in f are the fragments
-        frags = tuple(
-            [AtomGroup(np.sort(np.array([at.index for at in ag])), self)
-             for ag in set(f.values())],
-        )
-
-        fragdict = {}
-        for f in frags:
-            for a in f:
-                fragdict[a] = f
-
-        return fragdict
-
 
 # TODO: what is the point of this function???
 def as_Universe(*args, **kwargs):
@@ -29,9 +29,10 @@ This module contains classes that allow neighbor searches directly with
 """
 from __future__ import absolute_import
 
+import warnings
+
 import numpy as np
-from Bio.KDTree import KDTree
-from MDAnalysis.lib.pkdtree import PeriodicKDTree
+from MDAnalysis.lib.nsgrid import FastNS
 
 from MDAnalysis.core.groups import AtomGroup, Atom
 
@@ -39,11 +40,18 @@ class AtomNeighborSearch(object):
     """This class can be used to find all atoms/residues/segments within the
     radius of a given query position.
 
-    For the neighbor search, this class uses the BioPython KDTree and its
-    wrapper PeriodicKDTree for non-periodic and periodic systems, respectively.
+    For the neighbor search, this class uses the grid search of
+    :class:`MDAnalysis.lib.nsgrid.FastNS`, which handles both non-periodic
+    and periodic systems. All query atoms are searched in a single call.
+    The grid is built by the first search and reused by all later searches
+    with the same or a smaller radius.
+
+    .. versionchanged:: 0.17.0
+       Uses :class:`~MDAnalysis.lib.nsgrid.FastNS` instead of the BioPython
+       KDTree; the `bucket_size` keyword is deprecated.
     """
 
-    def __init__(self, atom_group, box=None, bucket_size=10):
+    def __init__(self, atom_group, box=None, bucket_size=None):
         """
 
         Parameters
@@ -56,18 +64,19 @@ class AtomNeighborSearch(object):
           periodic boundary conditions should be taken into account for
           the calculation of contacts.
         bucket_size : int
-          Number of entries in leafs of the KDTree. If you suffer poor
-          performance you can play around with this number. Increasing the
-          `bucket_size` will speed up the construction of the KDTree but
-          slow down the search.
+          Deprecated, the grid search has no buckets. Will be removed in
+          1.0.
         """
+        if bucket_size is not None:
+            warnings.warn("bucket_size is deprecated and has no effect, the "
+                          "grid search has no buckets; it will be removed "
+                          "in 1.0", category=DeprecationWarning)
         self.atom_group = atom_group
         self._u = atom_group.universe
-        if box is None:
-            self.kdtree = KDTree(dim=3, bucket_size=bucket_size)
-        else:
-            self.kdtree = PeriodicKDTree(box, bucket_size=bucket_size)
-        self.kdtree.set_coords(atom_group.positions)
+        self._box = box
+        # positions are fixed at construction, like the former KDTree
+        self._positions = atom_group.positions
+        self._grid = None
 
     def search(self, atoms, radius, level='A'):
         """
@@ -89,11 +98,13 @@ class AtomNeighborSearch(object):
         else:
             positions = atoms.positions
 
-        indices = []
-        for pos in positions:
-            self.kdtree.search(pos, radius)
-            indices.append(self.kdtree.get_indices())
-        unique_idx = np.unique([i for l in indices for i in l]).astype(np.int64)
+        if self._grid is None or radius > self._grid.cutoff:
+            self._grid = FastNS(radius, self._positions, box=self._box)
+        results = self._grid.search(positions)
+        pairs = results.get_pairs()
+        if radius < self._grid.cutoff:
+            pairs = pairs[results.get_pair_distances() <= radius]
+        unique_idx = np.unique(pairs[:, 1])
         return self._index2level(unique_idx, level)
 
     def _index2level(self, indices, level):
@@ -31,6 +31,8 @@ Serial versions of all distance calculations
 cimport cython
 import numpy
 cimport numpy
+from libc.math cimport floor, sqrt
+from libc.stdlib cimport realloc, free
 
 cdef extern from "string.h":
     void* memcpy(void *dst, void *src, int len)
@@ -39,21 +41,60 @@ cdef extern from "calc_distances.h":
     ctypedef float coordinate[3]
     cdef bint USED_OPENMP
     void _calc_distance_array(coordinate* ref, int numref, coordinate* conf, int numconf, double* distances)
+    void _calc_distance_array_f(coordinate* ref, int numref, coordinate* conf, int numconf, float* distances)
+    void _calc_distance_array_fd(coordinate* ref, int numref, coordinate* conf, int numconf, float* distances)
     void _calc_distance_array_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
+    void _calc_distance_array_ortho_f(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, float* distances)
+    void _calc_distance_array_ortho_fd(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, float* distances)
     void _calc_distance_array_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double* distances)
+    void _calc_distance_array_triclinic_f(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, float* distances)
+    void _calc_distance_array_triclinic_fd(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, float* distances)
     void _calc_self_distance_array(coordinate* ref, int numref, double* distances, int distnum)
+    void _calc_self_distance_array_f(coordinate* ref, int numref, float* distances, int distnum)
+    void _calc_self_distance_array_fd(coordinate* ref, int numref, float* distances, int distnum)
     void _calc_self_distance_array_ortho(coordinate* ref, int numref, float* box, double* distances, int distnum)
+    void _calc_self_distance_array_ortho_f(coordinate* ref, int numref, float* box, float* distances, int distnum)
+    void _calc_self_distance_array_ortho_fd(coordinate* ref, int numref, float* box, float* distances, int distnum)
     void _calc_self_distance_array_triclinic(coordinate* ref, int numref, coordinate* box, double* distances, int distnum)
+    void _calc_self_distance_array_triclinic_f(coordinate* ref, int numref, coordinate* box, float* distances, int distnum)
+    void _calc_self_distance_array_triclinic_fd(coordinate* ref, int numref, coordinate* box, float* distances, int distnum)
+    void _calc_distance_histogram(coordinate* ref, int numref, coordinate* conf, int numconf, double* edges, int nbins, long long* histo, int block_ref, int block_conf)
+    void _calc_distance_histogram_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* edges, int nbins, long long* histo, int block_ref, int block_conf)
+    void _calc_distance_histogram_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double* edges, int nbins, long long* histo, int block_ref, int block_conf)
+    void _calc_min_distance_per_atom(coordinate* ref, int numref, coordinate* conf, int numconf, double* distances)
+    void _calc_min_distance_per_atom_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
+    void _calc_min_distance_per_atom_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double* distances)
+    void _calc_count_within(coordinate* ref, int numref, coordinate* conf, int numconf, double cutoff, long long* counts)
+    void _calc_count_within_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double cutoff, long long* counts)
+    void _calc_count_within_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double cutoff, long long* counts)
     void _coord_transform(coordinate* coords, int numCoords, coordinate* box)
     void _calc_bond_distance(coordinate* atom1, coordinate* atom2, int numatom, double* distances)
+    void _calc_bond_distance_f(coordinate* atom1, coordinate* atom2, int numatom, float* distances)
+    void _calc_bond_distance_fd(coordinate* atom1, coordinate* atom2, int numatom, float* distances)
     void _calc_bond_distance_ortho(coordinate* atom1, coordinate* atom2, int numatom, float*box, double* distances)
+    void _calc_bond_distance_ortho_f(coordinate* atom1, coordinate* atom2, int numatom, float*box, float* distances)
+    void _calc_bond_distance_ortho_fd(coordinate* atom1, coordinate* atom2, int numatom, float*box, float* distances)
     void _calc_bond_distance_triclinic(coordinate* atom1, coordinate* atom2, int numatom, coordinate* box, double* distances)
+    void _calc_bond_distance_triclinic_f(coordinate* atom1, coordinate* atom2, int numatom, coordinate* box, float* distances)
+    void _calc_bond_distance_triclinic_fd(coordinate* atom1, coordinate* atom2, int numatom, coordinate* box, float* distances)
     void _calc_angle(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, double* angles)
+    void _calc_angle_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* angles)
+    void _calc_angle_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* angles)
     void _calc_angle_ortho(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* box, double* angles)
+    void _calc_angle_ortho_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* box, float* angles)
+    void _calc_angle_ortho_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* box, float* angles)
     void _calc_angle_triclinic(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, coordinate* box, double* angles)
+    void _calc_angle_triclinic_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, coordinate* box, float* angles)
+    void _calc_angle_triclinic_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, coordinate* box, float* angles)
     void _calc_dihedral(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, double* angles)
+    void _calc_dihedral_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* angles)
+    void _calc_dihedral_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* angles)
     void _calc_dihedral_ortho(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* box, double* angles)
+    void _calc_dihedral_ortho_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* box, float* angles)
+    void _calc_dihedral_ortho_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* box, float* angles)
     void _calc_dihedral_triclinic(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, coordinate* box, double* angles)
+    void _calc_dihedral_triclinic_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, coordinate* box, float* angles)
+    void _calc_dihedral_triclinic_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, coordinate* box, float* angles)
     void _ortho_pbc(coordinate* coords, int numcoords, float* box, float* box_inverse)
     void _triclinic_pbc(coordinate* coords, int numcoords, coordinate* box, float* box_inverse)
     void minimum_image(double *x, float *box, float *inverse_box)
@@ -61,69 +102,254 @@ cdef extern from "calc_distances.h":
 OPENMP_ENABLED = True if USED_OPENMP else False
 
 def calc_distance_array(numpy.ndarray ref, numpy.ndarray conf,
-                        numpy.ndarray result):
+                        numpy.ndarray result,
+                        bint double_accumulate=False):
     cdef int confnum, refnum
     confnum = conf.shape[0]
     refnum = ref.shape[0]
 
-    _calc_distance_array(<coordinate*>ref.data, refnum,
-                         <coordinate*>conf.data, confnum,
-                         <double*>result.data)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_distance_array_fd(<coordinate*>ref.data, refnum,
+                                <coordinate*>conf.data, confnum,
+                                <float*>result.data)
+    elif result.dtype == numpy.float32:
+        _calc_distance_array_f(<coordinate*>ref.data, refnum,
+                               <coordinate*>conf.data, confnum,
+                               <float*>result.data)
+    else:
+        _calc_distance_array(<coordinate*>ref.data, refnum,
+                             <coordinate*>conf.data, confnum,
+                             <double*>result.data)
 
 def calc_distance_array_ortho(numpy.ndarray ref, numpy.ndarray conf,
                               numpy.ndarray box,
-                              numpy.ndarray result):
+                              numpy.ndarray result,
+                              bint double_accumulate=False):
     cdef int confnum, refnum
     confnum = conf.shape[0]
     refnum = ref.shape[0]
 
-    _calc_distance_array_ortho(<coordinate*>ref.data, refnum,
-                               <coordinate*>conf.data, confnum,
-                               <float*>box.data,
-                               <double*>result.data)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_distance_array_ortho_fd(<coordinate*>ref.data, refnum,
+                                      <coordinate*>conf.data, confnum,
+                                      <float*>box.data,
+                                      <float*>result.data)
+    elif result.dtype == numpy.float32:
+        _calc_distance_array_ortho_f(<coordinate*>ref.data, refnum,
+                                     <coordinate*>conf.data, confnum,
+                                     <float*>box.data,
+                                     <float*>result.data)
+    else:
+        _calc_distance_array_ortho(<coordinate*>ref.data, refnum,
+                                   <coordinate*>conf.data, confnum,
+                                   <float*>box.data,
+                                   <double*>result.data)
 
 def calc_distance_array_triclinic(numpy.ndarray ref, numpy.ndarray conf,
                                   numpy.ndarray box,
-                                  numpy.ndarray result):
+                                  numpy.ndarray result,
+                                  bint double_accumulate=False):
     cdef int confnum, refnum
     confnum = conf.shape[0]
     refnum = ref.shape[0]
 
-    _calc_distance_array_triclinic(<coordinate*>ref.data, refnum,
-                                   <coordinate*>conf.data, confnum,
-                                   <coordinate*>box.data,
-                                   <double*>result.data)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_distance_array_triclinic_fd(<coordinate*>ref.data, refnum,
+                                          <coordinate*>conf.data, confnum,
+                                          <coordinate*>box.data,
+                                          <float*>result.data)
+    elif result.dtype == numpy.float32:
+        _calc_distance_array_triclinic_f(<coordinate*>ref.data, refnum,
+                                         <coordinate*>conf.data, confnum,
+                                         <coordinate*>box.data,
+                                         <float*>result.data)
+    else:
+        _calc_distance_array_triclinic(<coordinate*>ref.data, refnum,
+                                       <coordinate*>conf.data, confnum,
+                                       <coordinate*>box.data,
+                                       <double*>result.data)
 
 def calc_self_distance_array(numpy.ndarray ref,
-                             numpy.ndarray result):
+                             numpy.ndarray result,
+                             bint double_accumulate=False):
     cdef int refnum, distnum
     refnum = ref.shape[0]
     distnum = (refnum*(refnum-1))/2
 
-    _calc_self_distance_array(<coordinate*>ref.data, refnum,
-                              <double*>result.data, distnum)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_self_distance_array_fd(<coordinate*>ref.data, refnum,
+                                     <float*>result.data, distnum)
+    elif result.dtype == numpy.float32:
+        _calc_self_distance_array_f(<coordinate*>ref.data, refnum,
+                                    <float*>result.data, distnum)
+    else:
+        _calc_self_distance_array(<coordinate*>ref.data, refnum,
+                                  <double*>result.data, distnum)
 
 def calc_self_distance_array_ortho(numpy.ndarray ref,
                                    numpy.ndarray box,
-                                   numpy.ndarray result):
+                                   numpy.ndarray result,
+                                   bint double_accumulate=False):
     cdef int refnum, distnum
     refnum = ref.shape[0]
     distnum = (refnum*(refnum-1))/2
 
-    _calc_self_distance_array_ortho(<coordinate*>ref.data, refnum,
-                                    <float*>box.data,
-                                    <double*>result.data, distnum)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_self_distance_array_ortho_fd(<coordinate*>ref.data, refnum,
+                                           <float*>box.data,
+                                           <float*>result.data, distnum)
+    elif result.dtype == numpy.float32:
+        _calc_self_distance_array_ortho_f(<coordinate*>ref.data, refnum,
+                                          <float*>box.data,
+                                          <float*>result.data, distnum)
+    else:
+        _calc_self_distance_array_ortho(<coordinate*>ref.data, refnum,
+                                        <float*>box.data,
+                                        <double*>result.data, distnum)
 
 def calc_self_distance_array_triclinic(numpy.ndarray ref,
                                        numpy.ndarray box,
-                                       numpy.ndarray result):
+                                       numpy.ndarray result,
+                                       bint double_accumulate=False):
     cdef int refnum, distnum
     refnum = ref.shape[0]
     distnum = (refnum*(refnum-1))/2
 
-    _calc_self_distance_array_triclinic(<coordinate*>ref.data, refnum,
-                                        <coordinate*>box.data,
-                                        <double*>result.data, distnum)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_self_distance_array_triclinic_fd(<coordinate*>ref.data, refnum,
+                                               <coordinate*>box.data,
+                                               <float*>result.data, distnum)
+    elif result.dtype == numpy.float32:
+        _calc_self_distance_array_triclinic_f(<coordinate*>ref.data, refnum,
+                                              <coordinate*>box.data,
+                                              <float*>result.data, distnum)
+    else:
+        _calc_self_distance_array_triclinic(<coordinate*>ref.data, refnum,
+                                            <coordinate*>box.data,
+                                            <double*>result.data, distnum)
+
+def calc_distance_histogram(numpy.ndarray ref, numpy.ndarray conf,
+                            numpy.ndarray edges,
+                            numpy.ndarray histo,
+                            int block_ref=0, int block_conf=0):
+    cdef int confnum, refnum, nbins
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+    nbins = histo.shape[0]
+
+    _calc_distance_histogram(<coordinate*>ref.data, refnum,
+                             <coordinate*>conf.data, confnum,
+                             <double*>edges.data, nbins,
+                             <long long*>histo.data,
+                             block_ref, block_conf)
+
+def calc_distance_histogram_ortho(numpy.ndarray ref, numpy.ndarray conf,
+                                  numpy.ndarray box,
+                                  numpy.ndarray edges,
+                                  numpy.ndarray histo,
+                                  int block_ref=0, int block_conf=0):
+    cdef int confnum, refnum, nbins
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+    nbins = histo.shape[0]
+
+    _calc_distance_histogram_ortho(<coordinate*>ref.data, refnum,
+                                   <coordinate*>conf.data, confnum,
+                                   <float*>box.data,
+                                   <double*>edges.data, nbins,
+                                   <long long*>histo.data,
+                                   block_ref, block_conf)
+
+def calc_distance_histogram_triclinic(numpy.ndarray ref, numpy.ndarray conf,
+                                      numpy.ndarray box,
+                                      numpy.ndarray edges,
+                                      numpy.ndarray histo,
+                                      int block_ref=0, int block_conf=0):
+    cdef int confnum, refnum, nbins
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+    nbins = histo.shape[0]
+
+    _calc_distance_histogram_triclinic(<coordinate*>ref.data, refnum,
+                                       <coordinate*>conf.data, confnum,
+                                       <coordinate*>box.data,
+                                       <double*>edges.data, nbins,
+                                       <long long*>histo.data,
+                                       block_ref, block_conf)
+
+def calc_min_distance_per_atom(numpy.ndarray ref, numpy.ndarray conf,
+                               numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_min_distance_per_atom(<coordinate*>ref.data, refnum,
+                                <coordinate*>conf.data, confnum,
+                                <double*>result.data)
+
+def calc_min_distance_per_atom_ortho(numpy.ndarray ref, numpy.ndarray conf,
+                                     numpy.ndarray box,
+                                     numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_min_distance_per_atom_ortho(<coordinate*>ref.data, refnum,
+                                      <coordinate*>conf.data, confnum,
+                                      <float*>box.data,
+                                      <double*>result.data)
+
+def calc_min_distance_per_atom_triclinic(numpy.ndarray ref, numpy.ndarray conf,
+                                         numpy.ndarray box,
+                                         numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_min_distance_per_atom_triclinic(<coordinate*>ref.data, refnum,
+                                          <coordinate*>conf.data, confnum,
+                                          <coordinate*>box.data,
+                                          <double*>result.data)
+
+def calc_count_within(numpy.ndarray ref, numpy.ndarray conf,
+                      double cutoff,
+                      numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_count_within(<coordinate*>ref.data, refnum,
+                       <coordinate*>conf.data, confnum,
+                       cutoff,
+                       <long long*>result.data)
+
+def calc_count_within_ortho(numpy.ndarray ref, numpy.ndarray conf,
+                            numpy.ndarray box,
+                            double cutoff,
+                            numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_count_within_ortho(<coordinate*>ref.data, refnum,
+                             <coordinate*>conf.data, confnum,
+                             <float*>box.data,
+                             cutoff,
+                             <long long*>result.data)
+
+def calc_count_within_triclinic(numpy.ndarray ref, numpy.ndarray conf,
+                                numpy.ndarray box,
+                                double cutoff,
+                                numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_count_within_triclinic(<coordinate*>ref.data, refnum,
+                                 <coordinate*>conf.data, confnum,
+                                 <coordinate*>box.data,
+                                 cutoff,
+                                 <long long*>result.data)
 
 def coord_transform(numpy.ndarray coords,
                     numpy.ndarray box):
@@ -135,120 +361,234 @@ def coord_transform(numpy.ndarray coords,
 
 def calc_bond_distance(numpy.ndarray coords1,
                        numpy.ndarray coords2,
-                       numpy.ndarray results):
+                       numpy.ndarray results,
+                       bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_bond_distance(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                        numcoords,
-                        <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_bond_distance_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                               numcoords,
+                               <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_bond_distance_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                              numcoords,
+                              <float*>results.data)
+    else:
+        _calc_bond_distance(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                            numcoords,
+                            <double*>results.data)
 
 def calc_bond_distance_ortho(numpy.ndarray coords1,
                              numpy.ndarray coords2,
                              numpy.ndarray box,
-                             numpy.ndarray results):
+                             numpy.ndarray results,
+                             bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_bond_distance_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                              numcoords,
-                              <float*>box.data,
-                              <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_bond_distance_ortho_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                     numcoords,
+                                     <float*>box.data,
+                                     <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_bond_distance_ortho_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                    numcoords,
+                                    <float*>box.data,
+                                    <float*>results.data)
+    else:
+        _calc_bond_distance_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                  numcoords,
+                                  <float*>box.data,
+                                  <double*>results.data)
 
 def calc_bond_distance_triclinic(numpy.ndarray coords1,
                                  numpy.ndarray coords2,
                                  numpy.ndarray box,
-                                 numpy.ndarray results):
+                                 numpy.ndarray results,
+                                 bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_bond_distance_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                                  numcoords,
-                                  <coordinate*>box.data,
-                                  <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_bond_distance_triclinic_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                         numcoords,
+                                         <coordinate*>box.data,
+                                         <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_bond_distance_triclinic_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                        numcoords,
+                                        <coordinate*>box.data,
+                                        <float*>results.data)
+    else:
+        _calc_bond_distance_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                      numcoords,
+                                      <coordinate*>box.data,
+                                      <double*>results.data)
 
 def calc_angle(numpy.ndarray coords1,
                numpy.ndarray coords2,
                numpy.ndarray coords3,
-               numpy.ndarray results):
+               numpy.ndarray results,
+               bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_angle(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                <coordinate*> coords3.data,
-                numcoords,
-                <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_angle_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                       <coordinate*> coords3.data,
+                       numcoords,
+                       <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_angle_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                      <coordinate*> coords3.data,
+                      numcoords,
+                      <float*>results.data)
+    else:
+        _calc_angle(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                    <coordinate*> coords3.data,
+                    numcoords,
+                    <double*>results.data)
 
 def calc_angle_ortho(numpy.ndarray coords1,
                      numpy.ndarray coords2,
                      numpy.ndarray coords3,
                      numpy.ndarray box,
-                     numpy.ndarray results):
+                     numpy.ndarray results,
+                     bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_angle_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                      <coordinate*> coords3.data,
-                      numcoords,
-                      <float*>box.data,
-                      <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_angle_ortho_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                             <coordinate*> coords3.data,
+                             numcoords,
+                             <float*>box.data,
+                             <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_angle_ortho_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                            <coordinate*> coords3.data,
+                            numcoords,
+                            <float*>box.data,
+                            <float*>results.data)
+    else:
+        _calc_angle_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                          <coordinate*> coords3.data,
+                          numcoords,
+                          <float*>box.data,
+                          <double*>results.data)
 
 def calc_angle_triclinic(numpy.ndarray coords1,
                          numpy.ndarray coords2,
                          numpy.ndarray coords3,
                          numpy.ndarray box,
-                         numpy.ndarray results):
+                         numpy.ndarray results,
+                         bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_angle_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                          <coordinate*> coords3.data,
-                          numcoords,
-                          <coordinate*>box.data,
-                          <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_angle_triclinic_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                 <coordinate*> coords3.data,
+                                 numcoords,
+                                 <coordinate*>box.data,
+                                 <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_angle_triclinic_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                <coordinate*> coords3.data,
+                                numcoords,
+                                <coordinate*>box.data,
+                                <float*>results.data)
+    else:
+        _calc_angle_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                              <coordinate*> coords3.data,
+                              numcoords,
+                              <coordinate*>box.data,
+                              <double*>results.data)
 
 def calc_dihedral(numpy.ndarray coords1,
                  numpy.ndarray coords2,
                  numpy.ndarray coords3,
                  numpy.ndarray coords4,
-                 numpy.ndarray results):
+                 numpy.ndarray results,
+                 bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_dihedral(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                  <coordinate*> coords3.data, <coordinate*> coords4.data,
-                  numcoords,
-                  <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_dihedral_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                         <coordinate*> coords3.data, <coordinate*> coords4.data,
+                         numcoords,
+                         <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_dihedral_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                        <coordinate*> coords3.data, <coordinate*> coords4.data,
+                        numcoords,
+                        <float*>results.data)
+    else:
+        _calc_dihedral(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                      <coordinate*> coords3.data, <coordinate*> coords4.data,
+                      numcoords,
+                      <double*>results.data)
 
 def calc_dihedral_ortho(numpy.ndarray coords1,
                        numpy.ndarray coords2,
                        numpy.ndarray coords3,
                        numpy.ndarray coords4,
                        numpy.ndarray box,
-                       numpy.ndarray results):
+                       numpy.ndarray results,
+                       bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_dihedral_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                        <coordinate*> coords3.data, <coordinate*> coords4.data,
-                        numcoords,
-                        <float*>box.data,
-                        <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_dihedral_ortho_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                               <coordinate*> coords3.data, <coordinate*> coords4.data,
+                               numcoords,
+                               <float*>box.data,
+                               <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_dihedral_ortho_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                              <coordinate*> coords3.data, <coordinate*> coords4.data,
+                              numcoords,
+                              <float*>box.data,
+                              <float*>results.data)
+    else:
+        _calc_dihedral_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                            <coordinate*> coords3.data, <coordinate*> coords4.data,
+                            numcoords,
+                            <float*>box.data,
+                            <double*>results.data)
 
 def calc_dihedral_triclinic(numpy.ndarray coords1,
                            numpy.ndarray coords2,
                            numpy.ndarray coords3,
                            numpy.ndarray coords4,
                            numpy.ndarray box,
-                           numpy.ndarray results):
+                           numpy.ndarray results,
+                           bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_dihedral_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                            <coordinate*> coords3.data, <coordinate*> coords4.data,
-                            numcoords,
-                            <coordinate*>box.data,
-                            <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_dihedral_triclinic_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                   <coordinate*> coords3.data, <coordinate*> coords4.data,
+                                   numcoords,
+                                   <coordinate*>box.data,
+                                   <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_dihedral_triclinic_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                  <coordinate*> coords3.data, <coordinate*> coords4.data,
+                                  numcoords,
+                                  <coordinate*>box.data,
+                                  <float*>results.data)
+    else:
+        _calc_dihedral_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                <coordinate*> coords3.data, <coordinate*> coords4.data,
+                                numcoords,
+                                <coordinate*>box.data,
+                                <double*>results.data)
 
 def ortho_pbc(numpy.ndarray coords,
               numpy.ndarray box, numpy.ndarray box_inverse):
@@ -313,3 +653,273 @@ def contact_matrix_pbc(coord, sparse_contacts, box, cutoff):
             if dist < cutoff2:
                 sparse_contacts[i, j] = True
                 sparse_contacts[j, i] = True
+
+
+# Cell-list neighbor search used by MDAnalysis.lib.nsgrid.FastNS.  Cells are
+# given as int64 (n, 3) arrays, the grid coordinates are sorted by cell so
+# that every cell is the slice cell_start[c]:cell_start[c] + cell_count[c].
+
+ctypedef numpy.int64_t int64_t
+
+cdef struct _PairList:
+    int64_t* pairs
+    double* distances
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+
+cdef int _pairlist_add(_PairList* found, int64_t i, int64_t j,
+                       double dist2) except -1:
+    cdef Py_ssize_t capacity
+    cdef void* mem
+    if found.size == found.capacity:
+        capacity = 2 * found.capacity if found.capacity else 4096
+        mem = realloc(found.pairs, 2 * capacity * sizeof(int64_t))
+        if mem == NULL:
+            raise MemoryError()
+        found.pairs = <int64_t*>mem
+        mem = realloc(found.distances, capacity * sizeof(double))
+        if mem == NULL:
+            raise MemoryError()
+        found.distances = <double*>mem
+        found.capacity = capacity
+    found.pairs[2 * found.size] = i
+    found.pairs[2 * found.size + 1] = j
+    found.distances[found.size] = sqrt(dist2)
+    found.size += 1
+    return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef _pairlist_arrays(_PairList* found):
+    pairs = numpy.empty((found.size, 2), dtype=numpy.int64)
+    distances = numpy.empty(found.size, dtype=numpy.float64)
+    cdef int64_t[:, ::1] pairs_view = pairs
+    cdef double[::1] distances_view = distances
+    cdef Py_ssize_t k
+    for k in range(found.size):
+        pairs_view[k, 0] = found.pairs[2 * k]
+        pairs_view[k, 1] = found.pairs[2 * k + 1]
+        distances_view[k] = found.distances[k]
+    return pairs, distances
+
+
+cdef inline int64_t _neighbor_cell(int64_t* cell, int64_t* offset,
+                                   int64_t* n_cells, double* vectors,
+                                   bint periodic, double* shift) nogil:
+    """Index of the cell at `offset` from `cell`, -1 if it is outside of a
+    non-periodic grid.  `shift` is set to the sum of box vectors of the
+    periodic image the neighbor cell is in.
+    """
+    cdef int64_t neighbor[3]
+    cdef int64_t image
+    cdef int k
+    shift[0] = shift[1] = shift[2] = 0.0
+    for k in range(3):
+        neighbor[k] = cell[k] + offset[k]
+        if periodic:
+            # cells are at most one cell outside of the grid
+            image = -1 if neighbor[k] < 0 else (
+                1 if neighbor[k] >= n_cells[k] else 0)
+            if image:
+                neighbor[k] -= image * n_cells[k]
+                shift[0] += image * vectors[3 * k]
+                shift[1] += image * vectors[3 * k + 1]
+                shift[2] += image * vectors[3 * k + 2]
+        elif neighbor[k] < 0 or neighbor[k] >= n_cells[k]:
+            return -1
+    return (neighbor[0] * n_cells[1] + neighbor[1]) * n_cells[2] + neighbor[2]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nsgrid_bin(double[:, ::1] coords, double[::1] origin,
+               double[::1] cellsize, int64_t[::1] n_cells,
+               int64_t[:, ::1] cells):
+    cdef Py_ssize_t i
+    cdef int k
+    cdef double cell
+    for i in range(coords.shape[0]):
+        for k in range(3):
+            cell = floor((coords[i, k] - origin[k]) / cellsize[k])
+            # cells further outside have no neighbors in the grid
+            if cell < -1:
+                cell = -1
+            elif cell > n_cells[k]:
+                cell = n_cells[k]
+            cells[i, k] = <int64_t>cell
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nsgrid_bin_periodic(double[:, ::1] coords, double[:, ::1] vectors,
+                        double[:, ::1] inverse, int64_t[::1] n_cells,
+                        double[:, ::1] wrapped, int64_t[:, ::1] cells):
+    cdef Py_ssize_t i
+    cdef int k
+    cdef double frac[3]
+    for i in range(coords.shape[0]):
+        for k in range(3):
+            frac[k] = (coords[i, 0] * inverse[0, k] +
+                       coords[i, 1] * inverse[1, k] +
+                       coords[i, 2] * inverse[2, k])
+            frac[k] -= floor(frac[k])
+            # rounding can give exactly 1.0 for tiny negative values
+            if frac[k] >= 1.0:
+                frac[k] = 0.0
+            cells[i, k] = <int64_t>(frac[k] * n_cells[k])
+            if cells[i, k] >= n_cells[k]:
+                cells[i, k] = n_cells[k] - 1
+        for k in range(3):
+            wrapped[i, k] = (frac[0] * vectors[0, k] +
+                             frac[1] * vectors[1, k] +
+                             frac[2] * vectors[2, k])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nsgrid_sort(int64_t[:, ::1] cells, int64_t[::1] n_cells):
+    """Counting sort of coordinates by their cell.
+
+    Returns the order of the coordinates and the start and number of
+    coordinates of every cell in that order.
+    """
+    cdef Py_ssize_t n = cells.shape[0]
+    cdef int64_t n_total = n_cells[0] * n_cells[1] * n_cells[2]
+    order = numpy.empty(n, dtype=numpy.int64)
+    cell_start = numpy.zeros(n_total, dtype=numpy.int64)
+    cell_count = numpy.zeros(n_total, dtype=numpy.int64)
+    ids = numpy.empty(n, dtype=numpy.int64)
+    cdef int64_t[::1] order_view = order
+    cdef int64_t[::1] start = cell_start
+    cdef int64_t[::1] count = cell_count
+    cdef int64_t[::1] ids_view = ids
+    cdef Py_ssize_t i
+    cdef int64_t c, total = 0
+
+    for i in range(n):
+        ids_view[i] = ((cells[i, 0] * n_cells[1] + cells[i, 1]) * n_cells[2] +
+                       cells[i, 2])
+        count[ids_view[i]] += 1
+    for c in range(n_total):
+        start[c] = total
+        total += count[c]
+    # fill the cells in order, which leaves start at the end of every cell
+    for i in range(n):
+        order_view[start[ids_view[i]]] = i
+        start[ids_view[i]] += 1
+    for c in range(n_total):
+        start[c] -= count[c]
+    return order, cell_start, cell_count
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nsgrid_search(double[:, ::1] query, int64_t[:, ::1] query_cells,
+                  double[:, ::1] sorted_coords, int64_t[::1] cell_start,
+                  int64_t[::1] cell_count, int64_t[::1] n_cells,
+                  double[:, ::1] vectors, bint periodic,
+                  int64_t[:, ::1] stencil, double cutoff):
+    """Pairs of query and (cell sorted) grid coordinates within `cutoff`
+
+    Every query is compared to the grid coordinates in the cells of the
+    `stencil` around its cell.  Returns the ``(n, 2)`` pairs of query index
+    and sorted grid index and their distances.
+    """
+    cdef _PairList found
+    cdef Py_ssize_t i, o
+    cdef int64_t j, cell
+    cdef double cutoff2 = cutoff * cutoff
+    cdef double shift[3]
+    cdef double qx, qy, qz, dx, dy, dz, dist2
+
+    found.pairs = NULL
+    found.distances = NULL
+    found.size = found.capacity = 0
+    try:
+        for i in range(query.shape[0]):
+            for o in range(stencil.shape[0]):
+                cell = _neighbor_cell(&query_cells[i, 0], &stencil[o, 0],
+                                      &n_cells[0], &vectors[0, 0],
+                                      periodic, shift)
+                if cell < 0:
+                    continue
+                # move the query instead of the neighbor cell into its image
+                qx = query[i, 0] - shift[0]
+                qy = query[i, 1] - shift[1]
+                qz = query[i, 2] - shift[2]
+                for j in range(cell_start[cell],
+                               cell_start[cell] + cell_count[cell]):
+                    dx = sorted_coords[j, 0] - qx
+                    dy = sorted_coords[j, 1] - qy
+                    dz = sorted_coords[j, 2] - qz
+                    dist2 = dx * dx + dy * dy + dz * dz
+                    if dist2 <= cutoff2:
+                        _pairlist_add(&found, i, j, dist2)
+        return _pairlist_arrays(&found)
+    finally:
+        free(found.pairs)
+        free(found.distances)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def nsgrid_self_search(double[:, ::1] sorted_coords, int64_t[::1] cell_start,
+                       int64_t[::1] cell_count, int64_t[::1] n_cells,
+                       double[:, ::1] vectors, bint periodic,
+                       int64_t[:, ::1] stencil, double cutoff):
+    """Pairs of (cell sorted) grid coordinates within `cutoff`
+
+    The coordinates of every cell are compared to those in the cells of the
+    `stencil` around it.  In the cell itself only pairs ``i < j`` are
+    reported, and no coordinate is paired with itself.  Returns the
+    ``(n, 2)`` pairs of sorted indices and their distances.
+    """
+    cdef _PairList found
+    cdef Py_ssize_t o
+    cdef int64_t c, i, j, first, other
+    cdef int64_t n_total = n_cells[0] * n_cells[1] * n_cells[2]
+    cdef int64_t cell[3]
+    cdef bint central
+    cdef double cutoff2 = cutoff * cutoff
+    cdef double shift[3]
+    cdef double qx, qy, qz, dx, dy, dz, dist2
+
+    found.pairs = NULL
+    found.distances = NULL
+    found.size = found.capacity = 0
+    try:
+        for c in range(n_total):
+            if not cell_count[c]:
+                continue
+            cell[0] = c // (n_cells[1] * n_cells[2])
+            cell[1] = (c // n_cells[2]) % n_cells[1]
+            cell[2] = c % n_cells[2]
+            for o in range(stencil.shape[0]):
+                other = _neighbor_cell(cell, &stencil[o, 0], &n_cells[0],
+                                       &vectors[0, 0], periodic, shift)
+                if other < 0:
+                    continue
+                central = not (stencil[o, 0] or stencil[o, 1] or
+                               stencil[o, 2])
+                for i in range(cell_start[c], cell_start[c] + cell_count[c]):
+                    qx = sorted_coords[i, 0] - shift[0]
+                    qy = sorted_coords[i, 1] - shift[1]
+                    qz = sorted_coords[i, 2] - shift[2]
+                    first = i + 1 if central else cell_start[other]
+                    for j in range(first,
+                                   cell_start[other] + cell_count[other]):
+                        if j == i:
+                            continue
+                        dx = sorted_coords[j, 0] - qx
+                        dy = sorted_coords[j, 1] - qy
+                        dz = sorted_coords[j, 2] - qz
+                        dist2 = dx * dx + dy * dy + dz * dz
+                        if dist2 <= cutoff2:
+                            _pairlist_add(&found, i, j, dist2)
+        return _pairlist_arrays(&found)
+    finally:
+        free(found.pairs)
+        free(found.distances)
@@ -39,21 +39,60 @@ cdef extern from "calc_distances.h":
     ctypedef float coordinate[3]
     cdef bint USED_OPENMP
     void _calc_distance_array(coordinate* ref, int numref, coordinate* conf, int numconf, double* distances)
+    void _calc_distance_array_f(coordinate* ref, int numref, coordinate* conf, int numconf, float* distances)
+    void _calc_distance_array_fd(coordinate* ref, int numref, coordinate* conf, int numconf, float* distances)
     void _calc_distance_array_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
+    void _calc_distance_array_ortho_f(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, float* distances)
+    void _calc_distance_array_ortho_fd(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, float* distances)
     void _calc_distance_array_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double* distances)
+    void _calc_distance_array_triclinic_f(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, float* distances)
+    void _calc_distance_array_triclinic_fd(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, float* distances)
     void _calc_self_distance_array(coordinate* ref, int numref, double* distances, int distnum)
+    void _calc_self_distance_array_f(coordinate* ref, int numref, float* distances, int distnum)
+    void _calc_self_distance_array_fd(coordinate* ref, int numref, float* distances, int distnum)
     void _calc_self_distance_array_ortho(coordinate* ref, int numref, float* box, double* distances, int distnum)
+    void _calc_self_distance_array_ortho_f(coordinate* ref, int numref, float* box, float* distances, int distnum)
+    void _calc_self_distance_array_ortho_fd(coordinate* ref, int numref, float* box, float* distances, int distnum)
     void _calc_self_distance_array_triclinic(coordinate* ref, int numref, coordinate* box, double* distances, int distnum)
+    void _calc_self_distance_array_triclinic_f(coordinate* ref, int numref, coordinate* box, float* distances, int distnum)
+    void _calc_self_distance_array_triclinic_fd(coordinate* ref, int numref, coordinate* box, float* distances, int distnum)
+    void _calc_distance_histogram(coordinate* ref, int numref, coordinate* conf, int numconf, double* edges, int nbins, long long* histo, int block_ref, int block_conf)
+    void _calc_distance_histogram_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* edges, int nbins, long long* histo, int block_ref, int block_conf)
+    void _calc_distance_histogram_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double* edges, int nbins, long long* histo, int block_ref, int block_conf)
+    void _calc_min_distance_per_atom(coordinate* ref, int numref, coordinate* conf, int numconf, double* distances)
+    void _calc_min_distance_per_atom_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double* distances)
+    void _calc_min_distance_per_atom_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double* distances)
+    void _calc_count_within(coordinate* ref, int numref, coordinate* conf, int numconf, double cutoff, long long* counts)
+    void _calc_count_within_ortho(coordinate* ref, int numref, coordinate* conf, int numconf, float* box, double cutoff, long long* counts)
+    void _calc_count_within_triclinic(coordinate* ref, int numref, coordinate* conf, int numconf, coordinate* box, double cutoff, long long* counts)
     void _coord_transform(coordinate* coords, int numCoords, coordinate* box)
     void _calc_bond_distance(coordinate* atom1, coordinate* atom2, int numatom, double* distances)
+    void _calc_bond_distance_f(coordinate* atom1, coordinate* atom2, int numatom, float* distances)
+    void _calc_bond_distance_fd(coordinate* atom1, coordinate* atom2, int numatom, float* distances)
     void _calc_bond_distance_ortho(coordinate* atom1, coordinate* atom2, int numatom, float*box, double* distances)
+    void _calc_bond_distance_ortho_f(coordinate* atom1, coordinate* atom2, int numatom, float*box, float* distances)
+    void _calc_bond_distance_ortho_fd(coordinate* atom1, coordinate* atom2, int numatom, float*box, float* distances)
     void _calc_bond_distance_triclinic(coordinate* atom1, coordinate* atom2, int numatom, coordinate* box, double* distances)
+    void _calc_bond_distance_triclinic_f(coordinate* atom1, coordinate* atom2, int numatom, coordinate* box, float* distances)
+    void _calc_bond_distance_triclinic_fd(coordinate* atom1, coordinate* atom2, int numatom, coordinate* box, float* distances)
     void _calc_angle(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, double* angles)
+    void _calc_angle_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* angles)
+    void _calc_angle_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* angles)
     void _calc_angle_ortho(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* box, double* angles)
+    void _calc_angle_ortho_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* box, float* angles)
+    void _calc_angle_ortho_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, float* box, float* angles)
     void _calc_angle_triclinic(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, coordinate* box, double* angles)
+    void _calc_angle_triclinic_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, coordinate* box, float* angles)
+    void _calc_angle_triclinic_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, int numatom, coordinate* box, float* angles)
     void _calc_dihedral(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, double* angles)
+    void _calc_dihedral_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* angles)
+    void _calc_dihedral_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* angles)
     void _calc_dihedral_ortho(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* box, double* angles)
+    void _calc_dihedral_ortho_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* box, float* angles)
+    void _calc_dihedral_ortho_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, float* box, float* angles)
     void _calc_dihedral_triclinic(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, coordinate* box, double* angles)
+    void _calc_dihedral_triclinic_f(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, coordinate* box, float* angles)
+    void _calc_dihedral_triclinic_fd(coordinate* atom1, coordinate* atom2, coordinate* atom3, coordinate* atom4, int numatom, coordinate* box, float* angles)
     void _ortho_pbc(coordinate* coords, int numcoords, float* box, float* box_inverse)
     void _triclinic_pbc(coordinate* coords, int numcoords, coordinate* box, float* box_inverse)
 
@@ -62,69 +101,254 @@ OPENMP_ENABLED = True if USED_OPENMP else False
 
 
 def calc_distance_array(numpy.ndarray ref, numpy.ndarray conf,
-                        numpy.ndarray result):
+                        numpy.ndarray result,
+                        bint double_accumulate=False):
     cdef int confnum, refnum
     confnum = conf.shape[0]
     refnum = ref.shape[0]
 
-    _calc_distance_array(<coordinate*>ref.data, refnum,
-                         <coordinate*>conf.data, confnum,
-                         <double*>result.data)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_distance_array_fd(<coordinate*>ref.data, refnum,
+                                <coordinate*>conf.data, confnum,
+                                <float*>result.data)
+    elif result.dtype == numpy.float32:
+        _calc_distance_array_f(<coordinate*>ref.data, refnum,
+                               <coordinate*>conf.data, confnum,
+                               <float*>result.data)
+    else:
+        _calc_distance_array(<coordinate*>ref.data, refnum,
+                             <coordinate*>conf.data, confnum,
+                             <double*>result.data)
 
 def calc_distance_array_ortho(numpy.ndarray ref, numpy.ndarray conf,
                               numpy.ndarray box,
-                              numpy.ndarray result):
+                              numpy.ndarray result,
+                              bint double_accumulate=False):
     cdef int confnum, refnum
     confnum = conf.shape[0]
     refnum = ref.shape[0]
 
-    _calc_distance_array_ortho(<coordinate*>ref.data, refnum,
-                               <coordinate*>conf.data, confnum,
-                               <float*>box.data,
-                               <double*>result.data)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_distance_array_ortho_fd(<coordinate*>ref.data, refnum,
+                                      <coordinate*>conf.data, confnum,
+                                      <float*>box.data,
+                                      <float*>result.data)
+    elif result.dtype == numpy.float32:
+        _calc_distance_array_ortho_f(<coordinate*>ref.data, refnum,
+                                     <coordinate*>conf.data, confnum,
+                                     <float*>box.data,
+                                     <float*>result.data)
+    else:
+        _calc_distance_array_ortho(<coordinate*>ref.data, refnum,
+                                   <coordinate*>conf.data, confnum,
+                                   <float*>box.data,
+                                   <double*>result.data)
 
 def calc_distance_array_triclinic(numpy.ndarray ref, numpy.ndarray conf,
                                   numpy.ndarray box,
-                                  numpy.ndarray result):
+                                  numpy.ndarray result,
+                                  bint double_accumulate=False):
     cdef int confnum, refnum
     confnum = conf.shape[0]
     refnum = ref.shape[0]
 
-    _calc_distance_array_triclinic(<coordinate*>ref.data, refnum,
-                                   <coordinate*>conf.data, confnum,
-                                   <coordinate*>box.data,
-                                   <double*>result.data)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_distance_array_triclinic_fd(<coordinate*>ref.data, refnum,
+                                          <coordinate*>conf.data, confnum,
+                                          <coordinate*>box.data,
+                                          <float*>result.data)
+    elif result.dtype == numpy.float32:
+        _calc_distance_array_triclinic_f(<coordinate*>ref.data, refnum,
+                                         <coordinate*>conf.data, confnum,
+                                         <coordinate*>box.data,
+                                         <float*>result.data)
+    else:
+        _calc_distance_array_triclinic(<coordinate*>ref.data, refnum,
+                                       <coordinate*>conf.data, confnum,
+                                       <coordinate*>box.data,
+                                       <double*>result.data)
 
 def calc_self_distance_array(numpy.ndarray ref,
-                             numpy.ndarray result):
+                             numpy.ndarray result,
+                             bint double_accumulate=False):
     cdef int refnum, distnum
     refnum = ref.shape[0]
     distnum = (refnum*(refnum-1))/2
 
-    _calc_self_distance_array(<coordinate*>ref.data, refnum,
-                              <double*>result.data, distnum)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_self_distance_array_fd(<coordinate*>ref.data, refnum,
+                                     <float*>result.data, distnum)
+    elif result.dtype == numpy.float32:
+        _calc_self_distance_array_f(<coordinate*>ref.data, refnum,
+                                    <float*>result.data, distnum)
+    else:
+        _calc_self_distance_array(<coordinate*>ref.data, refnum,
+                                  <double*>result.data, distnum)
 
 def calc_self_distance_array_ortho(numpy.ndarray ref,
                                    numpy.ndarray box,
-                                   numpy.ndarray result):
+                                   numpy.ndarray result,
+                                   bint double_accumulate=False):
     cdef int refnum, distnum
     refnum = ref.shape[0]
     distnum = (refnum*(refnum-1))/2
 
-    _calc_self_distance_array_ortho(<coordinate*>ref.data, refnum,
-                                    <float*>box.data,
-                                    <double*>result.data, distnum)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_self_distance_array_ortho_fd(<coordinate*>ref.data, refnum,
+                                           <float*>box.data,
+                                           <float*>result.data, distnum)
+    elif result.dtype == numpy.float32:
+        _calc_self_distance_array_ortho_f(<coordinate*>ref.data, refnum,
+                                          <float*>box.data,
+                                          <float*>result.data, distnum)
+    else:
+        _calc_self_distance_array_ortho(<coordinate*>ref.data, refnum,
+                                        <float*>box.data,
+                                        <double*>result.data, distnum)
 
 def calc_self_distance_array_triclinic(numpy.ndarray ref,
                                        numpy.ndarray box,
-                                       numpy.ndarray result):
+                                       numpy.ndarray result,
+                                       bint double_accumulate=False):
     cdef int refnum, distnum
     refnum = ref.shape[0]
     distnum = (refnum*(refnum-1))/2
 
-    _calc_self_distance_array_triclinic(<coordinate*>ref.data, refnum,
-                                        <coordinate*>box.data,
-                                        <double*>result.data, distnum)
+    if result.dtype == numpy.float32 and double_accumulate:
+        _calc_self_distance_array_triclinic_fd(<coordinate*>ref.data, refnum,
+                                               <coordinate*>box.data,
+                                               <float*>result.data, distnum)
+    elif result.dtype == numpy.float32:
+        _calc_self_distance_array_triclinic_f(<coordinate*>ref.data, refnum,
+                                              <coordinate*>box.data,
+                                              <float*>result.data, distnum)
+    else:
+        _calc_self_distance_array_triclinic(<coordinate*>ref.data, refnum,
+                                            <coordinate*>box.data,
+                                            <double*>result.data, distnum)
+
+def calc_distance_histogram(numpy.ndarray ref, numpy.ndarray conf,
+                            numpy.ndarray edges,
+                            numpy.ndarray histo,
+                            int block_ref=0, int block_conf=0):
+    cdef int confnum, refnum, nbins
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+    nbins = histo.shape[0]
+
+    _calc_distance_histogram(<coordinate*>ref.data, refnum,
+                             <coordinate*>conf.data, confnum,
+                             <double*>edges.data, nbins,
+                             <long long*>histo.data,
+                             block_ref, block_conf)
+
+def calc_distance_histogram_ortho(numpy.ndarray ref, numpy.ndarray conf,
+                                  numpy.ndarray box,
+                                  numpy.ndarray edges,
+                                  numpy.ndarray histo,
+                                  int block_ref=0, int block_conf=0):
+    cdef int confnum, refnum, nbins
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+    nbins = histo.shape[0]
+
+    _calc_distance_histogram_ortho(<coordinate*>ref.data, refnum,
+                                   <coordinate*>conf.data, confnum,
+                                   <float*>box.data,
+                                   <double*>edges.data, nbins,
+                                   <long long*>histo.data,
+                                   block_ref, block_conf)
+
+def calc_distance_histogram_triclinic(numpy.ndarray ref, numpy.ndarray conf,
+                                      numpy.ndarray box,
+                                      numpy.ndarray edges,
+                                      numpy.ndarray histo,
+                                      int block_ref=0, int block_conf=0):
+    cdef int confnum, refnum, nbins
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+    nbins = histo.shape[0]
+
+    _calc_distance_histogram_triclinic(<coordinate*>ref.data, refnum,
+                                       <coordinate*>conf.data, confnum,
+                                       <coordinate*>box.data,
+                                       <double*>edges.data, nbins,
+                                       <long long*>histo.data,
+                                       block_ref, block_conf)
+
+def calc_min_distance_per_atom(numpy.ndarray ref, numpy.ndarray conf,
+                               numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_min_distance_per_atom(<coordinate*>ref.data, refnum,
+                                <coordinate*>conf.data, confnum,
+                                <double*>result.data)
+
+def calc_min_distance_per_atom_ortho(numpy.ndarray ref, numpy.ndarray conf,
+                                     numpy.ndarray box,
+                                     numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_min_distance_per_atom_ortho(<coordinate*>ref.data, refnum,
+                                      <coordinate*>conf.data, confnum,
+                                      <float*>box.data,
+                                      <double*>result.data)
+
+def calc_min_distance_per_atom_triclinic(numpy.ndarray ref, numpy.ndarray conf,
+                                         numpy.ndarray box,
+                                         numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_min_distance_per_atom_triclinic(<coordinate*>ref.data, refnum,
+                                          <coordinate*>conf.data, confnum,
+                                          <coordinate*>box.data,
+                                          <double*>result.data)
+
+def calc_count_within(numpy.ndarray ref, numpy.ndarray conf,
+                      double cutoff,
+                      numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_count_within(<coordinate*>ref.data, refnum,
+                       <coordinate*>conf.data, confnum,
+                       cutoff,
+                       <long long*>result.data)
+
+def calc_count_within_ortho(numpy.ndarray ref, numpy.ndarray conf,
+                            numpy.ndarray box,
+                            double cutoff,
+                            numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_count_within_ortho(<coordinate*>ref.data, refnum,
+                             <coordinate*>conf.data, confnum,
+                             <float*>box.data,
+                             cutoff,
+                             <long long*>result.data)
+
+def calc_count_within_triclinic(numpy.ndarray ref, numpy.ndarray conf,
+                                numpy.ndarray box,
+                                double cutoff,
+                                numpy.ndarray result):
+    cdef int confnum, refnum
+    confnum = conf.shape[0]
+    refnum = ref.shape[0]
+
+    _calc_count_within_triclinic(<coordinate*>ref.data, refnum,
+                                 <coordinate*>conf.data, confnum,
+                                 <coordinate*>box.data,
+                                 cutoff,
+                                 <long long*>result.data)
 
 def coord_transform(numpy.ndarray coords,
                     numpy.ndarray box):
@@ -136,120 +360,234 @@ def coord_transform(numpy.ndarray coords,
 
 def calc_bond_distance(numpy.ndarray coords1,
                        numpy.ndarray coords2,
-                       numpy.ndarray results):
+                       numpy.ndarray results,
+                       bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_bond_distance(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                        numcoords,
-                        <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_bond_distance_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                               numcoords,
+                               <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_bond_distance_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                              numcoords,
+                              <float*>results.data)
+    else:
+        _calc_bond_distance(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                            numcoords,
+                            <double*>results.data)
 
 def calc_bond_distance_ortho(numpy.ndarray coords1,
                              numpy.ndarray coords2,
                              numpy.ndarray box,
-                             numpy.ndarray results):
+                             numpy.ndarray results,
+                             bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_bond_distance_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                              numcoords,
-                              <float*>box.data,
-                              <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_bond_distance_ortho_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                     numcoords,
+                                     <float*>box.data,
+                                     <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_bond_distance_ortho_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                    numcoords,
+                                    <float*>box.data,
+                                    <float*>results.data)
+    else:
+        _calc_bond_distance_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                  numcoords,
+                                  <float*>box.data,
+                                  <double*>results.data)
 
 def calc_bond_distance_triclinic(numpy.ndarray coords1,
                                  numpy.ndarray coords2,
                                  numpy.ndarray box,
-                                 numpy.ndarray results):
+                                 numpy.ndarray results,
+                                 bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_bond_distance_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                                  numcoords,
-                                  <coordinate*>box.data,
-                                  <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_bond_distance_triclinic_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                         numcoords,
+                                         <coordinate*>box.data,
+                                         <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_bond_distance_triclinic_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                        numcoords,
+                                        <coordinate*>box.data,
+                                        <float*>results.data)
+    else:
+        _calc_bond_distance_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                      numcoords,
+                                      <coordinate*>box.data,
+                                      <double*>results.data)
 
 def calc_angle(numpy.ndarray coords1,
                numpy.ndarray coords2,
                numpy.ndarray coords3,
-               numpy.ndarray results):
+               numpy.ndarray results,
+               bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_angle(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                <coordinate*> coords3.data,
-                numcoords,
-                <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_angle_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                       <coordinate*> coords3.data,
+                       numcoords,
+                       <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_angle_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                      <coordinate*> coords3.data,
+                      numcoords,
+                      <float*>results.data)
+    else:
+        _calc_angle(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                    <coordinate*> coords3.data,
+                    numcoords,
+                    <double*>results.data)
 
 def calc_angle_ortho(numpy.ndarray coords1,
                      numpy.ndarray coords2,
                      numpy.ndarray coords3,
                      numpy.ndarray box,
-                     numpy.ndarray results):
+                     numpy.ndarray results,
+                     bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_angle_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                      <coordinate*> coords3.data,
-                      numcoords,
-                      <float*>box.data,
-                      <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_angle_ortho_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                             <coordinate*> coords3.data,
+                             numcoords,
+                             <float*>box.data,
+                             <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_angle_ortho_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                            <coordinate*> coords3.data,
+                            numcoords,
+                            <float*>box.data,
+                            <float*>results.data)
+    else:
+        _calc_angle_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                          <coordinate*> coords3.data,
+                          numcoords,
+                          <float*>box.data,
+                          <double*>results.data)
 
 def calc_angle_triclinic(numpy.ndarray coords1,
                          numpy.ndarray coords2,
                          numpy.ndarray coords3,
                          numpy.ndarray box,
-                         numpy.ndarray results):
+                         numpy.ndarray results,
+                         bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_angle_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                          <coordinate*> coords3.data,
-                          numcoords,
-                          <coordinate*>box.data,
-                          <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_angle_triclinic_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                 <coordinate*> coords3.data,
+                                 numcoords,
+                                 <coordinate*>box.data,
+                                 <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_angle_triclinic_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                <coordinate*> coords3.data,
+                                numcoords,
+                                <coordinate*>box.data,
+                                <float*>results.data)
+    else:
+        _calc_angle_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                              <coordinate*> coords3.data,
+                              numcoords,
+                              <coordinate*>box.data,
+                              <double*>results.data)
 
 def calc_dihedral(numpy.ndarray coords1,
                  numpy.ndarray coords2,
                  numpy.ndarray coords3,
                  numpy.ndarray coords4,
-                 numpy.ndarray results):
+                 numpy.ndarray results,
+                 bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_dihedral(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                  <coordinate*> coords3.data, <coordinate*> coords4.data,
-                  numcoords,
-                  <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_dihedral_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                         <coordinate*> coords3.data, <coordinate*> coords4.data,
+                         numcoords,
+                         <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_dihedral_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                        <coordinate*> coords3.data, <coordinate*> coords4.data,
+                        numcoords,
+                        <float*>results.data)
+    else:
+        _calc_dihedral(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                      <coordinate*> coords3.data, <coordinate*> coords4.data,
+                      numcoords,
+                      <double*>results.data)
 
 def calc_dihedral_ortho(numpy.ndarray coords1,
                        numpy.ndarray coords2,
                        numpy.ndarray coords3,
                        numpy.ndarray coords4,
                        numpy.ndarray box,
-                       numpy.ndarray results):
+                       numpy.ndarray results,
+                       bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_dihedral_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                        <coordinate*> coords3.data, <coordinate*> coords4.data,
-                        numcoords,
-                        <float*>box.data,
-                        <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_dihedral_ortho_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                               <coordinate*> coords3.data, <coordinate*> coords4.data,
+                               numcoords,
+                               <float*>box.data,
+                               <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_dihedral_ortho_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                              <coordinate*> coords3.data, <coordinate*> coords4.data,
+                              numcoords,
+                              <float*>box.data,
+                              <float*>results.data)
+    else:
+        _calc_dihedral_ortho(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                            <coordinate*> coords3.data, <coordinate*> coords4.data,
+                            numcoords,
+                            <float*>box.data,
+                            <double*>results.data)
 
 def calc_dihedral_triclinic(numpy.ndarray coords1,
                            numpy.ndarray coords2,
                            numpy.ndarray coords3,
                            numpy.ndarray coords4,
                            numpy.ndarray box,
-                           numpy.ndarray results):
+                           numpy.ndarray results,
+                           bint double_accumulate=False):
     cdef int numcoords
     numcoords = coords1.shape[0]
 
-    _calc_dihedral_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
-                            <coordinate*> coords3.data, <coordinate*> coords4.data,
-                            numcoords,
-                            <coordinate*>box.data,
-                            <double*>results.data)
+    if results.dtype == numpy.float32 and double_accumulate:
+        _calc_dihedral_triclinic_fd(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                   <coordinate*> coords3.data, <coordinate*> coords4.data,
+                                   numcoords,
+                                   <coordinate*>box.data,
+                                   <float*>results.data)
+    elif results.dtype == numpy.float32:
+        _calc_dihedral_triclinic_f(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                  <coordinate*> coords3.data, <coordinate*> coords4.data,
+                                  numcoords,
+                                  <coordinate*>box.data,
+                                  <float*>results.data)
+    else:
+        _calc_dihedral_triclinic(<coordinate*> coords1.data, <coordinate*> coords2.data,
+                                <coordinate*> coords3.data, <coordinate*> coords4.data,
+                                numcoords,
+                                <coordinate*>box.data,
+                                <double*>results.data)
 
 def ortho_pbc(numpy.ndarray coords,
               numpy.ndarray box, numpy.ndarray box_inverse):
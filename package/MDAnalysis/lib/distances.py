@@ -53,11 +53,17 @@ implemented (*backend* is case-insensitive):
 Functions
 ---------
 
-.. autofunction:: distance_array(reference, configuration [, box [, result [, backend]]])
-.. autofunction:: self_distance_array(reference [, box [,result [, backend]]])
-.. autofunction:: calc_bonds(atom1, atom2 [, box, [, result [, backend]]])
-.. autofunction:: calc_angles(atom1, atom2, atom3 [,box [, result [, backend]]])
-.. autofunction:: calc_dihedrals(atom1, atom2, atom3, atom4 [,box [, result [, backend]]])
+.. autofunction:: distance_array(reference, configuration [, box [, result [, backend [, dtype [, double_accumulate]]]]])
+.. autofunction:: self_distance_array(reference [, box [,result [, backend [, dtype [, double_accumulate]]]]])
+.. autofunction:: tiled_distance_array(reference, configuration, reduce [, box [, tile_size [, backend]]])
+.. autofunction:: distance_histogram(reference, configuration [, bins [, range [, box [, exclusion_block [, backend]]]]])
+.. autofunction:: min_distance_per_atom(reference, configuration [, box [, backend]])
+.. autofunction:: count_within(reference, configuration, cutoff [, box [, backend]])
+.. autofunction:: capped_distance(reference, configuration, max_cutoff [, min_cutoff [, box [, method [, return_distances [, backend]]]]])
+.. autofunction:: self_capped_distance(reference, max_cutoff [, min_cutoff [, box [, method [, return_distances [, backend]]]]])
+.. autofunction:: calc_bonds(atom1, atom2 [, box, [, result [, backend [, dtype [, double_accumulate]]]]])
+.. autofunction:: calc_angles(atom1, atom2, atom3 [,box [, result [, backend [, dtype [, double_accumulate]]]]])
+.. autofunction:: calc_dihedrals(atom1, atom2, atom3, atom4 [,box [, result [, backend [, dtype [, double_accumulate]]]]])
 .. autofunction:: apply_PBC(coordinates, box [, backend])
 .. autofunction:: transform_RtoS(coordinates, box [, backend])
 .. autofunction:: transform_StoR(coordinates, box [,backend])
@@ -70,6 +76,7 @@ import numpy as np
 from numpy.lib.utils import deprecate
 
 from .mdamath import triclinic_vectors, triclinic_box
+from .nsgrid import FastNS, _box_vectors
 
 
 # hack to select backend with backend=<backend> kwarg. Note that
@@ -172,6 +179,18 @@ def _box_check(box):
     return boxtype
 
 
+def _coordinates(coords, box):
+    """C contiguous coordinates to pass to a kernel
+
+    The triclinic kernels move the coordinates into the box in place, so
+    for a triclinic `box` a copy is returned. Otherwise `coords` is only
+    copied if it is not C contiguous.
+    """
+    if box is not None and _box_check(box) != 'ortho':
+        return coords.copy('C')
+    return np.ascontiguousarray(coords)
+
+
 def _check_array(coords, desc):
     """Check an array is a valid array of coordinates
 
@@ -191,13 +210,30 @@ def _check_results_array(results, size):
 
     Must be:
       same shape as size
-      float64
+      float64 or float32
+      C contiguous
     """
     if results.shape != size:
         raise ValueError("Result array has incorrect size,"
                          "should be {0}, got {1}".format(size, results.shape))
-    if results.dtype != np.float64:
-        raise TypeError("Results array must be of type float64")
+    if results.dtype not in (np.float64, np.float32):
+        raise TypeError("Results array must be of type float64 or float32")
+    if not results.flags['C_CONTIGUOUS']:
+        raise ValueError("Results array must be C contiguous")
+
+
+def _results_array(result, size, dtype):
+    """Array the results are written to
+
+    `result` if it is given, otherwise a new array of type `dtype`.
+    """
+    if result is not None:
+        _check_results_array(result, size)
+        return np.asarray(result)
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise TypeError("dtype must be float64 or float32")
+    return np.empty(size, dtype=dtype)
 
 
 def _check_lengths_match(*arrays):
@@ -208,7 +244,8 @@ def _check_lengths_match(*arrays):
         raise ValueError("Input arrays must all be same shape"
                          "Got {0}".format([a.shape for a in arrays]))
 
-def distance_array(reference, configuration, box=None, result=None, backend="serial"):
+def distance_array(reference, configuration, box=None, result=None, backend="serial",
+                   dtype=np.float64, double_accumulate=False):
     """Calculate all distances between a reference set and another configuration.
 
     If there are *i* positions in reference, and *j* positions in configuration,
@@ -216,9 +253,9 @@ def distance_array(reference, configuration, box=None, result=None, backend="ser
     If an *box* is supplied then a minimum image convention is used when
     calculating distances.
 
-    If a 2D numpy array of dtype ``numpy.float64`` with the shape ``(len(reference),
-    len(configuration))`` is provided in *result* then this preallocated array is
-    filled. This can speed up calculations.
+    If a 2D numpy array of dtype ``numpy.float64`` (or ``numpy.float32``) with
+    the shape ``(len(reference), len(configuration))`` is provided in *result*
+    then this preallocated array is filled. This can speed up calculations.
 
     Parameters
     ----------
@@ -233,12 +270,20 @@ def distance_array(reference, configuration, box=None, result=None, backend="ser
         ly, lz, alpha, beta, gamma]``.
     result : numpy.array of numpy.float64, optional
         Preallocated result array which must have the
-        shape ``(len(ref), len(conf))`` and ``dtype=numpy.float64``.
+        shape ``(len(ref), len(conf))`` and ``dtype=numpy.float64`` or
+        ``dtype=numpy.float32``.
         Avoids creating the array which saves time when the function
         is called repeatedly. [``None``]
     backend
         Select the type of acceleration; "serial" is always available. Other
         possibilities are "OpenMP" (OpenMP).
+    dtype : numpy.dtype, optional
+        Type of the result array if `result` is not given, ``numpy.float64``
+        or ``numpy.float32``. [``numpy.float64``]
+    double_accumulate : bool, optional
+        ``numpy.float32`` results are computed in single precision, which is
+        faster; set to ``True`` to compute them in double precision and only
+        store them in single precision. [``False``]
 
     Returns
     -------
@@ -249,15 +294,19 @@ def distance_array(reference, configuration, box=None, result=None, backend="ser
 
     Note
     ----
-    This method is slower than it could be because internally we need to make
-    copies of the ref and conf arrays.
+    With a triclinic box this method is slower than it could be because
+    internally we need to make copies of the ref and conf arrays.
 
 
     .. versionchanged:: 0.13.0
        Added *backend* keyword.
+    .. versionchanged:: 0.17.0
+       Added *dtype* and *double_accumulate* keywords; *result* can be of
+       type ``numpy.float32``.
+       The coordinates are only copied for triclinic boxes.
     """
-    ref = reference.copy('C')
-    conf = configuration.copy('C')
+    ref = _coordinates(reference, box)
+    conf = _coordinates(configuration, box)
 
     _check_array(conf, 'conf')
     _check_array(ref, 'ref')
@@ -273,38 +322,35 @@ def distance_array(reference, configuration, box=None, result=None, backend="ser
     confnum = conf.shape[0]
     refnum = ref.shape[0]
 
-    if result is not None:
-        _check_results_array(result, (refnum, confnum))
-        distances = np.asarray(result)
-    else:
-        distances = np.zeros((refnum, confnum), np.float64)
+    distances = _results_array(result, (refnum, confnum), dtype)
 
     if box is not None:
         if boxtype == 'ortho':
             _run("calc_distance_array_ortho",
-                   args=(ref, conf, box, distances),
+                   args=(ref, conf, box, distances, double_accumulate),
                    backend=backend)
         else:
             _run("calc_distance_array_triclinic",
-                   args=(ref, conf, box, distances),
+                   args=(ref, conf, box, distances, double_accumulate),
                    backend=backend)
     else:
         _run("calc_distance_array",
-               args=(ref, conf, distances),
+               args=(ref, conf, distances, double_accumulate),
                backend=backend)
 
     return distances
 
 
-def self_distance_array(reference, box=None, result=None, backend="serial"):
+def self_distance_array(reference, box=None, result=None, backend="serial",
+                        dtype=np.float64, double_accumulate=False):
     """Calculate all distances within a configuration *reference*.
 
     If a *box* is supplied then a minimum image convention is used before
     calculating distances.
 
-    If a 1D numpy array of dtype ``numpy.float64`` with the shape
-    ``(N*(N-1)/2)`` is provided in *result* then this preallocated array
-    is filled. This can speed up calculations.
+    If a 1D numpy array of dtype ``numpy.float64`` (or ``numpy.float32``) with
+    the shape ``(N*(N-1)/2)`` is provided in *result* then this preallocated
+    array is filled. This can speed up calculations.
 
     Parameters
     ----------
@@ -317,12 +363,19 @@ def self_distance_array(reference, box=None, result=None, backend="serial"):
         ly, lz, alpha, beta, gamma]``.
     result : array, optional
         Preallocated result array which must have the shape
-        ``(N*(N-1)/2,)`` and dtype ``numpy.float64``. Avoids creating
-        the array which saves time when the function is called
+        ``(N*(N-1)/2,)`` and dtype ``numpy.float64`` or ``numpy.float32``.
+        Avoids creating the array which saves time when the function is called
         repeatedly. [``None``]
     backend
         Select the type of acceleration; "serial" is always available. Other
         possibilities are "OpenMP" (OpenMP).
+    dtype : numpy.dtype, optional
+        Type of the result array if `result` is not given, ``numpy.float64``
+        or ``numpy.float32``. [``numpy.float64``]
+    double_accumulate : bool, optional
+        ``numpy.float32`` results are computed in single precision, which is
+        faster; set to ``True`` to compute them in double precision and only
+        store them in single precision. [``False``]
 
     Returns
     -------
@@ -339,14 +392,18 @@ def self_distance_array(reference, box=None, result=None, backend="serial"):
 
     Note
     ----
-    This method is slower than it could be because internally we need to make
-    copies of the coordinate arrays.
+    With a triclinic box this method is slower than it could be because
+    internally we need to make copies of the coordinate arrays.
 
 
     .. versionchanged:: 0.13.0
        Added *backend* keyword.
+    .. versionchanged:: 0.17.0
+       Added *dtype* and *double_accumulate* keywords; *result* can be of
+       type ``numpy.float32``.
+       The coordinates are only copied for triclinic boxes.
     """
-    ref = reference.copy('C')
+    ref = _coordinates(reference, box)
 
     _check_array(ref, 'ref')
 
@@ -362,29 +419,497 @@ def self_distance_array(reference, box=None, result=None, backend="serial"):
     refnum = ref.shape[0]
     distnum = refnum * (refnum - 1) // 2
 
-    if result is not None:
-        _check_results_array(result, (distnum,))
-        distances = np.asarray(result)
-    else:
-        distances = np.zeros((distnum,), np.float64)
+    distances = _results_array(result, (distnum,), dtype)
 
     if box is not None:
         if boxtype == 'ortho':
             _run("calc_self_distance_array_ortho",
-                   args=(ref, box, distances),
+                   args=(ref, box, distances, double_accumulate),
                    backend=backend)
         else:
             _run("calc_self_distance_array_triclinic",
-                   args=(ref, box, distances),
+                   args=(ref, box, distances, double_accumulate),
                    backend=backend)
     else:
         _run("calc_self_distance_array",
-               args=(ref, distances),
+               args=(ref, distances, double_accumulate),
                backend=backend)
 
     return distances
 
 
+#: largest number of distances for which :func:`capped_distance` and
+#: :func:`self_capped_distance` choose the brute force method
+_BRUTEFORCE_MAX_PAIRS = 2 ** 20
+#: number of distances held in memory at once by the brute force method
+_BRUTEFORCE_CHUNK = 2 ** 20
+
+
+def _capped_method(method, n_pairs):
+    """Select the method of a capped distance search
+
+    Brute force for few pairs and the grid otherwise. The grid limits its
+    number of cells itself, so sparse systems do not need the tree, which is
+    searched one reference coordinate at a time.
+    """
+    if method is not None:
+        method = method.lower()
+        if method not in _capped_methods:
+            raise ValueError("Method {0} not available; try one of: {1}"
+                             "".format(method, ", ".join(_capped_methods)))
+        return method
+    if n_pairs <= _BRUTEFORCE_MAX_PAIRS:
+        return 'bruteforce'
+    return 'nsgrid'
+
+
+def _capped_bruteforce(reference, configuration, max_cutoff, box, backend,
+                       self_pairs=False):
+    """Pairs within *max_cutoff* from :func:`distance_array` of row chunks
+
+    With *self_pairs*, *configuration* is *reference* and only the pairs
+    ``i < j`` are kept.
+    """
+    chunk = max(1, _BRUTEFORCE_CHUNK // max(1, len(configuration)))
+    pairs, distances = [], []
+    for start in range(0, len(reference), chunk):
+        d = distance_array(reference[start:start + chunk], configuration,
+                           box=box, backend=backend)
+        mask = d <= max_cutoff
+        if self_pairs:
+            rows = np.arange(start, start + len(d))
+            mask &= np.arange(len(configuration)) > rows[:, None]
+        i, j = np.nonzero(mask)
+        pairs.append(np.column_stack([i + start, j]))
+        distances.append(d[i, j])
+    return pairs, distances
+
+
+def _capped_nsgrid(reference, configuration, max_cutoff, box, backend,
+                   self_pairs=False):
+    """Pairs within *max_cutoff* from the grid search of FastNS"""
+    grid = FastNS(max_cutoff, configuration, box=box)
+    if self_pairs:
+        results = grid.self_search()
+    else:
+        results = grid.search(reference)
+    return [results.get_pairs()], [results.get_pair_distances()]
+
+
+def _capped_pkdtree(reference, configuration, max_cutoff, box, backend,
+                    self_pairs=False):
+    """Pairs within *max_cutoff* from a KDTree of *configuration*"""
+    if box is not None:
+        from .pkdtree import PeriodicKDTree
+        tree = PeriodicKDTree(box, bucket_size=10)
+    else:
+        from Bio.KDTree import KDTree
+        tree = KDTree(dim=3, bucket_size=10)
+    tree.set_coords(configuration)
+
+    pairs = []
+    for i, center in enumerate(reference):
+        tree.search(center, max_cutoff)
+        indices = tree.get_indices()
+        if indices is None or not len(indices):
+            continue
+        indices = np.asarray(indices, dtype=np.intp)
+        if self_pairs:
+            indices = indices[indices > i]
+        pairs.append(np.column_stack([np.full(len(indices), i, np.intp),
+                                      indices]))
+    if not pairs:
+        return [], []
+    pairs = np.concatenate(pairs)
+    distances = calc_bonds(reference[pairs[:, 0]], configuration[pairs[:, 1]],
+                           box=box, backend=backend)
+    keep = distances <= max_cutoff
+    return [pairs[keep]], [distances[keep]]
+
+
+_capped_methods = {
+    'bruteforce': _capped_bruteforce,
+    'nsgrid': _capped_nsgrid,
+    'pkdtree': _capped_pkdtree,
+}
+
+
+def _capped_search(reference, configuration, max_cutoff, min_cutoff, box,
+                   method, return_distances, backend):
+    """Common part of :func:`capped_distance` and
+    :func:`self_capped_distance`; *configuration* is ``None`` for the
+    latter"""
+    self_pairs = configuration is None
+    reference = np.asarray(reference, dtype=np.float32).reshape(-1, 3)
+    if self_pairs:
+        configuration = reference
+        n_pairs = len(reference) * (len(reference) - 1) // 2
+    else:
+        configuration = np.asarray(configuration,
+                                   dtype=np.float32).reshape(-1, 3)
+        n_pairs = len(reference) * len(configuration)
+    if box is not None:
+        box = np.asarray(box, dtype=np.float32)
+        if _box_vectors(box) is None:
+            # no unit cell, eg a trajectory without box information
+            box = None
+
+    pairs = np.zeros((0, 2), dtype=np.intp)
+    distances = np.zeros(0, dtype=np.float64)
+    if n_pairs:
+        method = _capped_method(method, n_pairs)
+        found_pairs, found_distances = _capped_methods[method](
+            reference, configuration, max_cutoff, box, backend,
+            self_pairs=self_pairs)
+        if found_pairs:
+            pairs = np.concatenate(found_pairs).astype(np.intp)
+            distances = np.concatenate(found_distances).astype(np.float64)
+
+    if min_cutoff is not None:
+        keep = distances > min_cutoff
+        pairs, distances = pairs[keep], distances[keep]
+    # same order whichever method found the pairs
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    pairs, distances = pairs[order], distances[order]
+
+    if return_distances:
+        return pairs, distances
+    return pairs
+
+
+def capped_distance(reference, configuration, max_cutoff, min_cutoff=None,
+                    box=None, method=None, return_distances=True,
+                    backend="serial"):
+    """Find all pairs of reference and configuration coordinates within a
+    cutoff distance.
+
+    Only the pairs found are stored, so unlike :func:`distance_array` the
+    memory used scales with the number of pairs instead of
+    ``len(reference) * len(configuration)``.
+
+    Parameters
+    ----------
+    reference : numpy.array
+        Reference coordinate array of shape ``(N, 3)`` or ``(3,)``.
+    configuration : numpy.array
+        Configuration coordinate array of shape ``(M, 3)`` or ``(3,)``.
+    max_cutoff : float
+        Pairs at a distance of at most `max_cutoff` are returned.
+    min_cutoff : float, optional
+        Only pairs at a distance of more than `min_cutoff` are returned.
+        [``None``]
+    box : numpy.array or None
+        Dimensions of the cell; if provided, the minimum image convention is
+        applied. The dimensions must be provided in the same format as returned
+        by :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`: ``[lx,
+        ly, lz, alpha, beta, gamma]``. A box without volume (such as the
+        zero box of a trajectory without unit cell) is ignored.
+    method : {'bruteforce', 'nsgrid', 'pkdtree'}, optional
+        Search method: :func:`distance_array` over blocks of rows
+        (``'bruteforce'``), the cell grid of
+        :class:`MDAnalysis.lib.nsgrid.FastNS` (``'nsgrid'``) or a KDTree,
+        :class:`MDAnalysis.lib.pkdtree.PeriodicKDTree` with a `box`
+        (``'pkdtree'``). ``None`` chooses by problem size: brute force for
+        up to about a million distances and the grid otherwise. The tree is
+        only used when asked for. [``None``]
+    return_distances : bool, optional
+        Also return the distances of the pairs. [``True``]
+    backend
+        Select the type of acceleration of the brute force and tree
+        methods; "serial" is always available. Other possibilities are
+        "OpenMP" (OpenMP).
+
+    Returns
+    -------
+    pairs : numpy.array
+        ``(n_pairs, 2)`` array of the indices ``(i, j)`` of the pairs of
+        ``reference[i]`` and ``configuration[j]``, sorted by `i`, then `j`.
+    distances : numpy.array
+        ``(n_pairs,)`` float64 array of the distances of the pairs, only
+        returned with `return_distances`.
+
+    See Also
+    --------
+    self_capped_distance
+
+
+    .. versionadded:: 0.17.0
+    """
+    return _capped_search(reference, configuration, max_cutoff, min_cutoff,
+                          box, method, return_distances, backend)
+
+
+def self_capped_distance(reference, max_cutoff, min_cutoff=None, box=None,
+                         method=None, return_distances=True,
+                         backend="serial"):
+    """Find all pairs of coordinates within a cutoff distance in
+    *reference*.
+
+    Every pair ``(i, j)`` is reported once, with ``i < j``. See
+    :func:`capped_distance` for the parameters.
+
+    Returns
+    -------
+    pairs : numpy.array
+        ``(n_pairs, 2)`` array of the indices ``(i, j)`` of the pairs,
+        sorted by `i`, then `j`.
+    distances : numpy.array
+        ``(n_pairs,)`` float64 array of the distances of the pairs, only
+        returned with `return_distances`.
+
+    See Also
+    --------
+    capped_distance
+
+
+    .. versionadded:: 0.17.0
+    """
+    return _capped_search(reference, None, max_cutoff, min_cutoff, box,
+                          method, return_distances, backend)
+
+
+def _pbc_variant(funcname, box):
+    """Select the variant of the all pairs kernel *funcname* for *box*.
+
+    Returns the name of the kernel and the box arguments it takes.
+    """
+    if box is None:
+        return funcname, ()
+    boxtype = _box_check(box)
+    # Convert [A,B,C,alpha,beta,gamma] to [[A],[B],[C]]
+    if (boxtype == 'tri_box'):
+        box = triclinic_vectors(box)
+    if (boxtype == 'tri_vecs_bad'):
+        box = triclinic_vectors(triclinic_box(box[0], box[1], box[2]))
+    if boxtype == 'ortho':
+        return funcname + "_ortho", (box,)
+    return funcname + "_triclinic", (box,)
+
+
+def _run_pairwise(funcname, reference, configuration, box, args,
+                  backend="serial"):
+    """Run the all pairs kernel *funcname* on copies of the coordinates.
+
+    The kernel variant is chosen by :func:`_pbc_variant`, *args* are passed
+    after the coordinates and the box.
+    """
+    ref = _coordinates(reference, box)
+    conf = _coordinates(configuration, box)
+
+    _check_array(conf, 'conf')
+    _check_array(ref, 'ref')
+
+    funcname, boxargs = _pbc_variant(funcname, box)
+    _run(funcname, args=(ref, conf) + boxargs + args, backend=backend)
+
+
+#: number of distances in one tile of :func:`tiled_distance_array`; the
+#: float64 tile (256 kB) and its coordinates stay in the L2 cache
+_TILE_SIZE = 2 ** 15
+
+
+def tiled_distance_array(reference, configuration, reduce, box=None,
+                         tile_size=None, backend="serial"):
+    """Calculate the distance array tile by tile and reduce each tile.
+
+    The distances between all reference and configuration coordinates are
+    computed in tiles of about `tile_size` distances, so memory use does
+    not depend on the number of coordinates. Each tile is passed to
+    `reduce` and then overwritten by the next one, the callback must copy
+    what it wants to keep.
+
+    Parameters
+    ----------
+    reference : numpy.array of numpy.float32
+        Reference coordinate array.
+    configuration : numpy.array of numpy.float32
+        Configuration coordinate array.
+    reduce : callable
+        Called as ``reduce(tile, rows, cols)`` for every tile, where `tile`
+        holds the distances between ``reference[rows]`` and
+        ``configuration[cols]`` and `rows` and `cols` are slices.
+    box : numpy.array or None
+        Dimensions of the cell; if provided, the minimum image convention is
+        applied. The dimensions must be provided in the same format as returned
+        by :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`: ``[lx,
+        ly, lz, alpha, beta, gamma]``.
+    tile_size : int, optional
+        Number of distances in a tile. [``32768``]
+    backend
+        Select the type of acceleration; "serial" is always available. Other
+        possibilities are "OpenMP" (OpenMP).
+
+    See Also
+    --------
+    distance_histogram
+    min_distance_per_atom
+    count_within
+
+
+    .. versionadded:: 0.17.0
+    """
+    ref = _coordinates(reference, box)
+    conf = _coordinates(configuration, box)
+
+    _check_array(conf, 'conf')
+    _check_array(ref, 'ref')
+
+    funcname, boxargs = _pbc_variant("calc_distance_array", box)
+
+    refnum = ref.shape[0]
+    confnum = conf.shape[0]
+    if not refnum or not confnum:
+        return
+
+    tile_size = _TILE_SIZE if tile_size is None else tile_size
+    # square tiles, unless there are only few configuration coordinates
+    tile_cols = min(confnum, max(1, int(np.sqrt(tile_size))))
+    tile_rows = max(1, tile_size // tile_cols)
+    buffer = np.empty(tile_rows * tile_cols, dtype=np.float64)
+
+    for start in range(0, refnum, tile_rows):
+        rows = slice(start, min(start + tile_rows, refnum))
+        for cstart in range(0, confnum, tile_cols):
+            cols = slice(cstart, min(cstart + tile_cols, confnum))
+            tile = buffer[:(rows.stop - rows.start) *
+                          (cols.stop - cols.start)].reshape(
+                rows.stop - rows.start, cols.stop - cols.start)
+            _run(funcname, args=(ref[rows], conf[cols]) + boxargs + (tile,),
+                 backend=backend)
+            reduce(tile, rows, cols)
+
+
+def distance_histogram(reference, configuration, bins=75, range=(0.0, 15.0),
+                       box=None, exclusion_block=None, backend="serial"):
+    """Histogram of all distances between reference and configuration.
+
+    Gives the same result as ``numpy.histogram(distance_array(reference,
+    configuration, box), bins, range)``, but the distances are binned as
+    they are calculated in a single compiled loop over all pairs, so the
+    distance array is never stored.
+
+    Parameters
+    ----------
+    reference : numpy.array of numpy.float32
+        Reference coordinate array.
+    configuration : numpy.array of numpy.float32
+        Configuration coordinate array.
+    bins : int, optional
+        Number of bins of the histogram. [75]
+    range : tuple, optional
+        Lower and upper edge of the histogram. [(0.0, 15.0)]
+    box : numpy.array or None
+        Dimensions of the cell; if provided, the minimum image convention is
+        applied.
+    exclusion_block : tuple, optional
+        ``(nA, nB)``: the distance between ``reference[i]`` and
+        ``configuration[j]`` is not counted if ``i // nA == j // nB``, for
+        example the pairs within molecules of `nA` reference and `nB`
+        configuration coordinates. The excluded pairs are skipped in the
+        loop over all pairs. [``None``]
+    backend
+        Select the type of acceleration; "serial" is always available. Other
+        possibilities are "OpenMP" (OpenMP).
+
+    Returns
+    -------
+    count : numpy.array
+        ``(bins,)`` int64 array of the number of distances in each bin
+    edges : numpy.array
+        ``(bins + 1,)`` array of the bin edges
+
+
+    .. versionadded:: 0.17.0
+    """
+    count, edges = np.histogram([], bins=bins, range=range)
+    count = count.astype(np.int64)
+    if exclusion_block is None:
+        blocks = (0, 0)
+    else:
+        blocks = tuple(int(size) for size in exclusion_block)
+        if len(blocks) != 2 or min(blocks) < 1:
+            raise ValueError("exclusion_block must be two positive block "
+                             "sizes, got {0}".format(exclusion_block))
+    _run_pairwise("calc_distance_histogram", reference, configuration, box,
+                  (edges, count) + blocks, backend=backend)
+    return count, edges
+
+
+def min_distance_per_atom(reference, configuration, box=None,
+                          backend="serial"):
+    """Distance of each reference coordinate to the closest configuration
+    coordinate.
+
+    Gives the same result as ``distance_array(reference, configuration,
+    box).min(axis=1)`` in a single compiled loop over all pairs, without
+    storing the distance array.
+
+    Parameters
+    ----------
+    reference : numpy.array of numpy.float32
+        Reference coordinate array.
+    configuration : numpy.array of numpy.float32
+        Configuration coordinate array.
+    box : numpy.array or None
+        Dimensions of the cell; if provided, the minimum image convention is
+        applied.
+    backend
+        Select the type of acceleration; "serial" is always available. Other
+        possibilities are "OpenMP" (OpenMP).
+
+    Returns
+    -------
+    numpy.array
+        ``(len(reference),)`` float64 array, ``inf`` where `configuration`
+        is empty
+
+
+    .. versionadded:: 0.17.0
+    """
+    dmin = np.empty(len(reference), dtype=np.float64)
+    _run_pairwise("calc_min_distance_per_atom", reference, configuration,
+                  box, (dmin,), backend=backend)
+    return dmin
+
+
+def count_within(reference, configuration, cutoff, box=None,
+                 backend="serial"):
+    """Number of configuration coordinates within `cutoff` of each reference
+    coordinate.
+
+    Gives the same result as ``(distance_array(reference, configuration,
+    box) <= cutoff).sum(axis=1)`` in a single compiled loop over all pairs,
+    without storing the distance array.
+
+    Parameters
+    ----------
+    reference : numpy.array of numpy.float32
+        Reference coordinate array.
+    configuration : numpy.array of numpy.float32
+        Configuration coordinate array.
+    cutoff : float
+        Distances of at most `cutoff` are counted.
+    box : numpy.array or None
+        Dimensions of the cell; if provided, the minimum image convention is
+        applied.
+    backend
+        Select the type of acceleration; "serial" is always available. Other
+        possibilities are "OpenMP" (OpenMP).
+
+    Returns
+    -------
+    numpy.array
+        ``(len(reference),)`` int64 array of counts
+
+
+    .. versionadded:: 0.17.0
+    """
+    counts = np.zeros(len(reference), dtype=np.int64)
+    _run_pairwise("calc_count_within", reference, configuration, box,
+                  (float(cutoff), counts), backend=backend)
+    return counts
+
+
 def transform_RtoS(inputcoords, box, backend="serial"):
     """Transform an array of coordinates from real space to S space (aka lambda space)
 
@@ -498,7 +1023,8 @@ def transform_StoR(inputcoords, box, backend="serial"):
     return coords
 
 
-def calc_bonds(coords1, coords2, box=None, result=None, backend="serial"):
+def calc_bonds(coords1, coords2, box=None, result=None, backend="serial",
+               dtype=np.float64, double_accumulate=False):
     """
     Calculate all distances between a pair of atoms.  *atom1* and *atom2* are both
     arrays of coordinates, where atom1[i] and atom2[i] represent a bond.
@@ -531,11 +1057,19 @@ def calc_bonds(coords1, coords2, box=None, result=None, backend="serial"):
         ly, lz, alpha, beta, gamma]``.
     result : array, optional
         Preallocated result array which must be same length as coord
-        arrays and ``dtype=numpy.float64``. Avoids creating the
-        array which saves time when the function is called repeatedly. [None]
+        arrays and ``dtype=numpy.float64`` or ``numpy.float32``. Avoids
+        creating the array which saves time when the function is called
+        repeatedly. [None]
     backend
         Select the type of acceleration; "serial" is always available. Other
         possibilities are "OpenMP" (OpenMP).
+    dtype : numpy.dtype, optional
+        Type of the result array if `result` is not given, ``numpy.float64``
+        or ``numpy.float32``. [``numpy.float64``]
+    double_accumulate : bool, optional
+        ``numpy.float32`` results are computed in single precision, which is
+        faster; set to ``True`` to compute them in double precision and only
+        store them in single precision. [``False``]
 
     Returns
     -------
@@ -546,9 +1080,13 @@ def calc_bonds(coords1, coords2, box=None, result=None, backend="serial"):
     .. versionadded:: 0.8
     .. versionchanged:: 0.13.0
        Added *backend* keyword.
+    .. versionchanged:: 0.17.0
+       Added *dtype* and *double_accumulate* keywords; *result* can be of
+       type ``numpy.float32``.
+       The coordinates are only copied for triclinic boxes.
     """
-    atom1 = coords1.copy('C')
-    atom2 = coords2.copy('C')
+    atom1 = _coordinates(coords1, box)
+    atom2 = _coordinates(coords2, box)
 
     _check_array(atom1, 'atom1')
     _check_array(atom2, 'atom2')
@@ -564,30 +1102,27 @@ def calc_bonds(coords1, coords2, box=None, result=None, backend="serial"):
 
     numatom = atom1.shape[0]
 
-    if result is not None:
-        _check_results_array(result, (numatom,))
-        distances = np.asarray(result)
-    else:
-        distances = np.zeros((numatom,), np.float64)
+    distances = _results_array(result, (numatom,), dtype)
 
     if box is not None:
         if boxtype == 'ortho':
             _run("calc_bond_distance_ortho",
-                   args=(atom1, atom2, box, distances),
+                   args=(atom1, atom2, box, distances, double_accumulate),
                    backend=backend)
         else:
             _run("calc_bond_distance_triclinic",
-                   args=(atom1, atom2, box, distances),
+                   args=(atom1, atom2, box, distances, double_accumulate),
                    backend=backend)
     else:
         _run("calc_bond_distance",
-               args=(atom1, atom2, distances),
+               args=(atom1, atom2, distances, double_accumulate),
                backend=backend)
 
     return distances
 
 
-def calc_angles(coords1, coords2, coords3, box=None, result=None, backend="serial"):
+def calc_angles(coords1, coords2, coords3, box=None, result=None,
+                backend="serial", dtype=np.float64, double_accumulate=False):
     """
     Calculates the angle formed between three atoms, over a list of coordinates.
     All *atom* inputs are lists of coordinates of equal length, with *atom2*
@@ -618,11 +1153,19 @@ def calc_angles(coords1, coords2, coords3, box=None, result=None, backend="seria
         ly, lz, alpha, beta, gamma]``.
     result : array, optional
         Preallocated result array which must be same length as coord
-        arrays and ``dtype=numpy.float64``. Avoids creating the
-        array which saves time when the function is called repeatedly. [None]
+        arrays and ``dtype=numpy.float64`` or ``numpy.float32``. Avoids
+        creating the array which saves time when the function is called
+        repeatedly. [None]
     backend
         Select the type of acceleration; "serial" is always available. Other
         possibilities are "OpenMP" (OpenMP).
+    dtype : numpy.dtype, optional
+        Type of the result array if `result` is not given, ``numpy.float64``
+        or ``numpy.float32``. [``numpy.float64``]
+    double_accumulate : bool, optional
+        ``numpy.float32`` results are computed in single precision, which is
+        faster; set to ``True`` to compute them in double precision and only
+        store them in single precision. [``False``]
 
     Returns
     -------
@@ -635,10 +1178,14 @@ def calc_angles(coords1, coords2, coords3, box=None, result=None, backend="seria
        Added optional box argument to account for periodic boundaries in calculation
     .. versionchanged:: 0.13.0
        Added *backend* keyword.
+    .. versionchanged:: 0.17.0
+       Added *dtype* and *double_accumulate* keywords; *result* can be of
+       type ``numpy.float32``.
+       The coordinates are only copied for triclinic boxes.
     """
-    atom1 = coords1.copy('C')
-    atom2 = coords2.copy('C')
-    atom3 = coords3.copy('C')
+    atom1 = _coordinates(coords1, box)
+    atom2 = _coordinates(coords2, box)
+    atom3 = _coordinates(coords3, box)
     numatom = atom1.shape[0]
 
     _check_array(atom1, 'coords1')
@@ -654,31 +1201,27 @@ def calc_angles(coords1, coords2, coords3, box=None, result=None, backend="seria
         if (boxtype == 'tri_vecs_bad'):
             box = triclinic_vectors(triclinic_box(box[0], box[1], box[2]))
 
-    if result is not None:
-        _check_results_array(result, (numatom,))
-        angles = np.asarray(result)
-    else:
-        angles = np.zeros((numatom,), np.float64)
+    angles = _results_array(result, (numatom,), dtype)
 
     if box is not None:
         if boxtype == 'ortho':
             _run("calc_angle_ortho",
-                   args=(atom1, atom2, atom3, box, angles),
+                   args=(atom1, atom2, atom3, box, angles, double_accumulate),
                    backend=backend)
         else:
             _run("calc_angle_triclinic",
-                   args=(atom1, atom2, atom3, box, angles),
+                   args=(atom1, atom2, atom3, box, angles, double_accumulate),
                    backend=backend)
     else:
         _run("calc_angle",
-               args=(atom1, atom2, atom3, angles),
+               args=(atom1, atom2, atom3, angles, double_accumulate),
                backend=backend)
 
     return angles
 
 
 def calc_dihedrals(coords1, coords2, coords3, coords4, box=None, result=None,
-                   backend="serial"):
+                   backend="serial", dtype=np.float64, double_accumulate=False):
     """
     Calculate the dihedral angle formed by four atoms, over a list of coordinates.
 
@@ -719,11 +1262,19 @@ def calc_dihedrals(coords1, coords2, coords3, coords4, box=None, result=None,
         ly, lz, alpha, beta, gamma]``.
     result : array, optional
         Preallocated result array which must be same length as coord
-        arrays and ``dtype=numpy.float64``. Avoids creating the
-        array which saves time when the function is called repeatedly. [None]
+        arrays and ``dtype=numpy.float64`` or ``numpy.float32``. Avoids
+        creating the array which saves time when the function is called
+        repeatedly. [None]
     backend
         Select the type of acceleration; "serial" is always available. Other
         possibilities are "OpenMP" (OpenMP).
+    dtype : numpy.dtype, optional
+        Type of the result array if `result` is not given, ``numpy.float64``
+        or ``numpy.float32``. [``numpy.float64``]
+    double_accumulate : bool, optional
+        ``numpy.float32`` results are computed in single precision, which is
+        faster; set to ``True`` to compute them in double precision and only
+        store them in single precision. [``False``]
 
     Returns
     -------
@@ -738,11 +1289,15 @@ def calc_dihedrals(coords1, coords2, coords3, coords4, box=None, result=None,
        Renamed from calc_torsions to calc_dihedrals
     .. versionchanged:: 0.13.0
        Added *backend* keyword.
+    .. versionchanged:: 0.17.0
+       Added *dtype* and *double_accumulate* keywords; *result* can be of
+       type ``numpy.float32``.
+       The coordinates are only copied for triclinic boxes.
     """
-    atom1 = coords1.copy('C')
-    atom2 = coords2.copy('C')
-    atom3 = coords3.copy('C')
-    atom4 = coords4.copy('C')
+    atom1 = _coordinates(coords1, box)
+    atom2 = _coordinates(coords2, box)
+    atom3 = _coordinates(coords3, box)
+    atom4 = _coordinates(coords4, box)
 
     _check_array(atom1, 'atom1')
     _check_array(atom2, 'atom2')
@@ -760,24 +1315,20 @@ def calc_dihedrals(coords1, coords2, coords3, coords4, box=None, result=None,
         if (boxtype == 'tri_vecs_bad'):
             box = triclinic_vectors(triclinic_box(box[0], box[1], box[2]))
 
-    if result is not None:
-        _check_results_array(result, (numatom,))
-        angles = np.asarray(result)
-    else:
-        angles = np.zeros((numatom,), np.float64)
+    angles = _results_array(result, (numatom,), dtype)
 
     if box is not None:
         if boxtype == 'ortho':
             _run("calc_dihedral_ortho",
-                   args=(atom1, atom2, atom3, atom4, box, angles),
+                   args=(atom1, atom2, atom3, atom4, box, angles, double_accumulate),
                    backend=backend)
         else:
             _run("calc_dihedral_triclinic",
-                   args=(atom1, atom2, atom3, atom4, box, angles),
+                   args=(atom1, atom2, atom3, atom4, box, angles, double_accumulate),
                    backend=backend)
     else:
         _run("calc_dihedral",
-               args=(atom1, atom2, atom3, atom4, angles),
+               args=(atom1, atom2, atom3, atom4, angles, double_accumulate),
                backend=backend)
 
     return angles
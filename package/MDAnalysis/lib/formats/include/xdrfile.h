@@ -552,6 +552,35 @@ extern "C"
 
 
 
+	/*! \brief Decompress coordiates of a subset of atoms to array of floats
+	 *
+	 *  Like xdrfile_decompress_coord_float(), but only the coordinates of the
+	 *  atoms selected by \a map are written. All coordinates still have to be
+	 *  decompressed, but only the selected ones are converted and stored.
+	 *
+	 *  \param ptr        Pointer to the selected coordinates
+	 *  \param ncoord     Max number of coordinate triplets to read on input,
+	 *                    actual number of coordinate triplets read on return.
+	 *  \param precision  The precision used in the previous compression will be
+	 *                    written to this variable on return.
+	 *  \param map        For each coordinate triplet in the file the index of the
+	 *                    triplet in \a ptr it is stored at, or a negative value
+	 *                    to skip it (length>= ncoord).
+	 *  \param xfp        Handle to portably binary file
+	 *
+	 *  \return           Number of coordinate triplets read. If this is negative,
+	 *                    an error occured.
+	 */
+	int
+	xdrfile_decompress_coord_float_sub(float *     ptr,
+									   int *	   ncoord,
+									   float *     precision,
+									   const int * map,
+									   XDRFILE *   xfp);
+
+
+
+
 	/*! \brief Compress coordiates in a double array to XDR file
 	 *
 	 *  This routine will perform \a lossy compression on the three-dimensional
@@ -77,6 +77,15 @@ extern int read_trr_natoms(char *fn, int *natoms);
 extern int read_trr(XDRFILE *xd, int natoms, int *step, float *t, float *lambda,
                     matrix box, rvec *x, rvec *v, rvec *f, int *has_prop);
 
+/* Read one frame of an open trr file, but only the `nsub` atoms `atoms`
+   (sorted ascending). atoms[i] is stored at x[slots[i]], v[slots[i]] and
+   f[slots[i]], all other atoms are skipped in the file without reading them.
+   If either of x,v,f,box are NULL the arrays are skipped as well. */
+extern int read_trr_sub(XDRFILE *xd, int natoms, int *step, float *t,
+                        float *lambda, matrix box, rvec *x, rvec *v, rvec *f,
+                        int *has_prop, int nsub, const int *atoms,
+                        const int *slots);
+
 /* Write a frame to trr file */
 extern int write_trr(XDRFILE *xd, int natoms, int step, float t, float lambda,
                      matrix box, rvec *x, rvec *v, rvec *f);
@@ -53,6 +53,11 @@ extern int read_xtc_natoms(char *fn, int *natoms);
 extern int read_xtc(XDRFILE * xd, int natoms, int *step, float *time,
                     matrix box, rvec *x, float *prec);
 
+/* Read one frame of an open xtc file, x only holds the atoms selected by map:
+ * atom i is stored at x[map[i]] and skipped if map[i] is negative. */
+extern int read_xtc_sub(XDRFILE * xd, int natoms, int *step, float *time,
+                        matrix box, rvec *x, float *prec, const int *map);
+
 /* Write a frame to xtc file */
 extern int write_xtc(XDRFILE * xd, int natoms, int step, float time,
                        matrix box, rvec *x, float prec);
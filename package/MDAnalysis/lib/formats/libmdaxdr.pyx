@@ -83,6 +83,8 @@ cdef extern from 'include/xdrfile_xtc.h':
     int read_xtc_natoms(char * fname, int * natoms)
     int read_xtc(XDRFILE * xfp, int natoms, int * step, float * time, matrix box,
                  rvec * x, float * prec)
+    int read_xtc_sub(XDRFILE * xfp, int natoms, int * step, float * time,
+                     matrix box, rvec * x, float * prec, const int * map)
     int write_xtc(XDRFILE * xfp, int natoms, int step, float time, matrix box,
                   rvec * x, float prec)
 
@@ -92,6 +94,10 @@ cdef extern from 'include/xdrfile_trr.h':
     int read_trr_natoms(char *fname, int *natoms)
     int read_trr(XDRFILE *xfp, int natoms, int *step, float *time, float *_lambda,
                  matrix box, rvec *x, rvec *v, rvec *f, int *has_prop)
+    int read_trr_sub(XDRFILE *xfp, int natoms, int *step, float *time,
+                     float *_lambda, matrix box, rvec *x, rvec *v, rvec *f,
+                     int *has_prop, int nsub, const int *atoms,
+                     const int *slots)
     int write_trr(XDRFILE *xfp, int natoms, int step, float time, float _lambda,
                   matrix box, rvec *x, rvec *v, rvec *f)
 
@@ -139,6 +145,28 @@ cdef int HASV = 2
 cdef int HASF = 4
 
 
+cdef _check_buffer(arr, shape, name):
+    """raise ValueError if `arr` can not be decoded into directly"""
+    if not isinstance(arr, np.ndarray):
+        raise TypeError('{} has to be a numpy array'.format(name))
+    if (arr.dtype != DTYPE or arr.shape != shape or
+            not arr.flags['C_CONTIGUOUS'] or not arr.flags['WRITEABLE']):
+        raise ValueError('{} has to be a writeable C-contiguous float32 '
+                         'array of shape {}'.format(name, shape))
+
+
+cdef np.ndarray _sub_indices(sub, int n_atoms):
+    """validated atom indices of `sub` as an int32 array"""
+    indices = np.asarray(sub)
+    if indices.ndim != 1 or (indices.size and
+                             not np.issubdtype(indices.dtype, np.integer)):
+        raise TypeError('sub has to be a 1D array of atom indices')
+    if indices.size and (indices.min() < 0 or indices.max() >= n_atoms):
+        raise ValueError('sub contains atom indices outside of '
+                         '[0, {})'.format(n_atoms))
+    return indices.astype(np.int32)
+
+
 cdef class _XDRFile:
     """Base python wrapper for gromacs-xdr formats
 
@@ -442,11 +470,25 @@ cdef class TRRFile(_XDRFile):
     frame and offsets
     """
 
+    cdef np.ndarray _sub
+    cdef np.ndarray _sub_atoms
+    cdef np.ndarray _sub_slots
+
     def _calc_natoms(self, fname):
         cdef int n_atoms
         return_code = read_trr_natoms(fname, &n_atoms)
         return return_code, n_atoms
 
+    cdef _set_sub(self, sub):
+        """sort the atoms of `sub` to read them in file order"""
+        indices = _sub_indices(sub, self.n_atoms)
+        if self._sub is not None and np.array_equal(indices, self._sub):
+            return
+        order = np.argsort(indices, kind='mergesort')
+        self._sub_atoms = np.ascontiguousarray(indices[order])
+        self._sub_slots = order.astype(np.int32)
+        self._sub = indices
+
 
     def calc_offsets(self):
         """read byte offsets from TRR file directly"""
@@ -480,11 +522,61 @@ cdef class TRRFile(_XDRFile):
         --------
         TRRFrame
         XTCFile
+        readinto
 
         Raises
         ------
         IOError
         """
+        xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+        velocity = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+        forces = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+        box = np.empty((DIMS, DIMS), dtype=DTYPE)
+        return self.readinto(xyz, velocity, forces, box)
+
+    def readinto(self, xyz, velocity, forces, box, sub=None):
+        """Read next frame in the TRR file into existing arrays
+
+        The frame is decoded directly into the given arrays, no new arrays
+        are allocated. Data blocks for which ``None`` is passed are skipped.
+        If `sub` is given only the data of these atoms is read, the data of
+        all other atoms is skipped in the file without reading it.
+
+        Parameters
+        ----------
+        xyz : numpy.ndarray, shape=(`n_atoms`, 3)
+            positions are written into this array
+        velocity : numpy.ndarray, shape=(`n_atoms`, 3) or None
+            velocities are written into this array
+        forces : numpy.ndarray, shape=(`n_atoms`, 3) or None
+            forces are written into this array
+        box : numpy.ndarray, shape=(3, 3)
+            box vectors are written into this array
+        sub : array_like (optional)
+            indices of the atoms to read, the per atom arrays then have the
+            shape ``(len(sub), 3)``
+
+        All arrays have to be writeable C-contiguous float32 arrays.
+
+        Returns
+        -------
+        frame : libmdaxdr.TRRFrame
+            namedtuple with frame information, the arrays of the frame are
+            the arrays passed in
+
+        Raises
+        ------
+        IOError
+        ValueError
+            if one of the arrays has the wrong type or shape
+
+        See Also
+        --------
+        read
+
+
+        .. versionadded:: 0.17.0
+        """
         if self.reached_eof:
             raise EOFError('Reached last frame in TRR, seek to 0')
         if not self.is_open:
@@ -493,25 +585,43 @@ cdef class TRRFile(_XDRFile):
             raise IOError('File opened in mode: {}. Reading only allow '
                                'in mode "r"'.format('self.mode'))
 
+        if sub is not None:
+            self._set_sub(sub)
+            shape = (len(self._sub), DIMS)
+        else:
+            shape = (self.n_atoms, DIMS)
+        _check_buffer(xyz, shape, 'xyz')
+        _check_buffer(box, (DIMS, DIMS), 'box')
+        cdef rvec* v_ptr = NULL
+        cdef rvec* f_ptr = NULL
+        if velocity is not None:
+            _check_buffer(velocity, shape, 'velocity')
+            v_ptr = <rvec*> (<np.ndarray> velocity).data
+        if forces is not None:
+            _check_buffer(forces, shape, 'forces')
+            f_ptr = <rvec*> (<np.ndarray> forces).data
+
         return_code = 1
         cdef int step = 0
         cdef int has_prop = 0
         cdef float time = 0
         cdef float lmbda = 0
 
-        # Use this instead of memviews here to make sure that references are
-        # counted correctly
-        cdef np.ndarray xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
-        cdef np.ndarray velocity = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
-        cdef np.ndarray forces = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
-        cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
-
-        return_code = read_trr(self.xfp, self.n_atoms, <int*> &step,
-                                      &time, &lmbda, <matrix>box.data,
-                                      <rvec*>xyz.data,
-                                      <rvec*>velocity.data,
-                                      <rvec*>forces.data,
-                                      <int*> &has_prop)
+        if sub is None:
+            return_code = read_trr(self.xfp, self.n_atoms, <int*> &step,
+                                   &time, &lmbda,
+                                   <matrix> (<np.ndarray> box).data,
+                                   <rvec*> (<np.ndarray> xyz).data,
+                                   v_ptr, f_ptr, <int*> &has_prop)
+        else:
+            return_code = read_trr_sub(self.xfp, self.n_atoms, <int*> &step,
+                                       &time, &lmbda,
+                                       <matrix> (<np.ndarray> box).data,
+                                       <rvec*> (<np.ndarray> xyz).data,
+                                       v_ptr, f_ptr, <int*> &has_prop,
+                                       len(self._sub_atoms),
+                                       <int*> self._sub_atoms.data,
+                                       <int*> self._sub_slots.data)
         # trr are a bit weird. Reading after the last frame always always
         # results in an integer error while reading. I tried it also with trr
         # produced by different codes (Gromacs, ...).
@@ -660,11 +770,31 @@ cdef class XTCFile(_XDRFile):
     """
     cdef float precision
 
+    cdef np.ndarray _sub
+    cdef np.ndarray _sub_map
+    cdef np.ndarray _sub_dup
+    cdef np.ndarray _sub_dup_src
+
     def _calc_natoms(self, fname):
         cdef int n_atoms
         return_code = read_xtc_natoms(fname, &n_atoms)
         return return_code, n_atoms
 
+    cdef _set_sub(self, sub):
+        """map every atom of the file to its position in `sub`"""
+        indices = _sub_indices(sub, self.n_atoms)
+        if self._sub is not None and np.array_equal(indices, self._sub):
+            return
+        self._sub_map = np.full(self.n_atoms, -1, dtype=np.int32)
+        unique, first = np.unique(indices, return_index=True)
+        self._sub_map[unique] = first
+        # atoms selected more than once are copied after decompression
+        dup = np.ones(len(indices), dtype=bool)
+        dup[first] = False
+        self._sub_dup = np.flatnonzero(dup)
+        self._sub_dup_src = self._sub_map[indices[dup]]
+        self._sub = indices
+
 
     def calc_offsets(self):
         """Calculate offsets from XTC file directly"""
@@ -698,11 +828,54 @@ cdef class XTCFile(_XDRFile):
         --------
         XTCFrame
         TRRFile
+        readinto
 
         Raises
         ------
         IOError
         """
+        xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+        box = np.empty((DIMS, DIMS), dtype=DTYPE)
+        return self.readinto(xyz, box)
+
+    def readinto(self, xyz, box, sub=None):
+        """Read next frame in the XTC file into existing arrays
+
+        The frame is decompressed directly into the given arrays, no new
+        arrays are allocated. If `sub` is given all positions are still
+        decompressed, but only those of the selected atoms are stored.
+
+        Parameters
+        ----------
+        xyz : numpy.ndarray, shape=(`n_atoms`, 3)
+            positions are written into this array
+        box : numpy.ndarray, shape=(3, 3)
+            box vectors are written into this array
+        sub : array_like (optional)
+            indices of the atoms to read, `xyz` then has the shape
+            ``(len(sub), 3)``
+
+        Both arrays have to be writeable C-contiguous float32 arrays.
+
+        Returns
+        -------
+        frame : libmdaxdr.XTCFrame
+            namedtuple with frame information, the arrays of the frame are
+            the arrays passed in
+
+        Raises
+        ------
+        IOError
+        ValueError
+            if one of the arrays has the wrong type or shape
+
+        See Also
+        --------
+        read
+
+
+        .. versionadded:: 0.17.0
+        """
         if self.reached_eof:
             raise EOFError('Reached last frame in XTC, seek to 0')
         if not self.is_open:
@@ -711,16 +884,29 @@ cdef class XTCFile(_XDRFile):
             raise IOError('File opened in mode: {}. Reading only allow '
                                'in mode "r"'.format('self.mode'))
 
+        if sub is not None:
+            self._set_sub(sub)
+            _check_buffer(xyz, (len(self._sub), DIMS), 'xyz')
+        else:
+            _check_buffer(xyz, (self.n_atoms, DIMS), 'xyz')
+        _check_buffer(box, (DIMS, DIMS), 'box')
+
         return_code = 1
         cdef int step
         cdef float time, prec
 
-        cdef np.ndarray xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
-        cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
-
-        return_code = read_xtc(self.xfp, self.n_atoms, <int*> &step,
-                                      &time, <matrix>box.data,
-                                      <rvec*>xyz.data, <float*> &prec)
+        if sub is None:
+            return_code = read_xtc(self.xfp, self.n_atoms, <int*> &step,
+                                   &time, <matrix> (<np.ndarray> box).data,
+                                   <rvec*> (<np.ndarray> xyz).data,
+                                   <float*> &prec)
+        else:
+            return_code = read_xtc_sub(self.xfp, self.n_atoms, <int*> &step,
+                                       &time,
+                                       <matrix> (<np.ndarray> box).data,
+                                       <rvec*> (<np.ndarray> xyz).data,
+                                       <float*> &prec,
+                                       <int*> self._sub_map.data)
         if return_code != EOK and return_code != EENDOFFILE:
             raise IOError('XTC read error = {}'.format(
                 error_message[return_code]))
@@ -731,6 +917,8 @@ cdef class XTCFile(_XDRFile):
 
         if return_code == EOK:
             self.current_frame += 1
+        if sub is not None and len(self._sub_dup):
+            xyz[self._sub_dup] = xyz[self._sub_dup_src]
         return XTCFrame(xyz, box, step, time, prec)
 
     def write(self, xyz, box, int step, float time, float precision=1000):
@@ -772,20 +772,43 @@ static const int magicints[] =
 /* Compressed coordinate routines - modified from the original
  * implementation by Frans v. Hoesel to make them threadsafe.
  */
-int
-xdrfile_decompress_coord_float(float     *ptr,
-							   int       *size,
-							   float     *precision,
-							   XDRFILE*   xfp)
+/* Store one decompressed coordinate triplet of atom `atom`, either at its own
+ * position or at the position given by `map`.
+ */
+static void
+store_coord_float(float *ptr, const int *map, int atom, const int *coord,
+				  float inv_precision)
+{
+	float *dst;
+
+	if (map == NULL)
+		dst = ptr + 3 * atom;
+	else if (map[atom] < 0)
+		return;
+	else
+		dst = ptr + 3 * map[atom];
+	dst[0] = coord[0] * inv_precision;
+	dst[1] = coord[1] * inv_precision;
+	dst[2] = coord[2] * inv_precision;
+}
+
+static int
+decompress_coord_float(float     *ptr,
+					   int       *size,
+					   float     *precision,
+					   const int *map,
+					   XDRFILE*   xfp)
 {
 	int minint[3], maxint[3], *lip;
 	int smallidx, minidx, maxidx;
 	unsigned sizeint[3], sizesmall[3], bitsizeint[3], size3;
 	int k, *buf1, *buf2, lsize, flag;
 	int smallnum, smaller, larger, i, is_smaller, run;
-	float *lfp, inv_precision;
+	float inv_precision;
 	int tmp, *thiscoord,  prevcoord[3];
 	unsigned int bitsize;
+	int atom;
+	float fbuf[9 * 3];
 
     bitsizeint[0] = 0;
     bitsizeint[1] = 0;
@@ -822,8 +845,20 @@ xdrfile_decompress_coord_float(float     *ptr,
 	/* Dont bother with compression for three atoms or less */
 	if(*size<=9)
     {
-		return xdrfile_read_float(ptr,size3,xfp)/3;
+		if (map == NULL)
+			return xdrfile_read_float(ptr,size3,xfp)/3;
 		/* return number of coords, not floats */
+		tmp = xdrfile_read_float(fbuf,size3,xfp)/3;
+		for (atom = 0; atom < tmp; atom++)
+		{
+			if (map[atom] >= 0)
+			{
+				ptr[3 * map[atom]] = fbuf[3 * atom];
+				ptr[3 * map[atom] + 1] = fbuf[3 * atom + 1];
+				ptr[3 * map[atom] + 2] = fbuf[3 * atom + 2];
+			}
+		}
+		return tmp;
 	}
 	/* Compression-time if we got here. Read precision first */
 	xdrfile_read_float(precision,1,xfp);
@@ -873,7 +908,7 @@ xdrfile_decompress_coord_float(float     *ptr,
 		return 0;
 	buf2[0] = buf2[1] = buf2[2] = 0;
 
-	lfp = ptr;
+	atom = 0;
 	inv_precision = 1.0 / * precision;
 	run = 0;
 	i = 0;
@@ -931,24 +966,19 @@ xdrfile_decompress_coord_float(float     *ptr,
 					prevcoord[1] = tmp;
 					tmp = thiscoord[2]; thiscoord[2] = prevcoord[2];
 					prevcoord[2] = tmp;
-					*lfp++ = prevcoord[0] * inv_precision;
-					*lfp++ = prevcoord[1] * inv_precision;
-					*lfp++ = prevcoord[2] * inv_precision;
+					store_coord_float(ptr, map, atom++, prevcoord,
+									  inv_precision);
 				} else {
 					prevcoord[0] = thiscoord[0];
 					prevcoord[1] = thiscoord[1];
 					prevcoord[2] = thiscoord[2];
 				}
-				*lfp++ = thiscoord[0] * inv_precision;
-				*lfp++ = thiscoord[1] * inv_precision;
-				*lfp++ = thiscoord[2] * inv_precision;
+				store_coord_float(ptr, map, atom++, thiscoord, inv_precision);
 			}
 		}
         else
         {
-			*lfp++ = thiscoord[0] * inv_precision;
-			*lfp++ = thiscoord[1] * inv_precision;
-			*lfp++ = thiscoord[2] * inv_precision;
+			store_coord_float(ptr, map, atom++, thiscoord, inv_precision);
 		}
 		smallidx += is_smaller;
 		if (is_smaller < 0)
@@ -974,6 +1004,25 @@ xdrfile_decompress_coord_float(float     *ptr,
 	return *size;
 }
 
+int
+xdrfile_decompress_coord_float(float     *ptr,
+							   int       *size,
+							   float     *precision,
+							   XDRFILE*   xfp)
+{
+	return decompress_coord_float(ptr, size, precision, NULL, xfp);
+}
+
+int
+xdrfile_decompress_coord_float_sub(float     *ptr,
+								   int       *size,
+								   float     *precision,
+								   const int *map,
+								   XDRFILE*   xfp)
+{
+	return decompress_coord_float(ptr, size, precision, map, xfp);
+}
+
 int
 xdrfile_compress_coord_float(float   *ptr,
 							 int      size,
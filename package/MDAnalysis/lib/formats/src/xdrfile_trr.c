@@ -269,62 +269,67 @@ static int do_htrn(XDRFILE *xd, mybool bRead, t_trnheader *sh, matrix box,
         return exdrFLOAT;
     }
 
-    if ((sh->x_size != 0) || (sh->v_size != 0) || (sh->f_size != 0)) {
+    /* When reading, single precision coordinates are decoded straight into
+       the caller's arrays; the scratch buffer is only needed for writing and
+       to skip over blocks the caller passed no array for. */
+    if ((!bRead && ((sh->x_size != 0) || (sh->v_size != 0) ||
+                    (sh->f_size != 0))) ||
+        ((sh->x_size != 0) && (NULL == x)) ||
+        ((sh->v_size != 0) && (NULL == v)) ||
+        ((sh->f_size != 0) && (NULL == f))) {
       fx = (float *)calloc(sh->natoms * DIM, sizeof(fx[0]));
       if (NULL == fx)
         return exdrNOMEM;
     }
     if (sh->x_size != 0) {
-      if (!bRead) {
-        for (i = 0; (i < sh->natoms); i++)
-          for (j = 0; (j < DIM); j++)
-            if (NULL != x) {
-              fx[i * DIM + j] = x[i][j];
-            }
-      }
-      if (xdrfile_read_float(fx, sh->natoms * DIM, xd) == sh->natoms * DIM) {
-        if (bRead) {
+      if (bRead && (NULL != x)) {
+        if (xdrfile_read_float(x[0], sh->natoms * DIM, xd) != sh->natoms * DIM)
+          return exdrFLOAT;
+      } else {
+        if (!bRead) {
           for (i = 0; (i < sh->natoms); i++)
             for (j = 0; (j < DIM); j++)
-              if (NULL != x)
-                x[i][j] = fx[i * DIM + j];
+              if (NULL != x) {
+                fx[i * DIM + j] = x[i][j];
+              }
         }
-      } else
-        return exdrFLOAT;
+        if (xdrfile_read_float(fx, sh->natoms * DIM, xd) != sh->natoms * DIM)
+          return exdrFLOAT;
+      }
     }
     if (sh->v_size != 0) {
-      if (!bRead) {
-        for (i = 0; (i < sh->natoms); i++)
-          for (j = 0; (j < DIM); j++)
-            if (NULL != x) {
-              fx[i * DIM + j] = v[i][j];
-            }
+      if (bRead && (NULL != v)) {
+        if (xdrfile_read_float(v[0], sh->natoms * DIM, xd) != sh->natoms * DIM)
+          return exdrFLOAT;
+      } else {
+        if (!bRead) {
+          for (i = 0; (i < sh->natoms); i++)
+            for (j = 0; (j < DIM); j++)
+              if (NULL != x) {
+                fx[i * DIM + j] = v[i][j];
+              }
+        }
+        if (xdrfile_read_float(fx, sh->natoms * DIM, xd) != sh->natoms * DIM)
+          return exdrFLOAT;
       }
-      if (xdrfile_read_float(fx, sh->natoms * DIM, xd) == sh->natoms * DIM) {
-        for (i = 0; (i < sh->natoms); i++)
-          for (j = 0; (j < DIM); j++)
-            if (NULL != v)
-              v[i][j] = fx[i * DIM + j];
-      } else
-        return exdrFLOAT;
     }
     if (sh->f_size != 0) {
-      if (!bRead) {
-        for (i = 0; (i < sh->natoms); i++)
-          for (j = 0; (j < DIM); j++)
-            if (NULL != x) {
-              fx[i * DIM + j] = f[i][j];
-            }
+      if (bRead && (NULL != f)) {
+        if (xdrfile_read_float(f[0], sh->natoms * DIM, xd) != sh->natoms * DIM)
+          return exdrFLOAT;
+      } else {
+        if (!bRead) {
+          for (i = 0; (i < sh->natoms); i++)
+            for (j = 0; (j < DIM); j++)
+              if (NULL != x) {
+                fx[i * DIM + j] = f[i][j];
+              }
+        }
+        if (xdrfile_read_float(fx, sh->natoms * DIM, xd) != sh->natoms * DIM)
+          return exdrFLOAT;
       }
-      if (xdrfile_read_float(fx, sh->natoms * DIM, xd) == sh->natoms * DIM) {
-        for (i = 0; (i < sh->natoms); i++)
-          for (j = 0; (j < DIM); j++)
-            if (NULL != f)
-              f[i][j] = fx[i * DIM + j];
-      } else
-        return exdrFLOAT;
     }
-    if ((sh->x_size != 0) || (sh->v_size != 0) || (sh->f_size != 0)) {
+    if (NULL != fx) {
       free(fx);
     }
   }
@@ -412,3 +417,110 @@ int read_trr(XDRFILE *xd, int natoms, int *step, float *t, float *lambda,
              matrix box, rvec *x, rvec *v, rvec *f, int *has_prop) {
   return do_trn(xd, 1, step, t, lambda, box, &natoms, x, v, f, has_prop);
 }
+
+/* Atoms that are at most this far apart are read in one go instead of
+   seeking from one to the next */
+#define TRR_SUB_GAP 16
+
+/* Read the coordinate triplets of the sorted `atoms` from the x, v or f
+   block starting at byte offset `start` and store atoms[i] at
+   dst[slots[i]]. The scratch buffer `buf` is grown as needed. */
+static int read_block_sub(XDRFILE *xd, mybool bDouble, int64_t start,
+                          int nsub, const int *atoms, const int *slots,
+                          rvec *dst, double **buf, int *bufsize) {
+  int i, j, k, d, n;
+  int64_t width = DIM * (bDouble ? sizeof(double) : sizeof(float));
+  float *fbuf;
+  double *dbuf;
+
+  for (j = 0; j < nsub; j = k) {
+    for (k = j + 1; (k < nsub) && (atoms[k] - atoms[k - 1] <= TRR_SUB_GAP);
+         k++)
+      ;
+    n = atoms[k - 1] - atoms[j] + 1;
+    if (n * DIM > *bufsize) {
+      dbuf = (double *)realloc(*buf, n * DIM * sizeof(double));
+      if (NULL == dbuf)
+        return exdrNOMEM;
+      *buf = dbuf;
+      *bufsize = n * DIM;
+    }
+    if (xdr_seek(xd, start + atoms[j] * width, SEEK_SET) != exdrOK)
+      return exdrFLOAT;
+    if (bDouble) {
+      dbuf = *buf;
+      if (xdrfile_read_double(dbuf, n * DIM, xd) != n * DIM)
+        return exdrDOUBLE;
+      for (i = j; i < k; i++)
+        for (d = 0; d < DIM; d++)
+          dst[slots[i]][d] = dbuf[(atoms[i] - atoms[j]) * DIM + d];
+    } else {
+      fbuf = (float *)*buf;
+      if (xdrfile_read_float(fbuf, n * DIM, xd) != n * DIM)
+        return exdrFLOAT;
+      for (i = j; i < k; i++)
+        for (d = 0; d < DIM; d++)
+          dst[slots[i]][d] = fbuf[(atoms[i] - atoms[j]) * DIM + d];
+    }
+  }
+  return exdrOK;
+}
+
+int read_trr_sub(XDRFILE *xd, int natoms, int *step, float *t, float *lambda,
+                 matrix box, rvec *x, rvec *v, rvec *f, int *has_prop,
+                 int nsub, const int *atoms, const int *slots) {
+  t_trnheader sh, boxsh;
+  rvec *dst[3];
+  int size[3];
+  int64_t start;
+  double *buf = NULL;
+  int bufsize = 0;
+  int result, b;
+
+  if ((result = do_trnheader(xd, 1, &sh)) != exdrOK)
+    return result;
+  *step = sh.step;
+  *t = sh.td;
+  *lambda = sh.lambdad;
+  *has_prop = 0;
+  if (sh.x_size > 0)
+    *has_prop |= HASX;
+  if (sh.v_size > 0)
+    *has_prop |= HASV;
+  if (sh.f_size > 0)
+    *has_prop |= HASF;
+
+  /* box, virial and pressure are read as usual */
+  boxsh = sh;
+  boxsh.x_size = boxsh.v_size = boxsh.f_size = 0;
+  if ((result = do_htrn(xd, 1, &boxsh, box, NULL, NULL, NULL)) != exdrOK)
+    return result;
+
+  dst[0] = x;
+  dst[1] = v;
+  dst[2] = f;
+  size[0] = sh.x_size;
+  size[1] = sh.v_size;
+  size[2] = sh.f_size;
+  for (b = 0; b < 3; b++) {
+    if (size[b] == 0)
+      continue;
+    start = xdr_tell(xd);
+    if ((NULL != dst[b]) && (nsub > 0)) {
+      result = read_block_sub(xd, sh.bDouble, start, nsub, atoms, slots,
+                              dst[b], &buf, &bufsize);
+      if (result != exdrOK) {
+        free(buf);
+        return result;
+      }
+    }
+    /* continue after the block whatever was read from it */
+    if (xdr_seek(xd, start + size[b], SEEK_SET) != exdrOK) {
+      free(buf);
+      return exdrFLOAT;
+    }
+  }
+  free(buf);
+
+  return exdrOK;
+}
@@ -61,7 +61,7 @@ int xtc_header(XDRFILE *xd, int *natoms, int *step, float *time,
 }
 
 static int xtc_coord(XDRFILE *xd, int *natoms, matrix box, rvec *x, float *prec,
-                     mybool bRead) {
+                     const int *map, mybool bRead) {
   int result;
 
   /* box */
@@ -70,7 +70,11 @@ static int xtc_coord(XDRFILE *xd, int *natoms, matrix box, rvec *x, float *prec,
     return exdrFLOAT;
   else {
     if (bRead) {
-      result = xdrfile_decompress_coord_float(x[0], natoms, prec, xd);
+      if (NULL == map)
+        result = xdrfile_decompress_coord_float(x[0], natoms, prec, xd);
+      else
+        result = xdrfile_decompress_coord_float_sub(x[0], natoms, prec, map,
+                                                    xd);
       if (result != *natoms)
         return exdr3DX;
     } else {
@@ -105,7 +109,22 @@ int read_xtc(XDRFILE *xd, int natoms, int *step, float *time, matrix box,
   if ((result = xtc_header(xd, &natoms, step, time, TRUE)) != exdrOK)
     return result;
 
-  if ((result = xtc_coord(xd, &natoms, box, x, prec, 1)) != exdrOK)
+  if ((result = xtc_coord(xd, &natoms, box, x, prec, NULL, 1)) != exdrOK)
+    return result;
+
+  return exdrOK;
+}
+
+int read_xtc_sub(XDRFILE *xd, int natoms, int *step, float *time, matrix box,
+                 rvec *x, float *prec, const int *map)
+/* Read subsequent frames, only the atoms selected by map */
+{
+  int result;
+
+  if ((result = xtc_header(xd, &natoms, step, time, TRUE)) != exdrOK)
+    return result;
+
+  if ((result = xtc_coord(xd, &natoms, box, x, prec, map, 1)) != exdrOK)
     return result;
 
   return exdrOK;
@@ -121,7 +140,7 @@ int write_xtc(XDRFILE *xd, int natoms, int step, float time, matrix box,
   if ((result = xtc_header(xd, &natoms, &step, &time, FALSE)) != exdrOK)
     return result;
 
-  if ((result = xtc_coord(xd, &natoms, box, x, &prec, 0)) != exdrOK)
+  if ((result = xtc_coord(xd, &natoms, box, x, &prec, NULL, 0)) != exdrOK)
     return result;
 
   return exdrOK;
@@ -20,6 +20,7 @@
 #define __DISTANCES_H
 
 #include <math.h>
+#include <stdlib.h>
 
 #include <float.h>
 typedef float coordinate[3];
@@ -122,42 +123,263 @@ static void _triclinic_pbc(coordinate* coords, int numcoords, coordinate* box, f
   }
 }
 
-static void _calc_distance_array(coordinate* ref, int numref, coordinate* conf,
-                                 int numconf, double* distances)
+/* kernels with double results, e.g. _calc_distance_array, with float
+   results computed in float, e.g. _calc_distance_array_f, and with float
+   results computed in double, e.g. _calc_distance_array_fd */
+#define RESULT_T double
+#define CALC_T double
+#define KERNEL(name) name
+#define MATH(name) name
+#include "calc_distances_kernels.h"
+#undef RESULT_T
+#undef CALC_T
+#undef KERNEL
+#undef MATH
+#define RESULT_T float
+#define CALC_T float
+#define KERNEL(name) name##_f
+#define MATH(name) name##f
+#include "calc_distances_kernels.h"
+#undef RESULT_T
+#undef CALC_T
+#undef KERNEL
+#undef MATH
+#define RESULT_T float
+#define CALC_T double
+#define KERNEL(name) name##_fd
+#define MATH(name) name
+#include "calc_distances_kernels.h"
+#undef RESULT_T
+#undef CALC_T
+#undef KERNEL
+#undef MATH
+
+static int _histogram_bin(double d, double* edges, int nbins, double norm)
+{
+  // Bin of d in the histogram with equal width bins and the given edges,
+  // -1 if outside. Same rounding corrections as numpy.histogram, so that
+  // the counts are identical.
+  int bin;
+
+  if (d < edges[0] || d > edges[nbins])
+    return -1;
+  bin = (int)((d - edges[0]) * norm);
+  if (bin == nbins)
+    bin -= 1;
+  if (d < edges[bin])
+    bin -= 1;
+  else if (d >= edges[bin + 1] && bin != nbins - 1)
+    bin += 1;
+  return bin;
+}
+
+static void _excluded_block(int i, int block_ref, int block_conf, int* jstart,
+                            int* jstop)
+{
+  // Configuration coordinates [jstart, jstop) in the same block as reference
+  // coordinate i, for blocks of block_ref reference and block_conf
+  // configuration coordinates; jstart is -1 for a block size of 0.
+  if (block_ref > 0 && block_conf > 0) {
+    *jstart = (i / block_ref) * block_conf;
+    *jstop = *jstart + block_conf;
+  }
+  else {
+    *jstart = -1;
+    *jstop = -1;
+  }
+}
+
+static void _calc_distance_histogram(coordinate* ref, int numref, coordinate* conf,
+                                     int numconf, double* edges, int nbins,
+                                     long long* histo, int block_ref,
+                                     int block_conf)
+{
+  int i, j, bin, jstart, jstop;
+  double dx[3];
+  double rsq, norm;
+  long long* local;
+
+  norm = nbins / (edges[nbins] - edges[0]);
+
+  // every thread fills its own histogram, which are summed at the end
+#ifdef PARALLEL
+#pragma omp parallel private(i, j, bin, jstart, jstop, dx, rsq, local) shared(histo)
+#endif
+  {
+    local = (long long*) calloc(nbins, sizeof(long long));
+#ifdef PARALLEL
+#pragma omp for
+#endif
+    for (i=0; i<numref; i++) {
+      _excluded_block(i, block_ref, block_conf, &jstart, &jstop);
+      for (j=0; j<numconf; j++) {
+        if (j == jstart) {
+          j = jstop - 1;
+          continue;
+        }
+        dx[0] = conf[j][0] - ref[i][0];
+        dx[1] = conf[j][1] - ref[i][1];
+        dx[2] = conf[j][2] - ref[i][2];
+        rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+        bin = _histogram_bin(sqrt(rsq), edges, nbins, norm);
+        if (bin >= 0)
+          local[bin] += 1;
+      }
+    }
+#ifdef PARALLEL
+#pragma omp critical
+#endif
+    for (bin=0; bin<nbins; bin++)
+      histo[bin] += local[bin];
+    free(local);
+  }
+}
+
+static void _calc_distance_histogram_ortho(coordinate* ref, int numref, coordinate* conf,
+                                           int numconf, float* box, double* edges,
+                                           int nbins, long long* histo,
+                                           int block_ref, int block_conf)
+{
+  int i, j, bin, jstart, jstop;
+  double dx[3];
+  float inverse_box[3];
+  double rsq, norm;
+  long long* local;
+
+  inverse_box[0] = 1.0 / box[0];
+  inverse_box[1] = 1.0 / box[1];
+  inverse_box[2] = 1.0 / box[2];
+  norm = nbins / (edges[nbins] - edges[0]);
+
+#ifdef PARALLEL
+#pragma omp parallel private(i, j, bin, jstart, jstop, dx, rsq, local) shared(histo)
+#endif
+  {
+    local = (long long*) calloc(nbins, sizeof(long long));
+#ifdef PARALLEL
+#pragma omp for
+#endif
+    for (i=0; i<numref; i++) {
+      _excluded_block(i, block_ref, block_conf, &jstart, &jstop);
+      for (j=0; j<numconf; j++) {
+        if (j == jstart) {
+          j = jstop - 1;
+          continue;
+        }
+        dx[0] = conf[j][0] - ref[i][0];
+        dx[1] = conf[j][1] - ref[i][1];
+        dx[2] = conf[j][2] - ref[i][2];
+        // Periodic boundaries
+        minimum_image(dx, box, inverse_box);
+        rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+        bin = _histogram_bin(sqrt(rsq), edges, nbins, norm);
+        if (bin >= 0)
+          local[bin] += 1;
+      }
+    }
+#ifdef PARALLEL
+#pragma omp critical
+#endif
+    for (bin=0; bin<nbins; bin++)
+      histo[bin] += local[bin];
+    free(local);
+  }
+}
+
+static void _calc_distance_histogram_triclinic(coordinate* ref, int numref,
+                                               coordinate* conf, int numconf,
+                                               coordinate* box, double* edges,
+                                               int nbins, long long* histo,
+                                               int block_ref, int block_conf)
+{
+  int i, j, bin, jstart, jstop;
+  double dx[3];
+  float box_inverse[3];
+  double rsq, norm;
+  long long* local;
+
+  box_inverse[0] = 1.0 / box[0][0];
+  box_inverse[1] = 1.0 / box[1][1];
+  box_inverse[2] = 1.0 / box[2][2];
+  // Move coords to inside box
+  _triclinic_pbc(ref, numref, box, box_inverse);
+  _triclinic_pbc(conf, numconf, box, box_inverse);
+  norm = nbins / (edges[nbins] - edges[0]);
+
+#ifdef PARALLEL
+#pragma omp parallel private(i, j, bin, jstart, jstop, dx, rsq, local) shared(histo)
+#endif
+  {
+    local = (long long*) calloc(nbins, sizeof(long long));
+#ifdef PARALLEL
+#pragma omp for
+#endif
+    for (i=0; i<numref; i++) {
+      _excluded_block(i, block_ref, block_conf, &jstart, &jstop);
+      for (j=0; j<numconf; j++) {
+        if (j == jstart) {
+          j = jstop - 1;
+          continue;
+        }
+        dx[0] = conf[j][0] - ref[i][0];
+        dx[1] = conf[j][1] - ref[i][1];
+        dx[2] = conf[j][2] - ref[i][2];
+        minimum_image_triclinic(dx, box);
+        rsq = (dx[0]*dx[0] + dx[1]*dx[1] + dx[2]*dx[2]);
+        bin = _histogram_bin(sqrt(rsq), edges, nbins, norm);
+        if (bin >= 0)
+          local[bin] += 1;
+      }
+    }
+#ifdef PARALLEL
+#pragma omp critical
+#endif
+    for (bin=0; bin<nbins; bin++)
+      histo[bin] += local[bin];
+    free(local);
+  }
+}
+
+static void _calc_min_distance_per_atom(coordinate* ref, int numref, coordinate* conf,
+                                        int numconf, double* distances)
 {
   int i, j;
   double dx[3];
-  double rsq;
+  double rsq, rsqmin;
 
 #ifdef PARALLEL
-#pragma omp parallel for private(i, j, dx, rsq) shared(distances)
+#pragma omp parallel for private(i, j, dx, rsq, rsqmin) shared(distances)
 #endif
   for (i=0; i<numref; i++) {
+    rsqmin = HUGE_VAL;
     for (j=0; j<numconf; j++) {
       dx[0] = conf[j][0] - ref[i][0];
       dx[1] = conf[j][1] - ref[i][1];
       dx[2] = conf[j][2] - ref[i][2];
       rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
-      *(distances+i*numconf+j) = sqrt(rsq);
+      if (rsq < rsqmin)
+        rsqmin = rsq;
     }
+    distances[i] = sqrt(rsqmin);
   }
 }
 
-static void _calc_distance_array_ortho(coordinate* ref, int numref, coordinate* conf,
-                                       int numconf, float* box, double* distances)
+static void _calc_min_distance_per_atom_ortho(coordinate* ref, int numref, coordinate* conf,
+                                              int numconf, float* box, double* distances)
 {
   int i, j;
   double dx[3];
   float inverse_box[3];
-  double rsq;
+  double rsq, rsqmin;
 
   inverse_box[0] = 1.0 / box[0];
   inverse_box[1] = 1.0 / box[1];
   inverse_box[2] = 1.0 / box[2];
 #ifdef PARALLEL
-#pragma omp parallel for private(i, j, dx, rsq) shared(distances)
+#pragma omp parallel for private(i, j, dx, rsq, rsqmin) shared(distances)
 #endif
   for (i=0; i<numref; i++) {
+    rsqmin = HUGE_VAL;
     for (j=0; j<numconf; j++) {
       dx[0] = conf[j][0] - ref[i][0];
       dx[1] = conf[j][1] - ref[i][1];
@@ -165,19 +387,21 @@ static void _calc_distance_array_ortho(coordinate* ref, int numref, coordinate*
       // Periodic boundaries
       minimum_image(dx, box, inverse_box);
       rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
-      *(distances+i*numconf+j) = sqrt(rsq);
+      if (rsq < rsqmin)
+        rsqmin = rsq;
     }
+    distances[i] = sqrt(rsqmin);
   }
 }
 
-static void _calc_distance_array_triclinic(coordinate* ref, int numref,
-                                           coordinate* conf, int numconf,
-                                           coordinate* box, double* distances)
+static void _calc_min_distance_per_atom_triclinic(coordinate* ref, int numref,
+                                                  coordinate* conf, int numconf,
+                                                  coordinate* box, double* distances)
 {
   int i, j;
   double dx[3];
   float box_inverse[3];
-  double rsq;
+  double rsq, rsqmin;
 
   box_inverse[0] = 1.0 / box[0][0];
   box_inverse[1] = 1.0 / box[1][1];
@@ -187,113 +411,116 @@ static void _calc_distance_array_triclinic(coordinate* ref, int numref,
   _triclinic_pbc(conf, numconf, box, box_inverse);
 
 #ifdef PARALLEL
-#pragma omp parallel for private(i, j, dx, rsq) shared(distances)
+#pragma omp parallel for private(i, j, dx, rsq, rsqmin) shared(distances)
 #endif
-  for (i=0; i<numref; i++){
-    for (j=0; j<numconf; j++){
+  for (i=0; i<numref; i++) {
+    rsqmin = HUGE_VAL;
+    for (j=0; j<numconf; j++) {
       dx[0] = conf[j][0] - ref[i][0];
       dx[1] = conf[j][1] - ref[i][1];
       dx[2] = conf[j][2] - ref[i][2];
       minimum_image_triclinic(dx, box);
       rsq = (dx[0]*dx[0] + dx[1]*dx[1] + dx[2]*dx[2]);
-      *(distances + i*numconf + j) = sqrt(rsq);
+      if (rsq < rsqmin)
+        rsqmin = rsq;
     }
+    distances[i] = sqrt(rsqmin);
   }
 }
 
-static void _calc_self_distance_array(coordinate* ref, int numref, double* distances,
-                                      int distnum)
+static void _calc_count_within(coordinate* ref, int numref, coordinate* conf,
+                               int numconf, double cutoff, long long* counts)
 {
-  int i, j, distpos;
+  int i, j;
   double dx[3];
-  double rsq;
-
-  distpos = 0;
+  double rsq, cutoff2;
+  long long n;
 
+  cutoff2 = cutoff * cutoff;
 #ifdef PARALLEL
-#pragma omp parallel for private(i, distpos, j, dx, rsq) shared(distances)
+#pragma omp parallel for private(i, j, dx, rsq, n) shared(counts)
 #endif
   for (i=0; i<numref; i++) {
-#ifdef PARALLEL
-    distpos = i * (2 * numref - i - 1) / 2;  // calculates the offset into distances
-#endif
-    for (j=i+1; j<numref; j++) {
-      dx[0] = ref[j][0] - ref[i][0];
-      dx[1] = ref[j][1] - ref[i][1];
-      dx[2] = ref[j][2] - ref[i][2];
+    n = 0;
+    for (j=0; j<numconf; j++) {
+      dx[0] = conf[j][0] - ref[i][0];
+      dx[1] = conf[j][1] - ref[i][1];
+      dx[2] = conf[j][2] - ref[i][2];
       rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
-      *(distances+distpos) = sqrt(rsq);
-      distpos += 1;
+      if (rsq <= cutoff2)
+        n += 1;
     }
+    counts[i] = n;
   }
 }
 
-static void _calc_self_distance_array_ortho(coordinate* ref, int numref, float* box,
-                                            double* distances, int distnum)
+static void _calc_count_within_ortho(coordinate* ref, int numref, coordinate* conf,
+                                     int numconf, float* box, double cutoff,
+                                     long long* counts)
 {
-  int i, j, distpos;
+  int i, j;
   double dx[3];
   float inverse_box[3];
-  double rsq;
+  double rsq, cutoff2;
+  long long n;
 
   inverse_box[0] = 1.0 / box[0];
   inverse_box[1] = 1.0 / box[1];
   inverse_box[2] = 1.0 / box[2];
-  distpos = 0;
-
+  cutoff2 = cutoff * cutoff;
 #ifdef PARALLEL
-#pragma omp parallel for private(i, distpos, j, dx, rsq) shared(distances)
+#pragma omp parallel for private(i, j, dx, rsq, n) shared(counts)
 #endif
   for (i=0; i<numref; i++) {
-#ifdef PARALLEL
-    distpos = i * (2 * numref - i - 1) / 2;  // calculates the offset into distances
-#endif
-    for (j=i+1; j<numref; j++) {
-      dx[0] = ref[j][0] - ref[i][0];
-      dx[1] = ref[j][1] - ref[i][1];
-      dx[2] = ref[j][2] - ref[i][2];
+    n = 0;
+    for (j=0; j<numconf; j++) {
+      dx[0] = conf[j][0] - ref[i][0];
+      dx[1] = conf[j][1] - ref[i][1];
+      dx[2] = conf[j][2] - ref[i][2];
       // Periodic boundaries
       minimum_image(dx, box, inverse_box);
       rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
-      *(distances+distpos) = sqrt(rsq);
-      distpos += 1;
+      if (rsq <= cutoff2)
+        n += 1;
     }
+    counts[i] = n;
   }
 }
 
-static void _calc_self_distance_array_triclinic(coordinate* ref, int numref,
-                                                coordinate* box, double *distances,
-                                                int distnum)
+static void _calc_count_within_triclinic(coordinate* ref, int numref,
+                                         coordinate* conf, int numconf,
+                                         coordinate* box, double cutoff,
+                                         long long* counts)
 {
-  int i, j, distpos;
+  int i, j;
   double dx[3];
-  double rsq;
   float box_inverse[3];
+  double rsq, cutoff2;
+  long long n;
 
   box_inverse[0] = 1.0 / box[0][0];
   box_inverse[1] = 1.0 / box[1][1];
   box_inverse[2] = 1.0 / box[2][2];
-
+  // Move coords to inside box
   _triclinic_pbc(ref, numref, box, box_inverse);
-
-  distpos = 0;
+  _triclinic_pbc(conf, numconf, box, box_inverse);
+  cutoff2 = cutoff * cutoff;
 
 #ifdef PARALLEL
-#pragma omp parallel for private(i, distpos, j, dx, rsq) shared(distances)
+#pragma omp parallel for private(i, j, dx, rsq, n) shared(counts)
 #endif
-  for (i=0; i<numref; i++){
-#ifdef PARALLEL
-    distpos = i * (2 * numref - i - 1) / 2;  // calculates the offset into distances
-#endif
-    for (j=i+1; j<numref; j++){
-      dx[0] = ref[j][0] - ref[i][0];
-      dx[1] = ref[j][1] - ref[i][1];
-      dx[2] = ref[j][2] - ref[i][2];
+  for (i=0; i<numref; i++) {
+    n = 0;
+    for (j=0; j<numconf; j++) {
+      dx[0] = conf[j][0] - ref[i][0];
+      dx[1] = conf[j][1] - ref[i][1];
+      dx[2] = conf[j][2] - ref[i][2];
       minimum_image_triclinic(dx, box);
       rsq = (dx[0]*dx[0] + dx[1]*dx[1] + dx[2]*dx[2]);
-      *(distances + distpos) = sqrt(rsq);
-      distpos += 1;
+      if (rsq <= cutoff2)
+        n += 1;
     }
+    counts[i] = n;
   }
 }
 
@@ -322,338 +549,4 @@ static void _coord_transform(coordinate* coords, int numCoords, coordinate* box)
   }
 }
 
-static void _calc_bond_distance(coordinate* atom1, coordinate* atom2,
-                                int numatom, double* distances)
-{
-  int i;
-  double dx[3];
-  double rsq;
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, dx, rsq) shared(distances)
-#endif
-  for (i=0; i<numatom; i++) {
-    dx[0] = atom1[i][0] - atom2[i][0];
-    dx[1] = atom1[i][1] - atom2[i][1];
-    dx[2] = atom1[i][2] - atom2[i][2];
-    rsq = (dx[0]*dx[0])+(dx[1]*dx[1])+(dx[2]*dx[2]);
-    *(distances+i) = sqrt(rsq);
-  }
-}
-
-static void _calc_bond_distance_ortho(coordinate* atom1, coordinate* atom2,
-                                      int numatom, float* box, double* distances)
-{
-  int i;
-  double dx[3];
-  float inverse_box[3];
-  double rsq;
-
-  inverse_box[0] = 1.0/box[0];
-  inverse_box[1] = 1.0/box[1];
-  inverse_box[2] = 1.0/box[2];
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, dx, rsq) shared(distances)
-#endif
-  for (i=0; i<numatom; i++) {
-    dx[0] = atom1[i][0] - atom2[i][0];
-    dx[1] = atom1[i][1] - atom2[i][1];
-    dx[2] = atom1[i][2] - atom2[i][2];
-    // PBC time!
-    minimum_image(dx, box, inverse_box);
-    rsq = (dx[0]*dx[0])+(dx[1]*dx[1])+(dx[2]*dx[2]);
-    *(distances+i) = sqrt(rsq);
-  }
-}
-static void _calc_bond_distance_triclinic(coordinate* atom1, coordinate* atom2,
-                                          int numatom, coordinate* box,
-                                          double* distances)
-{
-  int i;
-  double dx[3];
-  float box_inverse[3];
-  double rsq;
-
-  box_inverse[0] = 1.0/box[0][0];
-  box_inverse[1] = 1.0/box[1][1];
-  box_inverse[2] = 1.0/box[2][2];
-
-  _triclinic_pbc(atom1, numatom, box, box_inverse);
-  _triclinic_pbc(atom2, numatom, box, box_inverse);
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, dx, rsq) shared(distances)
-#endif
-  for (i=0; i<numatom; i++) {
-    dx[0] = atom1[i][0] - atom2[i][0];
-    dx[1] = atom1[i][1] - atom2[i][1];
-    dx[2] = atom1[i][2] - atom2[i][2];
-    // PBC time!
-    minimum_image_triclinic(dx, box);
-    rsq = (dx[0]*dx[0])+(dx[1]*dx[1])+(dx[2]*dx[2]);
-    *(distances+i) = sqrt(rsq);
-  }
-}
-
-static void _calc_angle(coordinate* atom1, coordinate* atom2,
-                        coordinate* atom3, int numatom, double* angles)
-{
-  int i;
-  double rji[3], rjk[3];
-  double x, y, xp[3];
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, rji, rjk, x, xp, y) shared(angles)
-#endif
-  for (i=0; i<numatom; i++) {
-    rji[0] = atom1[i][0] - atom2[i][0];
-    rji[1] = atom1[i][1] - atom2[i][1];
-    rji[2] = atom1[i][2] - atom2[i][2];
-
-    rjk[0] = atom3[i][0] - atom2[i][0];
-    rjk[1] = atom3[i][1] - atom2[i][1];
-    rjk[2] = atom3[i][2] - atom2[i][2];
-
-    x = rji[0]*rjk[0] + rji[1]*rjk[1] + rji[2]*rjk[2];
-
-    xp[0] = rji[1]*rjk[2] - rji[2]*rjk[1];
-    xp[1] =-rji[0]*rjk[2] + rji[2]*rjk[0];
-    xp[2] = rji[0]*rjk[1] - rji[1]*rjk[0];
-
-    y = sqrt(xp[0]*xp[0] + xp[1]*xp[1] + xp[2]*xp[2]);
-
-    *(angles+i) = atan2(y,x);
-  }
-}
-
-static void _calc_angle_ortho(coordinate* atom1, coordinate* atom2,
-                              coordinate* atom3, int numatom,
-                              float* box, double* angles)
-{
-  // Angle is calculated between two vectors
-  // pbc option ensures that vectors are constructed between atoms in the same image as eachother
-  // ie that vectors don't go across a boxlength
-  // it doesn't matter if vectors are from different boxes however
-  int i;
-  double rji[3], rjk[3];
-  double x, y, xp[3];
-  float inverse_box[3];
-
-  inverse_box[0] = 1.0/box[0];
-  inverse_box[1] = 1.0/box[1];
-  inverse_box[2] = 1.0/box[2];
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, rji, rjk, x, xp, y) shared(angles)
-#endif
-  for (i=0; i<numatom; i++) {
-    rji[0] = atom1[i][0] - atom2[i][0];
-    rji[1] = atom1[i][1] - atom2[i][1];
-    rji[2] = atom1[i][2] - atom2[i][2];
-    minimum_image(rji, box, inverse_box);
-
-    rjk[0] = atom3[i][0] - atom2[i][0];
-    rjk[1] = atom3[i][1] - atom2[i][1];
-    rjk[2] = atom3[i][2] - atom2[i][2];
-    minimum_image(rjk, box, inverse_box);
-
-    x = rji[0]*rjk[0] + rji[1]*rjk[1] + rji[2]*rjk[2];
-
-    xp[0] = rji[1]*rjk[2] - rji[2]*rjk[1];
-    xp[1] =-rji[0]*rjk[2] + rji[2]*rjk[0];
-    xp[2] = rji[0]*rjk[1] - rji[1]*rjk[0];
-
-    y = sqrt(xp[0]*xp[0] + xp[1]*xp[1] + xp[2]*xp[2]);
-
-    *(angles+i) = atan2(y,x);
-  }
-}
-
-static void _calc_angle_triclinic(coordinate* atom1, coordinate* atom2,
-                                  coordinate* atom3, int numatom,
-                                  coordinate* box, double* angles)
-{
-  // Triclinic version of min image aware angle calculate, see above
-  int i;
-  double rji[3], rjk[3];
-  double x, y, xp[3];
-  float box_inverse[3];
-
-  box_inverse[0] = 1.0/box[0][0];
-  box_inverse[1] = 1.0/box[1][1];
-  box_inverse[2] = 1.0/box[2][2];
-
-  _triclinic_pbc(atom1, numatom, box, box_inverse);
-  _triclinic_pbc(atom2, numatom, box, box_inverse);
-  _triclinic_pbc(atom3, numatom, box, box_inverse);
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, rji, rjk, x, xp, y) shared(angles)
-#endif
-  for (i=0; i<numatom; i++) {
-    rji[0] = atom1[i][0] - atom2[i][0];
-    rji[1] = atom1[i][1] - atom2[i][1];
-    rji[2] = atom1[i][2] - atom2[i][2];
-    minimum_image_triclinic(rji, box);
-
-    rjk[0] = atom3[i][0] - atom2[i][0];
-    rjk[1] = atom3[i][1] - atom2[i][1];
-    rjk[2] = atom3[i][2] - atom2[i][2];
-    minimum_image_triclinic(rjk, box);
-
-    x = rji[0]*rjk[0] + rji[1]*rjk[1] + rji[2]*rjk[2];
-
-    xp[0] = rji[1]*rjk[2] - rji[2]*rjk[1];
-    xp[1] =-rji[0]*rjk[2] + rji[2]*rjk[0];
-    xp[2] = rji[0]*rjk[1] - rji[1]*rjk[0];
-
-    y = sqrt(xp[0]*xp[0] + xp[1]*xp[1] + xp[2]*xp[2]);
-
-    *(angles+i) = atan2(y,x);
-  }
-}
-
-static void _calc_dihedral_angle(double* va, double* vb, double* vc, double* result)
-{
-  // Returns atan2 from vectors va, vb, vc
-  double n1[3], n2[3];
-  double xp[3], vb_norm;
-  double x, y;
-
-  //n1 is normal vector to -va, vb
-  //n2 is normal vector to -vb, vc
-  n1[0] =-va[1]*vb[2] + va[2]*vb[1];
-  n1[1] = va[0]*vb[2] - va[2]*vb[0];
-  n1[2] =-va[0]*vb[1] + va[1]*vb[0];
-
-  n2[0] =-vb[1]*vc[2] + vb[2]*vc[1];
-  n2[1] = vb[0]*vc[2] - vb[2]*vc[0];
-  n2[2] =-vb[0]*vc[1] + vb[1]*vc[0];
-
-  // x = dot(n1,n2) = cos theta
-  x = (n1[0]*n2[0] + n1[1]*n2[1] + n1[2]*n2[2]);
-
-  // xp = cross(n1,n2)
-  xp[0] = n1[1]*n2[2] - n1[2]*n2[1];
-  xp[1] =-n1[0]*n2[2] + n1[2]*n2[0];
-  xp[2] = n1[0]*n2[1] - n1[1]*n2[0];
-
-  vb_norm = sqrt(vb[0]*vb[0] + vb[1]*vb[1] + vb[2]*vb[2]);
-
-  y = (xp[0]*vb[0] + xp[1]*vb[1] + xp[2]*vb[2]) / vb_norm;
-
-  if ( (fabs(x) == 0.0) && (fabs(y) == 0.0) ) // numpy consistency
-  {
-    *result = NAN;
-    return;
-  }
-
-  *result = atan2(y, x); //atan2 is better conditioned than acos
-}
-
-static void _calc_dihedral(coordinate* atom1, coordinate* atom2,
-                           coordinate* atom3, coordinate* atom4,
-                           int numatom, double* angles)
-{
-  int i;
-  double va[3], vb[3], vc[3];
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, va, vb, vc) shared(angles)
-#endif
-  for (i=0; i<numatom; i++) {
-    // connecting vectors between all 4 atoms: 1 -va-> 2 -vb-> 3 -vc-> 4
-    va[0] = atom2[i][0] - atom1[i][0];
-    va[1] = atom2[i][1] - atom1[i][1];
-    va[2] = atom2[i][2] - atom1[i][2];
-
-    vb[0] = atom3[i][0] - atom2[i][0];
-    vb[1] = atom3[i][1] - atom2[i][1];
-    vb[2] = atom3[i][2] - atom2[i][2];
-
-    vc[0] = atom4[i][0] - atom3[i][0];
-    vc[1] = atom4[i][1] - atom3[i][1];
-    vc[2] = atom4[i][2] - atom3[i][2];
-
-    _calc_dihedral_angle(va, vb, vc, angles + i);
-  }
-}
-
-static void _calc_dihedral_ortho(coordinate* atom1, coordinate* atom2,
-                                 coordinate* atom3, coordinate* atom4,
-                                 int numatom, float* box, double* angles)
-{
-  int i;
-  double va[3], vb[3], vc[3];
-  float inverse_box[3];
-
-  inverse_box[0] = 1.0/box[0];
-  inverse_box[1] = 1.0/box[1];
-  inverse_box[2] = 1.0/box[2];
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, va, vb, vc) shared(angles)
-#endif
-  for (i=0; i<numatom; i++) {
-    // connecting vectors between all 4 atoms: 1 -va-> 2 -vb-> 3 -vc-> 4
-    va[0] = atom2[i][0] - atom1[i][0];
-    va[1] = atom2[i][1] - atom1[i][1];
-    va[2] = atom2[i][2] - atom1[i][2];
-    minimum_image(va, box, inverse_box);
-
-    vb[0] = atom3[i][0] - atom2[i][0];
-    vb[1] = atom3[i][1] - atom2[i][1];
-    vb[2] = atom3[i][2] - atom2[i][2];
-    minimum_image(vb, box, inverse_box);
-
-    vc[0] = atom4[i][0] - atom3[i][0];
-    vc[1] = atom4[i][1] - atom3[i][1];
-    vc[2] = atom4[i][2] - atom3[i][2];
-    minimum_image(vc, box, inverse_box);
-
-    _calc_dihedral_angle(va, vb, vc, angles + i);
-  }
-}
-
-static void _calc_dihedral_triclinic(coordinate* atom1, coordinate* atom2,
-                                     coordinate* atom3, coordinate* atom4,
-                                     int numatom, coordinate* box, double* angles)
-{
-  int i;
-  double va[3], vb[3], vc[3];
-  float box_inverse[3];
-
-  box_inverse[0] = 1.0/box[0][0];
-  box_inverse[1] = 1.0/box[1][1];
-  box_inverse[2] = 1.0/box[2][2];
-
-  _triclinic_pbc(atom1, numatom, box, box_inverse);
-  _triclinic_pbc(atom2, numatom, box, box_inverse);
-  _triclinic_pbc(atom3, numatom, box, box_inverse);
-  _triclinic_pbc(atom4, numatom, box, box_inverse);
-
-#ifdef PARALLEL
-#pragma omp parallel for private(i, va, vb, vc) shared(angles)
-#endif
-  for (i=0; i<numatom; i++) {
-    // connecting vectors between all 4 atoms: 1 -va-> 2 -vb-> 3 -vc-> 4
-    va[0] = atom2[i][0] - atom1[i][0];
-    va[1] = atom2[i][1] - atom1[i][1];
-    va[2] = atom2[i][2] - atom1[i][2];
-    minimum_image_triclinic(va, box);
-
-    vb[0] = atom3[i][0] - atom2[i][0];
-    vb[1] = atom3[i][1] - atom2[i][1];
-    vb[2] = atom3[i][2] - atom2[i][2];
-    minimum_image_triclinic(vb, box);
-
-    vc[0] = atom4[i][0] - atom3[i][0];
-    vc[1] = atom4[i][1] - atom3[i][1];
-    vc[2] = atom4[i][2] - atom3[i][2];
-    minimum_image_triclinic(vc, box);
-
-    _calc_dihedral_angle(va, vb, vc, angles + i);
-  }
-}
 #endif
@@ -0,0 +1,634 @@
+/* -*- Mode: C; tab-width: 4; indent-tabs-mode:nil; -*- */
+/* vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 */
+/*
+  MDAnalysis --- https://www.mdanalysis.org
+
+  Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+  (see the file AUTHORS for the full list of names)
+  Released under the GNU Public Licence, v2 or any higher version
+
+  Please cite your use of MDAnalysis in published work:
+
+      N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and
+      O. Beckstein. MDAnalysis: A Toolkit for the Analysis of
+      Molecular Dynamics Simulations. J. Comput. Chem. 32 (2011), 2319--2327,
+      in press.
+*/
+
+/*
+  Kernels that write one result per distance or angle.
+
+  This file is included by calc_distances.h once for every combination of
+  RESULT_T, the type the results are stored as, and CALC_T, the type the
+  arithmetic is done in. KERNEL(name) gives the name of the kernel for the
+  combination and MATH(name) the libm function for CALC_T, e.g. sqrtf for
+  float.
+
+  The kernels avoid branches and calls to round() in their inner loops, and
+  the distance array kernels read the coordinates from contiguous x, y and z
+  columns of CALC_T, so that the compiler can vectorize them. All kernels
+  take the differences of the coordinates in CALC_T, so that e.g. a bond
+  and the same pair in a distance array have the same length.
+*/
+
+static inline CALC_T KERNEL(_nearest_int)(CALC_T s)
+{
+  // round half away from zero; unlike round() this vectorizes
+  return (CALC_T)(int)(s + MATH(copysign)((CALC_T)0.5, s));
+}
+
+static void KERNEL(_ortho_box)(float* box, CALC_T* box_c, CALC_T* inverse_box)
+{
+  int i;
+  // a zero inverse leaves dimensions without a box length alone in
+  // _minimum_image
+  for (i=0; i<3; i++) {
+    box_c[i] = box[i];
+    inverse_box[i] = (box[i] > FLT_EPSILON) ? 1.0 / box[i] : 0.0;
+  }
+}
+
+static void KERNEL(_triclinic_box)(coordinate* box, CALC_T* box_c)
+{
+  int i;
+  for (i=0; i<9; i++) {
+    box_c[i] = box[i/3][i%3];
+  }
+}
+
+static inline void KERNEL(_minimum_image)(CALC_T* dx, CALC_T* box, CALC_T* inverse_box)
+{
+  dx[0] -= box[0] * KERNEL(_nearest_int)(dx[0] * inverse_box[0]);
+  dx[1] -= box[1] * KERNEL(_nearest_int)(dx[1] * inverse_box[1]);
+  dx[2] -= box[2] * KERNEL(_nearest_int)(dx[2] * inverse_box[2]);
+}
+
+static inline CALC_T KERNEL(_minimum_image_triclinic)(CALC_T* dx, CALC_T* box)
+{
+  // Same search over the 27 neighbouring images as minimum_image_triclinic,
+  // with the box as nine values from _triclinic_box. The loops are unrolled
+  // and the closest image is picked with selects so that the calling loop
+  // can be vectorized. Returns the squared length of the minimum image.
+  CALC_T rx, ry, rz, d, min = FLT_MAX;
+  CALC_T mx = dx[0], my = dx[1], mz = dx[2];
+  int x, y, z, closer;
+
+#pragma GCC unroll 3
+  for (x = -1; x < 2; ++x) {
+#pragma GCC unroll 3
+    for (y = -1; y < 2; ++y) {
+#pragma GCC unroll 3
+      for (z = -1; z < 2; ++z) {
+        rx = dx[0] + box[0] * x + box[3] * y + box[6] * z;
+        ry = dx[1] + box[4] * y + box[7] * z;
+        rz = dx[2] + box[8] * z;
+        d = rx*rx + ry*ry + rz*rz;
+        closer = d < min;
+        min = closer ? d : min;
+        mx = closer ? rx : mx;
+        my = closer ? ry : my;
+        mz = closer ? rz : mz;
+      }
+    }
+  }
+  dx[0] = mx;
+  dx[1] = my;
+  dx[2] = mz;
+  return min;
+}
+
+static inline CALC_T KERNEL(_dihedral_angle)(CALC_T* va, CALC_T* vb, CALC_T* vc)
+{
+  // Returns the dihedral angle from the vectors va, vb, vc between the
+  // four atoms
+  CALC_T n1[3], n2[3];
+  CALC_T xp[3], vb_norm;
+  CALC_T x, y;
+
+  //n1 is normal vector to -va, vb
+  //n2 is normal vector to -vb, vc
+  n1[0] =-va[1]*vb[2] + va[2]*vb[1];
+  n1[1] = va[0]*vb[2] - va[2]*vb[0];
+  n1[2] =-va[0]*vb[1] + va[1]*vb[0];
+
+  n2[0] =-vb[1]*vc[2] + vb[2]*vc[1];
+  n2[1] = vb[0]*vc[2] - vb[2]*vc[0];
+  n2[2] =-vb[0]*vc[1] + vb[1]*vc[0];
+
+  // x = dot(n1,n2) = cos theta
+  x = (n1[0]*n2[0] + n1[1]*n2[1] + n1[2]*n2[2]);
+
+  // xp = cross(n1,n2)
+  xp[0] = n1[1]*n2[2] - n1[2]*n2[1];
+  xp[1] =-n1[0]*n2[2] + n1[2]*n2[0];
+  xp[2] = n1[0]*n2[1] - n1[1]*n2[0];
+
+  vb_norm = MATH(sqrt)(vb[0]*vb[0] + vb[1]*vb[1] + vb[2]*vb[2]);
+
+  y = (xp[0]*vb[0] + xp[1]*vb[1] + xp[2]*vb[2]) / vb_norm;
+
+  if ( (MATH(fabs)(x) == 0.0) && (MATH(fabs)(y) == 0.0) ) // numpy consistency
+  {
+    return NAN;
+  }
+
+  return MATH(atan2)(y, x); //atan2 is better conditioned than acos
+}
+
+static CALC_T* KERNEL(_coordinate_columns)(coordinate* coords, int numcoords)
+{
+  // Copies coords to a new array holding all x, then all y, then all z
+  // values. The caller frees the array.
+  int i;
+  CALC_T* columns = (CALC_T*) malloc(3 * (size_t)numcoords * sizeof(CALC_T));
+
+  for (i=0; i<numcoords; i++) {
+    columns[i] = coords[i][0];
+    columns[numcoords + i] = coords[i][1];
+    columns[2*numcoords + i] = coords[i][2];
+  }
+  return columns;
+}
+
+static void KERNEL(_calc_distance_array)(coordinate* ref, int numref, coordinate* conf,
+                                         int numconf, RESULT_T* distances)
+{
+  int i, j;
+  CALC_T dx[3], rsq;
+  CALC_T* x = KERNEL(_coordinate_columns)(conf, numconf);
+  CALC_T* y = x + numconf;
+  CALC_T* z = y + numconf;
+  RESULT_T* row;
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx, rsq, row) shared(distances)
+#endif
+  for (i=0; i<numref; i++) {
+    row = distances + (size_t)i * numconf;
+    for (j=0; j<numconf; j++) {
+      dx[0] = x[j] - ref[i][0];
+      dx[1] = y[j] - ref[i][1];
+      dx[2] = z[j] - ref[i][2];
+      rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+      row[j] = MATH(sqrt)(rsq);
+    }
+  }
+  free(x);
+}
+
+static void KERNEL(_calc_distance_array_ortho)(coordinate* ref, int numref, coordinate* conf,
+                                               int numconf, float* box, RESULT_T* distances)
+{
+  int i, j;
+  CALC_T dx[3], rsq;
+  CALC_T box_c[3], inverse_box[3];
+  CALC_T* x = KERNEL(_coordinate_columns)(conf, numconf);
+  CALC_T* y = x + numconf;
+  CALC_T* z = y + numconf;
+  RESULT_T* row;
+
+  KERNEL(_ortho_box)(box, box_c, inverse_box);
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx, rsq, row) shared(distances)
+#endif
+  for (i=0; i<numref; i++) {
+    row = distances + (size_t)i * numconf;
+    for (j=0; j<numconf; j++) {
+      dx[0] = x[j] - ref[i][0];
+      dx[1] = y[j] - ref[i][1];
+      dx[2] = z[j] - ref[i][2];
+      // Periodic boundaries
+      KERNEL(_minimum_image)(dx, box_c, inverse_box);
+      rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+      row[j] = MATH(sqrt)(rsq);
+    }
+  }
+  free(x);
+}
+
+static void KERNEL(_calc_distance_array_triclinic)(coordinate* ref, int numref,
+                                                   coordinate* conf, int numconf,
+                                                   coordinate* box, RESULT_T* distances)
+{
+  int i, j;
+  CALC_T dx[3], box_c[9];
+  float box_inverse[3];
+  CALC_T *x, *y, *z;
+  RESULT_T* row;
+
+  box_inverse[0] = 1.0 / box[0][0];
+  box_inverse[1] = 1.0 / box[1][1];
+  box_inverse[2] = 1.0 / box[2][2];
+  // Move coords to inside box
+  _triclinic_pbc(ref, numref, box, box_inverse);
+  _triclinic_pbc(conf, numconf, box, box_inverse);
+  KERNEL(_triclinic_box)(box, box_c);
+  x = KERNEL(_coordinate_columns)(conf, numconf);
+  y = x + numconf;
+  z = y + numconf;
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx, row) shared(distances)
+#endif
+  for (i=0; i<numref; i++){
+    row = distances + (size_t)i * numconf;
+    for (j=0; j<numconf; j++){
+      dx[0] = x[j] - ref[i][0];
+      dx[1] = y[j] - ref[i][1];
+      dx[2] = z[j] - ref[i][2];
+      row[j] = MATH(sqrt)(KERNEL(_minimum_image_triclinic)(dx, box_c));
+    }
+  }
+  free(x);
+}
+
+static void KERNEL(_calc_self_distance_array)(coordinate* ref, int numref, RESULT_T* distances,
+                                              int distnum)
+{
+  int i, j;
+  CALC_T dx[3], rsq;
+  CALC_T* x = KERNEL(_coordinate_columns)(ref, numref);
+  CALC_T* y = x + numref;
+  CALC_T* z = y + numref;
+  RESULT_T* row;
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx, rsq, row) shared(distances)
+#endif
+  for (i=0; i<numref; i++) {
+    // offset of the distances from i into distances, row[j-i-1] is the
+    // distance between i and j
+    row = distances + (size_t)i * (2 * (size_t)numref - i - 1) / 2;
+    for (j=i+1; j<numref; j++) {
+      dx[0] = x[j] - x[i];
+      dx[1] = y[j] - y[i];
+      dx[2] = z[j] - z[i];
+      rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+      row[j-i-1] = MATH(sqrt)(rsq);
+    }
+  }
+  free(x);
+}
+
+static void KERNEL(_calc_self_distance_array_ortho)(coordinate* ref, int numref, float* box,
+                                                    RESULT_T* distances, int distnum)
+{
+  int i, j;
+  CALC_T dx[3], rsq;
+  CALC_T box_c[3], inverse_box[3];
+  CALC_T* x = KERNEL(_coordinate_columns)(ref, numref);
+  CALC_T* y = x + numref;
+  CALC_T* z = y + numref;
+  RESULT_T* row;
+
+  KERNEL(_ortho_box)(box, box_c, inverse_box);
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx, rsq, row) shared(distances)
+#endif
+  for (i=0; i<numref; i++) {
+    row = distances + (size_t)i * (2 * (size_t)numref - i - 1) / 2;
+    for (j=i+1; j<numref; j++) {
+      dx[0] = x[j] - x[i];
+      dx[1] = y[j] - y[i];
+      dx[2] = z[j] - z[i];
+      // Periodic boundaries
+      KERNEL(_minimum_image)(dx, box_c, inverse_box);
+      rsq = (dx[0]*dx[0]) + (dx[1]*dx[1]) + (dx[2]*dx[2]);
+      row[j-i-1] = MATH(sqrt)(rsq);
+    }
+  }
+  free(x);
+}
+
+static void KERNEL(_calc_self_distance_array_triclinic)(coordinate* ref, int numref,
+                                                        coordinate* box, RESULT_T* distances,
+                                                        int distnum)
+{
+  int i, j;
+  CALC_T dx[3], box_c[9];
+  float box_inverse[3];
+  CALC_T *x, *y, *z;
+  RESULT_T* row;
+
+  box_inverse[0] = 1.0 / box[0][0];
+  box_inverse[1] = 1.0 / box[1][1];
+  box_inverse[2] = 1.0 / box[2][2];
+
+  _triclinic_pbc(ref, numref, box, box_inverse);
+  KERNEL(_triclinic_box)(box, box_c);
+  x = KERNEL(_coordinate_columns)(ref, numref);
+  y = x + numref;
+  z = y + numref;
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, j, dx, row) shared(distances)
+#endif
+  for (i=0; i<numref; i++){
+    row = distances + (size_t)i * (2 * (size_t)numref - i - 1) / 2;
+    for (j=i+1; j<numref; j++){
+      dx[0] = x[j] - x[i];
+      dx[1] = y[j] - y[i];
+      dx[2] = z[j] - z[i];
+      row[j-i-1] = MATH(sqrt)(KERNEL(_minimum_image_triclinic)(dx, box_c));
+    }
+  }
+  free(x);
+}
+
+static void KERNEL(_calc_bond_distance)(coordinate* atom1, coordinate* atom2,
+                                        int numatom, RESULT_T* distances)
+{
+  int i;
+  CALC_T dx[3];
+  CALC_T rsq;
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, dx, rsq) shared(distances)
+#endif
+  for (i=0; i<numatom; i++) {
+    dx[0] = (CALC_T)atom1[i][0] - atom2[i][0];
+    dx[1] = (CALC_T)atom1[i][1] - atom2[i][1];
+    dx[2] = (CALC_T)atom1[i][2] - atom2[i][2];
+    rsq = (dx[0]*dx[0])+(dx[1]*dx[1])+(dx[2]*dx[2]);
+    *(distances+i) = MATH(sqrt)(rsq);
+  }
+}
+
+static void KERNEL(_calc_bond_distance_ortho)(coordinate* atom1, coordinate* atom2,
+                                              int numatom, float* box, RESULT_T* distances)
+{
+  int i;
+  CALC_T dx[3];
+  CALC_T box_c[3], inverse_box[3];
+  CALC_T rsq;
+
+  KERNEL(_ortho_box)(box, box_c, inverse_box);
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, dx, rsq) shared(distances)
+#endif
+  for (i=0; i<numatom; i++) {
+    dx[0] = (CALC_T)atom1[i][0] - atom2[i][0];
+    dx[1] = (CALC_T)atom1[i][1] - atom2[i][1];
+    dx[2] = (CALC_T)atom1[i][2] - atom2[i][2];
+    // PBC time!
+    KERNEL(_minimum_image)(dx, box_c, inverse_box);
+    rsq = (dx[0]*dx[0])+(dx[1]*dx[1])+(dx[2]*dx[2]);
+    *(distances+i) = MATH(sqrt)(rsq);
+  }
+}
+static void KERNEL(_calc_bond_distance_triclinic)(coordinate* atom1, coordinate* atom2,
+                                                  int numatom, coordinate* box,
+                                                  RESULT_T* distances)
+{
+  int i;
+  CALC_T dx[3];
+  CALC_T box_c[9];
+  float box_inverse[3];
+  CALC_T rsq;
+
+  box_inverse[0] = 1.0/box[0][0];
+  box_inverse[1] = 1.0/box[1][1];
+  box_inverse[2] = 1.0/box[2][2];
+
+  _triclinic_pbc(atom1, numatom, box, box_inverse);
+  _triclinic_pbc(atom2, numatom, box, box_inverse);
+  KERNEL(_triclinic_box)(box, box_c);
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, dx, rsq) shared(distances)
+#endif
+  for (i=0; i<numatom; i++) {
+    dx[0] = (CALC_T)atom1[i][0] - atom2[i][0];
+    dx[1] = (CALC_T)atom1[i][1] - atom2[i][1];
+    dx[2] = (CALC_T)atom1[i][2] - atom2[i][2];
+    // PBC time!
+    KERNEL(_minimum_image_triclinic)(dx, box_c);
+    rsq = (dx[0]*dx[0])+(dx[1]*dx[1])+(dx[2]*dx[2]);
+    *(distances+i) = MATH(sqrt)(rsq);
+  }
+}
+
+static void KERNEL(_calc_angle)(coordinate* atom1, coordinate* atom2,
+                                coordinate* atom3, int numatom, RESULT_T* angles)
+{
+  int i;
+  CALC_T rji[3], rjk[3];
+  CALC_T x, y, xp[3];
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, rji, rjk, x, xp, y) shared(angles)
+#endif
+  for (i=0; i<numatom; i++) {
+    rji[0] = (CALC_T)atom1[i][0] - atom2[i][0];
+    rji[1] = (CALC_T)atom1[i][1] - atom2[i][1];
+    rji[2] = (CALC_T)atom1[i][2] - atom2[i][2];
+
+    rjk[0] = (CALC_T)atom3[i][0] - atom2[i][0];
+    rjk[1] = (CALC_T)atom3[i][1] - atom2[i][1];
+    rjk[2] = (CALC_T)atom3[i][2] - atom2[i][2];
+
+    x = rji[0]*rjk[0] + rji[1]*rjk[1] + rji[2]*rjk[2];
+
+    xp[0] = rji[1]*rjk[2] - rji[2]*rjk[1];
+    xp[1] =-rji[0]*rjk[2] + rji[2]*rjk[0];
+    xp[2] = rji[0]*rjk[1] - rji[1]*rjk[0];
+
+    y = MATH(sqrt)(xp[0]*xp[0] + xp[1]*xp[1] + xp[2]*xp[2]);
+
+    *(angles+i) = MATH(atan2)(y,x);
+  }
+}
+
+static void KERNEL(_calc_angle_ortho)(coordinate* atom1, coordinate* atom2,
+                                      coordinate* atom3, int numatom,
+                                      float* box, RESULT_T* angles)
+{
+  // Angle is calculated between two vectors
+  // pbc option ensures that vectors are constructed between atoms in the same image as eachother
+  // ie that vectors don't go across a boxlength
+  // it doesn't matter if vectors are from different boxes however
+  int i;
+  CALC_T rji[3], rjk[3];
+  CALC_T x, y, xp[3];
+  CALC_T box_c[3], inverse_box[3];
+
+  KERNEL(_ortho_box)(box, box_c, inverse_box);
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, rji, rjk, x, xp, y) shared(angles)
+#endif
+  for (i=0; i<numatom; i++) {
+    rji[0] = (CALC_T)atom1[i][0] - atom2[i][0];
+    rji[1] = (CALC_T)atom1[i][1] - atom2[i][1];
+    rji[2] = (CALC_T)atom1[i][2] - atom2[i][2];
+    KERNEL(_minimum_image)(rji, box_c, inverse_box);
+
+    rjk[0] = (CALC_T)atom3[i][0] - atom2[i][0];
+    rjk[1] = (CALC_T)atom3[i][1] - atom2[i][1];
+    rjk[2] = (CALC_T)atom3[i][2] - atom2[i][2];
+    KERNEL(_minimum_image)(rjk, box_c, inverse_box);
+
+    x = rji[0]*rjk[0] + rji[1]*rjk[1] + rji[2]*rjk[2];
+
+    xp[0] = rji[1]*rjk[2] - rji[2]*rjk[1];
+    xp[1] =-rji[0]*rjk[2] + rji[2]*rjk[0];
+    xp[2] = rji[0]*rjk[1] - rji[1]*rjk[0];
+
+    y = MATH(sqrt)(xp[0]*xp[0] + xp[1]*xp[1] + xp[2]*xp[2]);
+
+    *(angles+i) = MATH(atan2)(y,x);
+  }
+}
+
+static void KERNEL(_calc_angle_triclinic)(coordinate* atom1, coordinate* atom2,
+                                          coordinate* atom3, int numatom,
+                                          coordinate* box, RESULT_T* angles)
+{
+  // Triclinic version of min image aware angle calculate, see above
+  int i;
+  CALC_T rji[3], rjk[3];
+  CALC_T x, y, xp[3];
+  CALC_T box_c[9];
+  float box_inverse[3];
+
+  box_inverse[0] = 1.0/box[0][0];
+  box_inverse[1] = 1.0/box[1][1];
+  box_inverse[2] = 1.0/box[2][2];
+
+  _triclinic_pbc(atom1, numatom, box, box_inverse);
+  _triclinic_pbc(atom2, numatom, box, box_inverse);
+  _triclinic_pbc(atom3, numatom, box, box_inverse);
+  KERNEL(_triclinic_box)(box, box_c);
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, rji, rjk, x, xp, y) shared(angles)
+#endif
+  for (i=0; i<numatom; i++) {
+    rji[0] = (CALC_T)atom1[i][0] - atom2[i][0];
+    rji[1] = (CALC_T)atom1[i][1] - atom2[i][1];
+    rji[2] = (CALC_T)atom1[i][2] - atom2[i][2];
+    KERNEL(_minimum_image_triclinic)(rji, box_c);
+
+    rjk[0] = (CALC_T)atom3[i][0] - atom2[i][0];
+    rjk[1] = (CALC_T)atom3[i][1] - atom2[i][1];
+    rjk[2] = (CALC_T)atom3[i][2] - atom2[i][2];
+    KERNEL(_minimum_image_triclinic)(rjk, box_c);
+
+    x = rji[0]*rjk[0] + rji[1]*rjk[1] + rji[2]*rjk[2];
+
+    xp[0] = rji[1]*rjk[2] - rji[2]*rjk[1];
+    xp[1] =-rji[0]*rjk[2] + rji[2]*rjk[0];
+    xp[2] = rji[0]*rjk[1] - rji[1]*rjk[0];
+
+    y = MATH(sqrt)(xp[0]*xp[0] + xp[1]*xp[1] + xp[2]*xp[2]);
+
+    *(angles+i) = MATH(atan2)(y,x);
+  }
+}
+
+static void KERNEL(_calc_dihedral)(coordinate* atom1, coordinate* atom2,
+                                   coordinate* atom3, coordinate* atom4,
+                                   int numatom, RESULT_T* angles)
+{
+  int i;
+  CALC_T va[3], vb[3], vc[3];
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, va, vb, vc) shared(angles)
+#endif
+  for (i=0; i<numatom; i++) {
+    // connecting vectors between all 4 atoms: 1 -va-> 2 -vb-> 3 -vc-> 4
+    va[0] = (CALC_T)atom2[i][0] - atom1[i][0];
+    va[1] = (CALC_T)atom2[i][1] - atom1[i][1];
+    va[2] = (CALC_T)atom2[i][2] - atom1[i][2];
+
+    vb[0] = (CALC_T)atom3[i][0] - atom2[i][0];
+    vb[1] = (CALC_T)atom3[i][1] - atom2[i][1];
+    vb[2] = (CALC_T)atom3[i][2] - atom2[i][2];
+
+    vc[0] = (CALC_T)atom4[i][0] - atom3[i][0];
+    vc[1] = (CALC_T)atom4[i][1] - atom3[i][1];
+    vc[2] = (CALC_T)atom4[i][2] - atom3[i][2];
+
+    *(angles+i) = KERNEL(_dihedral_angle)(va, vb, vc);
+  }
+}
+
+static void KERNEL(_calc_dihedral_ortho)(coordinate* atom1, coordinate* atom2,
+                                         coordinate* atom3, coordinate* atom4,
+                                         int numatom, float* box, RESULT_T* angles)
+{
+  int i;
+  CALC_T va[3], vb[3], vc[3];
+  CALC_T box_c[3], inverse_box[3];
+
+  KERNEL(_ortho_box)(box, box_c, inverse_box);
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, va, vb, vc) shared(angles)
+#endif
+  for (i=0; i<numatom; i++) {
+    // connecting vectors between all 4 atoms: 1 -va-> 2 -vb-> 3 -vc-> 4
+    va[0] = (CALC_T)atom2[i][0] - atom1[i][0];
+    va[1] = (CALC_T)atom2[i][1] - atom1[i][1];
+    va[2] = (CALC_T)atom2[i][2] - atom1[i][2];
+    KERNEL(_minimum_image)(va, box_c, inverse_box);
+
+    vb[0] = (CALC_T)atom3[i][0] - atom2[i][0];
+    vb[1] = (CALC_T)atom3[i][1] - atom2[i][1];
+    vb[2] = (CALC_T)atom3[i][2] - atom2[i][2];
+    KERNEL(_minimum_image)(vb, box_c, inverse_box);
+
+    vc[0] = (CALC_T)atom4[i][0] - atom3[i][0];
+    vc[1] = (CALC_T)atom4[i][1] - atom3[i][1];
+    vc[2] = (CALC_T)atom4[i][2] - atom3[i][2];
+    KERNEL(_minimum_image)(vc, box_c, inverse_box);
+
+    *(angles+i) = KERNEL(_dihedral_angle)(va, vb, vc);
+  }
+}
+
+static void KERNEL(_calc_dihedral_triclinic)(coordinate* atom1, coordinate* atom2,
+                                             coordinate* atom3, coordinate* atom4,
+                                             int numatom, coordinate* box, RESULT_T* angles)
+{
+  int i;
+  CALC_T va[3], vb[3], vc[3];
+  CALC_T box_c[9];
+  float box_inverse[3];
+
+  box_inverse[0] = 1.0/box[0][0];
+  box_inverse[1] = 1.0/box[1][1];
+  box_inverse[2] = 1.0/box[2][2];
+
+  _triclinic_pbc(atom1, numatom, box, box_inverse);
+  _triclinic_pbc(atom2, numatom, box, box_inverse);
+  _triclinic_pbc(atom3, numatom, box, box_inverse);
+  _triclinic_pbc(atom4, numatom, box, box_inverse);
+  KERNEL(_triclinic_box)(box, box_c);
+
+#ifdef PARALLEL
+#pragma omp parallel for private(i, va, vb, vc) shared(angles)
+#endif
+  for (i=0; i<numatom; i++) {
+    // connecting vectors between all 4 atoms: 1 -va-> 2 -vb-> 3 -vc-> 4
+    va[0] = (CALC_T)atom2[i][0] - atom1[i][0];
+    va[1] = (CALC_T)atom2[i][1] - atom1[i][1];
+    va[2] = (CALC_T)atom2[i][2] - atom1[i][2];
+    KERNEL(_minimum_image_triclinic)(va, box_c);
+
+    vb[0] = (CALC_T)atom3[i][0] - atom2[i][0];
+    vb[1] = (CALC_T)atom3[i][1] - atom2[i][1];
+    vb[2] = (CALC_T)atom3[i][2] - atom2[i][2];
+    KERNEL(_minimum_image_triclinic)(vb, box_c);
+
+    vc[0] = (CALC_T)atom4[i][0] - atom3[i][0];
+    vc[1] = (CALC_T)atom4[i][1] - atom3[i][1];
+    vc[2] = (CALC_T)atom4[i][2] - atom3[i][2];
+    KERNEL(_minimum_image_triclinic)(vc, box_c);
+
+    *(angles+i) = KERNEL(_dihedral_angle)(va, vb, vc);
+  }
+}
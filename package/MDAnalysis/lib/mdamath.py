@@ -249,6 +249,143 @@ def box_volume(dimensions):
     return np.linalg.det(triclinic_vectors(dimensions))
 
 
+def _connected_components(n_atoms, bonds):
+    """Label the connected components of a bond graph.
+
+    Union-find over the bond array: every round hooks the root of each
+    bond's larger side onto the smaller one and then compresses all paths,
+    until both atoms of every bond share a root.
+
+    Parameters
+    ----------
+    n_atoms : int
+        number of atoms in the graph
+    bonds : numpy.ndarray
+        ``(n_bonds, 2)`` array of atom indices (``< n_atoms``)
+
+    Returns
+    -------
+    labels : numpy.ndarray
+        component index of every atom; components are numbered in the
+        order of their lowest atom and atoms without bonds are components
+        of their own
+
+
+    .. versionadded:: 0.17.0
+    """
+    roots = np.arange(n_atoms, dtype=np.intp)
+    a, b = bonds[:, 0], bonds[:, 1]
+    while True:
+        # path compression, every atom points straight at its root
+        while True:
+            grand = roots[roots]
+            if np.array_equal(grand, roots):
+                break
+            roots = grand
+        ra, rb = roots[a], roots[b]
+        split = ra != rb
+        if not split.any():
+            break
+        ra, rb = ra[split], rb[split]
+        np.minimum.at(roots, np.maximum(ra, rb), np.minimum(ra, rb))
+    return np.unique(roots, return_inverse=True)[1]
+
+
+def _internal_bonds(atomgroup):
+    """Bonds between the atoms of *atomgroup*, as indices into it.
+
+    Raises
+    ------
+    NoDataError
+        There are no bonds present.
+    """
+    try:
+        bondattr = atomgroup.universe._topology.bonds
+    except AttributeError:
+        raise NoDataError("The atomgroup is required to have bonds")
+    ix = atomgroup.ix
+    if not len(ix):
+        return np.zeros((0, 2), dtype=np.intp)
+    bix = bondattr._bix[bondattr._terms_of(ix)]
+    order = np.argsort(ix, kind='mergesort')
+    local = order[np.searchsorted(ix, bix, sorter=order).clip(0, len(ix) - 1)]
+    inside = (ix[local] == bix).all(axis=1)
+    return local[inside]
+
+
+def _minimum_image(vectors, dimensions):
+    """Apply the minimum image convention to *vectors* in place.
+
+    Works for orthogonal and triclinic boxes by wrapping the vectors in
+    fractional coordinates of the box vectors.
+    """
+    if np.all(dimensions[3:] == 90.0):
+        box = dimensions[:3]
+        vectors -= np.rint(vectors / box) * box
+    else:
+        tri = triclinic_vectors(dimensions)
+        frac = np.dot(vectors, np.linalg.inv(tri))
+        vectors -= np.dot(np.rint(frac), tri).astype(vectors.dtype)
+    return vectors
+
+
+def _unwrap(positions, bonds, roots, dimensions):
+    """Make every bonded piece whole, modifying *positions* in place.
+
+    Breadth-first traversal of all pieces at once over a CSR adjacency of
+    *bonds*, starting from *roots*.  Every atom reached is placed at the
+    minimum image of its bond vector from the atom it was reached from, so
+    the *roots* stay where they are.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        ``(n_atoms, 3)`` coordinates
+    bonds : numpy.ndarray
+        ``(n_bonds, 2)`` indices into `positions`
+    roots : numpy.ndarray
+        one atom of every piece to start from
+    dimensions : numpy.ndarray
+        unitcell ``[A, B, C, alpha, beta, gamma]``
+
+    Returns
+    -------
+    visited : numpy.ndarray
+        boolean mask of the atoms reached from *roots*
+    """
+    n_atoms = len(positions)
+    # undirected adjacency in CSR form
+    src = np.concatenate([bonds[:, 0], bonds[:, 1]])
+    dst = np.concatenate([bonds[:, 1], bonds[:, 0]])
+    order = np.argsort(src, kind='mergesort')
+    dst = dst[order]
+    indptr = np.zeros(n_atoms + 1, dtype=np.intp)
+    np.cumsum(np.bincount(src, minlength=n_atoms), out=indptr[1:])
+
+    visited = np.zeros(n_atoms, dtype=bool)
+    frontier = np.unique(roots)
+    visited[frontier] = True
+    while len(frontier):
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        ends = np.cumsum(counts)
+        pos = np.arange(ends[-1], dtype=np.intp)
+        pos += np.repeat(starts - ends + counts, counts)
+        parents = np.repeat(frontier, counts)
+        children = dst[pos]
+        new = ~visited[children]
+        # every atom is placed from the first parent that reaches it
+        children, first = np.unique(children[new], return_index=True)
+        parents = parents[new][first]
+
+        vec = positions[children] - positions[parents]
+        positions[children] = positions[parents] + _minimum_image(vec,
+                                                                  dimensions)
+        visited[children] = True
+        frontier = children
+    return visited
+
+
 def _is_contiguous(atomgroup, atom):
     """Walk through atomgroup, starting with atom.
 
@@ -258,25 +395,12 @@ def _is_contiguous(atomgroup, atom):
         ``True`` if all of *atomgroup* is accessible through walking
         along bonds.
         ``False`` otherwise.
-    """
-    seen = set([atom])
-    walked = set()
-    ag_set = set(atomgroup)
-
-    nloops = 0
-    while len(seen) < len(atomgroup):
-        nloops += 1
-        if nloops > len(atomgroup):
-            return False
-
-        todo = seen.difference(walked)
-        for atom in todo:
-            for other in atom.bonded_atoms:
-                if other in ag_set:
-                    seen.add(other)
-            walked.add(atom)
 
-    return True
+    .. versionchanged:: 0.17.0
+       Uses the connected components of the bonds within *atomgroup*.
+    """
+    labels = _connected_components(len(atomgroup), _internal_bonds(atomgroup))
+    return not labels.any()
 
 
 def make_whole(atomgroup, reference_atom=None):
@@ -321,10 +445,6 @@ def make_whole(atomgroup, reference_atom=None):
         caused by the atomgroup not being a single fragment.
         (ie the molecule can't be traversed by following bonds)
 
-    Note
-    ----
-    Only orthogonal boxes are currently supported.
-
     Example
     -------
     Make fragments whole::
@@ -338,9 +458,14 @@ def make_whole(atomgroup, reference_atom=None):
         # based on bonding information.
         # Note that this function will only handle a single fragment
         # at a time, necessitating a loop.
-        for frag in u.fragments:
+        for frag in u.atoms.fragments:
           make_whole(frag)
 
+    All fragments can be made whole in a single call, which is much faster
+    for many molecules::
+
+        u.atoms.unwrap(compound='fragments')
+
     Alternatively, to keep a single atom in place as the anchor::
 
         # This will mean that atomgroup[10] will NOT get moved,
@@ -349,11 +474,12 @@ def make_whole(atomgroup, reference_atom=None):
 
 
     .. versionadded:: 0.11.0
+    .. versionchanged:: 0.17.0
+       Atomgroups spanning several fragments are rejected up front using
+       their fragment indices.  The bonds are walked breadth-first for all
+       atoms at once and triclinic boxes are supported.
     """
-    try:
-        b = atomgroup.bonds
-    except (AttributeError, NoDataError):
-        raise NoDataError("The atomgroup is required to have bonds")
+    bonds = _internal_bonds(atomgroup)
 
     if reference_atom is None:
         ref = atomgroup[0]
@@ -363,70 +489,37 @@ def make_whole(atomgroup, reference_atom=None):
         if not ref in atomgroup:
             raise ValueError("Reference atom not in atomgroup")
 
+    # Atoms of different fragments can never be reached through bonds
+    if atomgroup.n_fragments > 1:
+        raise ValueError("atomgroup not contiguous from bonds")
     # Check all of atomgroup is accessible from ref
-    if not _is_contiguous(atomgroup, ref):
+    if _connected_components(len(atomgroup), bonds).any():
         raise ValueError("atomgroup not contiguous from bonds")
 
-    # Not sure if this is actually a requirement...
-    # I think application of pbc would need to be changed for triclinic boxes
-    # but that's all?  How does minimum bond length criteria change?
-    if not all(atomgroup.dimensions[3:] == 90.0):
-        raise ValueError("Non orthogonal boxes are not supported")
-    box = atomgroup.dimensions[:3]
-
-    if all(box == 0.0):
+    dimensions = atomgroup.dimensions
+    if all(dimensions[:3] == 0.0):
         raise ValueError("Supplied box had zero size")
+    if not len(bonds):
+        return
 
-    box_length = box.min() / 2.0
+    box_length = dimensions[:3].min() / 2.0
 
-    bondlengths = atomgroup.bonds.bonds(pbc=True)
+    positions = atomgroup.positions
+    vec = positions[bonds[:, 1]] - positions[bonds[:, 0]]
+    bondlengths = np.sqrt((_minimum_image(vec.copy(), dimensions) ** 2
+                           ).sum(axis=1))
     if bondlengths.min() * 1.4 > box_length:
         raise ValueError("Box lengths are too small relative to bond lengths")
 
     # All checks done, let's continue
     # If bond lengths don't change after pbc applied, then no bonds
     # straddle the box boundaries
-    if np.allclose(atomgroup.bonds.bonds(), bondlengths):
+    if np.allclose(np.sqrt((vec ** 2).sum(axis=1)), bondlengths):
         return
-    # Can't reuse this calculation of bond lengths as we're changing
-    # stuff as we go.
-
-    processed = set()  # Who have I already done?
-    ref_points = set([ref])  # Who is safe to use as reference point?
-
-    ag_set = set(atomgroup)
-    nres = len(atomgroup)  # total size of the problem
-    nloops = 0
-    while len(ref_points) < nres:  # While all atoms aren't correct
-        nloops += 1
-        if nloops > nres:  # To prevent infinite loop
-            # This point probable isn't reachable with the above _is_contiguous
-            # check, but better safe than sorry.
-            raise ValueError("Algorithm couldn't traverse atomgroup. "
-                             "Perhaps the atomgroup isn't fully connected")
-
-        # We want to iterate over atoms that are good to use as reference
-        # points, but haven't been processed yet.
-        todo = ref_points.difference(processed)
-        for atom in todo:
-            for b in atom.bonds:
-                other = b.partner(atom)
-                # Avoid atoms not in our scope
-                if other not in ag_set:
-                    continue
-                if other in ref_points:
-                    continue
-                if b.length() > box_length:
-                    # Vector from ref atom to other
-                    vec = other.position - ref.position
-                    # Apply pbc to this vector
-                    vec -= np.rint(vec/box) * box
-                    # Define the position of other based on this vector
-                    other.position = ref.position + vec
-                # This atom can now be used as a reference point
-                ref_points.add(other)
-
-            processed.add(atom)
+
+    root = np.flatnonzero(atomgroup.ix == ref.ix)[:1]
+    _unwrap(positions, bonds, root, dimensions)
+    atomgroup.positions = positions
 
 
 def one_to_many_pointers(Ni, Nj, i2j):
@@ -0,0 +1,497 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+
+"""
+Grid based neighbor search --- :mod:`MDAnalysis.lib.nsgrid`
+===========================================================
+
+This module implements a cell-list (grid) search for all pairs of points
+that lie within a cutoff distance of each other. Coordinates are binned
+into cells that are at least as wide as the cutoff, so that all neighbors
+of a point are found in the 27 cells surrounding the cell of that point.
+Binning the points, sorting them by cell and the loops over neighboring
+cells are compiled (in :mod:`MDAnalysis.lib.c_distances`), which makes the
+cost of a search scale linearly with the number of points instead of
+quadratically.
+
+Periodic boundary conditions are supported for orthorhombic and triclinic
+unit cells. The grid is then built in fractional coordinates of the cell,
+with the number of cells along each box vector chosen from the distance
+between the opposing faces of the cell. Distances are always reported for
+the nearest periodic image.
+
+Typical usage ::
+
+  from MDAnalysis.lib.nsgrid import FastNS
+
+  searcher = FastNS(cutoff=5.0, coords=u.atoms.positions,
+                    box=u.dimensions)
+  results = searcher.search(u.select_atoms('resname SOL').positions)
+  pairs = results.get_pairs()
+  distances = results.get_pair_distances()
+
+:meth:`FastNS.self_search` finds all unique pairs among the grid
+coordinates themselves.
+
+When the same search is repeated for consecutive frames of a trajectory,
+:class:`VerletNS` keeps the pairs within the cutoff plus a skin and only
+recomputes the distances of those pairs until the coordinates have moved
+further than the skin allows.
+
+.. autoclass:: FastNS
+   :members:
+.. autoclass:: VerletNS
+   :members:
+.. autoclass:: NSResults
+   :members:
+
+"""
+from __future__ import division, absolute_import
+
+import itertools
+
+import numpy as np
+
+from .mdamath import triclinic_vectors
+from .c_distances import (nsgrid_bin, nsgrid_bin_periodic, nsgrid_sort,
+                          nsgrid_search, nsgrid_self_search)
+
+__all__ = ['FastNS', 'VerletNS', 'NSResults']
+
+
+#: All 27 neighbor cell offsets (including the cell itself).
+_FULL_STENCIL = np.array(list(itertools.product((-1, 0, 1), repeat=3)),
+                         dtype=np.int64)
+#: The 13 "forward" offsets plus the cell itself; every unordered pair of
+#: neighboring cells is visited exactly once.
+_HALF_STENCIL = _FULL_STENCIL[13:]
+
+
+def _box_vectors(box):
+    """Convert `box` into a ``(3, 3)`` float64 matrix of box vectors.
+
+    `box` can be given as ``[lx, ly, lz]``, as
+    ``[lx, ly, lz, alpha, beta, gamma]`` (the format of
+    :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`) or as a
+    ``(3, 3)`` matrix of box vectors.  Returns ``None`` for a box without
+    volume (such as the zero box of a trajectory without unit cell), which
+    can not be used for a periodic search.
+    """
+    box = np.asarray(box, dtype=np.float64)
+    if box.shape == (3,):
+        vectors = np.diag(box)
+    elif box.shape == (6,):
+        vectors = triclinic_vectors(box).astype(np.float64)
+    elif box.shape == (3, 3):
+        vectors = box.copy()
+    else:
+        raise ValueError("box input not recognised, must be an array of box "
+                         "dimensions or box vectors")
+    if not np.all(np.isfinite(vectors)) or \
+            np.abs(np.linalg.det(vectors)) < 1e-8:
+        return None
+    return vectors
+
+
+class NSResults(object):
+    """Results of a :class:`FastNS` search.
+
+    The results are stored as pairs of indices ``(i, j)`` where ``i`` is
+    the index of the query coordinate and ``j`` the index of the grid
+    coordinate, together with the distance between the two. Pairs are not
+    reported in any particular order.
+    """
+
+    def __init__(self, pairs, distances, n_queries):
+        self._pairs = pairs
+        self._distances = distances
+        self._n_queries = n_queries
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def get_pairs(self):
+        """Indices of all pairs within the cutoff.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(n_pairs, 2)`` array of ``(query index, grid index)``
+        """
+        return self._pairs
+
+    def get_pair_distances(self):
+        """Distances of all pairs, in the same order as :meth:`get_pairs`.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(n_pairs,)`` array of distances
+        """
+        return self._distances
+
+    def _split(self, values):
+        order = np.argsort(self._pairs[:, 0], kind='mergesort')
+        counts = np.bincount(self._pairs[:, 0], minlength=self._n_queries)
+        return np.split(values[order], np.cumsum(counts)[:-1])
+
+    def get_indices(self):
+        """Grid indices of the neighbors of each query coordinate.
+
+        Returns
+        -------
+        list
+            one array of grid indices per query coordinate
+        """
+        return self._split(self._pairs[:, 1])
+
+    def get_distances(self):
+        """Distances to the neighbors of each query coordinate, in the same
+        order as :meth:`get_indices`.
+
+        Returns
+        -------
+        list
+            one array of distances per query coordinate
+        """
+        return self._split(self._distances)
+
+
+class FastNS(object):
+    """Cell-list neighbor search of a set of coordinates.
+
+    The grid is built once from `coords` and can then be searched for the
+    neighbors of any number of query coordinates with :meth:`search`, or
+    for all pairs within the grid coordinates with :meth:`self_search`.
+
+    Parameters
+    ----------
+    cutoff : float
+        all pairs with a distance of at most `cutoff` are found
+    coords : array_like
+        ``(N, 3)`` array of coordinates used to build the grid
+    box : array_like, optional
+        unit cell as ``[lx, ly, lz, alpha, beta, gamma]``, ``[lx, ly, lz]``
+        or as ``(3, 3)`` box vectors. If ``None`` (the default) or a box
+        without volume, no periodic boundary conditions are applied.
+    max_gridsize : int, optional
+        upper limit on the number of cells of the grid. If the cutoff would
+        require more cells, larger cells are used, which keeps the search
+        correct but makes it slower. [5000000]
+
+
+    .. versionadded:: 0.17.0
+    """
+
+    def __init__(self, cutoff, coords, box=None, max_gridsize=5000000):
+        cutoff = float(cutoff)
+        if not cutoff > 0:
+            raise ValueError("cutoff must be positive, got {0}".format(cutoff))
+        coords = np.ascontiguousarray(coords, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] != 3:
+            raise ValueError("coords must be a sequence of 3 dimensional "
+                             "coordinates")
+        self.cutoff = cutoff
+        self.coords = coords
+        vectors = None if box is None else _box_vectors(box)
+        self.periodic = vectors is not None
+
+        if self.periodic:
+            self._vectors = vectors
+            self._inverse = np.linalg.inv(self._vectors)
+            # the distance between opposing faces of the cell limits how
+            # many cells of width `cutoff` fit along each box vector
+            volume = np.abs(np.linalg.det(self._vectors))
+            faces = np.array([np.cross(self._vectors[1], self._vectors[2]),
+                              np.cross(self._vectors[2], self._vectors[0]),
+                              np.cross(self._vectors[0], self._vectors[1])])
+            widths = volume / np.sqrt((faces ** 2).sum(axis=1))
+            n_cells = np.maximum(np.floor(widths / cutoff), 1)
+        else:
+            if len(coords):
+                self._origin = coords.min(axis=0)
+                extent = coords.max(axis=0) - self._origin
+            else:
+                self._origin = np.zeros(3)
+                extent = np.zeros(3)
+            # not used without periodic boundaries
+            self._vectors = np.zeros((3, 3))
+            n_cells = np.floor(extent / cutoff) + 1
+
+        # shrink the grid until it fits, cells can only get wider
+        while np.prod(n_cells) > max_gridsize:
+            n_cells = np.maximum(np.floor(n_cells / 2), 1)
+        self._n_cells = n_cells.astype(np.int64)
+        if not self.periodic:
+            self._cellsize = np.where(self._n_cells > 1,
+                                      np.maximum(cutoff,
+                                                 extent / self._n_cells),
+                                      np.inf)
+            # the last cell has to hold the maximum coordinate
+            self._cellsize[self._n_cells > 1] *= 1 + 1e-10
+
+        grid_coords, cells = self._bin(coords)
+        self._order, self._cell_start, self._cell_count = nsgrid_sort(
+            cells, self._n_cells)
+        # coordinates sorted by cell, every cell is a contiguous slice
+        self._sorted_coords = grid_coords[self._order]
+
+    def _bin(self, coords):
+        """Cell of each coordinate.
+
+        Coordinates of periodic systems are wrapped into the central cell
+        first, the wrapped coordinates are returned together with the cells.
+        Coordinates outside of a non-periodic grid get the nearest cell just
+        outside of it.
+        """
+        cells = np.empty(coords.shape, dtype=np.int64)
+        if not self.periodic:
+            nsgrid_bin(coords, self._origin, self._cellsize, self._n_cells,
+                       cells)
+            return coords, cells
+        wrapped = np.empty_like(coords)
+        nsgrid_bin_periodic(coords, self._vectors, self._inverse,
+                            self._n_cells, wrapped, cells)
+        return wrapped, cells
+
+    def _unique_images(self, pairs, distances):
+        """Keep only the nearest image of pairs found more than once."""
+        if not (self.periodic and np.any(self._n_cells < 3)):
+            return pairs, distances
+        # with fewer than three cells along a box vector different
+        # images of the same pair can be found
+        order = np.lexsort((distances, pairs[:, 1], pairs[:, 0]))
+        pairs, distances = pairs[order], distances[order]
+        first = np.ones(len(pairs), dtype=bool)
+        first[1:] = np.any(pairs[1:] != pairs[:-1], axis=1)
+        return pairs[first], distances[first]
+
+    def search(self, search_coords):
+        """Find all grid coordinates within the cutoff of `search_coords`.
+
+        Parameters
+        ----------
+        search_coords : array_like
+            ``(M, 3)`` array of query coordinates
+
+        Returns
+        -------
+        NSResults
+            pairs of ``(query index, grid index)`` and their distances
+        """
+        query = np.ascontiguousarray(search_coords,
+                                     dtype=np.float64).reshape(-1, 3)
+        query, query_cells = self._bin(query)
+        pairs, distances = nsgrid_search(
+            query, query_cells, self._sorted_coords, self._cell_start,
+            self._cell_count, self._n_cells, self._vectors, self.periodic,
+            _FULL_STENCIL, self.cutoff)
+        pairs[:, 1] = self._order[pairs[:, 1]]
+        pairs, distances = self._unique_images(pairs, distances)
+        return NSResults(pairs, distances, len(query))
+
+    def self_search(self):
+        """Find all unique pairs of grid coordinates within the cutoff.
+
+        Every pair ``(i, j)`` is reported once with ``i < j``; a coordinate
+        is never paired with itself or its own periodic images.
+
+        Returns
+        -------
+        NSResults
+            pairs of grid indices and their distances
+        """
+        if self.periodic and np.any(self._n_cells < 3):
+            # the half stencil would revisit the same pair of cells
+            stencil = _FULL_STENCIL
+        else:
+            stencil = _HALF_STENCIL
+        pairs, distances = nsgrid_self_search(
+            self._sorted_coords, self._cell_start, self._cell_count,
+            self._n_cells, self._vectors, self.periodic, stencil,
+            self.cutoff)
+        pairs = self._order[pairs]
+        pairs.sort(axis=1)
+        pairs, distances = self._unique_images(pairs, distances)
+        return NSResults(pairs, distances, len(self.coords))
+
+
+def _nearest_images(delta, vectors):
+    """Nearest periodic image of each vector in `delta`."""
+    frac = np.dot(delta, np.linalg.inv(vectors))
+    delta = delta - np.dot(np.rint(frac), vectors)
+    if np.count_nonzero(vectors - np.diag(np.diag(vectors))):
+        # in triclinic cells the nearest image can be in a neighboring cell
+        # of the one found by rounding
+        images = delta[:, None, :] + np.dot(_FULL_STENCIL, vectors)
+        nearest = np.einsum('ijk,ijk->ij', images, images).argmin(axis=1)
+        delta = images[np.arange(len(delta)), nearest]
+    return delta
+
+
+class VerletNS(object):
+    """Neighbor search that reuses a Verlet list between calls.
+
+    The first :meth:`search` finds all pairs within ``cutoff + skin`` with
+    :class:`FastNS`.  Later searches only recompute the distances of these
+    candidate pairs, as long as the largest displacement of the query
+    coordinates plus the largest displacement of the grid coordinates since
+    the list was built stays below `skin`: no other pair can have come
+    within the cutoff.  Otherwise the list is rebuilt.
+
+    The list is also rebuilt when the number of coordinates or the `key`
+    change, or when a coordinate moved into another periodic image (which
+    counts as a displacement of a box length).  Every pair keeps the
+    periodic image it was found in; a change of the box moves these images
+    and counts as a displacement of at most the change of the box vectors
+    times the number of box lengths spanned by the coordinates.  The small
+    box fluctuations of a constant pressure simulation therefore use up the
+    skin slowly instead of rebuilding the list every frame.
+
+    Parameters
+    ----------
+    cutoff : float
+        all pairs with a distance of at most `cutoff` are found
+    skin : float
+        extra distance searched when the list is built
+    max_gridsize : int, optional
+        passed on to :class:`FastNS`
+
+    Example
+    -------
+    Find the solvent atoms within 5 A of a protein in every frame::
+
+        verlet = VerletNS(5.0, skin=2.0)
+        for ts in u.trajectory:
+            pairs = verlet.search(protein.positions, solvent.positions,
+                                  box=u.dimensions).get_pairs()
+
+
+    .. versionadded:: 0.17.0
+    """
+
+    def __init__(self, cutoff, skin, max_gridsize=5000000):
+        cutoff = float(cutoff)
+        skin = float(skin)
+        if not cutoff > 0:
+            raise ValueError("cutoff must be positive, got {0}".format(cutoff))
+        if skin < 0:
+            raise ValueError("skin must not be negative, got {0}".format(skin))
+        self.cutoff = cutoff
+        self.skin = skin
+        self.max_gridsize = max_gridsize
+        #: number of times the Verlet list was (re)built
+        self.n_builds = 0
+        self._query = None
+
+    def _is_valid(self, query, coords, vectors, key):
+        """Can the current list be used for these coordinates?"""
+        if self._query is None:
+            return False
+        if (query.shape != self._query.shape or
+                coords.shape != self._coords.shape):
+            return False
+        if (vectors is None) != (self._vectors is None):
+            return False
+        if key is not None or self._key is not None:
+            if (key is None or self._key is None or
+                    len(key) != len(self._key) or
+                    not all(np.array_equal(a, b)
+                            for a, b in zip(key, self._key))):
+                return False
+        moved = 0.0
+        for new, old in ((query, self._query), (coords, self._coords)):
+            if len(new):
+                delta = new - old
+                moved += np.sqrt(np.einsum('ij,ij->i', delta, delta).max())
+        if vectors is not None:
+            moved += self._box_displacement(query, coords, vectors)
+        return moved <= self.skin
+
+    def _box_displacement(self, query, coords, vectors):
+        """Largest displacement of a periodic image by the change of the box
+
+        The nearest image of any pair is at most two box lengths further
+        along each box vector than the box lengths spanned by the
+        coordinates.
+        """
+        change = vectors - self._vectors
+        if not change.any():
+            return 0.0
+        frac = np.dot(np.concatenate([query, coords]), np.linalg.inv(vectors))
+        if not len(frac):
+            return 0.0
+        images = np.floor(frac.max(axis=0) - frac.min(axis=0)) + 2
+        return np.dot(images, np.sqrt((change ** 2).sum(axis=1)))
+
+    def _build(self, query, coords, vectors, key):
+        searcher = FastNS(self.cutoff + self.skin, coords, box=vectors,
+                          max_gridsize=self.max_gridsize)
+        pairs = searcher.search(query).get_pairs()
+        if vectors is not None:
+            delta = coords[pairs[:, 1]] - query[pairs[:, 0]]
+            nearest = _nearest_images(delta, vectors)
+            # box vectors added to each pair to get its nearest image
+            self._images = np.rint(np.dot(nearest - delta,
+                                          np.linalg.inv(vectors)))
+        self._pairs = pairs
+        self._query = query.copy()
+        self._coords = coords.copy()
+        self._vectors = vectors
+        self._key = None if key is None else tuple(np.array(k, copy=True)
+                                                   for k in key)
+        self.n_builds += 1
+
+    def search(self, search_coords, coords, box=None, key=None):
+        """Find all `coords` within the cutoff of `search_coords`.
+
+        Parameters
+        ----------
+        search_coords : array_like
+            ``(M, 3)`` array of query coordinates
+        coords : array_like
+            ``(N, 3)`` array of coordinates searched
+        box : array_like, optional
+            unit cell as for :class:`FastNS`
+        key : tuple of arrays, optional
+            identifies the coordinates, e.g. their atom indices; the list is
+            rebuilt when the key changes
+
+        Returns
+        -------
+        NSResults
+            pairs of ``(query index, coords index)`` and their distances
+        """
+        query = np.asarray(search_coords, dtype=np.float64).reshape(-1, 3)
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        vectors = None if box is None else _box_vectors(box)
+        if not self._is_valid(query, coords, vectors, key):
+            self._build(query, coords, vectors, key)
+
+        # the image of every pair is the one of the build
+        pairs = self._pairs
+        delta = coords[pairs[:, 1]] - query[pairs[:, 0]]
+        if vectors is not None:
+            delta += np.dot(self._images, vectors)
+        distances = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+        within = distances <= self.cutoff
+        return NSResults(pairs[within], distances[within], len(query))
@@ -117,12 +117,24 @@ File parsing
    :members:
 .. autodata:: FORTRAN_format_regex
 
+Fixed column records (for instance the ``ATOM`` records of PDB files) can
+also be converted for all lines at once::
+
+   chars, kinds = fixed_width_records(text, ('ATOM  ', 'HETATM'), width=54)
+   xyz, ok = fixed_width_floats(chars[:, 30:54].reshape(-1, 8))
+
+.. autofunction:: fixed_width_records
+.. autofunction:: fixed_width_floats
+.. autofunction:: fixed_width_ints
+.. autofunction:: fixed_width_strings
+
 
 Data manipulation and handling
 ------------------------------
 
 .. autofunction:: fixedwidth_bins
 .. autofunction:: get_weights
+.. autofunction:: factorize
 
 Strings
 -------
@@ -1230,6 +1242,210 @@ class FORTRANReader(object):
         return self.__class__.__name__ + "(" + ",".join(self.fmt) + ")"
 
 
+def _line_bounds(data):
+    """start and end (without line terminator) of all lines in `data`"""
+    ends = np.flatnonzero(data == ord('\n'))
+    starts = np.concatenate(([0], ends + 1))
+    ends = np.concatenate((ends, [len(data)]))
+    # "\r\n" line endings
+    crlf = ends > starts
+    crlf[crlf] = data[ends[crlf] - 1] == ord('\r')
+    return starts, ends - crlf
+
+
+def fixed_width_records(text, records, width=80, lstrip=False):
+    """Select all lines of `text` that start with one of `records`.
+
+    The selected lines are returned as a 2D array of characters, so that a
+    fixed width field can be converted for all lines at once with
+    :func:`fixed_width_floats`, :func:`fixed_width_ints` or
+    :func:`fixed_width_strings`.
+
+    Parameters
+    ----------
+    text : str or bytes
+        lines of a file, e.g. one frame of a PDB file
+    records : tuple of str
+        the record names (line prefixes) to select; a line matching
+        several of them is assigned to the first one
+    width : int (optional)
+        number of columns to keep, shorter lines are padded with spaces
+    lstrip : bool (optional)
+        ignore leading white space of lines
+
+    Returns
+    -------
+    chars : numpy.ndarray
+        ``(n_lines, width)`` array of the character codes (``uint8``) of
+        the selected lines
+    kinds : numpy.ndarray
+        for each selected line the index of the record in `records` it
+        starts with
+
+
+    .. versionadded:: 0.17.0
+    """
+    if not isinstance(text, bytes):
+        # one byte per character keeps the columns of all lines intact
+        text = text.encode('ascii', 'replace')
+    # the padding keeps all windows of `width` characters inside the buffer,
+    # a line can not match a record across its newline
+    data = np.frombuffer(text + b'\n' * width, dtype=np.uint8)
+    starts, ends = _line_bounds(data[:len(text)])
+    if lstrip:
+        # white space and control characters, str.lstrip() decides
+        first = data[starts]
+        indented = (starts < ends) & (first <= ord(' '))
+        for i in np.flatnonzero(indented):
+            line = text[starts[i]:ends[i]]
+            starts[i] += len(line) - len(line.lstrip())
+
+    kinds = np.full(len(starts), -1, dtype=np.intp)
+    for k, record in enumerate(records):
+        match = kinds < 0
+        for j, c in enumerate(bytearray(record.encode('ascii'))):
+            match &= data[starts + j] == c
+        kinds[match] = k
+    selected = np.flatnonzero(kinds >= 0)
+    starts, lengths = starts[selected], ends[selected] - starts[selected]
+
+    windows = np.lib.stride_tricks.as_strided(
+        data, shape=(len(text) + 1, width), strides=(1, 1))
+    chars = windows[starts]
+    short = np.flatnonzero(lengths < width)
+    if len(short):
+        chars[short] = np.where(np.arange(width) < lengths[short, np.newaxis],
+                                chars[short], ord(' '))
+    return chars, kinds[selected]
+
+
+def _parse_fixed_width(chars, integer):
+    """convert plain decimal numbers in `chars` and return them together with
+    a mask of the fields that were converted"""
+    chars = np.asarray(chars, dtype=np.uint8)
+    n, width = chars.shape
+    ok = np.ones(n, dtype=bool)
+    started = np.zeros(n, dtype=bool)
+    ended = np.zeros(n, dtype=bool)
+    seen_point = np.zeros(n, dtype=bool)
+    negative = np.zeros(n, dtype=bool)
+    n_digits = np.zeros(n, dtype=np.int64)
+    decimals = np.zeros(n, dtype=np.int64)
+    mantissa = np.zeros(n, dtype=np.int64)
+    # scan the fields column by column: an optional sign, digits and at most
+    # one decimal point, surrounded by white space only; everything else is
+    # left to Python
+    for c in np.ascontiguousarray(chars.T):
+        space = c == ord(' ')
+        value = c - ord('0')
+        digit = value < 10  # uint8 wraps around below '0'
+        point = c == ord('.')
+        minus = c == ord('-')
+        sign = minus | (c == ord('+'))
+        ok &= ~(ended & ~space)
+        ok &= ~(sign & started)
+        ok &= ~(point & (seen_point | integer))
+        ok &= space | digit | point | sign
+        ended |= space & started
+        started |= ~space
+        negative |= minus
+        seen_point |= point
+        n_digits += digit
+        decimals += digit & seen_point
+        mantissa = np.where(digit, mantissa * 10 + value, mantissa)
+    ok &= (n_digits > 0) & (n_digits <= 15)
+    if integer:
+        values = np.where(negative, -mantissa, mantissa)
+    else:
+        # both numbers are exact, so the division is correctly rounded
+        values = mantissa / 10.0 ** decimals
+        values[negative] *= -1
+    values[~ok] = 0
+    convert = int if integer else float
+    for i in np.flatnonzero(~ok):
+        try:
+            values[i] = convert(chars[i].tobytes())
+        except ValueError:
+            pass
+        else:
+            ok[i] = True
+    return values, ok
+
+
+def fixed_width_floats(chars):
+    """Convert fixed width fields to floats.
+
+    Parameters
+    ----------
+    chars : numpy.ndarray
+        ``(n, width)`` array of character codes as returned by
+        :func:`fixed_width_records`, one field per row
+
+    Returns
+    -------
+    values : numpy.ndarray
+        ``(n,)`` float64 array of the values, 0 where `ok` is ``False``
+    ok : numpy.ndarray
+        ``(n,)`` bool array, ``False`` for fields that are not a number
+        (e.g. blank fields)
+
+    Notes
+    -----
+    Plain decimal numbers are converted with vectorized integer
+    arithmetic and give exactly the same result as :func:`float`. Other
+    fields, e.g. in scientific notation, are converted with :func:`float`.
+
+
+    .. versionadded:: 0.17.0
+    """
+    return _parse_fixed_width(chars, integer=False)
+
+
+def fixed_width_ints(chars):
+    """Convert fixed width fields to integers.
+
+    Parameters
+    ----------
+    chars : numpy.ndarray
+        ``(n, width)`` array of character codes as returned by
+        :func:`fixed_width_records`, one field per row
+
+    Returns
+    -------
+    values : numpy.ndarray
+        ``(n,)`` int64 array of the values, 0 where `ok` is ``False``
+    ok : numpy.ndarray
+        ``(n,)`` bool array, ``False`` for fields that :func:`int` can not
+        convert (e.g. blank fields or ``*****``)
+
+
+    .. versionadded:: 0.17.0
+    """
+    return _parse_fixed_width(chars, integer=True)
+
+
+def fixed_width_strings(chars):
+    """Convert fixed width fields to white space stripped strings.
+
+    Parameters
+    ----------
+    chars : numpy.ndarray
+        ``(n, width)`` array of character codes as returned by
+        :func:`fixed_width_records`, one field per row
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(n,)`` object array of :class:`str`
+
+
+    .. versionadded:: 0.17.0
+    """
+    chars = np.ascontiguousarray(chars, dtype=np.uint8)
+    strings = chars.view('S{0}'.format(chars.shape[1])).ravel().astype('U')
+    return np.char.strip(strings).astype(object)
+
+
 def fixedwidth_bins(delta, xmin, xmax):
     """Return bins of width `delta` that cover `xmin`, `xmax` (or a larger range).
 
@@ -1560,6 +1776,50 @@ def unique_rows(arr, return_index=False):
         return u.view(arr.dtype).reshape(-1, m)
 
 
+def factorize(values):
+    """Split `values` into a vocabulary and the codes indexing it
+
+    Parameters
+    ----------
+    values : array_like
+        values to encode, for instance atom names
+
+    Returns
+    -------
+    vocabulary : numpy.ndarray
+        the distinct values; object arrays keep the order of first
+        appearance, other arrays are sorted and keep their dtype
+    codes : numpy.ndarray
+        int32 array of the shape of `values` so that ``vocabulary[codes]``
+        equals `values`
+
+    Examples
+    --------
+    >>> vocabulary, codes = factorize(np.array(['OW', 'HW', 'HW', 'OW'],
+    ...                                        dtype=object))
+    >>> vocabulary
+    array(['OW', 'HW'], dtype=object)
+    >>> codes
+    array([0, 1, 1, 0], dtype=int32)
+
+
+    .. versionadded:: 0.17.0
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'O':
+        lookup = {}
+        codes = np.fromiter((lookup.setdefault(v, len(lookup))
+                             for v in values.ravel()),
+                            dtype=np.int32, count=values.size)
+        vocabulary = np.empty(len(lookup), dtype=object)
+        for value, code in lookup.items():
+            vocabulary[code] = value
+    else:
+        vocabulary, codes = np.unique(values, return_inverse=True)
+        codes = codes.astype(np.int32)
+    return vocabulary, codes.reshape(values.shape)
+
+
 def blocks_of(a, n, m):
     """Extract a view of (n, m) blocks along the diagonal of the array `a`
 
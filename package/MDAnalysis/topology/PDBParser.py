@@ -108,8 +108,14 @@ class PDBParser(TopologyReaderBase):
     :class:`MDAnalysis.coordinates.PDB.PDBReader`
 
     .. versionadded:: 0.8
+    .. versionchanged:: 0.17.0
+       The ATOM/HETATM records are read in blocks and converted column by
+       column with the ``fixed_width_*`` functions of
+       :mod:`MDAnalysis.lib.util`.
     """
     format = ['PDB','ENT']
+    # number of characters read at once
+    _blocksize = 4 * 1024 ** 2
 
     def parse(self):
         """Parse atom information from PDB file
@@ -132,73 +138,71 @@ class PDBParser(TopologyReaderBase):
 
     def _parseatoms(self):
         """Create the initial Topology object"""
-        resid_prev = 0  # resid looping hack
-
-        serials = []
-        names = []
-        altlocs = []
-        chainids = []
-        icodes = []
-        tempfactors = []
-        occupancies = []
-        atomtypes = []
-
-        resids = []
-        resnames = []
-
-        segids = []
-
         self._wrapped_serials = False  # did serials go over 100k?
         last_wrapped_serial = 100000  # if serials wrap, start from here
-        with util.openany(self.filename ) as f:
-            for line in f:
-                line = line.strip()  # Remove extra spaces
-                if not line:  # Skip line if empty
-                    continue
-                if line.startswith('END'):
+
+        # the ATOM/HETATM records are collected as a 2D array of characters
+        # and every column is converted for all atoms at once
+        blocks = []
+        with util.openany(self.filename) as f:
+            while True:
+                # whole lines only
+                text = f.read(self._blocksize)
+                if not text:
                     break
-                if not line.startswith(('ATOM', 'HETATM')):
-                    continue
-
-                try:
-                    serial = int(line[6:11])
-                except ValueError:
-                    # serial can become '***' when they get too high
-                    self._wrapped_serials = True
-                    serial = last_wrapped_serial
-                    last_wrapped_serial += 1
-                finally:
-                    serials.append(serial)
-
-                names.append(line[12:16].strip())
-                altlocs.append(line[16:17].strip())
-                resnames.append(line[17:21].strip())
-                chainids.append(line[21:22].strip())
-
-                # Resids are optional
-                try:
-                    if self.format == "XPDB":  # fugly but keeps code DRY
-                        # extended non-standard format used by VMD
-                        resid = int(line[22:27])
-                    else:
-                        resid = int(line[22:26])
-                        icodes.append(line[26:27].strip())
-                        # Wrapping
-                        while resid - resid_prev < -5000:
-                            resid += 10000
-                        resid_prev = resid
-                except ValueError:
-                    warnings.warn("PDB file is missing resid information.  "
-                                  "Defaulted to '1'")
-                    resid = 1
-                finally:
-                    resids.append(resid)
-
-                occupancies.append(float_or_default(line[54:60], 0.0))
-                tempfactors.append(float_or_default(line[60:66], 1.0))  # AKA bfactor
-
-                segids.append(line[66:76].strip())
-                atomtypes.append(line[76:78].strip())
+                text += f.readline()
+                chars, kinds = util.fixed_width_records(
+                    text, ('ATOM', 'HETATM', 'END'), width=80, lstrip=True)
+                end = np.flatnonzero(kinds == 2)
+                if len(end):
+                    blocks.append(chars[:end[0]])
+                    break
+                blocks.append(chars)
+        if blocks:
+            chars = np.concatenate(blocks)
+        else:
+            chars = np.empty((0, 80), dtype=np.uint8)
+        n_atoms = len(chars)
+
+        serials, ok = util.fixed_width_ints(chars[:, 6:11])
+        if not ok.all():
+            # serial can become '***' when they get too high
+            self._wrapped_serials = True
+            serials[~ok] = last_wrapped_serial + np.arange(n_atoms - ok.sum())
+
+        names = util.fixed_width_strings(chars[:, 12:16])
+        altlocs = util.fixed_width_strings(chars[:, 16:17])
+        resnames = util.fixed_width_strings(chars[:, 17:21])
+        chainids = util.fixed_width_strings(chars[:, 21:22])
+
+        # Resids are optional
+        if self.format == "XPDB":  # fugly but keeps code DRY
+            # extended non-standard format used by VMD
+            resids, ok = util.fixed_width_ints(chars[:, 22:27])
+        else:
+            resids, ok = util.fixed_width_ints(chars[:, 22:26])
+            icodes = util.fixed_width_strings(chars[:, 26:27])
+            # Wrapping
+            valid = resids[ok]
+            if np.any(np.diff(np.concatenate(([0], valid))) < -5000):
+                resid_prev = 0  # resid looping hack
+                for i, resid in enumerate(valid):
+                    while resid - resid_prev < -5000:
+                        resid += 10000
+                    valid[i] = resid_prev = resid
+                resids[ok] = valid
+        if not ok.all():
+            warnings.warn("PDB file is missing resid information.  "
+                          "Defaulted to '1'")
+            resids[~ok] = 1
+
+        occupancies, ok = util.fixed_width_floats(chars[:, 54:60])
+        occupancies[~ok] = 0.0
+        tempfactors, ok = util.fixed_width_floats(chars[:, 60:66])  # AKA bfactor
+        tempfactors[~ok] = 1.0
+
+        segids = util.fixed_width_strings(chars[:, 66:76])
+        atomtypes = util.fixed_width_strings(chars[:, 76:78])
 
         # Warn about wrapped serials
         if self._wrapped_serials:
@@ -209,8 +213,6 @@ class PDBParser(TopologyReaderBase):
         if not any(segids):
             segids, chainids = chainids, None
 
-        n_atoms = len(serials)
-
         attrs = []
         # Make Atom TopologyAttrs
         for vals, Attr, dtype in (
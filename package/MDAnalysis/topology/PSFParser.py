@@ -27,7 +27,8 @@ PSF topology parser
 Reads a CHARMM/NAMD/XPLOR PSF_ file to build the system. The topology will
 contain atom IDs, segids, residue IDs, residue names, atom names, atom types,
 charges and masses. Bonds, angles, dihedrals and impropers are also read from
-the file.
+the file; with ``Universe(psf, lazy_topology=True)`` they are only read when
+they are first used.
 
 It reads both standard and extended ("EXT") PSF formats and can also parse NAMD
 space-separated "PSF" file variants.
@@ -47,10 +48,11 @@ from six.moves import range
 
 import logging
 import functools
+from itertools import islice
 from math import ceil
 import numpy as np
 
-from ..lib.util import openany
+from ..lib.util import openany, isstream
 from . import guessers
 from .base import TopologyReaderBase, squash_by, change_squash
 from ..core.topologyattrs import (
@@ -97,70 +99,106 @@ class PSFParser(TopologyReaderBase):
     def parse(self):
         """Parse PSF file into Topology
 
+        With the ``lazy`` keyword of the parser set, the bond, angle,
+        dihedral and improper sections are only skipped over here and read
+        when they are first used.
+
         Returns
         -------
         MDAnalysis *Topology* object
+
+
+        .. versionchanged:: 0.17.0
+           Added lazy reading of the connectivity sections.
         """
+        # a stream can't be opened again to read the sections later
+        lazy = self.kwargs.get('lazy', False) and not isstream(self.filename)
         # Open and check psf validity
         with openany(self.filename) as psffile:
-            header = next(psffile)
-            if not header.startswith("PSF"):
-                err = ("{0} is not valid PSF file (header = {1})"
-                       "".format(self.filename, header))
-                logger.error(err)
-                raise ValueError(err)
-            header_flags = header[3:].split()
-
-            if "NAMD" in header_flags:
-                self._format = "NAMD"        # NAMD/VMD
-            elif "EXT" in header_flags:
-                self._format = "EXTENDED"    # CHARMM
-            else:
-                self._format = "STANDARD"    # CHARMM
-
-            next(psffile)
-            title = next(psffile).split()
-            if not (title[1] == "!NTITLE"):
-                err = "{0} is not a valid PSF file".format(psffile.name)
-                logger.error(err)
-                raise ValueError(err)
-            # psfremarks = [psffile.next() for i in range(int(title[0]))]
-            for _ in range(int(title[0])):
-                next(psffile)
-            logger.debug("PSF file {0}: format {1}"
-                         "".format(psffile.name, self._format))
+            self._parse_header(psffile)
 
             # Atoms first and mandatory
             top = self._parse_sec(
                 psffile, ('NATOM', 1, 1, self._parseatoms))
             # Then possibly other sections
-            sections = (
-                #("atoms", ("NATOM", 1, 1, self._parseatoms)),
-                (Bonds, ("NBOND", 2, 4, self._parsesection)),
-                (Angles, ("NTHETA", 3, 3, self._parsesection)),
-                (Dihedrals, ("NPHI", 4, 2, self._parsesection)),
-                (Impropers, ("NIMPHI", 4, 2, self._parsesection)),
-                #("donors", ("NDON", 2, 4, self._parsesection)),
-                #("acceptors", ("NACC", 2, 4, self._parsesection))
-            )
-
             try:
-                for attr, info in sections:
+                for attr, info in self._sections():
                     next(psffile)
-                    top.add_TopologyAttr(
-                        attr(self._parse_sec(psffile, info)))
+                    if lazy:
+                        self._skip_sec(psffile, info)
+                        top.add_TopologyAttr(attr.from_loader(
+                            functools.partial(self._load_sec, attr)))
+                    else:
+                        top.add_TopologyAttr(
+                            attr(self._parse_sec(psffile, info)))
             except StopIteration:
                 # Reached the end of the file before we expected
                 pass
 
         return top
 
-    def _parse_sec(self, psffile, section_info):
-        """Parse a single section of the PSF
+    def _sections(self):
+        """The connectivity sections following the atoms, in file order"""
+        return (
+            #("atoms", ("NATOM", 1, 1, self._parseatoms)),
+            (Bonds, ("NBOND", 2, 4, self._parsesection)),
+            (Angles, ("NTHETA", 3, 3, self._parsesection)),
+            (Dihedrals, ("NPHI", 4, 2, self._parsesection)),
+            (Impropers, ("NIMPHI", 4, 2, self._parsesection)),
+            #("donors", ("NDON", 2, 4, self._parsesection)),
+            #("acceptors", ("NACC", 2, 4, self._parsesection))
+        )
+
+    def _parse_header(self, psffile):
+        """Check the header and title of the PSF and set its format"""
+        header = next(psffile)
+        if not header.startswith("PSF"):
+            err = ("{0} is not valid PSF file (header = {1})"
+                   "".format(self.filename, header))
+            logger.error(err)
+            raise ValueError(err)
+        header_flags = header[3:].split()
+
+        if "NAMD" in header_flags:
+            self._format = "NAMD"        # NAMD/VMD
+        elif "EXT" in header_flags:
+            self._format = "EXTENDED"    # CHARMM
+        else:
+            self._format = "STANDARD"    # CHARMM
+
+        next(psffile)
+        title = next(psffile).split()
+        if not (title[1] == "!NTITLE"):
+            err = "{0} is not a valid PSF file".format(psffile.name)
+            logger.error(err)
+            raise ValueError(err)
+        # psfremarks = [psffile.next() for i in range(int(title[0]))]
+        for _ in range(int(title[0])):
+            next(psffile)
+        logger.debug("PSF file {0}: format {1}"
+                     "".format(psffile.name, self._format))
+
+    def _load_sec(self, attr):
+        """Read the section of TopologyAttr class *attr* from the file
+
+        Loader of the lazy connectivity attributes: everything before the
+        section is skipped without being parsed.
+        """
+        with openany(self.filename) as psffile:
+            self._parse_header(psffile)
+            self._skip_sec(psffile, ('NATOM', 1, 1, None))
+            for other, info in self._sections():
+                next(psffile)
+                if other is attr:
+                    return attr(self._parse_sec(psffile, info))
+                self._skip_sec(psffile, info)
+
+    def _read_sec_header(self, psffile, section_info):
+        """Read the header of a section and check that it is the expected one
 
         Returns
         -------
-        A list of Attributes from this section
+        The number of lines of the section
         """
         desc, atoms_per, per_line, parsefunc = section_info
         header = next(psffile)
@@ -177,7 +215,23 @@ class PSFParser(TopologyReaderBase):
             logger.error(err)
             raise ValueError(err)
         # Now figure out how many lines to read
-        numlines = int(ceil(num/per_line))
+        return int(ceil(num/per_line))
+
+    def _skip_sec(self, psffile, section_info):
+        """Move past a single section of the PSF without parsing it"""
+        numlines = self._read_sec_header(psffile, section_info)
+        if sum(1 for _ in islice(psffile, numlines)) < numlines:
+            raise StopIteration
+
+    def _parse_sec(self, psffile, section_info):
+        """Parse a single section of the PSF
+
+        Returns
+        -------
+        A list of Attributes from this section
+        """
+        desc, atoms_per, per_line, parsefunc = section_info
+        numlines = self._read_sec_header(psffile, section_info)
 
         psffile_next = functools.partial(next, psffile)
         return parsefunc(psffile_next, atoms_per, numlines)
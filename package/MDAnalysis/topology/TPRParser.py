@@ -110,6 +110,11 @@ parser. Currently the following sections of the topology are parsed:
 * Dihedrals
 * Impropers
 
+The file is read sequentially, so the connectivity is always read. With the
+``lazy`` keyword of the parser (``Universe(tpr, lazy_topology=True)``) the
+bonds, angles, dihedrals and impropers of the molecule types are only copied
+to every molecule of the system when they are first used.
+
 This tpr parser is written according to the following files
 
 - :file:`{gromacs_dir}/src/kernel/gmxdump.c`
@@ -196,7 +201,8 @@ class TPRParser(TopologyReaderBase):
             tpr_utils.fileVersion_err(V)
 
         if th.bTop:
-            tpr_top = tpr_utils.do_mtop(data, V)
+            tpr_top = tpr_utils.do_mtop(data, V,
+                                        lazy=self.kwargs.get('lazy', False))
         else:
             msg = "{0}: No topology found in tpr file".format(self.filename)
             logger.critical(msg)
@@ -32,7 +32,8 @@ from __future__ import absolute_import
 import numpy as np
 import warnings
 
-from ..lib import distances
+from ..lib.nsgrid import FastNS
+from ..lib.util import factorize, unique_rows
 from . import tables
 
 
@@ -160,8 +161,9 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
 
     Returns
     -------
-    list
-        List of tuples suitable for use in Universe topology building.
+    numpy.ndarray
+        ``(n_bonds, 2)`` array of the atom indices of the bonds, suitable
+        for use in Universe topology building.
 
     Warnings
     --------
@@ -182,6 +184,11 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
        faster.  Should also use less memory, previously scaled as
        :math:`O(n^2)`.  *vdwradii* argument now augments table list
        rather than replacing entirely.
+    .. versionchanged:: 0.17.0
+       Candidate pairs are found with the grid search of
+       :class:`MDAnalysis.lib.nsgrid.FastNS` instead of a loop over all
+       atoms, scales as :math:`O(n)`. Returns an array of atom indices
+       instead of a tuple of tuples.
     """
     # why not just use atom.positions?
     if len(atoms) != len(coords):
@@ -195,12 +202,13 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
         vdwradii.update(user_vdwradii)
 
     # Try using types, then elements
-    atomtypes = atoms.types
+    # the radii are looked up once per distinct type
+    atomtypes, type_codes = factorize(atoms.types)
 
     # check that all types have a defined vdw
-    if not all(val in vdwradii for val in set(atomtypes)):
+    if not all(val in vdwradii for val in atomtypes):
         raise ValueError(("vdw radii for types: " +
-                          ", ".join([t for t in set(atomtypes) if
+                          ", ".join([t for t in atomtypes if
                                      not t in vdwradii]) +
                           ". These can be defined manually using the" +
                           " keyword 'vdwradii'"))
@@ -213,30 +221,72 @@ def guess_bonds(atoms, coords, box=None, **kwargs):
     # to speed up checking, calculate what the largest possible bond
     # atom that would warrant attention.
     # then use this to quickly mask distance results later
-    max_vdw = max([vdwradii[t] for t in atomtypes])
+    type_radii = np.array([vdwradii[t] for t in atomtypes])
+    max_vdw = max(type_radii)
 
-    bonds = []
+    # all candidate pairs in a single grid search, scales O(n)
+    results = FastNS(2 * max_vdw * fudge_factor, coords,
+                     box=box).self_search()
+    pairs = results.get_pairs()
+    dist = results.get_pair_distances()
 
-    for i, atom in enumerate(atoms[:-1]):
-        vdw_i = vdwradii[atomtypes[i]]
-        max_d = (vdw_i + max_vdw) * fudge_factor
+    radii = type_radii[type_codes]
+    mask = ((dist > lower_bound) &
+            (dist < (radii[pairs[:, 0]] + radii[pairs[:, 1]]) * fudge_factor))
+    pairs = pairs[mask]
+    # same ordering as a loop over all i < j
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
 
-        # using self_distance_array scales O(n^2)
-        # 20,000 atoms = 1.6 Gb memory
-        dist = distances.distance_array(coords[i][None, :], coords[i + 1:],
-                                        box=box)[0]
-        idx = np.where((dist > lower_bound) & (dist <= max_d))[0]
+    return atoms.indices[pairs]
 
-        for a in idx:
-            j = i + 1 + a
-            atom_j = atoms[j]
 
-            if dist[a] < (vdw_i + vdwradii[atomtypes[j]]) * fudge_factor:
-                # because of method used, same bond won't be seen twice,
-                # so don't need to worry about duplicates
-                bonds.append((atom.index, atom_j.index))
+def _term_indices(group, n):
+    """``(n_terms, n)`` integer array of the atom indices of *group*
+
+    The indices of an empty TopologyGroup are an empty 1D float array.
+    """
+    return np.asarray(group.indices, dtype=np.intp).reshape(-1, n)
+
+
+def _bond_graph(universe):
+    """Adjacency of the atoms of *universe* through its bonds
+
+    Returns
+    -------
+    indptr, neighbors : numpy.ndarray
+        the atoms bonded to atom ``i`` are
+        ``neighbors[indptr[i]:indptr[i + 1]]``
+    """
+    bix = _term_indices(universe.atoms.bonds, 2)
+    both = np.concatenate([bix, bix[:, ::-1]])
+    indptr = np.zeros(len(universe.atoms) + 1, dtype=np.intp)
+    np.cumsum(np.bincount(both[:, 0], minlength=len(universe.atoms)),
+              out=indptr[1:])
+    order = np.argsort(both[:, 0], kind='mergesort')
+    return indptr, both[order, 1]
 
-    return tuple(bonds)
+
+def _extend(graph, terms, end):
+    """Append every atom bonded to column *end* of *terms* to the terms
+
+    Atoms already in a term are skipped; the resulting terms are flipped so
+    that the first index is below the last and duplicates are removed.
+    """
+    indptr, neighbors = graph
+    atoms = terms[:, end]
+    starts = indptr[atoms]
+    counts = indptr[atoms + 1] - starts
+    # positions starts[i] ... starts[i] + counts[i] - 1 for every term
+    ends = np.cumsum(counts)
+    pos = np.arange(ends[-1] if len(ends) else 0, dtype=np.intp)
+    pos += np.repeat(starts - ends + counts, counts)
+    new = np.column_stack([np.repeat(terms, counts, axis=0),
+                           neighbors[pos]])
+    keep = (new[:, :-1] != new[:, -1:]).all(axis=1)
+    new = new[keep]
+    flip = new[:, 0] > new[:, -1]
+    new[flip] = new[flip, ::-1]
+    return unique_rows(new)
 
 
 def guess_angles(bonds):
@@ -247,8 +297,8 @@ def guess_angles(bonds):
 
     Returns
     -------
-    list of tuples
-        List of tuples defining the angles.
+    numpy.ndarray
+        ``(n_angles, 3)`` array of the atom indices of the angles.
         Suitable for use in u._topology
 
 
@@ -258,21 +308,15 @@ def guess_angles(bonds):
 
 
     .. versionadded 0.9.0
+    .. versionchanged:: 0.17.0
+       Built on an adjacency array of the bonds instead of loops over
+       Bond objects, returns an array.
     """
-    angles_found = set()
-
-    for b in bonds:
-        for atom in b:
-            other_a = b.partner(atom)  # who's my friend currently in Bond
-            for other_b in atom.bonds:
-                if other_b != b:  # if not the same bond I start as
-                    third_a = other_b.partner(atom)
-                    desc = tuple([other_a.index, atom.index, third_a.index])
-                    if desc[0] > desc[-1]:  # first index always less than last
-                        desc = desc[::-1]
-                    angles_found.add(desc)
+    bix = _term_indices(bonds, 2)
+    # every bond seen from both of its atoms
+    terms = np.concatenate([bix, bix[:, ::-1]])
 
-    return tuple(angles_found)
+    return _extend(_bond_graph(bonds.universe), terms, -1)
 
 
 def guess_dihedrals(angles):
@@ -283,29 +327,20 @@ def guess_dihedrals(angles):
 
     Returns
     -------
-    list of tuples
-        List of tuples defining the dihedrals.
+    numpy.ndarray
+        ``(n_dihedrals, 4)`` array of the atom indices of the dihedrals.
         Suitable for use in u._topology
 
     .. versionadded 0.9.0
+    .. versionchanged:: 0.17.0
+       Built on an adjacency array of the bonds instead of loops over
+       Angle objects, returns an array.
     """
-    dihedrals_found = set()
+    aix = _term_indices(angles, 3)
+    # search the first and last atom of each angle
+    terms = np.concatenate([aix, aix[:, ::-1]])
 
-    for b in angles:
-        a_tup = tuple([a.index for a in b])  # angle as tuple of numbers
-        # if searching with b[0], want tuple of (b[2], b[1], b[0], +new)
-        # search the first and last atom of each angle
-        for atom, prefix in zip([b.atoms[0], b.atoms[-1]],
-                                [a_tup[::-1], a_tup]):
-            for other_b in atom.bonds:
-                if not other_b.partner(atom) in b:
-                    third_a = other_b.partner(atom)
-                    desc = prefix + (third_a.index,)
-                    if desc[0] > desc[-1]:
-                        desc = desc[::-1]
-                    dihedrals_found.add(desc)
-
-    return tuple(dihedrals_found)
+    return _extend(_bond_graph(angles.universe), terms, -1)
 
 
 def guess_improper_dihedrals(angles):
@@ -319,29 +354,20 @@ def guess_improper_dihedrals(angles):
 
     Returns
     -------
-        List of tuples defining the improper dihedrals.
-        Suitable for use in u._topology
+    numpy.ndarray
+        ``(n_impropers, 4)`` array of the atom indices of the improper
+        dihedrals. Suitable for use in u._topology
 
     .. versionadded 0.9.0
+    .. versionchanged:: 0.17.0
+       Built on an adjacency array of the bonds instead of loops over
+       Angle objects, returns an array.
     """
-    dihedrals_found = set()
-
-    for b in angles:
-        atom = b[1]  # select middle atom in angle
-        # start of improper tuple
-        a_tup = tuple([b[a].index for a in [1, 2, 0]])
-        # if searching with b[1], want tuple of (b[1], b[2], b[0], +new)
-        # search the first and last atom of each angle
-        for other_b in atom.bonds:
-            other_atom = other_b.partner(atom)
-            # if this atom isn't in the angle I started with
-            if not other_atom in b:
-                desc = a_tup + (other_atom.index,)
-                if desc[0] > desc[-1]:
-                    desc = desc[::-1]
-                dihedrals_found.add(desc)
-
-    return tuple(dihedrals_found)
+    aix = _term_indices(angles, 3)
+    # start of improper tuple, searching from the middle atom
+    terms = aix[:, [1, 2, 0]]
+
+    return _extend(_bond_graph(angles.universe), terms, 0)
 
 
 def get_atom_mass(element):
@@ -47,6 +47,8 @@ The module also contains the :func:`do_inputrec` to read the TPR header with.
 """
 from __future__ import absolute_import
 
+import functools
+
 from six.moves import range
 import numpy as np
 
@@ -187,8 +189,10 @@ def extract_box_info(data, fileVersion):
     return obj.Box(box, box_rel, box_v)
 
 
-def do_mtop(data, fver):
+def do_mtop(data, fver, lazy=False):
     # mtop: the topology of the whole system
+    # with lazy, the connectivity of the molecules is only copied to every
+    # molecule of the system when it is first used
     symtab = do_symtab(data)
     do_symstr(data, symtab)  # system_name
     do_ffparams(data, fver)  # params
@@ -207,6 +211,8 @@ def do_mtop(data, fver):
     angles = []
     dihedrals = []
     impropers = []
+    # (molecule type, first atom of each of its molecules) per molblock
+    blocks = []
 
     atomids = []
     segids = []
@@ -227,6 +233,7 @@ def do_mtop(data, fver):
         # naming is kind of arbitrary
         molblock = mtop.moltypes[mb.molb_type].name.decode('utf-8')
         segid = "seg_{0}_{1}".format(i, molblock)
+        starts = []
         for j in range(mb.molb_nmol):
             mt = mtop.moltypes[mb.molb_type]  # mt: molecule type
             for atomkind in mt.atomkinds:
@@ -240,14 +247,19 @@ def do_mtop(data, fver):
                 charges.append(atomkind.charge)
                 masses.append(atomkind.mass)
 
-            # remap_ method returns [blah, blah, ..] or []
-            bonds.extend(mt.remap_bonds(atom_start_ndx))
-            angles.extend(mt.remap_angles(atom_start_ndx))
-            dihedrals.extend(mt.remap_dihe(atom_start_ndx))
-            impropers.extend(mt.remap_impr(atom_start_ndx))
+            if lazy:
+                starts.append(atom_start_ndx)
+            else:
+                # remap_ method returns [blah, blah, ..] or []
+                bonds.extend(mt.remap_bonds(atom_start_ndx))
+                angles.extend(mt.remap_angles(atom_start_ndx))
+                dihedrals.extend(mt.remap_dihe(atom_start_ndx))
+                impropers.extend(mt.remap_impr(atom_start_ndx))
 
             atom_start_ndx += mt.number_of_atoms()
             res_start_ndx += mt.number_of_residues()
+        if starts:
+            blocks.append((mtop.moltypes[mb.molb_type], np.array(starts)))
 
     # not useful here
 
@@ -287,6 +299,12 @@ def do_mtop(data, fver):
                           segids],
                    atom_resindex=residx,
                    residue_segindex=segidx)
+    if lazy:
+        for attr, name in ((Bonds, 'bonds'), (Angles, 'angles'),
+                           (Dihedrals, 'dihe'), (Impropers, 'impr')):
+            top.add_TopologyAttr(attr.from_loader(
+                functools.partial(_remap_terms, attr, blocks, name)))
+        return top
     top.add_TopologyAttr(Bonds([bond for bond in bonds if bond]))
     top.add_TopologyAttr(Angles([angle for angle in angles if angle]))
     top.add_TopologyAttr(Dihedrals([dihedral for dihedral in dihedrals
@@ -297,6 +315,26 @@ def do_mtop(data, fver):
     return top
 
 
+def _remap_terms(attr, blocks, name):
+    """Build TopologyAttr *attr* from the terms *name* of all molecules
+
+    *blocks* holds a molecule type and the index of the first atom of each
+    of its molecules; the terms of a molecule type are shifted to all of
+    its molecules at once.
+    """
+    terms = []
+    for mt, starts in blocks:
+        mol_terms = getattr(mt, name)
+        if not mol_terms:
+            continue
+        mol_terms = np.asarray(mol_terms, dtype=np.int64)
+        terms.append((mol_terms[None, :, :] + starts[:, None, None])
+                     .reshape(-1, mol_terms.shape[1]))
+    if not terms:
+        return attr([])
+    return attr(np.concatenate(terms))
+
+
 def do_symstr(data, symtab):
     #do_symstr: get a string based on index from the symtab
     ndx = data.unpack_int()
@@ -279,6 +279,9 @@ def extensions(config):
     parallel_args = ['-fopenmp'] if has_openmp and use_openmp else []
     parallel_libraries = ['gomp'] if has_openmp and use_openmp else []
     parallel_macros = [('PARALLEL', None)] if has_openmp and use_openmp else []
+    # the distance kernels only vectorize with -O3, and sqrt() only
+    # vectorizes when it does not have to set errno
+    distances_args = ["-O3", "-fno-math-errno"]
 
     if use_cython:
         print('Will attempt to use Cython.')
@@ -305,13 +308,13 @@ def extensions(config):
                              include_dirs=include_dirs + ['MDAnalysis/lib/include'],
                              libraries=['m'],
                              define_macros=define_macros,
-                             extra_compile_args=extra_compile_args)
+                             extra_compile_args=distances_args)
     distances_omp = MDAExtension('lib.c_distances_openmp',
                                  ['MDAnalysis/lib/c_distances_openmp' + source_suffix],
                                  include_dirs=include_dirs + ['MDAnalysis/lib/include'],
                                  libraries=['m'] + parallel_libraries,
                                  define_macros=define_macros + parallel_macros,
-                                 extra_compile_args=parallel_args,
+                                 extra_compile_args=parallel_args + distances_args,
                                  extra_link_args=parallel_args)
     qcprot = MDAExtension('lib.qcprot',
                           ['MDAnalysis/lib/qcprot' + source_suffix],
@@ -26,7 +26,7 @@ from six.moves import range
 
 import numpy as np
 
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_almost_equal
 
 import MDAnalysis as mda
 from MDAnalysis.analysis import base
@@ -46,6 +46,48 @@ class FrameAnalysis(base.AnalysisBase):
         self.frames.append(self._ts.frame)
 
 
+class BlockFrameAnalysis(base.AnalysisBase):
+    """Grabs frame numbers and can be run in several blocks"""
+    def _prepare(self):
+        self.frames = []
+
+    def _single_frame(self):
+        self.frames.append(self._ts.frame)
+
+    def _reduce(self, other):
+        self.frames.extend(other.frames)
+
+
+class MultiFrameAnalysis(base.AnalysisBase):
+    """Sums up positions per frame or per block of frames"""
+    def __init__(self, atomgroup, multi_frame=True, **kwargs):
+        super(MultiFrameAnalysis, self).__init__(atomgroup.universe.trajectory,
+                                                 **kwargs)
+        self.atomgroup = atomgroup
+        if multi_frame:
+            self._multi_frame_atoms = atomgroup
+
+    def _prepare(self):
+        self.frames = []
+        self.sums = np.zeros(self.n_frames)
+        self.block_sizes = []
+
+    def _single_frame(self):
+        self.frames.append(self._ts.frame)
+        self.sums[self._frame_index] = self.atomgroup.positions.sum()
+
+    def _multi_frame(self, block):
+        self.frames.extend(block.frames)
+        self.sums[block.indices] = block.positions.sum(axis=(1, 2))
+        self.block_sizes.append(len(block.positions))
+        assert_equal(block.dimensions.shape, (len(block.positions), 6))
+
+    def _reduce(self, other):
+        self.frames.extend(other.frames)
+        self.sums[other._block] = other.sums[other._block]
+        self.block_sizes.extend(other.block_sizes)
+
+
 class IncompleteAnalysis(base.AnalysisBase):
     def __init__(self, reader, **kwargs):
         super(IncompleteAnalysis, self).__init__(reader, **kwargs)
@@ -89,6 +131,45 @@ def test_step(u):
     assert_equal(an.frames, list(range(98))[::20])
 
 
+@pytest.mark.parametrize('backend', ['serial', 'threads', 'multiprocessing'])
+def test_blocks(u, backend):
+    an = BlockFrameAnalysis(u.trajectory, step=3).run(backend=backend,
+                                                      n_workers=2,
+                                                      n_blocks=4)
+    assert an.n_frames == 33
+    assert_equal(an.frames, list(range(98))[::3])
+
+
+def test_more_blocks_than_frames(u):
+    an = BlockFrameAnalysis(u.trajectory, stop=3).run(n_blocks=10)
+    assert_equal(an.frames, [0, 1, 2])
+
+
+def test_unknown_backend(u):
+    with pytest.raises(ValueError):
+        FrameAnalysis(u.trajectory).run(backend='mpi')
+
+
+def test_blocks_without_reduce(u):
+    with pytest.raises(NotImplementedError):
+        FrameAnalysis(u.trajectory).run(n_blocks=2)
+
+
+@pytest.mark.parametrize('n_blocks', [1, 3])
+@pytest.mark.parametrize('step', [1, 4])
+def test_multi_frame(u, n_blocks, step):
+    ag = u.select_atoms('name CA')
+    ref = MultiFrameAnalysis(ag, multi_frame=False, step=step).run()
+    an = MultiFrameAnalysis(ag, step=step)
+    an._multi_frame_size = 10
+    an.run(n_blocks=n_blocks)
+
+    assert_equal(an.frames, ref.frames)
+    assert_almost_equal(an.sums, ref.sums, decimal=3)
+    assert max(an.block_sizes) <= 10
+    assert sum(an.block_sizes) == an.n_frames
+
+
 def test_verbose(u):
     a = FrameAnalysis(u.trajectory, verbose=True)
     assert a._verbose
@@ -158,6 +239,19 @@ def test_AnalysisFromFunction():
         assert_equal(results, ana.results)
 
 
+@pytest.mark.parametrize('backend', ['serial', 'threads', 'multiprocessing'])
+def test_AnalysisFromFunction_blocks(backend):
+    u = mda.Universe(PSF, DCD)
+    ana = base.AnalysisFromFunction(simple_function, u.atoms, step=2)
+    ana.run(backend=backend, n_workers=2, n_blocks=3)
+
+    results = []
+    for ts in u.trajectory[::2]:
+        results.append(simple_function(u.atoms))
+
+    assert_equal(np.asarray(results), ana.results)
+
+
 def test_analysis_class():
     ana_class = base.analysis_class(simple_function)
     assert issubclass(ana_class, base.AnalysisBase)
@@ -203,3 +203,19 @@ class TestBetween(object):
             self.distance
         ).indices)
         assert_equal(actual, expected)
+
+    def test_between_grid(self, u):
+        # large enough for capped_distance to search with the grid
+        group, A, B = u.atoms[200:], u.atoms[:100], u.atoms[100:200]
+        near_A = (scipy.spatial.distance.cdist(
+            group.positions, A.positions) <= self.distance).any(axis=1)
+        near_B = (scipy.spatial.distance.cdist(
+            group.positions, B.positions) <= self.distance).any(axis=1)
+        actual = MDAnalysis.analysis.distances.between(group, A, B,
+                                                       self.distance)
+        assert_equal(actual.indices, group[near_A & near_B].indices)
+
+    def test_between_empty(self, group, ag, ag2):
+        actual = MDAnalysis.analysis.distances.between(group, ag, ag2, 0.0)
+        assert isinstance(actual, MDAnalysis.core.groups.AtomGroup)
+        assert len(actual) == 0
@@ -23,7 +23,8 @@ from __future__ import absolute_import
 import MDAnalysis as mda
 import numpy as np
 
-from MDAnalysisTests.datafiles import waterPSF, waterDCD
+from MDAnalysisTests.datafiles import (waterPSF, waterDCD, PSF_TRICLINIC,
+                                       DCD_TRICLINIC)
 from MDAnalysis.analysis.lineardensity import LinearDensity
 from numpy.testing import assert_almost_equal
 
@@ -37,3 +38,28 @@ def test_serial():
                           0., 0., 0., 0.])
     ld = LinearDensity(selection, binsize=5).run()
     assert_almost_equal(xpos, ld.results['x']['pos'])
+
+
+def test_blocks():
+    universe = mda.Universe(waterPSF, waterDCD)
+    selection = universe.select_atoms('all')
+
+    ld = LinearDensity(selection, binsize=5).run()
+    ld_blocks = LinearDensity(selection, binsize=5).run(n_blocks=3)
+    for key in ('pos', 'pos_std', 'char', 'char_std'):
+        assert_almost_equal(ld.results['x'][key], ld_blocks.results['x'][key])
+
+
+def test_multi_frame_triclinic():
+    universe = mda.Universe(PSF_TRICLINIC, DCD_TRICLINIC)
+    selection = universe.select_atoms('all')
+
+    ld = LinearDensity(selection, binsize=1).run()
+    ld_frames = LinearDensity(selection, binsize=1)
+    # analyse frame by frame with _single_frame
+    ld_frames._multi_frame_atoms = None
+    ld_frames.run()
+    for dim in ('x', 'y', 'z'):
+        for key in ('pos', 'pos_std', 'char', 'char_std'):
+            assert_almost_equal(ld.results[dim][key],
+                                ld_frames.results[dim][key])
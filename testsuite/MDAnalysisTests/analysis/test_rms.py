@@ -126,6 +126,21 @@ class Testrmsd(object):
         # very close to zero, change significant decimal places to 5
         assert_almost_equal(weighted, firstCoords, decimal=5)
 
+    @pytest.mark.parametrize('weights', [None, 'mass'])
+    def test_superposition_rmsd_frames(self, u, weights):
+        bb = u.select_atoms('backbone')
+        if weights == 'mass':
+            weights = bb.masses / bb.masses.mean()
+        ref = bb.positions - bb.center(weights)
+        mobile = np.array([bb.positions - bb.center(weights)
+                           for ts in u.trajectory[::10]])
+
+        rmsds = rms._superposition_rmsd(ref, mobile, weights)
+        assert_almost_equal(rmsds,
+                            [rms.rmsd(x, ref, weights=weights,
+                                      superposition=True) for x in mobile],
+                            decimal=5)
+
     def test_unequal_shape(self):
         a = np.ones((4, 3))
         b = np.ones((5, 3))
@@ -198,6 +213,16 @@ class TestRMSD(object):
                                   err_msg="error: rmsd profile should match" +
                                   "test values")
 
+    @pytest.mark.parametrize('backend', ['serial', 'multiprocessing'])
+    def test_rmsd_blocks(self, universe, backend):
+        serial = MDAnalysis.analysis.rms.RMSD(universe, select='name CA',
+                                              step=7).run()
+        blocks = MDAnalysis.analysis.rms.RMSD(universe, select='name CA',
+                                              step=7).run(backend=backend,
+                                                          n_workers=2,
+                                                          n_blocks=3)
+        assert_almost_equal(blocks.rmsd, serial.rmsd, 4)
+
     def test_rmsd_atomgroup_selections(self, universe):
         # see Issue #1684
         R1 = MDAnalysis.analysis.rms.RMSD(universe.atoms,
@@ -343,6 +368,16 @@ class TestRMSF(object):
                             err_msg="error: rmsf profile should match test "
                             "values")
 
+    @pytest.mark.parametrize('backend', ['serial', 'threads'])
+    def test_rmsf_blocks(self, universe, backend):
+        rmsfs = rms.RMSF(universe.select_atoms('name CA'))
+        rmsfs.run(backend=backend, n_workers=2, n_blocks=3)
+        test_rmsfs = np.load(rmsfArray)
+
+        assert_almost_equal(rmsfs.rmsf, test_rmsfs, 5,
+                            err_msg="error: rmsf profile should match test "
+                            "values")
+
     def test_rmsf_single_frame(self, universe):
         rmsfs = rms.RMSF(universe.select_atoms('name CA'), start=5, stop=6).run()
 
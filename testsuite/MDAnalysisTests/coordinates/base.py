@@ -23,7 +23,7 @@ from __future__ import absolute_import
 import itertools
 import numpy as np
 import pytest
-from six.moves import zip, range
+from six.moves import zip, range, cPickle
 from unittest import TestCase
 from numpy.testing import (assert_equal, assert_almost_equal,
                            assert_array_almost_equal, assert_allclose)
@@ -368,6 +368,57 @@ class MultiframeReaderTest(BaseReaderTest):
         assert_timestep_almost_equal(ts, ref.first_frame,
                                      decimal=ref.prec)
 
+    def test_pickle(self, ref, reader):
+        reader[ref.jump_to_frame.frame]
+        new_reader = cPickle.loads(cPickle.dumps(reader))
+        assert_equal(len(new_reader), len(reader))
+        assert_timestep_almost_equal(new_reader.ts, ref.jump_to_frame,
+                                     decimal=ref.prec)
+        # the unpickled reader continues from the same frame on its own
+        assert_timestep_almost_equal(new_reader.next(), reader.next(),
+                                     decimal=ref.prec)
+
+    def test_timeseries(self, ref, reader):
+        xyz = reader.timeseries(format='fac')
+        assert_equal(xyz.shape, (ref.n_frames, ref.n_atoms, 3))
+        for i in range(ref.n_frames):
+            assert_almost_equal(xyz[i], ref.iter_ts(i).positions,
+                                decimal=ref.prec)
+
+    @pytest.mark.parametrize('chunksize', [1, 2, 100])
+    @pytest.mark.parametrize('sl', [slice(None), slice(1, None, 2),
+                                    slice(None, None, -1)])
+    def test_iter_timeseries(self, ref, reader, chunksize, sl):
+        asel = make_Universe(size=(ref.n_atoms, 1, 1)).atoms[[0, -1]]
+        frames = list(range(ref.n_frames))[sl]
+        reader[ref.jump_to_frame.frame]
+
+        blocks = list(reader.iter_timeseries(chunksize, asel=asel,
+                                             start=sl.start, stop=sl.stop,
+                                             step=sl.step))
+        assert all(len(block) <= chunksize for block in blocks)
+        xyz = np.concatenate(blocks)
+        assert_equal(xyz.shape, (len(frames), 2, 3))
+        for block_frame, frame in zip(xyz, frames):
+            assert_almost_equal(block_frame,
+                                ref.iter_ts(frame).positions[[0, -1]],
+                                decimal=ref.prec)
+        # reading the timeseries leaves the reader on the current frame
+        assert_timestep_almost_equal(reader.ts, ref.jump_to_frame,
+                                     decimal=ref.prec)
+        assert_timestep_almost_equal(
+            reader.next(), ref.iter_ts(ref.jump_to_frame.frame + 1),
+            decimal=ref.prec)
+
+    def test_iter_timeseries_empty_asel(self, reader):
+        asel = make_Universe(size=(reader.n_atoms, 1, 1)).atoms[[]]
+        with pytest.raises(NoDataError):
+            reader.iter_timeseries(2, asel=asel)
+
+    def test_iter_timeseries_bad_chunksize(self, reader):
+        with pytest.raises(ValueError):
+            reader.iter_timeseries(0)
+
     def test_rename_aux(self, ref, reader):
         reader.rename_aux('lowf', 'lowf_renamed')
         # data should now be in aux namespace under new name
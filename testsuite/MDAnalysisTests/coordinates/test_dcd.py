@@ -170,6 +170,25 @@ def test_timeseries_slices(slice, length, universe_dcd):
     assert_array_almost_equal(xyz, allframes[start:stop:step])
 
 
+@pytest.mark.parametrize("step", [1, 3, -1, -4])
+def test_iter_timeseries_steps(step, universe_dcd):
+    allframes = universe_dcd.trajectory.timeseries(format='fac')
+    xyz = np.concatenate(list(universe_dcd.trajectory.iter_timeseries(
+        10, step=step)))
+    assert_array_almost_equal(xyz, allframes[::step])
+
+
+@pytest.mark.parametrize("frames", [[4, 3, 2, 1, 0], [9, 5, 1], [0, 1, 5, 6],
+                                    [3, 3], [7]])
+def test_read_timeseries_frames(frames, universe_dcd):
+    # frames that readframes() cannot read in one forward call
+    reader = universe_dcd.trajectory
+    allframes = reader.timeseries(format='fac')
+    out = np.empty((len(frames), reader.n_atoms, 3), dtype=np.float32)
+    reader._read_timeseries(np.array(frames), None, out)
+    assert_array_almost_equal(out, allframes[frames])
+
+
 @pytest.mark.parametrize("order, shape", (
     ('fac', (98, 3341, 3)),
     ('fca', (98, 3, 3341)),
@@ -29,7 +29,8 @@ from MDAnalysisTests.datafiles import DCD, PSF
 from MDAnalysisTests.coordinates.base import (BaseReference,
                                               MultiframeReaderTest)
 from MDAnalysis.coordinates.memory import Timestep
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_almost_equal
+from six.moves import cPickle
 
 
 class MemoryReference(BaseReference):
@@ -138,6 +139,23 @@ class TestMemoryReader(MultiframeReaderTest):
         array2 = reader.timeseries()[:,::10,:]
         assert_equal(array1, array2)
 
+    @pytest.mark.parametrize('start, step', [
+        (5, 2), (0, None), (None, None), (10, -3), (None, -1)])
+    def test_timeseries_slice(self, reader, start, step):
+        array1 = reader.timeseries(start=start, step=step, format='fac')
+        array2 = reader.timeseries(format='fac')[start::step]
+        assert_equal(array1, array2)
+
+    @pytest.mark.parametrize('stop, n_frames', [
+        (15, 16), (0, 1), (97, 98), (-1, 98), (-2, 97)])
+    def test_timeseries_stop_included(self, reader, stop, n_frames):
+        allframes = reader.timeseries(format='fac')
+        with pytest.warns(DeprecationWarning, match="stop frame"):
+            array = reader.timeseries(stop=stop, format='fac')
+        assert len(array) == n_frames
+        # the stop frame itself is returned
+        assert_equal(array[-1], allframes[stop])
+
     def test_timeseries_view(self, reader):
         # timeseries() is expected to provide a view of the underlying array
         assert reader.timeseries().base is reader.get_array()
@@ -146,8 +164,9 @@ class TestMemoryReader(MultiframeReaderTest):
         # timeseries() is expected to provide a view of the underlying array
         # also in the case where we slice the array using the start, stop and
         # step options.
-        assert reader.timeseries(start=5,stop=15,step=2,format='fac').base is\
-               reader.get_array()
+        with pytest.warns(DeprecationWarning):
+            array = reader.timeseries(start=5, stop=15, step=2, format='fac')
+        assert array.base is reader.get_array()
 
     def test_timeseries_view_from_universe_atoms(self, ref, reader):
         # timeseries() is expected to provide a view of the underlying array
@@ -185,3 +204,55 @@ class TestMemoryReader(MultiframeReaderTest):
         coordinates = np.random.uniform(size=(100, ref.universe.atoms.n_atoms, 3)).cumsum(0)
         universe = mda.Universe(ref.universe.filename, coordinates, format=MemoryReader)
         assert_equal(universe.trajectory.get_array().dtype, np.dtype('float32'))
+
+
+class TestMemoryReaderCache(object):
+    @staticmethod
+    @pytest.fixture()
+    def cache(tmpdir):
+        return str(tmpdir.join('cache.npy'))
+
+    @staticmethod
+    @pytest.fixture()
+    def universe(cache):
+        universe = mda.Universe(PSF, DCD)
+        universe.transfer_to_memory(step=2, cache=cache)
+        return universe
+
+    def test_cached_coordinates(self, universe, cache):
+        ref = mda.Universe(PSF, DCD)
+        coordinates = ref.trajectory.timeseries(format='fac')[::2]
+        assert_almost_equal(np.load(cache), coordinates)
+        assert_almost_equal(universe.trajectory.get_array(), coordinates)
+        assert_equal(universe.trajectory.n_frames, 49)
+        assert_equal(universe.trajectory.filename, DCD)
+
+    def test_memory_mapped(self, universe):
+        array = universe.trajectory.get_array()
+        assert isinstance(array.base, np.memmap)
+
+    def test_inplace_edit_written_to_cache(self, universe, cache):
+        universe.trajectory[3]
+        universe.atoms.positions = np.zeros((universe.atoms.n_atoms, 3))
+        universe.trajectory.get_array().base.flush()
+        assert_equal(np.load(cache)[3], 0)
+
+    def test_reopen_cache(self, universe, cache):
+        u = mda.Universe(PSF, cache, mmap_mode='r')
+        assert isinstance(u.trajectory, MemoryReader)
+        assert_equal(u.trajectory.n_frames, 49)
+        assert_almost_equal(u.trajectory.timeseries(format='fac'),
+                            universe.trajectory.get_array())
+        with pytest.raises(ValueError):
+            u.atoms.positions = np.zeros((u.atoms.n_atoms, 3))
+
+    def test_pickle_maps_cache(self, universe):
+        universe.trajectory[5]
+        data = cPickle.dumps(universe.trajectory)
+        # the coordinates are not part of the pickle
+        assert len(data) < universe.trajectory.get_array().nbytes // 10
+        reader = cPickle.loads(data)
+        assert_equal(reader.ts.frame, 5)
+        assert_almost_equal(reader.ts.positions,
+                            universe.trajectory.ts.positions)
+        assert isinstance(reader.get_array().base, np.memmap)
@@ -25,10 +25,12 @@ import pytest
 from six import StringIO
 from six.moves import zip
 import os
+import shutil
 from unittest import TestCase
 
 import MDAnalysis as mda
 import numpy as np
+from MDAnalysis.coordinates.base import offsets_filename, read_numpy_offsets
 from MDAnalysisTests import tempdir, make_Universe
 from MDAnalysisTests.coordinates.base import _SingleFrameReader
 from MDAnalysisTests.coordinates.reference import (RefAdKSmall, Ref4e43,
@@ -875,3 +877,46 @@ def test_write_pdb_zero_atoms():
         with mda.Writer(outfile, ag.n_atoms) as w:
             with pytest.raises(IndexError):
                 w.write(ag)
+
+
+class TestPDBPersistentOffsets(object):
+    @pytest.fixture()
+    def pdbfile(self, tmpdir):
+        shutil.copy(PDB_multiframe, str(tmpdir))
+        return str(tmpdir.join(os.path.basename(PDB_multiframe)))
+
+    def test_offsets_stored(self, pdbfile):
+        r = mda.coordinates.PDB.PDBReader(pdbfile)
+        saved = read_numpy_offsets(offsets_filename(pdbfile))
+
+        assert_equal(saved['start'], r._start_offsets)
+        assert_equal(saved['stop'], r._stop_offsets)
+        assert_equal(saved['n_atoms'], r.n_atoms)
+
+    def test_offsets_reused(self, pdbfile):
+        ref = mda.coordinates.PDB.PDBReader(pdbfile)
+        r = mda.coordinates.PDB.PDBReader(pdbfile)
+
+        assert r.n_frames == ref.n_frames
+        assert r.remarks == ref.remarks
+        assert r.title == ref.title
+        for frame in [3, 0, ref.n_frames - 1]:
+            assert_almost_equal(r[frame].positions, ref[frame].positions)
+
+    def test_offsets_outdated(self, pdbfile):
+        mda.coordinates.PDB.PDBReader(pdbfile)
+        fname = offsets_filename(pdbfile)
+        saved = read_numpy_offsets(fname)
+        saved['size'] += 1
+        np.savez(fname, **saved)
+
+        with pytest.warns(UserWarning, match="Reload offsets"):
+            r = mda.coordinates.PDB.PDBReader(pdbfile)
+        assert_equal(r._start_offsets, saved['start'])
+
+    def test_single_frame_not_stored(self, tmpdir):
+        shutil.copy(PDB_small, str(tmpdir))
+        pdbfile = str(tmpdir.join(os.path.basename(PDB_small)))
+        mda.coordinates.PDB.PDBReader(pdbfile)
+
+        assert not os.path.exists(offsets_filename(pdbfile))
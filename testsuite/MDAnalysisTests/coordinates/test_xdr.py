@@ -28,6 +28,7 @@ import errno
 import numpy as np
 import os
 import shutil
+import warnings
 
 from numpy.testing import (assert_equal, assert_almost_equal)
 
@@ -40,7 +41,7 @@ from MDAnalysisTests.coordinates.base import (MultiframeReaderTest,
                                               assert_timestep_almost_equal)
 
 import MDAnalysis as mda
-from MDAnalysis.coordinates.base import Timestep
+from MDAnalysis.coordinates.base import Timestep, OFFSETS_VERSION
 from MDAnalysis.coordinates import XDR
 
 
@@ -66,6 +67,28 @@ class _XDRReader_Sub(object):
         ts = udry.atoms.ts
         assert_timestep_almost_equal(ts, atoms.ts)
 
+    def test_sub_iteration(self, atoms):
+        udry = mda.Universe(PDB_sub_dry)
+        udry.load_new(self.XDR_SUB_SOL, sub=atoms.indices)
+        for ts, ts_sol in zip(udry.trajectory, atoms.universe.trajectory):
+            assert_almost_equal(ts.positions, atoms.positions)
+            assert_almost_equal(ts.dimensions, ts_sol.dimensions)
+
+    def test_sub_unsorted(self, atoms):
+        udry = mda.Universe(PDB_sub_dry)
+        sub = atoms.indices[::-1]
+        udry.load_new(self.XDR_SUB_SOL, sub=sub)
+        assert_almost_equal(udry.atoms.positions[::-1], atoms.positions)
+
+    def test_sub_timeseries(self, atoms):
+        udry = mda.Universe(PDB_sub_dry)
+        udry.load_new(self.XDR_SUB_SOL, sub=atoms.indices)
+        ref = atoms.universe.trajectory.timeseries(atoms, format='fac')
+        assert_almost_equal(udry.trajectory.timeseries(format='fac'), ref)
+        assert_almost_equal(
+            udry.trajectory.timeseries(udry.atoms[5:10], format='fac'),
+            ref[:, 5:10])
+
 
 class TestTRRReader_Sub(_XDRReader_Sub):
     XDR_SUB_SOL = TRR_sub_sol
@@ -716,7 +739,7 @@ class _GromacsReader_offsets(object):
         with open(fname, 'wb') as f:
             np.savez(f, **saved_offsets)
 
-        with pytest.warns(UserWarning, match="Reload offsets"):
+        with pytest.warns(UserWarning, match="size did not match"):
             self._reader(traj)
 
     def test_persistent_offsets_ctime_mismatch(self, traj):
@@ -742,6 +765,27 @@ class _GromacsReader_offsets(object):
         with pytest.warns(UserWarning, match="Reload offsets"):
             self._reader(traj)
 
+    def test_persistent_offsets_no_version(self, traj):
+        # offsets files of earlier releases have no version and are reused
+        fname = XDR.offsets_filename(traj)
+        saved_offsets = XDR.read_numpy_offsets(fname)
+        saved_offsets.pop('version')
+        np.savez(fname, **saved_offsets)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            reader = self._reader(traj)
+        assert_equal(reader._xdr.offsets, self.ref_offsets)
+
+    def test_persistent_offsets_version_mismatch(self, traj):
+        fname = XDR.offsets_filename(traj)
+        saved_offsets = XDR.read_numpy_offsets(fname)
+        saved_offsets['version'] = OFFSETS_VERSION + 1
+        np.savez(fname, **saved_offsets)
+
+        with pytest.warns(UserWarning, match="version did not match"):
+            self._reader(traj)
+
     def test_persistent_offsets_last_frame_wrong(self, traj):
         fname = XDR.offsets_filename(traj)
         saved_offsets = XDR.read_numpy_offsets(fname)
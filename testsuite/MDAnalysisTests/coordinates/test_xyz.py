@@ -21,6 +21,9 @@
 #
 from __future__ import absolute_import
 
+import os
+import shutil
+
 import pytest
 from six.moves import zip
 
@@ -28,9 +31,11 @@ import MDAnalysis as mda
 import numpy as np
 from numpy.testing import (
     assert_almost_equal,
+    assert_equal,
 )
 
 from MDAnalysis.coordinates.XYZ import XYZWriter
+from MDAnalysis.coordinates.base import offsets_filename, read_numpy_offsets
 
 from MDAnalysisTests.datafiles import COORDINATES_XYZ, COORDINATES_XYZ_BZ2
 from MDAnalysisTests.coordinates.base import (MultiframeReaderTest, BaseReference,
@@ -64,6 +69,50 @@ class TestXYZReader(MultiframeReaderTest):
             self.reader.open_trajectory()
 
 
+class TestXYZPersistentOffsets(object):
+    @pytest.fixture()
+    def xyzfile(self, tmpdir):
+        shutil.copy(COORDINATES_XYZ, str(tmpdir))
+        return str(tmpdir.join(os.path.basename(COORDINATES_XYZ)))
+
+    def test_offsets_stored(self, xyzfile):
+        r = mda.coordinates.XYZ.XYZReader(xyzfile)
+        n_frames = r.n_frames
+        saved = read_numpy_offsets(offsets_filename(xyzfile))
+
+        assert len(saved['offsets']) == n_frames
+        assert_equal(saved['offsets'], r._offsets[:n_frames])
+
+    def test_offsets_reused(self, xyzfile):
+        ref = mda.coordinates.XYZ.XYZReader(xyzfile)
+        ref_n_frames = ref.n_frames
+        r = mda.coordinates.XYZ.XYZReader(xyzfile)
+
+        assert r.n_frames == ref_n_frames
+        for frame in [3, 0, ref_n_frames - 1]:
+            assert_almost_equal(r[frame].positions, ref[frame].positions)
+
+    def test_refresh_offsets(self, xyzfile):
+        mda.coordinates.XYZ.XYZReader(xyzfile).n_frames
+        fname = offsets_filename(xyzfile)
+        saved = read_numpy_offsets(fname)
+        saved['offsets'] = saved['offsets'][:1]
+        np.savez(fname, **saved)
+
+        r = mda.coordinates.XYZ.XYZReader(xyzfile, refresh_offsets=True)
+        assert r.n_frames > 1
+
+    def test_offsets_version_mismatch(self, xyzfile):
+        mda.coordinates.XYZ.XYZReader(xyzfile).n_frames
+        fname = offsets_filename(xyzfile)
+        saved = read_numpy_offsets(fname)
+        saved['version'] += 1
+        np.savez(fname, **saved)
+
+        with pytest.warns(UserWarning, match="Reload offsets"):
+            mda.coordinates.XYZ.XYZReader(xyzfile).n_frames
+
+
 class TestXYZWriter(BaseWriterTest):
     @staticmethod
     @pytest.fixture()
@@ -28,6 +28,7 @@ from os import path
 import numpy as np
 
 from numpy.testing import (
+    assert_allclose,
     assert_almost_equal,
     assert_equal,
 )
@@ -445,6 +446,81 @@ class TestCenter(object):
             ag.center(weights)
 
 
+class TestCenterCompound(object):
+    @pytest.fixture()
+    def u(self):
+        return mda.Universe(TRZ_psf, TRZ)
+
+    @pytest.fixture()
+    def ag(self, u):
+        # starts and ends within a residue
+        return u.atoms[5:1050]
+
+    @staticmethod
+    def _split(ag, compound):
+        if compound == 'residues':
+            keys = ag.resindices
+        elif compound == 'segments':
+            keys = ag.segindices
+        else:
+            keys = np.array([f.ix[0] for f in (a.fragment for a in ag)])
+        return [ag[keys == k] for k in np.unique(keys)]
+
+    @pytest.mark.parametrize('compound', ['residues', 'segments',
+                                          'fragments'])
+    def test_center_of_geometry(self, ag, compound):
+        ref = [g.center_of_geometry() for g in self._split(ag, compound)]
+        # the centers of the compounds are summed in double precision, the
+        # center of a single float32 group is not
+        assert_allclose(ag.center_of_geometry(compound=compound), ref,
+                        rtol=1e-5)
+
+    @pytest.mark.parametrize('compound', ['residues', 'segments',
+                                          'fragments'])
+    def test_center_of_mass(self, ag, compound):
+        ref = [g.center_of_mass() for g in self._split(ag, compound)]
+        assert_almost_equal(ag.center_of_mass(compound=compound), ref,
+                            decimal=5)
+
+    def test_center_group(self, ag):
+        assert_almost_equal(ag.center_of_mass(compound='group'),
+                            ag.center_of_mass())
+
+    @pytest.mark.parametrize('compound', ['residues', 'segments',
+                                          'fragments'])
+    def test_total_mass(self, ag, compound):
+        ref = [g.total_mass() for g in self._split(ag, compound)]
+        assert_almost_equal(ag.total_mass(compound=compound), ref)
+
+    @pytest.mark.parametrize('compound', ['residues', 'segments'])
+    def test_total_charge(self, ag, compound):
+        ref = [g.total_charge() for g in self._split(ag, compound)]
+        assert_almost_equal(ag.total_charge(compound=compound), ref)
+
+    def test_residue_masses(self, u):
+        rg = u.residues[[4, 2, 7, 2]]
+        assert_almost_equal(rg.masses,
+                            [r.atoms.masses.sum() for r in rg])
+
+    def test_segment_charges(self, u):
+        sg = u.segments
+        assert_almost_equal(sg.charges,
+                            [s.atoms.charges.sum() for s in sg])
+
+    def test_residue_masses_moved_atom(self, u):
+        u.atoms[0].residue = u.residues[3]
+        rg = u.residues[[0, 3]]
+        assert_almost_equal(rg.masses,
+                            [r.atoms.masses.sum() for r in rg])
+
+    def test_empty_residues_masses(self, u):
+        assert_equal(u.residues[[]].masses, [])
+
+    def test_compound_fail(self, ag):
+        with pytest.raises(ValueError):
+            ag.center_of_geometry(compound='strawberries')
+
+
 class TestSplit(object):
     @pytest.fixture()
     def universe(self):
@@ -483,6 +559,10 @@ class TestSplit(object):
             for atom in g:
                 assert_equal(atom.segid, ref_segname)    
 
+    @pytest.mark.parametrize('level', ['atom', 'residue', 'segment'])
+    def test_split_empty(self, universe, level):
+        assert universe.atoms[[]].split(level) == []
+
     def test_split_VE(self, universe):
         ag = universe.atoms[:40]
 
@@ -557,6 +637,46 @@ class TestWrap(object):
         assert self._in_box(cen, u)
 
 
+class TestUnwrap(object):
+    @pytest.fixture()
+    def u(self):
+        u = mda.Universe(TRZ_psf, TRZ)
+        # break the molecules over the box
+        u.atoms.wrap(compound='atoms')
+        return u
+
+    def test_unwrap_comp_fail(self, u):
+        with pytest.raises(ValueError):
+            u.atoms.unwrap(compound='strawberries')
+
+    def test_unwrap_box_fail(self, u):
+        with pytest.raises(ValueError):
+            u.atoms.unwrap(box=np.zeros(6))
+
+    @pytest.mark.parametrize('compound', ('group', 'fragments', 'residues'))
+    def test_unwrap(self, u, compound):
+        bonds = u.atoms.bonds
+
+        u.atoms.unwrap(compound=compound)
+
+        assert_almost_equal(bonds.bonds(), bonds.bonds(pbc=True), decimal=4)
+
+    def test_unwrap_roots_stay(self, u):
+        firsts = [f[0].index for f in u.atoms.fragments]
+        ref = u.atoms[firsts].positions
+
+        u.atoms.unwrap()
+
+        assert_almost_equal(u.atoms[firsts].positions, ref)
+
+    def test_unwrap_partial(self, u):
+        ref = u.atoms[250:].positions
+
+        u.atoms[:250].unwrap()
+
+        assert_almost_equal(u.atoms[250:].positions, ref)
+
+
 class TestAtomGroupProperties(object):
     """Test working with the properties of Atoms via AtomGroups
 
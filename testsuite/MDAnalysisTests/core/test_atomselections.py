@@ -23,7 +23,10 @@ from __future__ import division, absolute_import
 
 from six.moves import range
 
+import gc
 import itertools
+import threading
+import weakref
 import numpy as np
 from numpy.testing import(
     assert_equal,
@@ -79,6 +82,14 @@ class TestSelectionsCHARMM(object):
         sel = universe.select_atoms('backbone')
         assert_equal(sel.n_atoms, 855)
 
+    def test_wildcards(self, universe):
+        sel = universe.select_atoms('name C* and resname LY* GLU')
+        names = universe.atoms.names.astype(str)
+        resnames = universe.atoms.resnames.astype(str)
+        ref = (np.char.startswith(names, 'C') &
+               (np.char.startswith(resnames, 'LY') | (resnames == 'GLU')))
+        assert_equal(sel.indices, np.where(ref)[0])
+
     def test_resid_single(self, universe):
         sel = universe.select_atoms('resid 100')
         assert_equal(sel.n_atoms, 7)
@@ -456,7 +467,7 @@ class TestSelectionsNucleicAcids(object):
 
 
 class BaseDistanceSelection(object):
-    """Both KDTree and distmat selections on orthogonal system
+    """Both grid search and distmat selections on orthogonal system
 
     Selections to check:
      - Around
@@ -464,18 +475,19 @@ class BaseDistanceSelection(object):
      - SphericalZone
      - Point
 
-    Cylindrical methods don't use KDTree
+    Cylindrical methods don't use the grid search
     """
 
-    methods = [('kdtree', False),
+    methods = [('nsgrid', True),
+               ('nsgrid', False),
                ('distmat', True),
                ('distmat', False)]
 
     @staticmethod
     def choosemeth(sel, meth, periodic):
         """hack in the desired apply method"""
-        if meth == 'kdtree':
-            sel.apply = sel._apply_KDTree
+        if meth == 'nsgrid':
+            sel.apply = sel._apply_nsgrid
         elif meth == 'distmat':
             sel.apply = sel._apply_distmat
 
@@ -487,7 +499,8 @@ class BaseDistanceSelection(object):
         return sel
 
     @pytest.mark.parametrize('meth, periodic', [
-        ('kdtree', False),
+        ('nsgrid', True),
+        ('nsgrid', False),
         ('distmat', True),
         ('distmat', False)
     ])
@@ -509,7 +522,8 @@ class BaseDistanceSelection(object):
         assert ref == set(result.indices)
 
     @pytest.mark.parametrize('meth, periodic', [
-        ('kdtree', False),
+        ('nsgrid', True),
+        ('nsgrid', False),
         ('distmat', True),
         ('distmat', False)
     ])
@@ -528,7 +542,8 @@ class BaseDistanceSelection(object):
         assert ref == set(result.indices)
 
     @pytest.mark.parametrize('meth, periodic', [
-        ('kdtree', False),
+        ('nsgrid', True),
+        ('nsgrid', False),
         ('distmat', True),
         ('distmat', False)
     ])
@@ -547,7 +562,8 @@ class BaseDistanceSelection(object):
         assert ref == set(result.indices)
 
     @pytest.mark.parametrize('meth, periodic', [
-        ('kdtree', False),
+        ('nsgrid', True),
+        ('nsgrid', False),
         ('distmat', True),
         ('distmat', False)
     ])
@@ -603,10 +619,50 @@ class TestTriclinicDistanceSelections(BaseDistanceSelection):
         return mda.Universe(GRO)
 
 
+class TestDistanceSelectionFlags(object):
+    @pytest.fixture()
+    def use_nsgrid(self, request):
+        old = MDAnalysis.core.flags['use_KDTree_routines']
+        MDAnalysis.core.flags['use_KDTree_routines'] = request.param
+        yield request.param
+        MDAnalysis.core.flags['use_KDTree_routines'] = old
+
+    @pytest.mark.parametrize('use_nsgrid, selstr, meth', [
+        ('fast', 'around 5 resid 1', '_apply_nsgrid'),
+        ('fast', 'point 0 0 0 5', '_apply_distmat'),
+        ('fast', 'sphzone 5 resid 1', '_apply_distmat'),
+        ('fast', 'sphlayer 2 5 resid 1', '_apply_distmat'),
+        ('always', 'around 5 resid 1', '_apply_nsgrid'),
+        ('always', 'point 0 0 0 5', '_apply_nsgrid'),
+        ('always', 'sphzone 5 resid 1', '_apply_nsgrid'),
+        ('always', 'sphlayer 2 5 resid 1', '_apply_nsgrid'),
+        ('never', 'around 5 resid 1', '_apply_distmat'),
+        ('never', 'point 0 0 0 5', '_apply_distmat'),
+    ], indirect=['use_nsgrid'])
+    def test_method(self, use_nsgrid, selstr, meth):
+        sel = Parser.parse(selstr, {})
+        assert sel.apply.__name__ == meth
+
+    @pytest.mark.parametrize('selstr', ['around 5 resid 1',
+                                        'point 0 0 0 5',
+                                        'sphzone 5 resid 1'])
+    def test_zero_box(self, selstr):
+        u = mda.Universe(PSF, DCD)
+        u.dimensions = np.zeros(6)
+        old = MDAnalysis.core.flags['use_periodic_selections']
+        MDAnalysis.core.flags['use_periodic_selections'] = True
+        try:
+            ref = set(u.select_atoms(selstr).indices)
+            MDAnalysis.core.flags['use_periodic_selections'] = False
+            assert set(u.select_atoms(selstr).indices) == ref
+        finally:
+            MDAnalysis.core.flags['use_periodic_selections'] = old
+
+
 class TestTriclinicSelections(object):
-    """Non-KDTree based selections
+    """Selections on a triclinic system with the default settings
 
-    This system has triclinic geometry so won't use KDTree based selections
+    The grid search takes the triclinic box into account
     """
 
     @pytest.fixture()
@@ -1013,3 +1069,129 @@ class TestICodeSelection(object):
         u = make_Universe(('resids',))
         with pytest.raises(ValueError):
             u.select_atoms('resid 10A-12')
+
+
+class TestCompiledSelection(object):
+    @pytest.fixture()
+    def u(self):
+        return mda.Universe(PSF, DCD)
+
+    def test_cached(self):
+        sel1 = MDAnalysis.core.selection.compile_selection('name CA')
+        sel2 = MDAnalysis.core.selection.compile_selection('name CA')
+        assert sel1 is sel2
+
+    def test_selgroups_key(self, u):
+        compile_selection = MDAnalysis.core.selection.compile_selection
+        g1 = u.atoms[:10]
+        g2 = u.atoms[10:20]
+        sel1 = compile_selection('group g', {'g': g1})
+        sel2 = compile_selection('group g', {'g': g2})
+        assert sel1 is not sel2
+        assert_equal(sel2.apply(u.atoms).indices, g2.indices)
+
+    def test_selgroups_not_cached(self, u):
+        compile_selection = MDAnalysis.core.selection.compile_selection
+        g = u.atoms[:10]
+        sel1 = compile_selection('group g', {'g': g})
+        sel2 = compile_selection('group g', {'g': g})
+        assert sel1 is not sel2
+
+    def test_universe_not_kept(self):
+        u = mda.Universe(PSF, DCD)
+        MDAnalysis.core.selection.compile_selection('name CA').apply(u.atoms)
+        ref = weakref.ref(u)
+        del u
+        gc.collect()
+        assert ref() is None
+
+    def test_threads(self, u):
+        sel = MDAnalysis.core.selection.CompiledSelection('name CA')
+        groups = [u.atoms[i::4] for i in range(4)]
+        expected = [np.sum(g.names == 'CA') for g in groups]
+        results = [[] for _ in groups]
+
+        def apply(i):
+            for _ in range(50):
+                results[i].append(len(sel.apply(groups[i])))
+
+        threads = [threading.Thread(target=apply, args=(i,))
+                   for i in range(len(groups))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for res, n in zip(results, expected):
+            assert res == [n] * 50
+
+    @pytest.mark.parametrize('selstr, static', [
+        ('resname LYS and name CA', True),
+        ('byres (not backbone)', True),
+        ('prop mass > 10', True),
+        ('name CA and prop z > 5', False),
+        ('around 5 resid 1', False),
+        ('same x as resid 1', False),
+    ])
+    def test_is_static(self, selstr, static):
+        sel = MDAnalysis.core.selection.CompiledSelection(selstr)
+        assert sel.is_static == static
+
+    def test_static_reused(self, u):
+        sel = MDAnalysis.core.selection.CompiledSelection('name CA')
+        calls = []
+        static = sel._tree.sel
+        apply = static.apply
+        static.apply = lambda group: calls.append(group) or apply(group)
+
+        assert len(sel.apply(u.atoms)) == 214
+        assert len(sel.apply(u.atoms)) == 214
+        assert len(calls) == 1
+
+        u._topology.names.values[:] = 'CA'
+        assert len(sel.apply(u.atoms)) == u.atoms.n_atoms
+        assert len(calls) == 2
+
+    def test_values_item_write(self, u):
+        assert len(u.select_atoms('name CA')) == 214
+        names = u._topology.names
+        names.values[20:30] = 'CA'
+        assert len(u.select_atoms('name CA')) == np.sum(names.values == 'CA')
+
+    def test_values_assignment(self, u):
+        assert len(u.select_atoms('name CA')) == 214
+        names = u._topology.names
+        values = names.values.copy()
+        values[40:50] = 'CA'
+        names.values = values
+        assert len(u.select_atoms('name CA')) == np.sum(values == 'CA')
+
+    def test_static_all(self, u):
+        # "all" returns Universe.atoms itself, also when reused
+        assert u.select_atoms('all') is u.atoms
+        assert u.select_atoms('all') is u.atoms
+
+    def test_topology_change(self, u):
+        sel = MDAnalysis.core.selection.CompiledSelection('name CA')
+        assert len(sel.apply(u.atoms)) == 214
+
+        u.atoms[:10].names = 'CA'
+
+        assert len(sel.apply(u.atoms)) == 223
+
+    def test_other_group(self, u):
+        sel = MDAnalysis.core.selection.CompiledSelection('name CA')
+        assert len(sel.apply(u.atoms)) == 214
+        ag = u.atoms[:100]
+        assert len(sel.apply(ag)) == np.sum(ag.names == 'CA')
+
+    @pytest.mark.parametrize('selstr', [
+        'name CA and prop z > 5',
+        'prop z > 5 and name CA',
+        'name OT1 OT2 CA and around 5 resid 1',
+        'point 0 0 0 15 and not backbone',
+    ])
+    def test_updating(self, u, selstr):
+        uag = u.select_atoms(selstr, updating=True)
+        for ts in u.trajectory[:5]:
+            sel = u.atoms[Parser.parse(selstr, {}).apply(u.atoms).ix]
+            assert_equal(uag.indices, sel.indices)
@@ -164,6 +164,42 @@ class TestFragments(object):
         for frag in frags:
             assert len(frag) == 25
 
+    @pytest.mark.parametrize('u', (
+            case1(),
+            case2()
+    ))
+    def test_fragindices(self, u):
+        assert_equal(u.atoms.fragindices, np.repeat(np.arange(5), 25))
+        assert u.atoms[76].fragindex == 3
+
+    @pytest.mark.parametrize('u', (
+            case1(),
+            case2()
+    ))
+    def test_n_fragments(self, u):
+        assert u.atoms.n_fragments == 5
+        assert u.atoms[:60].n_fragments == 3
+
+    def test_lone_atoms(self):
+        u = make_Universe()
+        u.add_TopologyAttr(Bonds([(3, 4), (4, 10)]))
+
+        assert u.atoms.n_fragments == 123
+        assert_equal(u.atoms[4].fragment.ix, [3, 4, 10])
+        assert_equal(u.atoms[5].fragment.ix, [5])
+        assert_equal(u.atoms[:12].fragindices,
+                     [0, 1, 2, 3, 3, 4, 5, 6, 7, 8, 3, 9])
+
+    def test_add_bonds_updates_fragments(self):
+        u = make_starshape()
+        assert u.atoms.n_fragments == 5
+
+        u._topology.bonds.add_bonds([(24, 25)])
+
+        assert u.atoms.n_fragments == 4
+        assert_equal(u.atoms[0].fragment.ix, np.arange(50))
+        assert u.atoms[60].fragindex == 1
+
     def test_atomgroup_fragments_nobonds_NDE(self):
         # should raise NDE
         u = make_Universe()
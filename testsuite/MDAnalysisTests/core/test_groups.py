@@ -603,6 +603,33 @@ class TestGroupBy(object):
         for g in gb.values():
             assert len(g) == 5
 
+    def test_groupby_multiple(self, u):
+        gb = u.atoms.groupby(['types', 'charges'])
+
+        ref = set(zip(u.atoms.types, u.atoms.charges))
+        assert set(gb) == ref
+        for (t, c), g in gb.items():
+            mask = (u.atoms.types == t) & (u.atoms.charges == c)
+            assert_array_equal(g.ix, u.atoms.ix[mask])
+
+    def test_groupby_ix(self, u):
+        ag = u.atoms[::-3]
+        gb = ag.groupby('resids')
+
+        for i, key in enumerate(gb):
+            assert_array_equal(gb.ix[gb.bounds[i]:gb.bounds[i + 1]],
+                               gb[key].ix)
+        assert gb.bounds[-1] == len(ag)
+        assert_array_equal(np.sort(gb.ix), np.sort(ag.ix))
+
+    def test_groupby_residues(self, u):
+        gb = u.residues.groupby('resids')
+
+        assert len(gb) == u.residues.n_residues
+
+    def test_groupby_empty(self, u):
+        assert len(u.atoms[[]].groupby('types')) == 0
+
 
 class TestReprs(object):
     @pytest.fixture()
@@ -919,6 +946,37 @@ class TestGroupBaseOperators(object):
 
         check_operator(op, method, level)
 
+    @pytest.mark.parametrize('size', (10, 1000))
+    def test_random_groups(self, size):
+        # small groups use a binary search, large ones a bitmap
+        u = make_Universe(size=(5000, 100, 10))
+        rng = np.random.RandomState(size)
+        a_ix = rng.randint(0, 5000, size)
+        b_ix = rng.randint(0, 5000, size // 2)
+        a, b = u.atoms[a_ix], u.atoms[b_ix]
+
+        assert_array_equal((a | b).ix, np.union1d(a_ix, b_ix))
+        assert_array_equal((a & b).ix, np.intersect1d(a_ix, b_ix))
+        assert_array_equal((a - b).ix, np.setdiff1d(a_ix, b_ix))
+        assert_array_equal((a ^ b).ix, np.setxor1d(a_ix, b_ix))
+        assert_array_equal(a.subtract(b).ix,
+                           a_ix[~np.in1d(a_ix, b_ix)])
+        assert a.isdisjoint(b) == (len(np.intersect1d(a_ix, b_ix)) == 0)
+        assert (a & b).issubset(b)
+        assert (a | b).issuperset(a)
+
+    def test_sorted_unique_propagation(self):
+        u = make_Universe()
+        ag = u.atoms[[5, 1, 3, 1]].unique
+
+        assert ag._cache['sorted_unique']
+        assert ag[ag.ix > 2]._cache['sorted_unique']
+        assert ag[1:]._cache['sorted_unique']
+        assert 'sorted_unique' not in ag[::-1]._cache
+        assert u.atoms[3] in ag
+        assert u.atoms[4] not in ag
+        assert u.atoms[7] not in ag
+
 
 class TestGroupHash(object):
     """
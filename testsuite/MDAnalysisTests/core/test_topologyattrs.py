@@ -174,6 +174,35 @@ class TestAtomnames(TestAtomAttr):
                       dtype=np.object)
     attrclass = tpattrs.Atomnames
 
+    def test_vocabulary(self, attr):
+        assert len(attr.vocabulary) == 10
+        assert_equal(attr.vocabulary[attr._codes], self.values)
+
+    def test_set_new_value(self, attr):
+        dg = DummyGroup([3, 7])
+        attr.set_atoms(dg, 'XX')
+        assert_equal(attr.get_atoms(dg), np.array(['XX', 'XX']))
+        assert_equal(attr.values[[2, 3, 4]], np.array(['CA', 'XX', 'CB']))
+
+    def test_write_values(self, attr):
+        attr.values[[3, 7]] = 'XX'
+        attr.values[0] = 'C'
+        dg = DummyGroup([0, 3, 7])
+        assert_equal(attr.get_atoms(dg), np.array(['C', 'XX', 'XX']))
+        assert_equal(attr.vocabulary[attr._codes], attr.values)
+
+    def test_values_detached(self, attr):
+        values = attr.values
+        assert type(values[:3]) is np.ndarray
+        assert type(values == 'CA') is np.ndarray
+        values[:3].fill('XX')
+        assert_equal(attr.values, self.values)
+
+    def test_match(self, attr):
+        mask = attr.match(['CA', 'O*'])
+        codes = attr.get_atom_codes(DummyGroup(np.arange(10)))
+        assert_equal(np.where(mask[codes])[0], [0, 2, 9])
+
 
 class AggregationMixin(TestAtomAttr):
     def test_get_residues(self, attr):
@@ -398,6 +427,57 @@ class TestAttr(object):
         assert_almost_equal(np.abs(ag.principal_axes()), np.eye(3), decimal=1)
 
 
+class TestBonds(object):
+    @pytest.fixture()
+    def u(self):
+        u = make_Universe(('names',))
+        u.add_TopologyAttr(tpattrs.Bonds([(1, 0), (1, 2), (2, 3), (7, 3)],
+                                         types=['a', 'b', 'c', 'd']))
+        return u
+
+    @pytest.fixture()
+    def attr(self, u):
+        return u._topology.bonds
+
+    def test_values(self, attr):
+        assert attr.values == ((1, 0), (1, 2), (2, 3), (7, 3))
+
+    def test_values_cached(self, attr):
+        values = attr.values
+        assert attr.values is values
+        with pytest.raises(TypeError):
+            values[0] = (4, 5)
+        attr.add_bonds([(4, 5)])
+        assert attr.values[-1] == (4, 5)
+
+    def test_len(self, attr):
+        # number of atoms with bonds
+        assert len(attr) == 5
+
+    def test_get_atoms(self, u):
+        bonds = u.atoms[[1, 3]].bonds
+
+        assert_equal(bonds.indices, [[0, 1], [1, 2], [2, 3], [3, 7]])
+        assert_equal(bonds._bondtypes, ['a', 'b', 'c', 'd'])
+
+    def test_get_atom(self, u):
+        assert_equal(u.atoms[2].bonds.indices, [[1, 2], [2, 3]])
+
+    def test_no_bonds(self, u):
+        assert len(u.atoms[[4, 5, 120]].bonds) == 0
+
+    def test_bonded_atoms(self, u):
+        assert_equal(u.atoms[3].bonded_atoms.indices, [2, 7])
+
+    def test_add_bonds(self, u, attr):
+        attr.add_bonds([(3, 2), (4, 5), (5, 4)], types=['x', 'y', 'z'])
+
+        assert attr.values == ((1, 0), (1, 2), (2, 3), (7, 3), (4, 5))
+        assert_equal(attr.types, ['a', 'b', 'c', 'd', 'y'])
+        assert_equal(u.atoms[5].bonds.indices, [[4, 5]])
+        assert u.atoms[5].bonds[0].is_guessed
+
+
 class TestCrossLevelAttributeSetting(object):
     """
 
@@ -47,7 +47,7 @@ from MDAnalysisTests.datafiles import (
     PSF_BAD,
     PDB_small,
     PDB_chainidrepeat,
-    GRO, TRR,
+    GRO, TRR, XTC,
     two_water_gro, two_water_gro_nonames,
     TRZ, TRZ_psf,
 )
@@ -258,10 +258,36 @@ class TestUniverse(object):
         assert_equal(len(u.atoms), 3341, "Loading universe failed somehow")
         assert_equal(u.trajectory.n_frames, 2 * ref.trajectory.n_frames)
 
-    def test_pickle_raises_NotImplementedError(self):
+    @pytest.mark.parametrize('args', [(PSF, DCD), (GRO, TRR), (GRO, XTC),
+                                      (TRZ_psf, TRZ), (PDB_small,)])
+    def test_pickle(self, args):
+        u = mda.Universe(*args)
+        frame = u.trajectory.n_frames - 1
+        u.trajectory[frame]
+        new_u = cPickle.loads(cPickle.dumps(u, protocol=cPickle.HIGHEST_PROTOCOL))
+
+        assert new_u is not u
+        assert_equal(new_u.atoms.names, u.atoms.names)
+        assert_equal(new_u.atoms.resids, u.atoms.resids)
+        assert new_u.trajectory.ts.frame == frame
+        assert_allclose(new_u.atoms.positions, u.atoms.positions)
+        # both Universes read independently of each other
+        new_u.trajectory[0]
+        assert u.trajectory.ts.frame == frame
+
+    def test_pickle_with_atomgroup(self):
         u = mda.Universe(PSF, DCD)
-        with pytest.raises(NotImplementedError):
-            cPickle.dumps(u, protocol = cPickle.HIGHEST_PROTOCOL)
+        new_u, ag = cPickle.loads(cPickle.dumps((u, u.atoms[:10])))
+        # groups pickled with their Universe belong to its copy, even while
+        # the original Universe is the anchor in this process
+        assert new_u is not u
+        assert ag.universe is new_u
+        assert_equal(ag.indices, np.arange(10))
+
+    def test_pickle_atomgroup_only(self):
+        u = mda.Universe(PSF, DCD)
+        ag = cPickle.loads(cPickle.dumps(u.atoms[:10]))
+        assert ag.universe is u
 
     def test_set_dimensions(self):
         u = mda.Universe(PSF, DCD)
@@ -114,6 +114,22 @@ class TestUpdatingSelection(object):
         with pytest.raises(TypeError):
             u.select_atoms("group updating", {"updating": True})
 
+    @pytest.mark.parametrize('selstr', [
+        "around 2 group sele",
+        "sphzone 6 group sele",
+        "sphlayer 3 6 group sele",
+        "point 5 5 5 4",
+    ])
+    def test_skin(self, u, ag, selstr):
+        ag_skin = u.select_atoms(selstr, sele=ag, updating=True, skin=1.0)
+        for ts in u.trajectory:
+            assert_equal(ag_skin.indices,
+                         u.select_atoms(selstr, sele=ag).indices)
+
+    def test_skin_kwarg_check(self, u):
+        with pytest.raises(TypeError):
+            u.select_atoms("group skin", skin=u.atoms[:2])
+
 
 class TestUpdatingSelectionNotraj(object):
     @pytest.fixture()
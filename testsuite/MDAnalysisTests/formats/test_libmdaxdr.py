@@ -241,6 +241,101 @@ def test_lmbda_trr(trr):
         assert_almost_equal(frame.lmbda, .01 * i)
 
 
+def test_readinto_xtc(xtc):
+    ones = np.ones(30).reshape(10, 3)
+    xyz = np.empty((10, 3), dtype=np.float32)
+    box = np.empty((3, 3), dtype=np.float32)
+    for i in range(len(xtc)):
+        frame = xtc.readinto(xyz, box)
+        assert frame.x is xyz
+        assert frame.box is box
+        assert frame.step == i
+        assert_array_almost_equal(xyz, ones * i, decimal=3)
+        assert_array_almost_equal(box, np.eye(3) * 20, decimal=3)
+
+
+def test_readinto_trr(trr):
+    ones = np.ones(30).reshape(10, 3)
+    xyz = np.empty((10, 3), dtype=np.float32)
+    velocity = np.empty((10, 3), dtype=np.float32)
+    forces = np.empty((10, 3), dtype=np.float32)
+    box = np.empty((3, 3), dtype=np.float32)
+    for i in range(len(trr)):
+        frame = trr.readinto(xyz, velocity, forces, box)
+        assert frame.x is xyz
+        assert frame.v is velocity
+        assert frame.f is forces
+        assert_array_almost_equal(xyz, ones * i)
+        assert_array_almost_equal(velocity, ones * i + 10)
+        assert_array_almost_equal(forces, ones * i + 20)
+
+
+def test_readinto_trr_skip(trr):
+    ones = np.ones(30).reshape(10, 3)
+    xyz = np.empty((10, 3), dtype=np.float32)
+    box = np.empty((3, 3), dtype=np.float32)
+    for i in range(len(trr)):
+        frame = trr.readinto(xyz, None, None, box)
+        assert frame.v is None
+        assert frame.f is None
+        assert frame.hasv
+        assert_array_almost_equal(xyz, ones * i)
+        assert_almost_equal(frame.lmbda, .01 * i)
+
+
+@pytest.mark.parametrize('sub', ([0, 3, 4], [9, 2, 5], [7, 7, 1, 7], [6]))
+def test_readinto_sub_xtc(sub):
+    with XTCFile(XTC_multi_frame) as f:
+        ref = [frame.x[sub] for frame in f]
+    with XTCFile(XTC_multi_frame) as f:
+        xyz = np.empty((len(sub), 3), dtype=np.float32)
+        box = np.empty((3, 3), dtype=np.float32)
+        for i, x in enumerate(ref):
+            frame = f.readinto(xyz, box, sub=sub)
+            assert frame.step == i
+            assert_array_equal(xyz, x)
+
+
+@pytest.mark.parametrize('sub', ([0, 3, 4], [9, 2, 5], [7, 7, 1, 7], [6]))
+def test_readinto_sub_trr(sub):
+    with TRRFile(TRR_multi_frame) as f:
+        ref = [(frame.x[sub], frame.v[sub], frame.f[sub]) for frame in f]
+    with TRRFile(TRR_multi_frame) as f:
+        xyz = np.empty((len(sub), 3), dtype=np.float32)
+        velocity = np.empty((len(sub), 3), dtype=np.float32)
+        forces = np.empty((len(sub), 3), dtype=np.float32)
+        box = np.empty((3, 3), dtype=np.float32)
+        for i, (x, v, fo) in enumerate(ref):
+            frame = f.readinto(xyz, velocity, forces, box, sub=sub)
+            assert_almost_equal(frame.lmbda, .01 * i)
+            assert_array_equal(xyz, x)
+            assert_array_equal(velocity, v)
+            assert_array_equal(forces, fo)
+        assert f.tell() == len(ref)
+
+
+@pytest.mark.parametrize('sub', ([10], [-1], [[1, 2]], [0.5]))
+def test_readinto_bad_sub(xtc, sub):
+    xyz = np.empty((len(sub), 3), dtype=np.float32)
+    box = np.empty((3, 3), dtype=np.float32)
+    with pytest.raises((ValueError, TypeError)):
+        xtc.readinto(xyz, box, sub=sub)
+
+
+@pytest.mark.parametrize('xyz', (
+    np.empty((10, 3), dtype=np.float64),
+    np.empty((9, 3), dtype=np.float32),
+    np.empty((3, 10), dtype=np.float32).T,
+    [[0, 0, 0]] * 10,
+))
+def test_readinto_bad_array(xtc, xyz):
+    box = np.empty((3, 3), dtype=np.float32)
+    with pytest.raises((ValueError, TypeError)):
+        xtc.readinto(xyz, box)
+    # nothing was read
+    assert xtc.tell() == 0
+
+
 @pytest.fixture
 def written_xtc(tmpdir, xtc):
     fname = str(tmpdir.join("foo.xtc"))
@@ -0,0 +1,62 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+
+from __future__ import absolute_import
+
+import pytest
+import numpy as np
+from numpy.testing import assert_equal
+
+import MDAnalysis as mda
+from MDAnalysis.lib.NeighborSearch import AtomNeighborSearch
+from MDAnalysis.lib.distances import distance_array
+
+from MDAnalysisTests.datafiles import PSF, DCD
+
+
+@pytest.fixture()
+def universe():
+    return mda.Universe(PSF, DCD)
+
+
+@pytest.mark.parametrize('radii', [(4.0, 6.0), (6.0, 4.0)])
+def test_search_radii(universe, radii):
+    protein = universe.atoms[100:]
+    query = universe.atoms[:20]
+    ns = AtomNeighborSearch(protein)
+    for radius in radii:
+        d = distance_array(query.positions, protein.positions)
+        ref = protein[np.unique(np.nonzero(d <= radius)[1])]
+        assert_equal(ns.search(query, radius).indices, ref.indices)
+
+
+def test_grid_reused(universe):
+    ns = AtomNeighborSearch(universe.atoms[100:])
+    ns.search(universe.atoms[:20], 6.0)
+    grid = ns._grid
+    ns.search(universe.atoms[20:40], 4.0)
+    assert ns._grid is grid
+
+
+def test_bucket_size_deprecated(universe):
+    with pytest.warns(DeprecationWarning):
+        AtomNeighborSearch(universe.atoms, bucket_size=10)
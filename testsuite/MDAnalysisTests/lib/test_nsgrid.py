@@ -0,0 +1,223 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4 fileencoding=utf-8
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+
+from __future__ import absolute_import
+
+import pytest
+import numpy as np
+from numpy.testing import assert_equal, assert_almost_equal
+
+from MDAnalysis.lib.nsgrid import FastNS, VerletNS
+from MDAnalysis.lib.distances import distance_array, self_distance_array
+from MDAnalysis.lib.mdamath import triclinic_vectors
+
+
+boxes = (None,
+         np.array([20, 25, 30, 90, 90, 90], dtype=np.float32),  # ortho
+         np.array([20, 25, 30, 80, 85, 95], dtype=np.float32),  # triclinic
+         np.array([20, 25, 30], dtype=np.float32),  # lengths only
+         triclinic_vectors(  # box vectors
+             np.array([20, 25, 30, 80, 85, 95], dtype=np.float32)),
+         np.array([7, 8, 9, 90, 90, 90], dtype=np.float32),  # < 3 cells
+         )
+
+
+@pytest.fixture()
+def coords():
+    return np.random.RandomState(42).uniform(
+        -10, 40, size=(500, 3)).astype(np.float32)
+
+
+@pytest.fixture()
+def query():
+    return np.random.RandomState(23).uniform(
+        -10, 40, size=(50, 3)).astype(np.float32)
+
+
+def _dist_box(box):
+    # distance_array does not take box vectors of this shape
+    if box is not None and box.shape == (3,):
+        return np.concatenate([box, np.full(3, 90, dtype=np.float32)])
+    return box
+
+
+@pytest.mark.parametrize('box', boxes)
+@pytest.mark.parametrize('cutoff', [1.5, 3.5])
+def test_search(coords, query, box, cutoff):
+    results = FastNS(cutoff, coords, box=box).search(query)
+
+    d = distance_array(query, coords, box=_dist_box(box))
+    ref = set(zip(*np.where(d <= cutoff)))
+    pairs = results.get_pairs()
+
+    assert len(pairs) == len(ref)
+    assert set(map(tuple, pairs)) == ref
+    assert_almost_equal(results.get_pair_distances(),
+                        d[pairs[:, 0], pairs[:, 1]], decimal=4)
+
+
+@pytest.mark.parametrize('box', boxes)
+@pytest.mark.parametrize('cutoff', [1.5, 3.5])
+def test_self_search(coords, box, cutoff):
+    results = FastNS(cutoff, coords, box=box).self_search()
+
+    d = distance_array(coords, coords, box=_dist_box(box))
+    i, j = np.where(d <= cutoff)
+    ref = set((a, b) for a, b in zip(i, j) if a < b)
+    pairs = results.get_pairs()
+
+    assert len(pairs) == len(ref)
+    assert set(map(tuple, pairs)) == ref
+    assert_almost_equal(results.get_pair_distances(),
+                        d[pairs[:, 0], pairs[:, 1]], decimal=4)
+
+
+def test_self_search_matches_self_distance_array(coords):
+    box = np.array([20, 25, 30, 90, 90, 90], dtype=np.float32)
+    results = FastNS(2.0, coords, box=box).self_search()
+
+    ref = self_distance_array(coords, box=box) <= 2.0
+    assert_equal(len(results), ref.sum())
+
+
+def test_get_indices(coords, query):
+    results = FastNS(3.0, coords).search(query)
+    indices = results.get_indices()
+    distances = results.get_distances()
+
+    d = distance_array(query, coords)
+    assert len(indices) == len(query)
+    for i, (idx, dist) in enumerate(zip(indices, distances)):
+        assert_equal(np.sort(idx), np.where(d[i] <= 3.0)[0])
+        assert_almost_equal(dist, d[i, idx], decimal=4)
+
+
+def test_max_gridsize(coords, query):
+    ref = FastNS(2.0, coords).search(query).get_pairs()
+    pairs = FastNS(2.0, coords, max_gridsize=8).search(query).get_pairs()
+
+    assert set(map(tuple, pairs)) == set(map(tuple, ref))
+
+
+def test_empty():
+    ns = FastNS(2.0, np.zeros((0, 3), dtype=np.float32))
+
+    assert_equal(ns.search(np.ones((4, 3))).get_pairs().shape, (0, 2))
+    assert len(ns.self_search()) == 0
+
+
+def test_bad_cutoff(coords):
+    with pytest.raises(ValueError):
+        FastNS(0.0, coords)
+
+
+def test_bad_box(coords):
+    with pytest.raises(ValueError):
+        FastNS(2.0, coords, box=np.zeros(4, dtype=np.float32))
+
+
+@pytest.mark.parametrize('box', [
+    np.zeros(6, dtype=np.float32),
+    np.array([20, 20, 0, 90, 90, 90], dtype=np.float32),
+    np.zeros((3, 3), dtype=np.float32),
+])
+def test_degenerate_box(coords, query, box):
+    # a box without volume is not periodic
+    ns = FastNS(2.5, coords, box=box)
+    assert not ns.periodic
+    ref = FastNS(2.5, coords).search(query)
+    assert_equal(ns.search(query).get_pairs(), ref.get_pairs())
+
+
+@pytest.mark.parametrize('box', boxes[:5])
+def test_verlet_search(coords, query, box):
+    verlet = VerletNS(2.5, skin=1.0)
+    rng = np.random.RandomState(7)
+    for _ in range(10):
+        coords = (coords + rng.normal(scale=0.1, size=coords.shape)).astype(
+            np.float32)
+        query = (query + rng.normal(scale=0.1, size=query.shape)).astype(
+            np.float32)
+        results = verlet.search(query, coords, box=box)
+
+        d = distance_array(query, coords, box=_dist_box(box))
+        ref = set(zip(*np.where(d <= 2.5)))
+        pairs = results.get_pairs()
+        assert set(map(tuple, pairs)) == ref
+        assert_almost_equal(results.get_pair_distances(),
+                            d[pairs[:, 0], pairs[:, 1]], decimal=4)
+    # displacements of 0.1 per step only need a few rebuilds
+    assert 1 < verlet.n_builds < 10
+
+
+def test_verlet_reuse(coords, query):
+    verlet = VerletNS(2.5, skin=1.0)
+    verlet.search(query, coords)
+    verlet.search(query + 0.2, coords - 0.2)
+    assert verlet.n_builds == 1
+    # moved further than the skin
+    verlet.search(query + 0.6, coords - 0.6)
+    assert verlet.n_builds == 2
+
+
+@pytest.mark.parametrize('change', ['shape', 'key', 'box'])
+def test_verlet_rebuild(coords, query, change):
+    box = np.array([50, 50, 50, 90, 90, 90], dtype=np.float32)
+    key = (np.arange(len(coords)),)
+    verlet = VerletNS(2.5, skin=1.0)
+    verlet.search(query, coords, box=box, key=key)
+    if change == 'shape':
+        coords = coords[:-1]
+    elif change == 'key':
+        key = (key[0][::-1],)
+    else:
+        # the images of the pairs move by more than the skin
+        box = box.copy()
+        box[:3] *= 1.05
+    verlet.search(query, coords, box=box, key=key)
+    assert verlet.n_builds == 2
+
+
+@pytest.mark.parametrize('angles', [(90, 90, 90), (80, 85, 95)])
+def test_verlet_box_fluctuation(angles):
+    # coordinates scaled with the box as by a barostat
+    rng = np.random.RandomState(3)
+    frac = rng.uniform(size=(400, 3))
+    box = np.array([30, 30, 30] + list(angles), dtype=np.float32)
+    verlet = VerletNS(2.5, skin=1.0)
+    for _ in range(10):
+        box[:3] *= rng.uniform(0.999, 1.001, size=3)
+        coords = np.dot(frac, triclinic_vectors(box)).astype(np.float32)
+        results = verlet.search(coords[:40], coords, box=box)
+
+        d = distance_array(coords[:40], coords, box=box)
+        ref = set(zip(*np.where(d <= 2.5)))
+        pairs = results.get_pairs()
+        assert set(map(tuple, pairs)) == ref
+        assert_almost_equal(results.get_pair_distances(),
+                            d[pairs[:, 0], pairs[:, 1]], decimal=4)
+    assert verlet.n_builds == 1
+
+
+def test_verlet_bad_skin():
+    with pytest.raises(ValueError):
+        VerletNS(2.0, skin=-1.0)
@@ -253,12 +253,18 @@ class TestMakeWhole(object):
         with pytest.raises(NoDataError):
             mdamath.make_whole(ag)
 
-    def test_not_orthogonal(self, universe, ag):
-        # Not an orthogonal unit cell
+    def test_triclinic(self, universe, ag):
+        # a triclinic unit cell, atom 4 is still one box vector away
+        universe.dimensions = [100., 100., 100., 80., 80., 80.]
+        refpos = universe.atoms[:4].positions.copy()
 
-        universe.dimensions = [10., 10., 10., 80., 80., 80]
-        with pytest.raises(ValueError):
-            mdamath.make_whole(ag)
+        mdamath.make_whole(ag)
+
+        assert_array_almost_equal(universe.atoms[:4].positions, refpos)
+        assert_array_almost_equal(universe.atoms[4].position,
+                                  np.array([110.0, 50.0, 0.0]), decimal=4)
+        assert_array_almost_equal(universe.atoms[7].position,
+                                  np.array([120.0, 50.0, 0.0]), decimal=4)
 
     def test_zero_box_size(self, universe, ag):
         universe.dimensions = [0., 0., 0., 90., 90., 90.]
@@ -523,6 +529,75 @@ class TestConvFloat(object):
         assert ret == output
 
 
+class TestFixedWidthRecords(object):
+    text = ("REMARK  1\n"
+            "ATOM      1  N   ALA     1      -1.234  10.000   0.500\r\n"
+            "\n"
+            "  HETATM    2  O   HOH     2      12.5     -.5   1e1\n"
+            "ATOM      3  C   ALA    **       0.000   0.000\n"
+            "ATO\n"
+            "END")
+
+    def test_records(self):
+        chars, kinds = util.fixed_width_records(
+            self.text, ('ATOM', 'HETATM', 'END'), width=30, lstrip=True)
+        assert chars.shape == (4, 30)
+        assert_equal(kinds, [0, 1, 0, 2])
+        assert chars[1].tobytes() == b'HETATM    2  O   HOH     2    '
+        # short lines are padded
+        assert chars[3].tobytes() == b'END' + b' ' * 27
+
+    def test_no_lstrip(self):
+        chars, kinds = util.fixed_width_records(self.text, ('ATOM', 'HETATM'))
+        assert_equal(kinds, [0, 0])
+
+    def test_empty(self):
+        chars, kinds = util.fixed_width_records('', ('ATOM',), width=10)
+        assert chars.shape == (0, 10)
+        assert len(kinds) == 0
+
+    def test_floats(self):
+        chars, _ = util.fixed_width_records(self.text, ('ATOM', 'HETATM'),
+                                            width=54, lstrip=True)
+        values, ok = util.fixed_width_floats(chars[:, 30:54].reshape(-1, 8))
+        assert_equal(ok, [True] * 8 + [False])
+        assert_equal(values, [-1.234, 10.0, 0.5, 12.5, -0.5, 10.0,
+                              0.0, 0.0, 0.0])
+
+    @pytest.mark.parametrize('field', ['   1.000', '-123.456', '  -0.000',
+                                       '     .25', '  +7.5  ', '1.5e-3  ',
+                                       '99999999', '  0.1234'])
+    def test_floats_like_float(self, field):
+        chars = np.frombuffer(field.encode(), dtype=np.uint8).reshape(1, -1)
+        values, ok = util.fixed_width_floats(chars)
+        assert ok[0]
+        assert values[0] == float(field)
+        assert np.signbit(values[0]) == np.signbit(float(field))
+
+    @pytest.mark.parametrize('field', ['        ', '********', ' 1 2    ',
+                                       '1.2.3   ', '--1     ', '1-      '])
+    def test_floats_invalid(self, field):
+        chars = np.frombuffer(field.encode(), dtype=np.uint8).reshape(1, -1)
+        values, ok = util.fixed_width_floats(chars)
+        assert not ok[0]
+        assert values[0] == 0
+
+    def test_ints(self):
+        fields = [' 12', '-3 ', '  7', '1.0', '   ', '***', ' +9']
+        chars = np.array([bytearray(f.encode()) for f in fields],
+                         dtype=np.uint8)
+        values, ok = util.fixed_width_ints(chars)
+        assert_equal(values, [12, -3, 7, 0, 0, 0, 9])
+        assert_equal(ok, [True, True, True, False, False, False, True])
+
+    def test_strings(self):
+        chars, _ = util.fixed_width_records(self.text, ('ATOM', 'HETATM'),
+                                            width=30, lstrip=True)
+        assert_equal(util.fixed_width_strings(chars[:, 12:16]),
+                     ['N', 'O', 'C'])
+        assert_equal(util.fixed_width_strings(chars[:, 16:17]), ['', '', ''])
+
+
 class TestFixedwidthBins(object):
     def test_keys(self):
         ret = util.fixedwidth_bins(0.5, 1.0, 2.0)
@@ -799,6 +874,28 @@ class TestUniqueRows(object):
                            np.array([[1, 2]]))
 
 
+class TestFactorize(object):
+    def test_object(self):
+        values = np.array(['OW', 'HW', 'HW', 'OW', 'MW'], dtype=object)
+        vocabulary, codes = util.factorize(values)
+
+        assert_array_equal(vocabulary, ['OW', 'HW', 'MW'])
+        assert_array_equal(codes, [0, 1, 1, 0, 2])
+        assert vocabulary.dtype == object
+
+    def test_numeric(self):
+        values = np.array([0.5, -1.0, 0.5])
+        vocabulary, codes = util.factorize(values)
+
+        assert_array_equal(vocabulary, [-1.0, 0.5])
+        assert_array_equal(vocabulary[codes], values)
+
+    def test_scalar(self):
+        vocabulary, codes = util.factorize('CA')
+
+        assert vocabulary[codes] == 'CA'
+
+
 class TestGetWriterFor(object):
     def test_no_filename_argument(self):
         # Does ``get_writer_for`` fails as expected when provided no
@@ -25,11 +25,13 @@ import pytest
 from numpy.testing import assert_equal
 import numpy as np
 
+import MDAnalysis as mda
 from MDAnalysis.topology import guessers
 from MDAnalysis.core.topologyattrs import Angles
 
 from MDAnalysisTests import make_Universe
 from MDAnalysisTests.core.test_fragments import make_starshape
+from MDAnalysisTests.datafiles import two_water_gro, PDB_small
 
 
 class TestGuessMasses(object):
@@ -99,3 +101,51 @@ def test_guess_impropers():
 
     vals = guessers.guess_improper_dihedrals(ag.angles)
     assert_equal(len(vals), 12)
+
+
+def test_guess_bonds_water():
+    u = mda.Universe(two_water_gro)
+    bonds = guessers.guess_bonds(u.atoms, u.atoms.positions,
+                                 box=u.dimensions)
+
+    assert isinstance(bonds, np.ndarray)
+    assert_equal(bonds, [[0, 1], [0, 2], [3, 4], [3, 5]])
+
+
+def test_guess_angles():
+    u = make_starshape()
+
+    vals = guessers.guess_angles(u.atoms[:5].bonds)
+    assert_equal(vals, [[0, 1, 2], [0, 1, 3], [0, 1, 4], [1, 4, 5],
+                        [2, 1, 3], [2, 1, 4], [3, 1, 4], [4, 5, 6]])
+
+
+def test_guess_dihedrals():
+    u = make_starshape()
+
+    ag = u.atoms[:5]
+    u.add_TopologyAttr(Angles(guessers.guess_angles(ag.bonds)))
+
+    vals = guessers.guess_dihedrals(ag.angles)
+    assert_equal(vals, [[0, 1, 4, 5], [1, 4, 5, 6], [2, 1, 4, 5],
+                        [3, 1, 4, 5], [4, 5, 6, 7], [4, 5, 6, 8],
+                        [4, 5, 6, 9]])
+
+
+def test_guess_empty_terms():
+    u = make_starshape()
+    ag = u.atoms[[]]
+    u.add_TopologyAttr(Angles([]))
+
+    assert_equal(guessers.guess_angles(ag.bonds).shape, (0, 3))
+    assert_equal(guessers.guess_dihedrals(ag.angles).shape, (0, 4))
+    assert_equal(guessers.guess_improper_dihedrals(ag.angles).shape, (0, 4))
+
+
+def test_guess_bonds_no_bonds():
+    u = mda.Universe(PDB_small)
+    u.atoms[[0, 2000]].guess_bonds()
+
+    assert len(u.bonds) == 0
+    assert len(u.angles) == 0
+    assert len(u.dihedrals) == 0
@@ -148,3 +148,17 @@ def test_sameresid_diffresname():
     for i, (resid, resname) in enumerate(zip(resids, resnames)):
         assert top.resids.values[i] == resid
         assert top.resnames.values[i] == resname
+
+
+def test_parse_in_blocks(monkeypatch):
+    # reading the file in small blocks must not change the topology
+    with _PDBPARSER(PDB_small) as p:
+        ref = p.parse()
+    monkeypatch.setattr(_PDBPARSER, '_blocksize', 1000)
+    with _PDBPARSER(PDB_small) as p:
+        top = p.parse()
+
+    assert top.n_atoms == ref.n_atoms
+    for attr in ('ids', 'names', 'resids', 'resnames', 'icodes', 'segids',
+                 'occupancies', 'tempfactors'):
+        assert_equal(getattr(top, attr).values, getattr(ref, attr).values)
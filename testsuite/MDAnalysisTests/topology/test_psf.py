@@ -20,6 +20,7 @@
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
 from __future__ import absolute_import
+import pytest
 from numpy.testing import assert_equal
 
 import MDAnalysis as mda
@@ -88,6 +89,28 @@ class TestPSFParser(ParserBase):
             assert (b in vals) or (b[::-1] in vals)
 
 
+@pytest.mark.parametrize('filename', [PSF, XYZ_psf])
+def test_lazy_connectivity(filename):
+    with mda.topology.PSFParser.PSFParser(filename) as p:
+        ref = p.parse()
+    with mda.topology.PSFParser.PSFParser(filename, lazy=True) as p:
+        top = p.parse()
+
+    for attrname in ('bonds', 'angles', 'dihedrals', 'impropers'):
+        attr = getattr(top, attrname)
+        # nothing read before the first use
+        assert '_loader' in attr.__dict__
+        assert_equal(attr.values, getattr(ref, attrname).values)
+        assert '_loader' not in attr.__dict__
+
+
+def test_lazy_universe():
+    u = mda.Universe(PSF, lazy_topology=True)
+    assert '_loader' in u._topology.bonds.__dict__
+    assert len(u.atoms[[0]].bonds) == 4
+    assert len(u.atoms[[0]].dihedrals) == 14
+
+
 class TestNAMDPSFParser(ParserBase):
     """Testfiles provided by JiyongPark77.
 
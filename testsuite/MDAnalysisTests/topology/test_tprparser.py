@@ -119,6 +119,20 @@ def _test_is_in_topology(name, elements, topology_path, topology_section):
             'Interaction type "{}" not found'.format(name)
 
 
+@pytest.mark.parametrize('filename', (TPR, TPR2016_bonded))
+def test_lazy_connectivity(filename):
+    parser = MDAnalysis.topology.TPRParser.TPRParser
+    with parser(filename) as p:
+        ref = p.parse()
+    with parser(filename, lazy=True) as p:
+        top = p.parse()
+
+    for attrname in ('bonds', 'angles', 'dihedrals', 'impropers'):
+        attr = getattr(top, attrname)
+        assert '_loader' in attr.__dict__
+        assert_equal(attr.values, getattr(ref, attrname).values)
+
+
 @pytest.mark.parametrize('topology', (
         TPR510_bonded,
         TPR2016_bonded
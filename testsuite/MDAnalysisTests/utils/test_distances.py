@@ -729,6 +729,300 @@ class TestPeriodicAngles(object):
 
 
 
+@pytest.mark.parametrize('method', ['bruteforce', 'nsgrid', 'pkdtree'])
+@pytest.mark.parametrize('box', [
+    None,
+    np.array([10, 12, 14, 90, 90, 90], dtype=np.float32),
+    np.array([10, 12, 14, 70, 80, 100], dtype=np.float32),
+])
+class TestCappedDistance(object):
+    @staticmethod
+    @pytest.fixture()
+    def coords():
+        rng = np.random.RandomState(42)
+        reference = (rng.random_sample((100, 3)) * 12).astype(np.float32)
+        configuration = (rng.random_sample((150, 3)) * 12).astype(np.float32)
+        return reference, configuration
+
+    def test_capped_distance(self, coords, box, method):
+        reference, configuration = coords
+        ref = MDAnalysis.lib.distances.distance_array(reference,
+                                                      configuration, box=box)
+        i, j = np.nonzero((ref <= 3.0) & (ref > 0.5))
+
+        pairs, distances = MDAnalysis.lib.distances.capped_distance(
+            reference, configuration, 3.0, min_cutoff=0.5, box=box,
+            method=method)
+        assert_equal(pairs, np.column_stack([i, j]))
+        assert_almost_equal(distances, ref[i, j], decimal=5)
+
+    def test_self_capped_distance(self, coords, box, method):
+        reference = coords[0]
+        ref = MDAnalysis.lib.distances.distance_array(reference, reference,
+                                                      box=box)
+        i, j = np.nonzero(np.triu(ref <= 3.0, k=1))
+
+        pairs = MDAnalysis.lib.distances.self_capped_distance(
+            reference, 3.0, box=box, method=method, return_distances=False)
+        assert_equal(pairs, np.column_stack([i, j]))
+
+
+def test_capped_distance_wrong_method():
+    points = np.zeros((2, 3), dtype=np.float32)
+    with pytest.raises(ValueError):
+        MDAnalysis.lib.distances.capped_distance(points, points, 1.0,
+                                                 method='not a method')
+
+
+@pytest.mark.parametrize('method', ['bruteforce', 'nsgrid', 'pkdtree'])
+def test_capped_distance_zero_box(method):
+    rng = np.random.RandomState(42)
+    points = (rng.random_sample((100, 3)) * 12).astype(np.float32)
+    ref = MDAnalysis.lib.distances.capped_distance(points, points, 3.0,
+                                                   method=method)
+    pairs, distances = MDAnalysis.lib.distances.capped_distance(
+        points, points, 3.0, box=np.zeros(6, dtype=np.float32),
+        method=method)
+    assert_equal(pairs, ref[0])
+    assert_almost_equal(distances, ref[1])
+
+
+@pytest.mark.parametrize('n_reference, n_configuration, size, box, method', [
+    (100, 150, 12., None, 'bruteforce'),
+    (1000, None, 12., None, 'bruteforce'),
+    (2000, 2000, 50., None, 'nsgrid'),
+    (2000, None, 50., [50., 50., 50., 90., 90., 90.], 'nsgrid'),
+    # sparse systems use the grid as well, the tree is never chosen
+    (2000, 2000, 2000., None, 'nsgrid'),
+    (2000, None, 2000., [2000., 2000., 2000., 90., 90., 90.], 'nsgrid'),
+])
+def test_capped_distance_method(monkeypatch, n_reference, n_configuration,
+                                size, box, method):
+    chosen = []
+
+    def recorded(name, func):
+        def record(*args, **kwargs):
+            chosen.append(name)
+            return func(*args, **kwargs)
+        return record
+
+    methods = MDAnalysis.lib.distances._capped_methods
+    for name, func in list(methods.items()):
+        monkeypatch.setitem(methods, name, recorded(name, func))
+    rng = np.random.RandomState(42)
+    reference = (rng.random_sample((n_reference, 3)) *
+                 size).astype(np.float32)
+    if box is not None:
+        box = np.array(box, dtype=np.float32)
+    if n_configuration is None:
+        MDAnalysis.lib.distances.self_capped_distance(reference, 2.0, box=box)
+    else:
+        configuration = (rng.random_sample((n_configuration, 3)) *
+                         size).astype(np.float32)
+        MDAnalysis.lib.distances.capped_distance(reference, configuration,
+                                                 2.0, box=box)
+    assert chosen == [method]
+
+
+def test_capped_distance_empty():
+    points = np.zeros((2, 3), dtype=np.float32)
+    pairs, distances = MDAnalysis.lib.distances.capped_distance(
+        points[:0], points, 1.0)
+    assert pairs.shape == (0, 2)
+    assert distances.shape == (0,)
+
+
+@pytest.mark.parametrize('box', [
+    None,
+    np.array([10, 12, 14, 90, 90, 90], dtype=np.float32),
+    np.array([10, 12, 14, 70, 80, 100], dtype=np.float32),
+])
+class TestTiledDistanceArray(object):
+    @staticmethod
+    @pytest.fixture()
+    def coords():
+        rng = np.random.RandomState(42)
+        reference = (rng.random_sample((100, 3)) * 12).astype(np.float32)
+        configuration = (rng.random_sample((150, 3)) * 12).astype(np.float32)
+        return reference, configuration
+
+    def test_tiled_distance_array(self, coords, box):
+        reference, configuration = coords
+        ref = MDAnalysis.lib.distances.distance_array(reference,
+                                                      configuration, box=box)
+        result = np.zeros_like(ref)
+
+        def reduce(tile, rows, cols):
+            result[rows, cols] = tile
+
+        MDAnalysis.lib.distances.tiled_distance_array(
+            reference, configuration, reduce, box=box, tile_size=17)
+        assert_almost_equal(result, ref, decimal=5)
+
+    @pytest.mark.parametrize('backend', ['serial', 'openmp'])
+    def test_distance_histogram(self, coords, box, backend):
+        reference, configuration = coords
+        ref = MDAnalysis.lib.distances.distance_array(reference,
+                                                      configuration, box=box)
+        ref_count, ref_edges = np.histogram(ref, bins=20, range=(0.0, 10.0))
+
+        count, edges = MDAnalysis.lib.distances.distance_histogram(
+            reference, configuration, bins=20, range=(0.0, 10.0), box=box,
+            backend=backend)
+        assert_equal(count, ref_count)
+        assert_almost_equal(edges, ref_edges)
+
+    @pytest.mark.parametrize('backend', ['serial', 'openmp'])
+    @pytest.mark.parametrize('exclusion_block', [(1, 1), (2, 3), (7, 4)])
+    def test_distance_histogram_exclusion(self, coords, box, backend,
+                                          exclusion_block):
+        reference, configuration = coords
+        ref = MDAnalysis.lib.distances.distance_array(reference,
+                                                      configuration, box=box)
+        xA, xB = exclusion_block
+        same = ((np.arange(len(reference)) // xA)[:, None] ==
+                (np.arange(len(configuration)) // xB)[None, :])
+        ref_count = np.histogram(ref[~same], bins=20, range=(0.0, 10.0))[0]
+
+        count = MDAnalysis.lib.distances.distance_histogram(
+            reference, configuration, bins=20, range=(0.0, 10.0), box=box,
+            exclusion_block=exclusion_block, backend=backend)[0]
+        assert_equal(count, ref_count)
+
+    @pytest.mark.parametrize('backend', ['serial', 'openmp'])
+    def test_min_distance_per_atom(self, coords, box, backend):
+        reference, configuration = coords
+        ref = MDAnalysis.lib.distances.distance_array(reference,
+                                                      configuration, box=box)
+
+        dmin = MDAnalysis.lib.distances.min_distance_per_atom(
+            reference, configuration, box=box, backend=backend)
+        assert_almost_equal(dmin, ref.min(axis=1), decimal=5)
+
+    @pytest.mark.parametrize('backend', ['serial', 'openmp'])
+    def test_count_within(self, coords, box, backend):
+        reference, configuration = coords
+        ref = MDAnalysis.lib.distances.distance_array(reference,
+                                                      configuration, box=box)
+
+        count = MDAnalysis.lib.distances.count_within(
+            reference, configuration, 3.0, box=box, backend=backend)
+        assert_equal(count, (ref <= 3.0).sum(axis=1))
+
+
+@pytest.mark.parametrize('exclusion_block', [(0, 1), (2,), (1, -1)])
+def test_distance_histogram_wrong_exclusion(exclusion_block):
+    points = np.zeros((2, 3), dtype=np.float32)
+    with pytest.raises(ValueError):
+        MDAnalysis.lib.distances.distance_histogram(
+            points, points, exclusion_block=exclusion_block)
+
+
+def test_min_distance_per_atom_empty():
+    points = np.zeros((2, 3), dtype=np.float32)
+    dmin = MDAnalysis.lib.distances.min_distance_per_atom(points, points[:0])
+    assert_equal(dmin, [np.inf, np.inf])
+
+
+@pytest.mark.parametrize('backend', ['serial', 'openmp'])
+@pytest.mark.parametrize('box', [
+    None,
+    np.array([10, 12, 14, 90, 90, 90], dtype=np.float32),
+    np.array([10, 12, 14, 70, 80, 100], dtype=np.float32),
+])
+class TestFloat32Results(object):
+    @staticmethod
+    @pytest.fixture()
+    def coords():
+        rng = np.random.RandomState(42)
+        return [(rng.random_sample((50, 3)) * 14).astype(np.float32)
+                for _ in range(4)]
+
+    @staticmethod
+    def assert_float32(result, ref, double_accumulate):
+        assert result.dtype == np.float32
+        if double_accumulate:
+            # same arithmetic as the float64 results, only rounded
+            assert_equal(result, ref.astype(np.float32))
+        else:
+            assert_almost_equal(result, ref, decimal=5)
+
+    @pytest.mark.parametrize('double_accumulate', [False, True])
+    def test_distance_array(self, coords, box, backend, double_accumulate):
+        a, b = coords[:2]
+        ref = MDAnalysis.lib.distances.distance_array(a, b, box=box,
+                                                      backend=backend)
+        d = MDAnalysis.lib.distances.distance_array(
+            a, b, box=box, backend=backend, dtype=np.float32,
+            double_accumulate=double_accumulate)
+        self.assert_float32(d, ref, double_accumulate)
+
+    @pytest.mark.parametrize('double_accumulate', [False, True])
+    def test_self_distance_array(self, coords, box, backend,
+                                 double_accumulate):
+        a = coords[0]
+        ref = MDAnalysis.lib.distances.self_distance_array(a, box=box,
+                                                           backend=backend)
+        d = np.empty(len(ref), dtype=np.float32)
+        MDAnalysis.lib.distances.self_distance_array(
+            a, box=box, result=d, backend=backend,
+            double_accumulate=double_accumulate)
+        self.assert_float32(d, ref, double_accumulate)
+
+    @pytest.mark.parametrize('double_accumulate', [False, True])
+    def test_calc_bonds(self, coords, box, backend, double_accumulate):
+        a, b = coords[:2]
+        ref = MDAnalysis.lib.distances.calc_bonds(a, b, box=box,
+                                                  backend=backend)
+        d = MDAnalysis.lib.distances.calc_bonds(
+            a, b, box=box, backend=backend, dtype=np.float32,
+            double_accumulate=double_accumulate)
+        self.assert_float32(d, ref, double_accumulate)
+
+    @pytest.mark.parametrize('double_accumulate', [False, True])
+    def test_calc_angles(self, coords, box, backend, double_accumulate):
+        a, b, c = coords[:3]
+        ref = MDAnalysis.lib.distances.calc_angles(a, b, c, box=box,
+                                                   backend=backend)
+        d = MDAnalysis.lib.distances.calc_angles(
+            a, b, c, box=box, backend=backend, dtype=np.float32,
+            double_accumulate=double_accumulate)
+        self.assert_float32(d, ref, double_accumulate)
+
+    @pytest.mark.parametrize('double_accumulate', [False, True])
+    def test_calc_dihedrals(self, coords, box, backend, double_accumulate):
+        a, b, c, d = coords
+        ref = MDAnalysis.lib.distances.calc_dihedrals(a, b, c, d, box=box,
+                                                      backend=backend)
+        dih = MDAnalysis.lib.distances.calc_dihedrals(
+            a, b, c, d, box=box, backend=backend, dtype=np.float32,
+            double_accumulate=double_accumulate)
+        self.assert_float32(dih, ref, double_accumulate)
+
+    def test_coordinates_unchanged(self, coords, box, backend):
+        a, b = coords[:2]
+        a_ref, b_ref = a.copy(), b.copy()
+        MDAnalysis.lib.distances.distance_array(a, b, box=box,
+                                                backend=backend)
+        assert_equal(a, a_ref)
+        assert_equal(b, b_ref)
+
+
+def test_distance_array_wrong_dtype():
+    points = np.zeros((2, 3), dtype=np.float32)
+    with pytest.raises(TypeError):
+        MDAnalysis.lib.distances.distance_array(points, points,
+                                                dtype=np.int32)
+
+
+def test_distance_array_noncontiguous_result():
+    points = np.zeros((2, 3), dtype=np.float32)
+    result = np.zeros((2, 4))[:, ::2]
+    with pytest.raises(ValueError):
+        MDAnalysis.lib.distances.distance_array(points, points,
+                                                result=result)
+
+
 class TestDistanceBackendSelection(object):
     @staticmethod
     @pytest.fixture()